@@ -0,0 +1,53 @@
+"""
+Basin configuration shared by every stage of the pipeline.
+
+Each basin is described by the lat/lon bounding box used to select GHCNd
+climate stations, the years that had a full water supply (used to train the
+full supply demand models), the day of year the irrigation season starts and
+the water supply sources (unregulated inflows and reservoirs) of each water
+supply component, and any quality control thresholds of its own.
+
+To add a basin, add an entry to each of the dictionaries below and make sure
+the reaches in Data/RiverWareReaches.csv and Data/ReachSWSI.csv end with
+_{BasinName}.
+"""
+
+# Lat lon bounding box for each basin
+BoundingBox = {'SNK': [[-114.8, -109.8], [42, 44.7]],
+               'PAY': [[-117, -115], [43.8, 45.2]],
+               'BOI': [[-117.1, -115.7], [43.4, 43.9]]}
+
+# Years that have have a full water supply
+Years = {'SNK': [2010, 2012, 2014, 2017],
+         'BOI': [2011, 2012, 2016, 2017, 2018],
+         'PAY': [2011, 2017, 2018]}
+
+# Day of year the irrigation season starts
+StartDay = {'SNK': 60, 'BOI': 60, 'PAY': 60}
+
+# Dictionary of water supply sources for each water supply component. The
+# group of each reach in Data/ReachSWSI.csv is its components joined by '+',
+# e.g. HEII+HEN+AMF is supplied by every source of HEII, HEN and AMF.
+WaterSupplyDict = {'SNK': {'HEII': {'Inflow': ['HEII'], 'Reservoirs': ['JCK', 'PAL']},
+                           'HEN': {'Inflow': ['ISLI'], 'Reservoirs': ['ISL', 'GRS', 'HEN']},
+                           'AMF': {'Inflow': [], 'Reservoirs': ['AMF']},
+                           'RIR': {'Inflow': [], 'Reservoirs': ['RIR']}},
+                    'BOI': {'BOI': {'Inflow': ['LUC'], 'Reservoirs': ['LUC', 'ARK', 'AND']}},
+                    'PAY': {'PAY': {'Inflow': ['HRSI'], 'Reservoirs': ['CSC', 'DED']}}}
+
+# Quality control thresholds of each basin that differ from the defaults in
+# QualityControl.Thresholds, e.g. {'Diversions': {'High': 5000}}
+QualityThresholds = {'SNK': {}, 'BOI': {}, 'PAY': {}}
+
+
+def basin_config(BasinName):
+    """Collect the configuration for a single basin into one dictionary."""
+    return {'BasinName': BasinName,
+            'BoundingBox': BoundingBox[BasinName],
+            'Years': Years[BasinName],
+            'StartDay': StartDay[BasinName],
+            'WaterSupply': WaterSupplyDict[BasinName],
+            'QualityThresholds': QualityThresholds[BasinName]}
+
+
+Basins = {BasinName: basin_config(BasinName) for BasinName in BoundingBox.keys()}
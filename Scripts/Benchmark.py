@@ -0,0 +1,258 @@
+"""
+Offline benchmark of the pipeline on synthetic data.
+
+Generates a synthetic basin (see SyntheticData.py) in a temporary folder and
+times the main steps of every stage on it:
+
+climate_pivot           read and pivot the GHCNd station files
+screen_climate          quality control of the climate matrices
+climateInterpolate      regression gap filling of TMAX
+observed_diversions     sum the IDWR site files into reach diversions
+screen_diversions       quality control of the IDWR sites
+find_best_station       ClimateDemand station search for one reach
+water_supply_total      Hydromet water supply by group
+fit_water_supply        piecewise linear fit for every reach
+reach_gap               ReachGap table
+RiverWare writers       FullDiversions files, DMI and .bak objects
+
+Wall time, CPU time and peak memory of each step are recorded with
+Instrument.py and saved to {out}/{label}.json so runs can be compared
+between versions. --out defaults to a CropWaterBenchmarks folder in the
+temporary directory, so a run doesn't add files to the repository:
+
+    python Benchmark.py --stations 200 --sites 1000 --label before --out ~/benchmarks
+    python Benchmark.py --stations 200 --sites 1000 --label after --out ~/benchmarks
+    python Benchmark.py --compare ~/benchmarks/before.json ~/benchmarks/after.json
+
+`--cold-start BASIN` instead times the light commands of CropWater.py
+(list-reaches, export --objects) on the real outputs of a basin, with the
+slowest imports of each, and exits 1 if one is over its CropWater.ColdStart
+target.
+
+The regression gap filling and the station search grow with the square of
+the number of stations and with the number of stations respectively, so
+they are run on the first --interpolate-stations and --search-stations
+stations only.
+"""
+# %%
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+
+import Instrument
+import Paths
+from Instrument import section
+from SyntheticData import generate
+
+from ClimateClean import climate_pivot, climateInterpolate
+from ClimateDemand import observed_diversions, site_diversions, find_best_station
+from QualityControl import screen_climate, screen_diversions
+from WaterSupply import water_supply_total
+from WaterSupplyAdjustment import fit_water_supply, reach_gap
+from RiverWareFormat import (write_full_diversions, diversion_weights, div_adj_object,
+                             full_diversions_object, reach_water_supply)
+
+
+def run_benchmark(root, Config, interpolate_stations=50, search_stations=10):
+    BasinName = Config["BasinName"]
+
+    # Point the pipeline functions at the synthetic tree
+    os.chdir(os.path.join(root, "Scripts"))
+    Paths.configure(os.path.join(root, "Data"), os.path.join(root, "Outputs"))
+
+    with section("climate_pivot"):
+        ClimateTMAX, ClimateTMIN, ClimatePRCP = climate_pivot(f"{Paths.Data}/Climate/{BasinName}")
+
+    with section("screen_climate", Stations=ClimateTMAX.shape[1]):
+        screen_climate(ClimateTMAX, ClimateTMIN, ClimatePRCP)
+
+    with section("climateInterpolate", Stations=min(interpolate_stations, ClimateTMAX.shape[1])):
+        climateInterpolate(ClimateTMAX.iloc[:, :interpolate_stations])
+
+    # Gap filled climate for the station search
+    Climate = [df.iloc[:, :search_stations].interpolate().ffill().bfill()
+               for df in (ClimateTMAX, ClimateTMIN, ClimatePRCP)]
+
+    Reaches = pd.read_csv(f"{Paths.Data}/RiverWareReaches.csv")
+
+    with section("observed_diversions", Sites=len(Reaches)):
+        Sites, Duplicates = site_diversions(Reaches, Climate[0].index)
+        ObservedDiversions = observed_diversions(Reaches, Climate[0].index, Sites)
+
+    with section("screen_diversions", Sites=Sites.shape[1]):
+        screen_diversions(Sites, Duplicates)
+
+    Reach = ObservedDiversions.columns[0]
+    with section("find_best_station", Stations=Climate[0].shape[1]):
+        find_best_station(ObservedDiversions[Reach], list(Climate[0].columns), *Climate, Config["Years"])
+
+    ReachWaterSupply = pd.read_csv(f"{Paths.Data}/ReachSWSI.csv", index_col=0)
+
+    with section("water_supply_total"):
+        SWSITotal = water_supply_total(Config["WaterSupply"], Config["StartDay"], Config["HydrometURL"],
+                                       Groups=ReachWaterSupply["Water Supply"])
+
+    # Stand in for the modeled full supply demand
+    ModeledDiversions = ObservedDiversions.groupby(ObservedDiversions.index.dayofyear).transform("max")
+
+    Outputs = pd.DataFrame(np.nan, index=ReachWaterSupply.index, columns=["Slope", "y2", "Break", "R2"])
+
+    with section("fit_water_supply", Reaches=ObservedDiversions.shape[1]):
+        for reach in ObservedDiversions.columns:
+            Flow = (ObservedDiversions - ModeledDiversions)[reach]
+            Flow = Flow.loc[(Flow.index.dayofyear >= Config["StartDay"]) & (Flow.index.dayofyear <= 273)]
+            Flow = Flow.resample("1Y").mean().fillna(0)
+            Flow = Flow.loc[Flow.index.year >= 2000]
+
+            WaterSupplyName = ReachWaterSupply.loc[reach, "Water Supply"]
+            fit_water_supply(Flow, SWSITotal[WaterSupplyName], WaterSupplyName, reach, Outputs,
+                             BasinName, "WaterSupplyFull")
+
+    with section("reach_gap"):
+        ReachGap = reach_gap(ObservedDiversions, ModeledDiversions, Config["StartDay"])
+
+    SlopeThreshold = Outputs.astype(float)
+
+    with section("write_full_diversions"):
+        write_full_diversions(BasinName, ModeledDiversions)
+
+    with section("diversion_weights"):
+        Perc = diversion_weights(BasinName, ModeledDiversions, Reaches, ObservedDiversions, SlopeThreshold)
+
+    with section("div_adj_object"):
+        div_adj_object(BasinName, ReachGap, Perc, reach_water_supply(BasinName))
+
+    with section("full_diversions_object"):
+        full_diversions_object(BasinName, ModeledDiversions)
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return None
+
+
+def cold_start(BasinName, repeat=5):
+    """
+    Time the light CropWater.py commands from start to exit in a new
+    interpreter against CropWater.ColdStart, and list the slowest top level
+    imports of each from -X importtime. Returns True if all are within target.
+    """
+    from CropWater import ColdStart
+
+    Script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CropWater.py")
+    Within = True
+
+    for command, target in ColdStart.items():
+        argv = [Script] + command.split() + ["--basins", BasinName]
+
+        Seconds = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable] + argv, capture_output=True, text=True)
+            Seconds.append(time.perf_counter() - start)
+
+        if result.returncode != 0:
+            print(f"{command}: failed\n{result.stderr}")
+            Within = False
+            continue
+
+        # import time: self [us] | cumulative [us] | package, nested imports are indented
+        Imports = []
+        for line in subprocess.run([sys.executable, "-X", "importtime"] + argv,
+                                   capture_output=True, text=True).stderr.splitlines():
+            fields = line.removeprefix("import time:").split("|")
+            if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith("  "):
+                Imports.append((int(fields[1]) / 1e6, fields[2].strip()))
+
+        Within &= min(Seconds) <= target
+        print(f"{command:20} {min(Seconds):7.3f} s (target {target:.2f} s)  "
+              + ", ".join(f"{name} {seconds:.3f} s" for seconds, name in sorted(Imports, reverse=True)[:3]))
+
+    return Within
+
+
+def compare(before, after):
+    """Print the change in wall time and peak memory of each benchmark step."""
+    with open(before) as f:
+        Before = {Record["Section"]: Record for Record in json.load(f)["Results"]}
+    with open(after) as f:
+        After = {Record["Section"]: Record for Record in json.load(f)["Results"]}
+
+    print(f"{'Step':26} {'Before (s)':>11} {'After (s)':>11} {'Speed-up':>9} {'Peak MB before':>15} {'after':>8}")
+    for step in Before:
+        if step not in After:
+            continue
+        b, a = Before[step], After[step]
+        print(f"{step:26} {b['WallSeconds']:11.3f} {a['WallSeconds']:11.3f} "
+              f"{b['WallSeconds'] / max(a['WallSeconds'], 1e-9):9.2f} "
+              f"{b['PeakRSSMB']:15.1f} {a['PeakRSSMB']:8.1f}")
+
+
+# %%
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline on synthetic data")
+    parser.add_argument("--stations", type=int, default=10, help="Number of climate stations (10 - 2000)")
+    parser.add_argument("--sites", type=int, default=50, help="Number of IDWR diversion sites (50 - 5000)")
+    parser.add_argument("--reaches", type=int, default=None, help="Number of reaches, default sites / 10")
+    parser.add_argument("--interpolate-stations", type=int, default=50)
+    parser.add_argument("--search-stations", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", default=datetime.now().strftime("%Y%m%d-%H%M%S"))
+    parser.add_argument("--out", default=os.path.join(tempfile.gettempdir(), "CropWaterBenchmarks"),
+                        help="Folder of the results (default CropWaterBenchmarks in the temporary directory)")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    parser.add_argument("--cold-start", metavar="BASIN", help="Time the light CropWater.py commands on a basin")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        sys.exit(0)
+
+    if args.cold_start:
+        sys.exit(0 if cold_start(args.cold_start) else 1)
+
+    Output = os.path.abspath(os.path.join(os.path.expanduser(args.out), f"{args.label}.json"))
+
+    with tempfile.TemporaryDirectory() as root:
+        Config = generate(root, n_stations=args.stations, n_sites=args.sites,
+                          n_reaches=args.reaches, seed=args.seed)
+
+        Instrument.enable()
+        run_benchmark(root, Config, args.interpolate_stations, args.search_stations)
+        Instrument.disable()
+
+        # Leave the temporary folder before it is removed
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    os.makedirs(os.path.dirname(Output), exist_ok=True)
+    with open(Output, "w") as f:
+        json.dump({"Label": args.label,
+                   "Commit": git_commit(),
+                   "Date": datetime.now().isoformat(),
+                   "Python": platform.python_version(),
+                   "pandas": pd.__version__,
+                   "numpy": np.__version__,
+                   "Scale": {"Stations": args.stations, "Sites": args.sites, "Reaches": args.reaches,
+                             "InterpolateStations": args.interpolate_stations,
+                             "SearchStations": args.search_stations},
+                   "Results": Instrument.Records}, f, indent=2)
+
+    for Record in Instrument.Records:
+        print(f"{Record['Section']:26} {Record['WallSeconds']:9.3f} s {Record['PeakRSSMB']:9.1f} MB")
+    print(f"Saved {Output}")
@@ -4,6 +4,9 @@ This script cleans and processes two climate datasets from 1980-2000 and 2000-20
 It concatenates the datasets, converts dates, and replaces missing data marked as -9999 with NaN. 
 Three pivot tables for maximum temperature (TMAX), minimum temperature (TMIN), and precipitation (PRCP) are created.
 
+Before they are filled, out of range values, flatlines, spikes and TMIN above TMAX are masked
+(see QualityControl.py).
+
 Two functions, climateInterpolate and climateClean, handle missing data. 
 They use linear regression to estimate missing TMAX and TMIN values based on the most strongly correlated column.
 
@@ -13,18 +16,22 @@ climateClean applies climateInterpolate twice, drops columns with >99% missing d
 and fills remaining missing data using linear interpolation.
 
 The cleaned TMAX, TMIN, and processed PRCP (dropping columns with >10% missing data and filling remaining with zero)
-are written to CSV files.
+are written to CSV files. For the interpolated reach climate of SpatialClimate.py the location of
+every station is also written to StationLocations.csv.
 """
 #%%
 import pandas as pd
 from datetime import datetime
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
 import numpy as np
 import os
 
 from urllib.error import HTTPError
-import os
+
+from ClimateStore import climate_clean_chunked
+import Paths
+from DailyMatrix import Dtype, read_daily
+from Instrument import section
+from QualityControl import limits, screen_climate, write_report
 
 
 def get_stations(bbox):
@@ -67,13 +74,16 @@ def climate_pivot(file_dir):
 
     Climate = []
 
+    # Only read the columns that are used, the values straight to Dtype
+    Columns = ['NAME', 'DATE', 'TMAX', 'TMIN', 'PRCP']
     for file in Files:
-        df = pd.read_csv(os.path.join(file_dir, file), low_memory=False)
+        df = pd.read_csv(os.path.join(file_dir, file), usecols=lambda col: col in Columns,
+                         dtype={'TMAX': Dtype, 'TMIN': Dtype, 'PRCP': Dtype})
         Climate.append(df)
 
     Climate = pd.concat(Climate, ignore_index=True)
 
-    Climate = Climate[['NAME', 'DATE', 'TMAX', 'TMIN', 'PRCP']]
+    Climate = Climate[Columns]
     Climate['DATE'] = pd.to_datetime(Climate['DATE'])
 
     # Precipitation is in tenths of mm, convert to inches
@@ -88,16 +98,20 @@ def climate_pivot(file_dir):
 
     # Get all post 1980 data
     Climate = Climate[Climate['DATE'] >= datetime(1980, 1, 1)]
+    Climate = Climate.astype({'TMAX': Dtype, 'TMIN': Dtype, 'PRCP': Dtype})
 
-    # Create pivot table NAME as columns, date as index, TMAX as values
-    ClimateTMAX = Climate.pivot_table(index='DATE', columns='NAME', values='TMAX')
-    ClimateTMIN = Climate.pivot_table(index='DATE', columns='NAME', values='TMIN')
-    ClimatePRCP = Climate.pivot_table(index='DATE', columns='NAME', values='PRCP')
+    # Create pivot tables NAME as columns, date as index, grouping the rows once for all three variables
+    Pivot = Climate.pivot_table(index='DATE', columns='NAME', values=['TMAX', 'TMIN', 'PRCP'])
+    ClimateTMAX, ClimateTMIN, ClimatePRCP = [Pivot[var].dropna(how='all').dropna(axis=1, how='all')
+                                             for var in ['TMAX', 'TMIN', 'PRCP']]
 
     return ClimateTMAX, ClimateTMIN, ClimatePRCP
 
 
 def climateInterpolate(climateVal):
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import r2_score
+
     climateVal = climateVal.loc[:datetime(2019, 1, 1)]
 
     # Drop all columns with more than 90% NaN values
@@ -132,7 +146,8 @@ def climateInterpolate(climateVal):
             continue
 
         # Replace missing values with regression
-        climateVal.loc[mask, col] = model.predict(climateVal.loc[mask, colMax].values.reshape(-1, 1)).flatten()
+        Pred = model.predict(climateVal.loc[mask, colMax].values.reshape(-1, 1)).flatten()
+        climateVal.loc[mask, col] = Pred.astype(climateVal[col].dtype)
         
     return climateVal
 
@@ -148,38 +163,110 @@ def climate_fill(climateVal):
 
 
 
-def climateClean(BasinName, bbox, file_dir, download=True):
+def station_locations(file_dir):
+    """
+    Latitude, Longitude and Elevation (m) of each station NAME from the first
+    row of its file, None if a file doesn't have them.
+    """
+    Columns = ['NAME', 'LATITUDE', 'LONGITUDE', 'ELEVATION']
+    try:
+        Locations = pd.concat([pd.read_csv(os.path.join(file_dir, file), usecols=Columns, nrows=1)
+                               for file in os.listdir(file_dir)])
+    except ValueError as error:
+        print(f"No station locations in {file_dir}: {error}")
+        return None
+
+    # Stations sharing a NAME are averaged in the pivot, so are their locations
+    Locations = Locations.groupby('NAME').mean()
+    Locations.columns = ['Latitude', 'Longitude', 'Elevation']
+
+    return Locations
+
+
+def archive_pivot(archive_dir):
+    """The TMAX, TMIN and PRCP matrices written by GHCNdArchive.ingest_archive."""
+    return [read_daily(os.path.join(archive_dir, f'Climate{var}.csv'))
+            for var in ['TMAX', 'TMIN', 'PRCP']]
+
+
+def climateClean(BasinName, bbox, file_dir, download=True, archive_dir=None, store=None,
+                 quality_control=True, thresholds=None, locations=False):
+    """
+    Clean the climate of a basin from the station files in file_dir, or with
+    archive_dir from the matrices built out of a local GHCNd archive by
+    GHCNdArchive.py, in which case nothing is downloaded.
+
+    With store the matrices are processed out of core in that folder, a block
+    of days or stations at a time (see ClimateStore.py).
+
+    quality_control masks the suspect values of the pivoted matrices before
+    they are filled, with the QualityControl.Thresholds updated by
+    thresholds, and writes QualityControlClimate.csv.
+
+    locations writes the location of every station to StationLocations.csv
+    for SpatialClimate.py, skipped with a message when the station files
+    don't have them.
+    """
+    if archive_dir is not None:
+        download = False
 
     if download:
-        # Get all stations within bounding box
-        Stations = get_stations(bbox)
+        if not os.path.exists(file_dir):
+            os.makedirs(file_dir)
 
-        # Download all station data
-        download_stations(Stations, file_dir)
+        with section("Download"):
+            # Get all stations within bounding box
+            Stations = get_stations(bbox)
 
-    # Create pivot tables for TMAX, TMIN, and PRCP for all stations
-    ClimateTMAX, ClimateTMIN, ClimatePRCP = climate_pivot(file_dir)
+            # Download all station data
+            download_stations(Stations, file_dir)
+
+    # Station locations for the interpolation of SpatialClimate.py
+    if locations:
+        if archive_dir is not None:
+            Locations = pd.read_csv(os.path.join(archive_dir, 'StationLocations.csv'), index_col=0)
+        else:
+            Locations = station_locations(file_dir)
+        if Locations is not None:
+            Locations.to_csv(f'{Paths.Outputs}/{BasinName}/Climate/StationLocations.csv')
 
+    if store is not None:
+        climate_clean_chunked(BasinName, file_dir, store, archive_dir, quality_control, thresholds)
+        return
 
-    ClimateTMAX = climate_fill(ClimateTMAX)
-    ClimateTMIN = climate_fill(ClimateTMIN)
+    # Create pivot tables for TMAX, TMIN, and PRCP for all stations
+    if archive_dir is not None:
+        with section("Pivot", Source="Archive"):
+            ClimateTMAX, ClimateTMIN, ClimatePRCP = archive_pivot(archive_dir)
+    else:
+        with section("Pivot"):
+            ClimateTMAX, ClimateTMIN, ClimatePRCP = climate_pivot(file_dir)
+
+    if quality_control:
+        with section("Quality control"):
+            ClimateTMAX, ClimateTMIN, ClimatePRCP, Report = screen_climate(ClimateTMAX, ClimateTMIN, ClimatePRCP,
+                                                                           limits(thresholds))
+            write_report(Report, f'{Paths.Outputs}/{BasinName}/QualityControlClimate.csv')
+
+    with section("Interpolation", Variable="TMAX"):
+        ClimateTMAX = climate_fill(ClimateTMAX)
+    with section("Interpolation", Variable="TMIN"):
+        ClimateTMIN = climate_fill(ClimateTMIN)
 
     # Drop all columns with more than 10% NaN values
     ClimatePRCP = ClimatePRCP.dropna(thresh=ClimatePRCP.shape[0]*0.9, axis=1).fillna(0)
 
-    ClimateTMAX.to_csv(f'../Outputs/{BasinName}/Climate/ClimateTMAX.csv')
-    ClimateTMIN.to_csv(f'../Outputs/{BasinName}/Climate/ClimateTMIN.csv')
-    ClimatePRCP.to_csv(f'../Outputs/{BasinName}/Climate/ClimatePRCP.csv')
+    with section("Write files"):
+        ClimateTMAX.to_csv(f'{Paths.Outputs}/{BasinName}/Climate/ClimateTMAX.csv')
+        ClimateTMIN.to_csv(f'{Paths.Outputs}/{BasinName}/Climate/ClimateTMIN.csv')
+        ClimatePRCP.to_csv(f'{Paths.Outputs}/{BasinName}/Climate/ClimatePRCP.csv')
 
 #%%
 
-# Lat lon bounding box for each basin
-BoundingBox = {'SNK':[[-114.8, -109.8], [42, 44.7]],
-                'PAY':[[-117, -115], [43.8, 45.2]],
-                'BOI':[[-117.1, -115.7], [43.4, 43.9]]}
-
+if __name__ == "__main__":
+    from BasinConfig import BoundingBox
 
-for BasinName in BoundingBox.keys():
-    climateClean(BasinName, BoundingBox[BasinName], f'../Data/Climate/{BasinName}')
+    for BasinName in BoundingBox.keys():
+        climateClean(BasinName, BoundingBox[BasinName], f'{Paths.Data}/Climate/{BasinName}')
 
 # %%
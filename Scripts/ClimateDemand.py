@@ -5,7 +5,8 @@ temperatures, and precipitation, as well as a list of river reaches and
 diversions.
 
 For each reach, it sums up the diversions, subtracts any recharge present, and
-removes leap days and negative values. It then finds the best fit climate
+removes leap days and negative values. Out of range days and spikes of each
+site are masked before the sum (see QualityControl.py). It then finds the best fit climate
 station for each reach by iterating through all stations and evaluating a
 Gradient Boosting Regressor model's performance.
 
@@ -18,132 +19,141 @@ for normalization of the target variable.
 """
 # %%
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from sklearn.metrics import r2_score
 
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import GradientBoostingRegressor
-from sklearn.metrics import r2_score
-from sklearn.preprocessing import QuantileTransformer
+# sklearn and plotly are imported where they are used, so that importing this
+# module (e.g. for observed_diversions) doesn't pay for them
 
-from sklearn.model_selection import GridSearchCV
+import copy
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-import plotly.graph_objects as go
+import Paths
+from DailyMatrix import Dtype, daily_frame, read_daily
+from Instrument import section
+from ModelRegistry import read_registry, save_registry
+from QualityControl import limits, screen_diversions, write_report
 
-import os
 
+# Stations of each reach cross validated after the single split screening
+CVStations = 5
 
-# Update this to the name of the basin
-BasinName = "PAY"
+# Boosting stages an incrementally updated model may grow to before it is fitted again
+MaxEstimators = 300
 
-# From USBR RiverWare Report
-Reaches = pd.read_csv("../Data/RiverWareReaches.csv")
 
-# Load weather data
-ClimateTMAX = pd.read_csv(f"../Outputs/{BasinName}/Climate/ClimateTMAX.csv", 
-                          index_col=0, parse_dates=True)
-ClimateTMIN = pd.read_csv(f"../Outputs/{BasinName}/Climate/ClimateTMIN.csv",
-                          index_col=0, parse_dates=True)
-ClimatePRCP = pd.read_csv(f"../Outputs/{BasinName}/Climate/ClimatePRCP.csv", 
-                          index_col=0, parse_dates=True)
+def ClimateStation(Station, ClimateTMAX, ClimateTMIN, ClimatePRCP):
+    Climate = pd.concat((ClimateTMAX[Station], ClimateTMIN[Station], ClimatePRCP[Station]), axis=1)
+    Climate.columns = ["TMAX", "TMIN", "PRCP"]
+    Climate["DayOfYear"] = Climate.index.dayofyear
 
-# Only use reaches the end with BasinName
-Reaches = Reaches[Reaches["RiverWare Reach"].str.contains(f"_{BasinName}")]
+    Climate["PRCP"] = Climate["PRCP"].rolling(7).mean()
 
+    return Climate
 
-# Create a dataframe to store observed diversions for each reach
-ObservedDiversions = pd.DataFrame(index=ClimateTMAX.index, 
-                                  columns=Reaches["RiverWare Reach"].unique()).fillna(0)
 
-# Sum up all diversions for each reach
-for Reach in Reaches["RiverWare Reach"].unique():
-    Diversions = pd.Series(index=ClimateTMAX.index, dtype=float).fillna(0)
+def read_site(path, index):
+    """Daily flow of an IDWR site on index and the number of repeated HSTDate rows, the first is kept."""
+    div_val = pd.read_csv(path, usecols=["HSTDate", "Flow (CFS)"], dtype={"Flow (CFS)": Dtype})
+    div_val.index = pd.to_datetime(div_val["HSTDate"])
+    Duplicated = div_val.index.duplicated()
+    div_val = div_val[~Duplicated]
+    return div_val["Flow (CFS)"].reindex(index).values, Duplicated.sum()
 
-    # Sum up all diversions for the given reach
-    for div in Reaches.loc[Reaches["RiverWare Reach"] == Reach, "IDWR Site Code"]:
-        try:
-            div_val = pd.read_csv(f"../Data/Diversions/{Reach}/{div}.csv", engine="python")
-            div_val.index = pd.to_datetime(div_val["HSTDate"])
-            div_val = div_val[~div_val.index.duplicated()]
-            div_val = div_val["Flow (CFS)"].reindex(ClimateTMAX.index).clip(lower=0).fillna(0)
-            Diversions += div_val.values
 
-        except FileNotFoundError:
-            print(f"No diversion data for {Reach} {div}")
-            continue
+def site_diversions(Reaches, index):
+    """
+    Daily flow of every IDWR site of the reaches, with a (reach, site) column
+    for each site, and the number of repeated HSTDate rows of each site.
+    Missing days are NaN.
+    """
+    Columns = []
+    Values = []
+    Duplicates = []
 
-    # Subtract out non-irrigation diversions
-    try:
-        rech = pd.read_csv(
-            f"../Data/Diversions/{Reach}/NonIrr.csv", index_col=0, parse_dates=True
-        )
-        Diversions -= rech.reindex(Diversions.index).fillna(0).values.flatten()
-    except FileNotFoundError:
-        pass
+    for Reach in Reaches["RiverWare Reach"].unique():
+        for div in Reaches.loc[Reaches["RiverWare Reach"] == Reach, "IDWR Site Code"]:
+            try:
+                Flow, Duplicated = read_site(f"{Paths.Data}/Diversions/{Reach}/{div}.csv", index)
 
-    # Set values outside irrigation season to 0
-    Diversions[Diversions.index.dayofyear < 61] = 0
+            except FileNotFoundError:
+                print(f"No diversion data for {Reach} {div}")
+                continue
 
-    # Reindex to 1980 - 2018
-    Diversions = Diversions.reindex(pd.date_range(datetime(1980, 1, 1), datetime(2018, 12, 31)))
+            Columns.append((Reach, div))
+            Values.append(Flow)
+            Duplicates.append(Duplicated)
 
-    # Remove leap days and negative values
-    Diversions = Diversions.clip(lower=0).fillna(0)
-    Diversions = Diversions[~((Diversions.index.month == 2) & (Diversions.index.day == 29))]
+    Columns = pd.MultiIndex.from_tuples(Columns, names=["Reach", "Site"])
+    Values = np.column_stack(Values) if Values else np.empty((len(index), 0), dtype=Dtype)
 
-    ObservedDiversions[Reach] += Diversions
+    return pd.DataFrame(Values, index=index, columns=Columns), pd.Series(Duplicates, index=Columns, dtype=int)
 
 
-# Find all columns with data for ClimateTMAX, ClimateTMIN, ClimatePRCP
-cols = list(set(ClimateTMAX.columns)
-    .intersection(ClimateTMIN.columns)
-    .intersection(ClimatePRCP.columns))
+def observed_diversions(Reaches, index, Sites=None):
+    """
+    Sum the IDWR diversions of each reach, less any non-irrigation diversions.
+    Sites are the site flows from site_diversions, e.g. after the quality
+    control, by default they are read here.
+    """
+    ReachNames = Reaches["RiverWare Reach"].unique()
 
+    if Sites is None:
+        Sites, _ = site_diversions(Reaches, index)
 
-DiversionTotal = pd.DataFrame(index=ClimateTMAX.index)
+    # Negative and missing days are 0, then sum up all diversions for each reach
+    Sites = Sites.clip(lower=0).fillna(0)
+    ObservedDiversions = (Sites.T.groupby(level="Reach").sum().T
+                          .reindex(columns=ReachNames, fill_value=0).to_numpy(dtype=Dtype, copy=True))
 
-ModelResults = []
+    for i, Reach in enumerate(ReachNames):
+        Diversions = ObservedDiversions[:, i]
 
-for Reach in ObservedDiversions.columns:
+        # Subtract out non-irrigation diversions
+        try:
+            rech = pd.read_csv(
+                f"{Paths.Data}/Diversions/{Reach}/NonIrr.csv", index_col=0, parse_dates=True
+            )
+            Diversions -= rech.reindex(index).fillna(0).values.flatten().astype(Dtype)
+        except FileNotFoundError:
+            pass
 
-    Diversions = ObservedDiversions[Reach].copy()
+        # Set values outside irrigation season to 0 and remove negative values
+        Diversions[index.dayofyear < 61] = 0
+        np.clip(Diversions, 0, None, out=Diversions)
 
-    if Diversions.mean()<10:
-        MedianDiv = ObservedDiversions.loc[ObservedDiversions[Reach]>0, Reach]
-        MedianDiv = MedianDiv.groupby(MedianDiv.index.dayofyear).median()
-        for i in MedianDiv.index:
-            DiversionTotal.loc[DiversionTotal.index.dayofyear == i, Reach] = MedianDiv.loc[i]
-        DiversionTotal[Reach] = DiversionTotal[Reach].fillna(0)
-        DiversionTotal = DiversionTotal.copy()
-        continue
+    # Only 1980 - 2018 without leap days are observed
+    Observed = ((index >= datetime(1980, 1, 1)) & (index <= datetime(2018, 12, 31))
+                & ~((index.month == 2) & (index.day == 29)))
+    ObservedDiversions[~Observed] = np.nan
+
+    return pd.DataFrame(ObservedDiversions, index=index, columns=ReachNames)
+
+
+def find_best_station(Diversions, Stations, ClimateTMAX, ClimateTMIN, ClimatePRCP, Years):
+    """
+    Fit a model of Diversions against every climate station in Stations and
+    return the station with the best test R2, the R2, the fitted model and its
+    QuantileTransformer.
+    """
+    from sklearn.ensemble import GradientBoostingRegressor
+    from sklearn.metrics import r2_score
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import QuantileTransformer
 
     rMax = 0
     colMax = ""
     rfFit = None
+    qtFit = None
 
     # Iterate through all climate stations to find best fit
-    for Station in cols:
-
-        def ClimateStation(Station):
-            Climate = pd.concat((ClimateTMAX[Station], ClimateTMIN[Station], ClimatePRCP[Station]), axis=1)
-            Climate.columns = ["TMAX", "TMIN", "PRCP"]
-            Climate["DayOfYear"] = Climate.index.dayofyear
-
-            Climate["PRCP"] = Climate["PRCP"].rolling(7).mean()
-
-            return Climate
+    for Station in Stations:
 
-        Climate = ClimateStation(Station)
+        Climate = ClimateStation(Station, ClimateTMAX, ClimateTMIN, ClimatePRCP)
     
-        # Years that have have a full water supply
-        if BasinName == "SNK":
-            Years = [2010, 2012, 2014, 2017]
-        elif BasinName == "BOI":
-            Years = [2011, 2012, 2016, 2017, 2018]
-        elif BasinName == "PAY":
-            Years = [2011, 2017, 2018]
-
         ClimateYear = Climate[[year in Years for year in Climate.index.year]]
 
         ClimateYear = ClimateYear.interpolate(limit=10).dropna()
@@ -172,37 +182,447 @@ for Reach in ObservedDiversions.columns:
             rMax = r2_score(TestDiv, TestPred)
             colMax = Station
             rfFit = rf
+            qtFit = qt
+
+    return colMax, rMax, rfFit, qtFit
+
+
+def update_model(Diversions, Entry, ClimateTMAX, ClimateTMIN, ClimatePRCP, Years, extra_stages=50,
+                 refit=False):
+    """
+    Extend the registry Entry's model with extra_stages boosting stages fitted
+    on Years, split 70/30 as in find_best_station, keeping its station. The
+    QuantileTransformer is fitted again on Years and the new stages correct
+    the old ones for it. refit fits a new model on the station instead.
+    Returns the model, its QuantileTransformer and its test R2.
+    """
+    from sklearn.ensemble import GradientBoostingRegressor
+    from sklearn.metrics import r2_score
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import QuantileTransformer
+
+    Climate = ClimateStation(Entry["Station"], ClimateTMAX, ClimateTMIN, ClimatePRCP)
+    ClimateYear = Climate[[year in Years for year in Climate.index.year]]
+    ClimateYear = ClimateYear.interpolate(limit=10).dropna()
+
+    qt = QuantileTransformer(n_quantiles=10)
+    DiversionsYear = Diversions.reindex(ClimateYear.index).fillna(0)
+    DiversionsYear = qt.fit_transform(DiversionsYear.values.reshape(-1, 1)).flatten()
+
+    TrainClimate, TestClimate, TrainDiv, TestDiv = train_test_split(ClimateYear, DiversionsYear,
+                                                                    test_size=0.3, shuffle=False)
+
+    if refit:
+        rf = GradientBoostingRegressor(n_estimators=100, max_depth=3)
+        rf.fit(TrainClimate, TrainDiv)
+    else:
+        # The new stages are fitted to the residuals of the current ones
+        rf = copy.deepcopy(Entry["Model"])
+        rf.set_params(warm_start=True, n_estimators=rf.n_estimators + extra_stages)
+        rf.fit(TrainClimate, TrainDiv)
+        rf.set_params(warm_start=False)
+
+    TestPred = qt.inverse_transform(rf.predict(TestClimate).reshape(-1, 1)).flatten()
+    TestDiv = qt.inverse_transform(TestDiv.reshape(-1, 1)).flatten()
+
+    return rf, qt, r2_score(TestDiv, np.nan_to_num(TestPred))
+
+
+def update_models(Diversions, Previous, Stations, ClimateTMAX, ClimateTMIN, ClimatePRCP, Years,
+                  margin=0.05, extra_stages=50):
+    """
+    Update the models of the Previous registry for Years instead of searching
+    the stations again. For each reach in Diversions:
+
+    Kept     no years were added, the model is kept as it is
+    Updated  the model was extended with extra boosting stages on Years and
+             its test R2 is within margin of the R2 it had
+    Refit    as Updated, but the extra stages would take the model past
+             MaxEstimators so a new one was fitted on its station
+    Search   the update lost more than margin of R2, or there is no model to
+             update (a new reach, a station that was dropped, years that
+             were removed or a registry without SplitR2), so the stations
+             are searched again
+
+    The R2 before and after are both the R2 of the single 70/30 split, the
+    SplitR2 of the registry, whether or not the models were cross validated.
+
+    Returns {Reach: update} with the model and timing of every Kept, Updated
+    or Refit reach and the Mode and R2 of the others. Stations are the
+    stations each reach can use, {Reach: [Station]}.
+    """
+    Added = sorted(set(Years) - set(Previous["Years"]))
+    Removed = set(Previous["Years"]) - set(Years)
+
+    Updates = {}
+    for Reach, Div in Diversions.items():
+        Entry = Previous["Reaches"].get(Reach, {})
+        Update = {"Mode": "Search", "Station": Entry.get("Station"), "R2 Before": Entry.get("SplitR2"),
+                  "Full Search Seconds": Entry.get("SearchSeconds"), "Update Seconds": 0.0}
+        Updates[Reach] = Update
+
+        if Entry.get("Station") not in Stations[Reach] or Removed or Entry.get("SplitR2") is None:
+            continue
+
+        if not Added:
+            Update.update(Entry, Mode="Kept", **{"R2 After": Entry["SplitR2"]})
+            continue
+
+        refit = Entry["Model"].n_estimators + extra_stages > MaxEstimators
+
+        start = time.perf_counter()
+        with section("Model update", Reach=Reach, Years=len(Added), Refit=refit):
+            rf, qt, r2 = update_model(Div, Entry, ClimateTMAX, ClimateTMIN, ClimatePRCP, Years, extra_stages,
+                                      refit)
+        Update.update({"R2 After": r2, "Update Seconds": time.perf_counter() - start})
+
+        if r2 >= Entry["SplitR2"] - margin:
+            Update.update({"Mode": "Refit" if refit else "Updated", "Model": rf, "Transformer": qt, "R2": r2,
+                           "SplitR2": r2, "SearchSeconds": Entry["SearchSeconds"],
+                           "UpdateSeconds": Update["Update Seconds"]})
+
+    return Updates
+
+
+def station_features(Stations, ClimateTMAX, ClimateTMIN, ClimatePRCP, Years):
+    """
+    Model features of every station on the full supply Years, as in
+    find_best_station, and a mask of the test rows of each year (the folds)
+    and, under None, of the last 30% of the rows (the single split of
+    find_best_station). These are computed once and shared by the search of
+    every reach.
+    """
+    Features = {}
+    Folds = {}
+
+    for Station in Stations:
+        Climate = ClimateStation(Station, ClimateTMAX, ClimateTMIN, ClimatePRCP)
+        ClimateYear = Climate[[year in Years for year in Climate.index.year]]
+        ClimateYear = ClimateYear.interpolate(limit=10).dropna()
+
+        Features[Station] = (ClimateYear.index, ClimateYear.values)
+        Folds[Station] = {year: ClimateYear.index.year == year for year in Years}
+        Folds[Station][None] = np.arange(len(ClimateYear)) >= len(ClimateYear) - np.ceil(0.3 * len(ClimateYear))
+
+    return Features, Folds
+
+
+# Features, folds and diversions shared with each worker process once
+_Shared = {}
+
+
+def _init_cv(Features, Folds, Diversions):
+    _Shared.update(Features=Features, Folds=Folds, Diversions=Diversions)
+
+
+def _fold_score(task):
+    """Test R2 of the model of Reach on Station trained without Year (the last 30% of the rows if None)."""
+    from sklearn.ensemble import GradientBoostingRegressor
+    from sklearn.metrics import r2_score
+    from sklearn.preprocessing import QuantileTransformer
+
+    Reach, Station, Year = task
+    start = time.perf_counter()
+
+    index, X = _Shared["Features"][Station]
+    y = _Shared["Diversions"][Reach].reindex(index).fillna(0).values
+    Test = _Shared["Folds"][Station][Year]
+
+    if Test.all() or not Test.any():
+        return Reach, Station, Year, np.nan, time.perf_counter() - start
+
+    qt = QuantileTransformer(n_quantiles=10)
+    TrainDiv = qt.fit_transform(y[~Test].reshape(-1, 1)).flatten()
+
+    rf = GradientBoostingRegressor(n_estimators=100, max_depth=3)
+    rf.fit(X[~Test], TrainDiv)
+
+    TestPred = qt.inverse_transform(rf.predict(X[Test]).reshape(-1, 1)).flatten()
+
+    return Reach, Station, Year, r2_score(y[Test], TestPred), time.perf_counter() - start
 
-    print(f"Reach: {Reach}")
-    print(f"Max R2: {rMax}")
-    print(f"Column: {colMax}")
-    Climate = ClimateStation(colMax)
-    MissPred = rfFit.predict(Climate.dropna())
-    MissPred = qt.inverse_transform(MissPred.reshape(-1, 1)).flatten()
-    MissPred = pd.Series(data=MissPred, index=Climate.dropna().index).fillna(0)
-    MissPred = MissPred.reindex(DiversionTotal.index).fillna(0)
-
-    # if folder doesn't exist, create it
-    if not os.path.exists(f"../Outputs/{BasinName}/Figures/ModeledDiversions"):
-        os.makedirs(f"../Outputs/{BasinName}/Figures/ModeledDiversions")
-
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=MissPred.index, y=MissPred, name="Modeled Full Water Supply Demand"))
-    fig.add_trace(go.Scatter(x=ObservedDiversions.index, y=ObservedDiversions[Reach], name="Observed Demand"))
-    fig.update_layout(title=f"{Reach} Modeled vs Observed Diversions", xaxis_title="Date", yaxis_title="Diversions (cfs)")
-    fig.write_html(f"../Outputs/{BasinName}/Figures/ModeledDiversions/{Reach}ModeledDiversions.html")
-
-    DiversionSum = Diversions.resample("1Y").sum().mean() * 1.9835
-    ModelResults.append([Reach, colMax, rMax, DiversionSum])
-
-    DiversionTotal[Reach] = MissPred
-    DiversionTotal = DiversionTotal.copy()
-
-ModelResults = pd.DataFrame(
-    ModelResults,
-    columns=["Reach", "Climate Station", "R2 Test", "Annual Diversion (AF)"],
-)
-ModelResults.to_csv(f"../Outputs/{BasinName}/ClimateRegressionResults.csv")
-DiversionTotal.to_csv(f"../Outputs/{BasinName}/ReachDiversions.csv")
-ObservedDiversions.to_csv(f"../Outputs/{BasinName}/ObservedDiversions.csv")
 
+def cross_validate_stations(Diversions, Stations, ClimateTMAX, ClimateTMIN, ClimatePRCP, Years, max_workers=None,
+                            top=CVStations):
+    """
+    Leave-one-year-out search for the best station of every reach. Diversions
+    is a dictionary of the diversions of each reach and Stations of the
+    stations it can use. Every station of a reach is first screened on the
+    single 70/30 split, then a (reach, station, held out year) model is
+    fitted for the top stations of each reach on a process pool, and the
+    station with the best mean test R2 over the years is refitted on all of
+    them. A reach none of whose stations can be scored falls back to
+    find_best_station. The wall time of the pool is shared out between the
+    reaches by the time their models took.
+
+    Returns {Reach: (Station, mean R2, model, QuantileTransformer, {Year: R2}, split R2, seconds)}.
+    """
+    from sklearn.ensemble import GradientBoostingRegressor
+    from sklearn.preprocessing import QuantileTransformer
+
+    if len(Years) < 2:
+        raise ValueError("Leave-one-year-out cross validation needs at least two full supply Years")
+
+    Features, Folds = station_features(sorted(set().union(*(Stations[Reach] for Reach in Diversions))),
+                                       ClimateTMAX, ClimateTMIN, ClimatePRCP, Years)
+
+    Seconds = {Reach: 0.0 for Reach in Diversions}
+
+    def run(pool, Tasks):
+        chunksize = max(1, len(Tasks) // (4 * (max_workers or os.cpu_count() or 1)))
+        for Reach, Station, Year, r2, seconds in pool.map(_fold_score, Tasks, chunksize=chunksize):
+            Seconds[Reach] += seconds
+            yield Reach, Station, Year, r2
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_cv,
+                             initargs=(Features, Folds, Diversions)) as pool:
+        # Only the top stations of the single split are worth a model per year
+        Screen = {Reach: {} for Reach in Diversions}
+        for Reach, Station, _, r2 in run(pool, [(Reach, Station, None) for Reach in Diversions
+                                                for Station in Stations[Reach]]):
+            if not np.isnan(r2):
+                Screen[Reach][Station] = r2
+        Top = {Reach: sorted(Screen[Reach], key=Screen[Reach].get, reverse=True)[:top] for Reach in Diversions}
+
+        Scores = {Reach: {Station: {} for Station in Top[Reach]} for Reach in Diversions}
+        for Reach, Station, Year, r2 in run(pool, [(Reach, Station, Year) for Reach in Diversions
+                                                   for Station in Top[Reach] for Year in Years]):
+            Scores[Reach][Station][Year] = r2
+
+    # The workers' seconds add up to more than the wall time of the pool
+    Wall = time.perf_counter() - start
+    Total = sum(Seconds.values())
+    Seconds = {Reach: seconds * Wall / Total if Total else Wall / len(Seconds) for Reach, seconds in Seconds.items()}
+
+    Results = {}
+    for Reach in Diversions:
+        Mean = {Station: np.nanmean(list(Scores[Reach][Station].values()))
+                for Station in Top[Reach] if not np.isnan(list(Scores[Reach][Station].values())).all()}
+
+        if not Mean:
+            print(f"No station of {Reach} could be cross validated, using the single split")
+            start = time.perf_counter()
+            colMax, rMax, rf, qt = find_best_station(Diversions[Reach], Stations[Reach], ClimateTMAX, ClimateTMIN,
+                                                     ClimatePRCP, Years)
+            Results[Reach] = (colMax, rMax, rf, qt, {}, rMax, Seconds[Reach] + time.perf_counter() - start)
+            continue
+
+        colMax = max(Mean, key=Mean.get)
+
+        # Refit the selected station on every full supply year
+        start = time.perf_counter()
+        index, X = Features[colMax]
+        y = Diversions[Reach].reindex(index).fillna(0).values
+        ClimateYear = pd.DataFrame(X, index=index, columns=["TMAX", "TMIN", "PRCP", "DayOfYear"])
+
+        qt = QuantileTransformer(n_quantiles=10)
+        rf = GradientBoostingRegressor(n_estimators=100, max_depth=3)
+        rf.fit(ClimateYear, qt.fit_transform(y.reshape(-1, 1)).flatten())
+
+        Results[Reach] = (colMax, Mean[colMax], rf, qt, Scores[Reach][colMax], Screen[Reach][colMax],
+                          Seconds[Reach] + time.perf_counter() - start)
+
+    return Results
+
+
+def climateDemand(BasinName, Years, cross_validate=False, max_workers=None, incremental=False,
+                  margin=0.05, extra_stages=50, quality_control=True, thresholds=None, spatial=False):
+    """
+    Fit the full water supply demand model for every reach in BasinName.
+
+    Years are the years with a full water supply, the models are only trained
+    on those years.
+
+    By default the station of each reach is picked on a single 70/30 split of
+    those years. cross_validate picks it on the mean R2 of leave-one-year-out
+    folds of the CVStations best stations of that split instead, run on a
+    pool of max_workers processes, and adds the R2 of each held out year to
+    ClimateRegressionResults.csv.
+
+    incremental keeps the stations of the saved ModelRegistry and extends
+    their models for the years added since (see update_models), searching
+    again only the reaches whose R2 drops by more than margin. The mode, R2
+    and time saved against the last full search of each reach are written
+    to IncrementalUpdate.csv.
+
+    quality_control masks the suspect days of the IDWR sites before they are
+    summed into reaches, with the QualityControl.Thresholds updated by
+    thresholds, and writes QualityControlDiversions.csv.
+
+    spatial models each reach in Data/ReachLocations.csv on the climate
+    interpolated from the stations around it (see SpatialClimate.py) instead
+    of searching for its best station. Without the StationLocations.csv of
+    ClimateClean or Data/ReachLocations.csv every reach is searched.
+    """
+    # From USBR RiverWare Report
+    Reaches = pd.read_csv(f"{Paths.Data}/RiverWareReaches.csv")
+
+    # Load weather data
+    with section("Read climate"):
+        ClimateTMAX = read_daily(f"{Paths.Outputs}/{BasinName}/Climate/ClimateTMAX.csv")
+        ClimateTMIN = read_daily(f"{Paths.Outputs}/{BasinName}/Climate/ClimateTMIN.csv")
+        ClimatePRCP = read_daily(f"{Paths.Outputs}/{BasinName}/Climate/ClimatePRCP.csv")
+
+    # Only use reaches the end with BasinName
+    Reaches = Reaches[Reaches["RiverWare Reach"].str.contains(f"_{BasinName}")]
+
+
+    with section("Observed diversions"):
+        Sites, Duplicates = site_diversions(Reaches, ClimateTMAX.index)
+
+    if quality_control:
+        with section("Quality control", Sites=Sites.shape[1]):
+            Sites, Report = screen_diversions(Sites, Duplicates, limits(thresholds))
+            write_report(Report, f"{Paths.Outputs}/{BasinName}/QualityControlDiversions.csv")
+
+    ObservedDiversions = observed_diversions(Reaches, ClimateTMAX.index, Sites)
+
+    # Find all columns with data for ClimateTMAX, ClimateTMIN, ClimatePRCP
+    cols = list(set(ClimateTMAX.columns)
+        .intersection(ClimateTMIN.columns)
+        .intersection(ClimatePRCP.columns))
+
+    # The climate series each reach's model can use
+    Candidates = {Reach: cols for Reach in ObservedDiversions.columns}
+
+    # Both the station and the reach locations are needed to interpolate
+    for path in [f"{Paths.Outputs}/{BasinName}/Climate/StationLocations.csv", f"{Paths.Data}/ReachLocations.csv"]:
+        if spatial and not os.path.exists(path):
+            print(f"No {path}, searching the stations of every reach")
+            spatial = False
+
+    if spatial:
+        from SpatialClimate import reach_climate
+
+        with section("Spatial climate", Reaches=len(Candidates)):
+            ReachClimate = reach_climate(BasinName, ClimateTMAX, ClimateTMIN, ClimatePRCP, ObservedDiversions.columns)
+
+        # The reach series are added as columns named by the reach
+        ClimateTMAX, ClimateTMIN, ClimatePRCP = [pd.concat([Climate, Reach], axis=1) for Climate, Reach
+                                                 in zip([ClimateTMAX, ClimateTMIN, ClimatePRCP], ReachClimate)]
+        Candidates.update({Reach: [Reach] for Reach in ReachClimate[0].columns})
+
+        for Reach in ObservedDiversions.columns.difference(ReachClimate[0].columns):
+            print(f"No location for {Reach} in ReachLocations.csv, searching the stations")
+
+
+    DiversionTotal = daily_frame(ClimateTMAX.index, ObservedDiversions.columns)
+
+    ModelResults = []
+
+    # Selected model of each reach, saved for DemandService.py
+    Models = {}
+
+    Modeled = {Reach: ObservedDiversions[Reach] for Reach in ObservedDiversions.columns
+               if ObservedDiversions[Reach].mean() >= 10}
+
+    # Update the saved models, the reaches that need it are searched below
+    Updates = {}
+    Previous = read_registry(BasinName) if incremental else None
+    if Previous is not None:
+        Updates = update_models(Modeled, Previous, Candidates, ClimateTMAX, ClimateTMIN, ClimatePRCP, Years,
+                                margin, extra_stages)
+        Modeled = {Reach: Div for Reach, Div in Modeled.items() if Updates[Reach]["Mode"] == "Search"}
+
+    # Search every reach with enough diversion at once on the process pool
+    if cross_validate:
+        with section("Station search CV", Reaches=len(Modeled), Stations=len(cols), Folds=len(Years)):
+            CrossValidated = cross_validate_stations(Modeled, Candidates, ClimateTMAX, ClimateTMIN, ClimatePRCP,
+                                                     Years, max_workers)
+
+    for Reach in ObservedDiversions.columns:
+
+        Diversions = ObservedDiversions[Reach].copy()
+
+        # As in Modeled, a reach without any diversions (NaN mean) isn't modeled
+        if not Diversions.mean() >= 10:
+            MedianDiv = ObservedDiversions.loc[ObservedDiversions[Reach]>0, Reach]
+            MedianDiv = MedianDiv.groupby(MedianDiv.index.dayofyear).median()
+            DiversionTotal[Reach] = MedianDiv.reindex(DiversionTotal.index.dayofyear).fillna(0).values.astype(Dtype)
+            Models[Reach] = {"Station": None, "Median": MedianDiv}
+            continue
+
+        FoldScores = {}
+        Update = Updates.get(Reach, {})
+        if Update.get("Mode") in ["Kept", "Updated", "Refit"]:
+            colMax, rMax, rfFit, qt = Update["Station"], Update["R2"], Update["Model"], Update["Transformer"]
+            SplitR2, SearchSeconds = Update["SplitR2"], Update["SearchSeconds"]
+        elif cross_validate:
+            colMax, rMax, rfFit, qt, FoldScores, SplitR2, SearchSeconds = CrossValidated[Reach]
+        else:
+            start = time.perf_counter()
+            with section("Station search", Reach=Reach, Stations=len(Candidates[Reach])):
+                colMax, rMax, rfFit, qt = find_best_station(Diversions, Candidates[Reach], ClimateTMAX, ClimateTMIN,
+                                                            ClimatePRCP, Years)
+            SplitR2, SearchSeconds = rMax, time.perf_counter() - start
+
+        Models[Reach] = {"Station": colMax, "Model": rfFit, "Transformer": qt, "R2": rMax, "SplitR2": SplitR2,
+                         "SearchSeconds": SearchSeconds, "UpdateSeconds": Update.get("Update Seconds")}
+
+        if Update.get("Mode") == "Search":
+            Update.update({"Station": colMax, "R2 After": SplitR2,
+                           "Update Seconds": Update["Update Seconds"] + SearchSeconds})
+
+        print(f"Reach: {Reach}")
+        print(f"Max R2: {rMax}")
+        print(f"Column: {colMax}")
+        Climate = ClimateStation(colMax, ClimateTMAX, ClimateTMIN, ClimatePRCP)
+        MissPred = rfFit.predict(Climate.dropna())
+        MissPred = qt.inverse_transform(MissPred.reshape(-1, 1)).flatten()
+        MissPred = pd.Series(data=MissPred, index=Climate.dropna().index).fillna(0)
+        MissPred = MissPred.reindex(DiversionTotal.index).fillna(0)
+
+        with section("Figure", Reach=Reach):
+            import plotly.graph_objects as go
+
+            # if folder doesn't exist, create it
+            if not os.path.exists(f"{Paths.Outputs}/{BasinName}/Figures/ModeledDiversions"):
+                os.makedirs(f"{Paths.Outputs}/{BasinName}/Figures/ModeledDiversions")
+
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=MissPred.index, y=MissPred, name="Modeled Full Water Supply Demand"))
+            fig.add_trace(go.Scatter(x=ObservedDiversions.index, y=ObservedDiversions[Reach], name="Observed Demand"))
+            fig.update_layout(title=f"{Reach} Modeled vs Observed Diversions", xaxis_title="Date", yaxis_title="Diversions (cfs)")
+            fig.write_html(f"{Paths.Outputs}/{BasinName}/Figures/ModeledDiversions/{Reach}ModeledDiversions.html")
+
+        DiversionSum = Diversions.resample("1Y").sum().mean() * 1.9835
+        ModelResults.append([Reach, colMax, rMax, DiversionSum] + [FoldScores.get(year) for year in Years])
+
+        DiversionTotal[Reach] = MissPred.astype(Dtype)
+
+    ModelResults = pd.DataFrame(
+        ModelResults,
+        columns=["Reach", "Climate Station", "R2 Test", "Annual Diversion (AF)"] + [f"R2 {year}" for year in Years],
+    )
+
+    # Per fold scores only come from the cross validation
+    if not cross_validate:
+        ModelResults = ModelResults.iloc[:, :4]
+    with section("Write files"):
+        ModelResults.to_csv(f"{Paths.Outputs}/{BasinName}/ClimateRegressionResults.csv")
+        DiversionTotal.to_csv(f"{Paths.Outputs}/{BasinName}/ReachDiversions.csv")
+        ObservedDiversions.to_csv(f"{Paths.Outputs}/{BasinName}/ObservedDiversions.csv")
+        save_registry(BasinName, Models, Years)
+
+        if Updates:
+            Report = pd.DataFrame.from_dict(Updates, orient="index")[
+                ["Mode", "Station", "R2 Before", "R2 After", "Update Seconds", "Full Search Seconds"]]
+            Numbers = ["R2 Before", "R2 After", "Update Seconds", "Full Search Seconds"]
+            Report[Numbers] = Report[Numbers].astype(float)
+            Report["Seconds Saved"] = Report["Full Search Seconds"] - Report["Update Seconds"]
+            Report.rename_axis("Reach").to_csv(f"{Paths.Outputs}/{BasinName}/IncrementalUpdate.csv")
+
+    if Updates:
+        print(Report["Mode"].value_counts().to_string())
+        print(f"Incremental update {Report['Update Seconds'].sum():.1f} s, "
+              f"saved {Report['Seconds Saved'].sum():.1f} s against a full search")
+
+
+if __name__ == "__main__":
+    from BasinConfig import Years
+
+    # Update this to the name of the basin
+    BasinName = "PAY"
+
+    climateDemand(BasinName, Years[BasinName])
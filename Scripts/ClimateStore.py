@@ -0,0 +1,373 @@
+"""
+Out-of-core climate processing for regional basins
+
+ClimateClean.climate_pivot and climate_fill hold every station's full daily
+record as wide frames and copy them through replace, pivot_table, dropna
+and interpolate. For a bounding box with thousands of stations this mode
+keeps the date x station matrices on disk instead, as .npy files in a store
+folder opened with np.memmap, and works on them a block at a time:
+
+store_pivot    reads the station files one at a time, converting the units,
+               masking the -9999 values and dropping the days before 1980
+               as climate_pivot does, into per variable matrices. Each
+               station is stored contiguously (Fortran order) so a block of
+               stations is one read.
+store_screen   the quality control of QualityControl.py, a block of
+               stations at a time.
+store_fill     the donor regression fill of climateInterpolate, twice, then
+               the linear interpolation, ffill and bfill of climate_fill.
+               The donor choice needs, for every pair of stations, the
+               count, sums, sums of squares and cross products over the
+               days both have values. These are built once from blocks of
+               days and updated from the filled days after each station is
+               filled, so the sequential fill gives the same donors and
+               values as the in-memory loop with memory bounded by the
+               number of stations squared rather than the record length.
+store_prcp     drops the stations missing more than 10% of the precipitation
+               record and fills the rest with 0.
+write_csv      writes a matrix to CSV a block of days at a time.
+
+The CSVs are the same as the in-memory path up to float rounding in the
+regression fill.
+"""
+# %%
+import os
+import shutil
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from numpy.lib.format import open_memmap
+
+import Paths
+from DailyMatrix import Dtype
+from Instrument import section
+from QualityControl import limits, screen_climate, write_report
+
+
+Variables = ["TMAX", "TMIN", "PRCP"]
+
+# Days and stations read at once
+DayBlock = 4096
+StationBlock = 256
+
+
+def create_matrix(store, name, dates, stations, dtype=None):
+    """Days x stations matrix on disk, zero filled, stored station by station."""
+    np.save(os.path.join(store, f"{name}Dates.npy"), np.asarray(dates, dtype="datetime64[ns]"))
+    np.save(os.path.join(store, f"{name}Stations.npy"), np.asarray(stations, dtype=str))
+
+    return open_memmap(os.path.join(store, f"{name}.npy"), mode="w+", dtype=dtype or Dtype,
+                       shape=(len(dates), len(stations)), fortran_order=True)
+
+
+def open_matrix(store, name, mode="r+"):
+    """Matrix, dates and stations of a matrix in the store."""
+    X = np.load(os.path.join(store, f"{name}.npy"), mmap_mode=mode)
+    dates = pd.DatetimeIndex(np.load(os.path.join(store, f"{name}Dates.npy")), name="DATE")
+    stations = list(np.load(os.path.join(store, f"{name}Stations.npy")))
+
+    return X, dates, stations
+
+
+def remove_matrix(store, name):
+    for suffix in ["", "Dates", "Stations"]:
+        os.remove(os.path.join(store, f"{name}{suffix}.npy"))
+
+
+def blocks(n, size):
+    for start in range(0, n, size):
+        yield slice(start, min(start + size, n))
+
+
+def compact(store, name, Sum, Count, dates, stations):
+    """Write Sum / Count as name without the days and stations that have no values."""
+    Rows = np.zeros(len(dates), dtype=bool)
+    Cols = np.zeros(len(stations), dtype=bool)
+
+    for b in blocks(len(stations), StationBlock):
+        Present = Count[:, b] > 0
+        Rows |= Present.any(axis=1)
+        Cols[b] = Present.any(axis=0)
+
+    Rows, Cols = np.flatnonzero(Rows), np.flatnonzero(Cols)
+    X = create_matrix(store, name, dates[Rows], [stations[j] for j in Cols])
+
+    for b in blocks(len(Cols), StationBlock):
+        j = Cols[b]
+        with np.errstate(invalid="ignore"):
+            X[:, b] = (Sum[:, j] / Count[:, j])[Rows]
+
+    X.flush()
+
+
+def store_pivot(file_dir, store, end=None):
+    """
+    climate_pivot into the store. Values of stations sharing a NAME (or of
+    repeated days) are averaged as in the pivot table.
+    """
+    if not os.path.exists(store):
+        os.makedirs(store)
+
+    Files = sorted(os.listdir(file_dir))
+    Names = [pd.read_csv(os.path.join(file_dir, file), usecols=["NAME"], nrows=1)["NAME"].iloc[0] for file in Files]
+    stations = sorted(set(Names))
+    Column = {name: j for j, name in enumerate(stations)}
+
+    dates = pd.date_range("1980-01-01", end or f"{datetime.now().year}-12-31", freq="D")
+
+    Sum = {var: create_matrix(store, f"Sum{var}", dates, stations, dtype=np.float64) for var in Variables}
+    Count = {var: create_matrix(store, f"Count{var}", dates, stations, dtype=np.uint16) for var in Variables}
+
+    Columns = ["NAME", "DATE"] + Variables
+    for file, name in zip(Files, Names):
+        df = pd.read_csv(os.path.join(file_dir, file), usecols=lambda col: col in Columns,
+                         dtype={var: Dtype for var in Variables})
+        df = df.reindex(columns=Columns)
+
+        # Same order of operations as climate_pivot
+        df["PRCP"] = df["PRCP"] / 254
+        df["TMAX"] = df["TMAX"] / 10 * 9/5 + 32
+        df["TMIN"] = df["TMIN"] / 10 * 9/5 + 32
+        df[Variables] = df[Variables].replace(-9999, np.nan).astype(Dtype)
+
+        rows = (pd.to_datetime(df["DATE"]) - dates[0]).dt.days.values
+        keep = (rows >= 0) & (rows < len(dates))
+        j = Column[name]
+
+        for var in Variables:
+            values = df[var].values[keep]
+            present = ~np.isnan(values)
+            np.add.at(Sum[var][:, j], rows[keep][present], values[present])
+            np.add.at(Count[var][:, j], rows[keep][present], 1)
+
+    for var in Variables:
+        compact(store, var, Sum[var], Count[var], dates, stations)
+        del Sum[var], Count[var]
+        remove_matrix(store, f"Sum{var}")
+        remove_matrix(store, f"Count{var}")
+
+
+def store_matrix(path, store, name, chunksize=DayBlock):
+    """Copy a date x station CSV matrix (e.g. from GHCNdArchive.py) into the store a block of days at a time."""
+    if not os.path.exists(store):
+        os.makedirs(store)
+
+    stations = list(pd.read_csv(path, index_col=0, nrows=0).columns)
+    dates = pd.DatetimeIndex(pd.read_csv(path, usecols=[0], parse_dates=[0]).iloc[:, 0])
+
+    X = create_matrix(store, name, dates, stations)
+    start = 0
+    for chunk in pd.read_csv(path, index_col=0, dtype={col: Dtype for col in stations}, chunksize=chunksize):
+        X[start:start + len(chunk)] = chunk.values
+        start += len(chunk)
+
+    X.flush()
+
+
+def pair_stats(X, n):
+    """
+    For every pair of stations (i, j) over the first n days where both have
+    values: the count N, the sum of i S, the sum of squares of i Q and the
+    sum of i times j P.
+    """
+    k = X.shape[1]
+    N, S, Q, P = [np.zeros((k, k)) for _ in range(4)]
+
+    for b in blocks(n, DayBlock):
+        B = np.asarray(X[b], dtype=np.float64)
+        M = (~np.isnan(B)).astype(np.float64)
+        Y = np.nan_to_num(B)
+
+        N += M.T @ M
+        S += Y.T @ M
+        Q += (Y * Y).T @ M
+        P += Y.T @ Y
+
+    return N, S, Q, P
+
+
+def donor(Stats, c, Active):
+    """
+    Station among Active with the highest r2_score(y=c, y_pred=donor) over the
+    days both have values, and the regression of c on it, as in
+    climateInterpolate. None when no station scores above 0.
+    """
+    N, S, Q, P = Stats
+    d = Active[Active != c]
+
+    n = N[c, d]
+    sy, syy, sx, sxx, sxy = S[c, d], Q[c, d], S[d, c], Q[d, c], P[c, d]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        num = syy - 2 * sxy + sxx
+        den = syy - sy ** 2 / n
+        r2 = np.where(den > 0, 1 - num / den, np.where(num == 0, 1.0, 0.0))
+
+    # r2_score is undefined for less than two days
+    r2[n < 2] = -np.inf
+    if len(d) == 0 or r2.max() <= 0:
+        return None
+
+    # The first of equal scores, as the strict > of the loop
+    i = int(np.argmax(r2))
+    n, sy, sx, sxx, sxy = n[i], sy[i], sx[i], sxx[i], sxy[i]
+
+    var = sxx - sx ** 2 / n
+    slope = (sxy - sx * sy / n) / var if var > 0 else 0.0
+    intercept = (sy - slope * sx) / n
+
+    return d[i], slope, intercept
+
+
+def update_stats(Stats, X, c, Rows):
+    """Add the days Rows, just filled in station c, to the pair statistics."""
+    N, S, Q, P = Stats
+
+    for b in blocks(len(Rows), DayBlock):
+        B = np.asarray(X[Rows[b]], dtype=np.float64)
+        M = (~np.isnan(B)).astype(np.float64)
+        Y = np.nan_to_num(B)
+        v = Y[:, c]
+
+        # Station c had no value on these days, so every pair with c gains them
+        Count = M.sum(axis=0)
+        N[c] += Count
+        N[:, c] += Count
+        N[c, c] -= Count[c]
+
+        Sum = v @ M
+        S[c] += Sum
+        S[:, c] += Y.sum(axis=0)
+        S[c, c] -= v.sum()
+
+        Square = (v * v) @ M
+        Q[c] += Square
+        Q[:, c] += (Y * Y).sum(axis=0)
+        Q[c, c] -= (v * v).sum()
+
+        Cross = v @ Y
+        P[c] += Cross
+        P[:, c] += Cross
+        P[c, c] -= (v * v).sum()
+
+
+def store_fill(store, name, end=datetime(2019, 1, 1)):
+    """climate_fill of the matrix name, written to Clean{name}."""
+    X, dates, stations = open_matrix(store, name)
+    n = dates.searchsorted(end, side="right")
+
+    Stats = pair_stats(X, n)
+    Active = np.arange(len(stations))
+
+    for _ in range(2):
+        # Drop the stations with more than 90% of the days missing
+        Active = Active[np.diag(Stats[0])[Active] >= n * 0.1]
+
+        for c in Active:
+            Donor = donor(Stats, c, Active)
+            if Donor is None:
+                continue
+
+            d, slope, intercept = Donor
+            y, x = X[:n, c], X[:n, d]
+            Rows = np.flatnonzero(np.isnan(y) & ~np.isnan(x))
+            if len(Rows) == 0:
+                continue
+
+            X[Rows, c] = (intercept + slope * x[Rows].astype(np.float64)).astype(X.dtype)
+            update_stats(Stats, X, c, Rows)
+
+    # Drop the stations with more than 1% of the days missing, interpolate the rest
+    Active = Active[np.diag(Stats[0])[Active] >= n * 0.99]
+    Clean = create_matrix(store, f"Clean{name}", dates[:n], [stations[j] for j in Active])
+
+    for b in blocks(len(Active), StationBlock):
+        df = pd.DataFrame(X[:n, Active[b]])
+        Clean[:, b] = df.interpolate(method="linear", axis=0).ffill().bfill().values
+
+    X.flush()
+    Clean.flush()
+
+
+def store_prcp(store, name="PRCP"):
+    """Precipitation without the stations missing more than 10% of the days, the rest filled with 0."""
+    X, dates, stations = open_matrix(store, name, mode="r")
+
+    Count = np.zeros(len(stations))
+    for b in blocks(len(stations), StationBlock):
+        Count[b] = (~np.isnan(X[:, b])).sum(axis=0)
+
+    Active = np.flatnonzero(Count >= len(dates) * 0.9)
+    Clean = create_matrix(store, f"Clean{name}", dates, [stations[j] for j in Active])
+
+    for b in blocks(len(Active), StationBlock):
+        Clean[:, b] = np.nan_to_num(X[:, Active[b]], nan=0)
+
+    Clean.flush()
+
+
+def write_csv(store, name, path):
+    """Write a matrix of the store to CSV a block of days at a time."""
+    X, dates, stations = open_matrix(store, name, mode="r")
+
+    with open(path, "w", newline="") as f:
+        for b in blocks(len(dates), DayBlock):
+            pd.DataFrame(X[b], index=dates[b], columns=stations).to_csv(f, header=b.start == 0)
+
+
+def store_screen(store, Limits=None):
+    """
+    QualityControl.screen_climate of the TMAX, TMIN and PRCP matrices a block
+    of stations at a time, masking them in place. Returns the report.
+    """
+    Matrices = {var: open_matrix(store, var) for var in Variables}
+    Columns = {var: {station: j for j, station in enumerate(stations)}
+               for var, (X, dates, stations) in Matrices.items()}
+    stations = sorted(set().union(*Columns.values()))
+
+    Reports = []
+    for b in blocks(len(stations), StationBlock):
+        Frames, Cols = {}, {}
+        for var, (X, dates, _) in Matrices.items():
+            Block = [station for station in stations[b] if station in Columns[var]]
+            Cols[var] = [Columns[var][station] for station in Block]
+            Frames[var] = pd.DataFrame(X[:, Cols[var]], index=dates, columns=Block)
+
+        *Screened, Report = screen_climate(Frames["TMAX"], Frames["TMIN"], Frames["PRCP"], Limits)
+        for var, df in zip(Variables, Screened):
+            Matrices[var][0][:, Cols[var]] = df.values
+        Reports.append(Report)
+
+    for X, _, _ in Matrices.values():
+        X.flush()
+
+    return pd.concat(Reports)
+
+
+def climate_clean_chunked(BasinName, file_dir, store, archive_dir=None, quality_control=True, thresholds=None):
+    """ClimateClean.climateClean from the pivot on, through the store."""
+    if os.path.exists(store):
+        shutil.rmtree(store)
+
+    with section("Pivot", Mode="Chunked"):
+        if archive_dir is None:
+            store_pivot(file_dir, store)
+        else:
+            for var in Variables:
+                store_matrix(os.path.join(archive_dir, f"Climate{var}.csv"), store, var)
+
+    if quality_control:
+        with section("Quality control", Mode="Chunked"):
+            write_report(store_screen(store, limits(thresholds)),
+                         f"{Paths.Outputs}/{BasinName}/QualityControlClimate.csv")
+
+    for var in ["TMAX", "TMIN"]:
+        with section("Interpolation", Variable=var, Mode="Chunked"):
+            store_fill(store, var)
+
+    store_prcp(store)
+
+    with section("Write files"):
+        for var in Variables:
+            write_csv(store, f"Clean{var}", f"{Paths.Outputs}/{BasinName}/Climate/Climate{var}.csv")
@@ -0,0 +1,197 @@
+"""
+Command line interface of the pipeline
+
+One entry point for the stages and the light tasks around them. The repo is
+not an installable package, run it with python from anywhere:
+
+    python Scripts/CropWater.py list-reaches --basins PAY
+    python Scripts/CropWater.py export --basins PAY --objects
+    python Scripts/CropWater.py export --basins PAY --incremental
+    python Scripts/CropWater.py climate-demand --basins PAY --incremental
+    python Scripts/CropWater.py run --basins SNK BOI --no-download
+
+Commands:
+    run                        every stage, as Pipeline.py
+    diversions-download        a single stage for each basin, through the
+    climate-clean              stage cache (--force to run it anyway)
+    climate-demand
+    water-supply-adjustment
+    riverware-format
+    export                     rewrite the RiverWare files from the outputs
+                               (--objects only the DivAdjPopulate.bak and
+                               FullDiversionsImport.bak objects, --incremental
+                               only what changed since the last export)
+    list-reaches               the reaches and IDWR sites of each basin
+    verify                     compare the outputs with the golden set
+                               (--save to keep them as the golden set),
+                               as Verify.py
+
+--data and --outputs (or CROPWATER_DATA and CROPWATER_OUTPUTS) set the Data
+and Outputs folders, by default the ones next to Scripts.
+
+Only the standard library is imported up front and each command imports
+what it needs, so list-reaches doesn't load pandas and export doesn't load
+sklearn, scipy, matplotlib or plotly. The cold start of the light commands
+is measured against ColdStart by `python Benchmark.py --cold-start`.
+"""
+# %%
+import argparse
+import csv
+import os
+import sys
+from collections import defaultdict
+
+import Paths
+from BasinConfig import Basins
+
+
+Stages = {"diversions-download": "DiversionsDownload",
+          "climate-clean": "ClimateClean",
+          "climate-demand": "ClimateDemand",
+          "water-supply-adjustment": "WaterSupplyAdjustment",
+          "riverware-format": "RiverWareFormat"}
+
+# Cold start targets (s) of the light commands, from start to exit
+ColdStart = {"list-reaches": 0.15, "export --objects": 1.5}
+
+
+def list_reaches(BasinNames):
+    """Print the reaches of each basin in Data/RiverWareReaches.csv with their IDWR sites."""
+    Sites = defaultdict(list)
+
+    with open(f"{Paths.Data}/RiverWareReaches.csv", newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            Sites[row["RiverWare Reach"]].append(row["IDWR Site Code"])
+
+    for BasinName in BasinNames:
+        Reaches = [Reach for Reach in Sites if Reach.endswith(f"_{BasinName}")]
+        print(f"{BasinName}: {len(Reaches)} reaches")
+
+        for Reach in Reaches:
+            print(f"  {Reach:32} {len(Sites[Reach]):3} sites")
+
+
+def export(BasinNames, objects=False, incremental=False):
+    """Rewrite the RiverWare files of each basin from the outputs of the earlier stages."""
+    from RiverWareFormat import export_objects, riverWareFormat
+
+    for BasinName in BasinNames:
+        if objects:
+            export_objects(BasinName, incremental)
+        else:
+            riverWareFormat(BasinName, incremental)
+        print(f"{BasinName}: {Paths.Outputs}/{BasinName}/RiverWareInputs")
+
+
+def verify(args):
+    """Compare the outputs with the golden set (or save them as it), returns the exit code."""
+    import Verify
+
+    if args.save:
+        Verify.save_golden(args.basins, args.golden)
+        return 0
+
+    return 0 if Verify.summary(Verify.verify(args.basins, args.golden, args.atol, args.rtol)) else 1
+
+
+def run(args, stages):
+    """Run stages for the basins through Pipeline.run_pipeline, returns the exit code."""
+    import Pipeline
+
+    Options = dict(download=not args.no_download, stages=stages, force=args.force,
+                   as_of_day=args.as_of_day, cross_validate=args.cross_validate,
+                   ghcnd_archive=args.ghcnd_archive, chunked_climate=args.chunked_climate,
+                   incremental=args.incremental, update_margin=args.update_margin,
+                   quality_control=not args.no_quality_control, spatial_climate=args.spatial_climate,
+                   incremental_export=args.incremental_export)
+
+    if args.dry_run:
+        Pipeline.dry_run(args.basins, **Options)
+        return 0
+
+    Results = Pipeline.run_pipeline(args.basins, max_workers=args.workers, cache=not args.no_cache,
+                                    report=not args.no_report, profile=args.profile, **Options)
+
+    for Result in Results:
+        if Result["Status"] != "OK":
+            print(f"\n{Result['Basin']} failed in {Result['Stage']}:\n{Result['Error']}")
+
+    return int(any(Result["Status"] != "OK" for Result in Results))
+
+
+def parser():
+    Common = argparse.ArgumentParser(add_help=False)
+    Common.add_argument("--basins", nargs="+", default=list(Basins.keys()), choices=list(Basins.keys()))
+    Common.add_argument("--data", help="Data folder (default CROPWATER_DATA or ../Data)")
+    Common.add_argument("--outputs", help="Outputs folder (default CROPWATER_OUTPUTS or ../Outputs)")
+
+    # The options of Pipeline.py
+    Stage = argparse.ArgumentParser(add_help=False)
+    Stage.add_argument("--no-download", action="store_true", help="Skip downloading diversion and climate data")
+    Stage.add_argument("--workers", type=int, default=None, help="Number of basins to run at once")
+    Stage.add_argument("--dry-run", action="store_true", help="Print the stages that would run and exit")
+    Stage.add_argument("--force", action="store_true", help="Run even if up to date")
+    Stage.add_argument("--no-cache", action="store_true", help="Don't check or update the stage cache")
+    Stage.add_argument("--no-report", action="store_true", help="Don't write the RunReport files")
+    Stage.add_argument("--profile", action="store_true", help="Dump cProfile stats per basin")
+    Stage.add_argument("--as-of-day", type=int, default=None, help="In-season water supply day of year")
+    Stage.add_argument("--cross-validate", action="store_true", help="Leave-one-year-out station search, ~2x slower")
+    Stage.add_argument("--ghcnd-archive", default=None, help="Local ghcnd_all.tar.gz or by_year folder")
+    Stage.add_argument("--chunked-climate", action="store_true", help="Clean the climate out of core")
+    Stage.add_argument("--incremental", action="store_true", help="Update the saved demand models")
+    Stage.add_argument("--update-margin", type=float, default=0.05, help="R2 loss that triggers a new search")
+    Stage.add_argument("--no-quality-control", action="store_true", help="Don't screen the raw data")
+    Stage.add_argument("--spatial-climate", action="store_true", help="Model the reaches on interpolated climate")
+    Stage.add_argument("--incremental-export", action="store_true", help="Write only the changed RiverWare inputs")
+
+    Parser = argparse.ArgumentParser(description="Crop water demand pipeline")
+    Commands = Parser.add_subparsers(dest="command", required=True)
+
+    Run = Commands.add_parser("run", parents=[Common, Stage], help="Run every stage")
+    Run.add_argument("--stages", nargs="+", default=list(Stages.values()), choices=list(Stages.values()))
+
+    for command, Name in Stages.items():
+        Commands.add_parser(command, parents=[Common, Stage], help=f"Run {Name}")
+
+    Export = Commands.add_parser("export", parents=[Common], help="Rewrite the RiverWare files")
+    Export.add_argument("--objects", action="store_true",
+                        help="Only the DivAdjPopulate.bak and FullDiversionsImport.bak objects")
+    Export.add_argument("--incremental", action="store_true",
+                        help="Only what changed since the last export, keeping the UUIDs")
+
+    Commands.add_parser("list-reaches", parents=[Common], help="List the reaches of each basin")
+
+    Verify = Commands.add_parser("verify", parents=[Common], help="Compare the outputs with the golden set")
+    Verify.add_argument("--golden", default=None, help="Folder of the golden set (default Outputs/Golden)")
+    Verify.add_argument("--save", action="store_true", help="Save the current outputs as the golden set")
+    Verify.add_argument("--atol", type=float, default=None, help="Absolute tolerance of every file")
+    Verify.add_argument("--rtol", type=float, default=None, help="Relative tolerance of every file")
+
+    return Parser
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+
+    # Folders given on the command line are relative to where it was run
+    Paths.configure(args.data, args.outputs)
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    if args.command == "list-reaches":
+        list_reaches(args.basins)
+    elif args.command == "export":
+        export(args.basins, args.objects, args.incremental)
+    elif args.command == "verify":
+        return verify(args)
+    elif args.command == "run":
+        return run(args, [Stage for Stage in Stages.values() if Stage in args.stages])
+    else:
+        return run(args, [Stages[args.command]])
+
+    return 0
+
+
+# %%
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""
+dtype policy for the daily matrices passed between the stages.
+
+The climate (date x station) and diversion (date x reach) matrices are held
+as NumPy backed frames of a single float dtype, float32 by default, which
+halves their memory against float64 and avoids the object columns that
+pd.DataFrame(index=..., columns=...) creates. Set the CROPWATER_DTYPE
+environment variable (e.g. to float64) to change it.
+
+Values are cast to Dtype when they are read from CSV and the frames are
+allocated with `daily_frame` rather than grown column by column. The small
+tables (water supply totals, slopes, breakpoints, R2) and the curve fitting
+stay float64, reservoir storage in acre-feet needs more than float32's seven
+significant digits.
+"""
+# %%
+import os
+
+import numpy as np
+import pandas as pd
+
+
+Dtype = np.dtype(os.environ.get("CROPWATER_DTYPE", "float32"))
+
+
+def daily_frame(index, columns, fill=0.0, dtype=None):
+    """Preallocate a frame of a single float dtype."""
+    columns = list(columns)
+    values = np.full((len(index), len(columns)), fill, dtype=dtype or Dtype)
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
+def read_daily(path, dtype=None, **kwargs):
+    """Read a date indexed CSV matrix with every value column cast to Dtype."""
+    columns = pd.read_csv(path, index_col=0, nrows=0).columns
+    return pd.read_csv(path, index_col=0, parse_dates=True,
+                       dtype={col: dtype or Dtype for col in columns}, **kwargs)
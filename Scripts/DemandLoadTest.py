@@ -0,0 +1,112 @@
+"""
+Load test client for DemandService.py
+
+Sends --requests /predict requests from --concurrency threads, each thread
+over its own keep-alive connection, and reports the requests per second and
+the latency percentiles. The forecast is a made up summer week for every
+station used by the basin's models, so only the service needs the registry.
+
+Usage:
+    python DemandService.py --basins PAY &
+    python DemandLoadTest.py --basin PAY --requests 2000 --concurrency 8 --days 7
+"""
+# %%
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlparse
+
+import numpy as np
+
+
+def forecast(Stations, Start, days, seed=0):
+    """A random forecast around typical July weather for each station."""
+    rng = np.random.default_rng(seed)
+    return {"Start": Start,
+            "Climate": {Station: {"TMAX": list(np.round(rng.normal(90, 5, days), 1)),
+                                  "TMIN": list(np.round(rng.normal(55, 5, days), 1)),
+                                  "PRCP": list(np.round(rng.gamma(0.2, 0.1, days), 2))}
+                        for Station in Stations}}
+
+
+def load_test(url, BasinName, requests=1000, concurrency=8, days=7, Start="2024-07-01"):
+    host = urlparse(url)
+
+    # The stations the basin's models need
+    connection = http.client.HTTPConnection(host.hostname, host.port)
+    connection.request("GET", f"/reaches?basin={BasinName}")
+    Reaches = json.loads(connection.getresponse().read())
+    connection.close()
+    if "Error" in Reaches:
+        raise RuntimeError(Reaches["Error"])
+
+    Stations = {Entry["Station"] for Entry in Reaches.values() if Entry["Station"] is not None}
+    Body = json.dumps({"Basin": BasinName, **forecast(sorted(Stations), Start, days)}).encode()
+    Headers = {"Content-Type": "application/json"}
+
+    Latency = []
+    Errors = []
+    counter = iter(range(requests))
+    lock = threading.Lock()
+
+    def worker():
+        connection = http.client.HTTPConnection(host.hostname, host.port)
+        while True:
+            with lock:
+                if next(counter, None) is None:
+                    break
+            start = time.perf_counter()
+            try:
+                connection.request("POST", "/predict", body=Body, headers=Headers)
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    Errors.append(response.status)
+            except (OSError, http.client.HTTPException) as e:
+                Errors.append(type(e).__name__)
+                connection.close()
+                connection = http.client.HTTPConnection(host.hostname, host.port)
+            Latency.append(time.perf_counter() - start)
+        connection.close()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    Latency = np.array(Latency) * 1000
+    return {"Requests": len(Latency),
+            "Errors": len(Errors),
+            "Reaches": len(Reaches),
+            "Stations": len(Stations),
+            "Days": days,
+            "RequestsPerSecond": len(Latency) / seconds,
+            "p50ms": np.percentile(Latency, 50),
+            "p95ms": np.percentile(Latency, 95),
+            "p99ms": np.percentile(Latency, 99),
+            "Maxms": Latency.max()}
+
+
+# %%
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test DemandService.py")
+    parser.add_argument("--url", default="http://127.0.0.1:8750")
+    parser.add_argument("--basin", required=True)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--days", type=int, default=7, help="Forecast days per request")
+    args = parser.parse_args()
+
+    Result = load_test(args.url, args.basin, args.requests, args.concurrency, args.days)
+
+    print(f"{Result['Requests']} requests ({Result['Errors']} errors), {Result['Reaches']} reaches, "
+          f"{Result['Stations']} stations, {Result['Days']} days each")
+    print(f"{Result['RequestsPerSecond']:.1f} requests/s")
+    print(f"Latency p50 {Result['p50ms']:.1f} ms, p95 {Result['p95ms']:.1f} ms, "
+          f"p99 {Result['p99ms']:.1f} ms, max {Result['Maxms']:.1f} ms")
@@ -0,0 +1,267 @@
+"""
+Full water supply demand prediction service
+
+Long running local HTTP service that loads the model registry of each basin
+(Outputs/{BasinName}/ModelRegistry.joblib, written by ClimateDemand.py) once
+and predicts the full supply demand of every reach from a weather forecast,
+without re-reading the climate CSVs or retraining the models. A background
+thread watches the registry files and reloads a basin when ClimateDemand
+rewrites its registry.
+
+Usage:
+    python DemandService.py --basins PAY BOI --port 8750
+
+Endpoints:
+    GET  /health              basins served and when their registry was created
+    GET  /reaches?basin=PAY   station and test R2 of every reach
+    POST /predict             predictions for a batch of forecast days
+
+The body of /predict gives the first forecast day and, for each climate
+station, the daily TMAX and TMIN (F) and PRCP (in) from that day on:
+
+    {"Basin": "PAY",
+     "Start": "2024-06-01",
+     "Climate": {"USC00101956": {"TMAX": [85, 88, ...],
+                                 "TMIN": [50, 52, ...],
+                                 "PRCP": [0, 0.1, ...]}, ...},
+     "Reaches": ["Reach8Diversions_PAY"]}        (optional, default all)
+
+and the response has the demand (cfs) of each reach for each day:
+
+    {"Basin": "PAY", "Created": "...", "Dates": ["2024-06-01", ...],
+     "Demand": {"Reach8Diversions_PAY": [812.4, ...], ...},
+     "Missing": {"Reach9Diversions_PAY": "USC00102575"}}
+
+Reaches whose station is not in the forecast are listed under Missing.
+The reaches modeled on their interpolated climate (ClimateDemand.py with
+--spatial-climate) have the reach name as their station, their forecast is
+given under the reach name.
+The models use the 7 day mean precipitation, include the six days before the
+forecast to match the training exactly (see ModelRegistry.climate_features).
+
+DemandLoadTest.py measures the requests per second and latency of a running
+service.
+"""
+# %%
+import argparse
+import json
+import os
+import threading
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+from BasinConfig import Basins
+from ModelRegistry import climate_features, load_registry, predict_reach, registry_path
+
+
+class Registries:
+    """The registry of each served basin, reloaded when its file changes."""
+
+    def __init__(self, BasinNames):
+        self.BasinNames = list(BasinNames)
+        self.Loaded = {}
+        self.Versions = {}
+        self.lock = threading.Lock()
+
+        for BasinName in self.BasinNames:
+            self.reload(BasinName)
+
+    def version(self, BasinName):
+        try:
+            stat = os.stat(registry_path(BasinName))
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self, BasinName):
+        """Load the registry of BasinName if it changed, return True if it was."""
+        version = self.version(BasinName)
+        if version is None or version == self.Versions.get(BasinName):
+            return False
+
+        try:
+            Registry = load_registry(BasinName)
+        except Exception:
+            print(f"Could not load the {BasinName} registry:\n{traceback.format_exc()}")
+            return False
+
+        # Requests in flight keep the registry they started with
+        with self.lock:
+            self.Loaded[BasinName] = Registry
+            self.Versions[BasinName] = version
+
+        print(f"Loaded {BasinName} registry created {Registry['Created']} ({len(Registry['Reaches'])} reaches)")
+        return True
+
+    def get(self, BasinName):
+        with self.lock:
+            return self.Loaded.get(BasinName)
+
+
+class _Watcher(threading.Thread):
+    """Background thread that reloads the registries every `interval` seconds if they changed."""
+
+    def __init__(self, registries, interval):
+        super().__init__(daemon=True)
+        self.registries = registries
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            for BasinName in self.registries.BasinNames:
+                self.registries.reload(BasinName)
+
+
+def predict(Registry, Request):
+    """Predict the demand of the requested reaches for the forecast in Request."""
+    Climate = Request["Climate"]
+    Reaches = Request.get("Reaches") or list(Registry["Reaches"].keys())
+
+    n = {len(values) for Station in Climate.values() for values in Station.values()}
+    if len(n) != 1:
+        raise ValueError("Every TMAX, TMIN and PRCP series must have the same number of days")
+    index = pd.date_range(Request["Start"], periods=n.pop(), freq="D")
+
+    Features = {}
+    Demand = {}
+    Missing = {}
+
+    for Reach in Reaches:
+        if Reach not in Registry["Reaches"]:
+            raise KeyError(f"Unknown reach {Reach}")
+        Entry = Registry["Reaches"][Reach]
+        Station = Entry["Station"]
+
+        if Station is not None and Station not in Climate:
+            Missing[Reach] = Station
+            continue
+
+        # Stations shared by several reaches are only converted once
+        if Station not in Features:
+            if Station is None:
+                Features[Station] = climate_features(np.zeros(len(index)), np.zeros(len(index)),
+                                                     np.zeros(len(index)), index)
+            else:
+                Features[Station] = climate_features(Climate[Station]["TMAX"], Climate[Station]["TMIN"],
+                                                     Climate[Station]["PRCP"], index)
+                if np.isnan(Features[Station]).any():
+                    raise ValueError(f"Missing values in the {Station} forecast")
+
+        Demand[Reach] = [round(float(value), 3) for value in predict_reach(Entry, Features[Station])]
+
+    return {"Basin": Registry["Basin"],
+            "Created": Registry["Created"],
+            "Dates": list(index.strftime("%Y-%m-%d")),
+            "Demand": Demand,
+            "Missing": Missing}
+
+
+class DemandHandler(BaseHTTPRequestHandler):
+    # Keep connections open between requests, without Nagle the headers and
+    # body aren't held back waiting for the client's delayed ACK
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    registries = None
+    verbose = False
+
+    def send_json(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def registry(self, BasinName):
+        Registry = self.registries.get(BasinName)
+        if Registry is None:
+            self.send_json(404, {"Error": f"No registry loaded for basin {BasinName}"})
+        return Registry
+
+    def do_GET(self):
+        url = urlparse(self.path)
+
+        if url.path == "/health":
+            with self.registries.lock:
+                Loaded = dict(self.registries.Loaded)
+            self.send_json(200, {"Basins": {BasinName: Registry["Created"] for BasinName, Registry in Loaded.items()}})
+
+        elif url.path == "/reaches":
+            BasinName = parse_qs(url.query).get("basin", [None])[0]
+            Registry = self.registry(BasinName)
+            if Registry is not None:
+                self.send_json(200, {Reach: {"Station": Entry["Station"], "R2": Entry.get("R2")}
+                                     for Reach, Entry in Registry["Reaches"].items()})
+
+        else:
+            self.send_json(404, {"Error": f"Unknown path {url.path}"})
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/predict":
+            self.send_json(404, {"Error": f"Unknown path {self.path}"})
+            return
+
+        try:
+            Request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            if not isinstance(Request, dict):
+                self.send_json(400, {"Error": f"The request must be a JSON object, not {type(Request).__name__}"})
+                return
+
+            Registry = self.registry(Request.get("Basin"))
+            if Registry is None:
+                return
+            self.send_json(200, predict(Registry, Request))
+
+        except (KeyError, ValueError, TypeError) as e:
+            self.send_json(400, {"Error": f"{type(e).__name__}: {e}"})
+
+        # Anything else is a bug, the client still gets an answer
+        except Exception as e:
+            print(f"Could not answer {self.path}:\n{traceback.format_exc()}")
+            self.send_json(500, {"Error": f"{type(e).__name__}: {e}"})
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+def serve(BasinNames, host="127.0.0.1", port=8750, interval=2.0, verbose=False):
+    registries = Registries(BasinNames)
+    watcher = _Watcher(registries, interval)
+    watcher.start()
+
+    DemandHandler.registries = registries
+    DemandHandler.verbose = verbose
+
+    server = ThreadingHTTPServer((host, port), DemandHandler)
+    print(f"Serving {', '.join(registries.Loaded)} on http://{host}:{port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stopped.set()
+        server.server_close()
+
+
+# %%
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve full water supply demand predictions")
+    parser.add_argument("--basins", nargs="+", default=list(Basins.keys()), choices=list(Basins.keys()))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8750)
+    parser.add_argument("--interval", type=float, default=2.0, help="Seconds between registry change checks")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    # The registries are found relative to the Scripts folder
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    serve(args.basins, args.host, args.port, args.interval, args.verbose)
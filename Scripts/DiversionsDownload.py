@@ -22,47 +22,66 @@ from pandas.errors import EmptyDataError
 import numpy as np
 import os
 
-# Read in the diversion data
-Reaches = pd.read_csv('../Data/RiverWareReaches.csv')
+import Paths
 
-for site in Reaches['IDWR Site Code']:
 
-    year_list = np.arange(1980, 2021, 1)
+def diversionsDownload(BasinName=None):
+    """Download the IDWR diversion history for every site, or only the sites in BasinName."""
+    # Read in the diversion data
+    Reaches = pd.read_csv(f'{Paths.Data}/RiverWareReaches.csv')
 
-    year_list = ','.join([str(x) for x in year_list])
+    if BasinName is not None:
+        Reaches = Reaches[Reaches['RiverWare Reach'].str.contains(f'_{BasinName}')]
 
-    url = f'https://research.idwr.idaho.gov/apps/Shared/WaterServices/Accounting/History?sitelist={site}&yearlist={year_list}&yeartype=IY&f=csv'
+    for site in Reaches['IDWR Site Code']:
 
-    try:
-        df = pd.read_csv(url)
-    except EmptyDataError:
-        print(f'No data for {site}')
-        continue
+        year_list = np.arange(1980, 2021, 1)
 
-    # Drop any unnamed columns
-    df = df.loc[:, ~df.columns.str.contains('Unnamed')]
+        year_list = ','.join([str(x) for x in year_list])
 
-    Reach = Reaches.loc[Reaches['IDWR Site Code'] == site, 'RiverWare Reach'].values[0]
+        url = f'https://research.idwr.idaho.gov/apps/Shared/WaterServices/Accounting/History?sitelist={site}&yearlist={year_list}&yeartype=IY&f=csv'
 
-    # Check if folder exists, if not create it
-    if not os.path.exists(f'../Data/Diversions/{Reach}'):
-        os.makedirs(f'../Data/Diversions/{Reach}')
+        try:
+            df = pd.read_csv(url)
+        except EmptyDataError:
+            print(f'No data for {site}')
+            continue
 
-    df.to_csv(f'../Data/Diversions/{Reach}/{site}.csv', index=False)
+        # Drop any unnamed columns
+        df = df.loc[:, ~df.columns.str.contains('Unnamed')]
 
-# %%
+        Reach = Reaches.loc[Reaches['IDWR Site Code'] == site, 'RiverWare Reach'].values[0]
 
-# Calculate diversions to Lake Lowell
-import pandas as pd
-import matplotlib.pyplot as plt
+        # Check if folder exists, if not create it
+        if not os.path.exists(f'{Paths.Data}/Diversions/{Reach}'):
+            os.makedirs(f'{Paths.Data}/Diversions/{Reach}')
+
+        df.to_csv(f'{Paths.Data}/Diversions/{Reach}/{site}.csv', index=False)
+
+
+def lakeLowellDiversions():
+    """Calculate diversions to Lake Lowell from the change in storage."""
+    Lowell = pd.read_html("https://www.usbr.gov/pn-bin/daily.pl?station=low&format=html&year=1980&month=9&day=30&year=2023&month=8&day=31&pcode=af", 
+                                    index_col=0, parse_dates=True)[0]
 
+    Div = Lowell.rolling(14, center=True).mean().diff().clip(0)
+
+    if not os.path.exists(f"{Paths.Data}/Diversions/Reach7Diversions_BOI"):
+        os.makedirs(f"{Paths.Data}/Diversions/Reach7Diversions_BOI")
+
+    Div.to_csv(f"{Paths.Data}/Diversions/Reach7Diversions_BOI/NonIrr.csv")
+
+    return Div
+
+# %%
 
-Lowell = pd.read_html("https://www.usbr.gov/pn-bin/daily.pl?station=low&format=html&year=1980&month=9&day=30&year=2023&month=8&day=31&pcode=af", 
-                                index_col=0, parse_dates=True)[0]
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
 
-Div = Lowell.rolling(14, center=True).mean().diff().clip(0)
+    diversionsDownload()
 
-Div.to_csv("../Data/Diversions/Reach7Diversions_BOI/NonIrr.csv")
+    # Calculate diversions to Lake Lowell
+    Div = lakeLowellDiversions()
 
-# Plot 1983
-plt.plot(Div.loc["1983-01-01":"1983-12-31"])
\ No newline at end of file
+    # Plot 1983
+    plt.plot(Div.loc["1983-01-01":"1983-12-31"])
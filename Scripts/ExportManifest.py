@@ -0,0 +1,101 @@
+"""
+Content hashes and UUIDs of the RiverWare inputs from the last export.
+
+RiverWareFormat.py normally rewrites every FullDiversions/{reach}.txt, the
+DMI and both .bak objects, with new random UUIDs, on every run. With
+incremental export it keeps a manifest in
+Outputs/{BasinName}/RiverWareInputs/ExportManifest.json instead:
+
+FullDiversions              the hash of the daily values of each reach, only
+                            the series whose values changed are written again
+                            and listed in FullDiversionsChanged.DMI
+DivAdjPopulate.bak,         the hash of the header and of each slot of the
+FullDiversionsImport.bak    object, the object is written again only when one
+                            of them changed
+UUIDs                       the UUID of each object and slot, reused on every
+                            export so RiverWare sees the same objects and the
+                            files can be diffed
+
+The manifest is saved after the files are written, so whatever an export
+that fails part way changed is written again on the next run.
+"""
+# %%
+import hashlib
+import json
+import os
+import re
+import uuid
+
+
+# First line of each slot of a RiverWare object, e.g. "$o" {TableSlot} {DiversionWeight}
+Slot = re.compile(r'^"\$o" \{\w+\} \{(.+?)\}$', re.MULTILINE)
+
+
+def hash_values(values):
+    """Hash of a numpy array's values and dtype."""
+    h = hashlib.sha256(str(values.dtype).encode())
+    h.update(values.tobytes())
+    return h.hexdigest()
+
+
+def hash_sections(text):
+    """Hash of the header and of each slot of a RiverWare object, by slot name."""
+    Starts = [m.start() for m in Slot.finditer(text)]
+    Names = ["Header"] + [m.group(1) for m in Slot.finditer(text)]
+    Bounds = [0] + Starts + [len(text)]
+
+    return {name: hashlib.sha256(text[start:end].encode()).hexdigest()
+            for name, start, end in zip(Names, Bounds[:-1], Bounds[1:])}
+
+
+def write_if_changed(path, text):
+    """Write text to path unless the file already holds it. Returns True if written."""
+    if os.path.exists(path):
+        with open(path) as f:
+            if f.read() == text:
+                return False
+
+    with open(path, "w") as f:
+        f.write(text)
+    return True
+
+
+class ExportManifest:
+    """Hashes and UUIDs of the RiverWare inputs of one basin."""
+
+    def __init__(self, path):
+        self.path = path
+
+        if os.path.exists(path):
+            with open(path) as f:
+                self.records = json.load(f)
+        else:
+            self.records = {}
+
+    def save(self):
+        with open(self.path + ".tmp", "w") as f:
+            json.dump(self.records, f, indent=2, sort_keys=True)
+        os.replace(self.path + ".tmp", self.path)
+
+    def changed(self, group, Hashes):
+        """
+        Names in Hashes whose hash differs from the last export, recording the
+        new ones. Names no longer exported are dropped from the group.
+        """
+        Last = self.records.get(group, {})
+        self.records[group] = Hashes
+
+        return [name for name, digest in Hashes.items() if Last.get(name) != digest]
+
+    def uuids(self, file):
+        """UUIDs of the objects and slots of file, see new_uuid."""
+        UUIDs = self.records.setdefault("UUIDs", {})
+        return UUIDs.setdefault(file, {})
+
+
+def new_uuid(UUIDs, name):
+    """The UUID of object or slot name in UUIDs, a new one if it has none (or without UUIDs)."""
+    if UUIDs is None:
+        return uuid.uuid4()
+
+    return UUIDs.setdefault(name, str(uuid.uuid4()))
@@ -0,0 +1,224 @@
+"""
+Climate ingest from a local GHCNd bulk archive
+
+Instead of downloading one access/{station}.csv at a time (ClimateClean.py),
+this reads a local mirror of the GHCNd bulk data in a single sequential pass
+and writes the daily TMAX, TMIN and PRCP matrices of every basin at once:
+
+ghcnd_all.tar.gz     the tarball of .dly files of every station, streamed
+                     member by member without extracting it
+by_year/             the {YYYY}.csv.gz files, only the years from `start`
+                     on are read, in chunks
+
+Only the stations inside a basin's bounding box (from ghcnd-stations.txt,
+looked for next to the archive by default) and the three elements are kept
+while streaming, straight into preallocated date x station arrays, so the
+archive is never held in memory.
+
+The matrices are written to Data/ClimateArchive/{BasinName}/Climate{TMAX,TMIN,PRCP}.csv
+in the units and layout of ClimateClean.climate_pivot (F and inches, days
+from 1980, a column per station named like the access files' NAME, e.g.
+"BOISE AIR TERMINAL, ID US", or by station ID with --names id), and the
+location of each column to StationLocations.csv.
+ClimateClean uses them in place of the downloaded files when given the
+folder (see Pipeline.py --ghcnd-archive).
+
+    python GHCNdArchive.py /data/ghcnd/ghcnd_all.tar.gz
+    python GHCNdArchive.py /data/ghcnd/by_year --basins SNK BOI
+"""
+# %%
+import argparse
+import os
+import re
+import tarfile
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import Paths
+from DailyMatrix import Dtype
+
+
+Elements = ["TMAX", "TMIN", "PRCP"]
+
+
+def read_station_list(path):
+    """Stations in ghcnd-stations.txt with the NAME used by the access files."""
+    Stations = pd.read_fwf(path, colspecs=[(0, 11), (12, 20), (21, 30), (31, 37), (38, 40), (41, 71)],
+                           names=["Station", "Latitude", "Longitude", "Elevation", "State", "Name"],
+                           dtype={"Station": str, "State": str, "Name": str})
+
+    State = Stations["State"].fillna("")
+    Stations["NAME"] = (Stations["Name"].str.strip() + ", "
+                        + (State + " ").where(State != "", "") + Stations["Station"].str[:2])
+
+    return Stations
+
+
+def basin_stations(Stations, BoundingBoxes):
+    """Stations inside the [[lon min, lon max], [lat min, lat max]] box of each basin."""
+    return {BasinName: Stations[(Stations["Longitude"] >= bbox[0][0]) & (Stations["Longitude"] <= bbox[0][1]) &
+                                (Stations["Latitude"] >= bbox[1][0]) & (Stations["Latitude"] <= bbox[1][1])]
+            for BasinName, bbox in BoundingBoxes.items()}
+
+
+class Matrices:
+    """Date x station arrays of each element for every basin, filled while streaming."""
+
+    def __init__(self, Selected, dates):
+        self.dates = dates
+        self.start = dates[0]
+        self.Selected = Selected
+        self.Values = {BasinName: {element: np.full((len(dates), len(Stations)), np.nan, dtype=Dtype)
+                                   for element in Elements}
+                       for BasinName, Stations in Selected.items()}
+
+        # Basin and column of each station, a station can be in several basins
+        self.Columns = {}
+        for BasinName, Stations in Selected.items():
+            for j, station in enumerate(Stations["Station"]):
+                self.Columns.setdefault(station, []).append((BasinName, j))
+
+    def add(self, station, element, rows, values):
+        for BasinName, j in self.Columns[station]:
+            self.Values[BasinName][element][rows, j] = values
+
+    def frames(self, names="name"):
+        """The matrices in climate_pivot units and layout."""
+        Frames = {}
+
+        for BasinName, Stations in self.Selected.items():
+            columns = Stations["NAME"] if names == "name" else Stations["Station"]
+            Frames[BasinName] = {}
+
+            for element in Elements:
+                df = pd.DataFrame(self.Values[BasinName][element], index=self.dates.rename("DATE"),
+                                  columns=list(columns))
+
+                # Precipitation is in tenths of mm, temperature in tenths of degrees C
+                if element == "PRCP":
+                    df = df / 254
+                else:
+                    df = df / 10 * 9 / 5 + 32
+
+                # Stations sharing a NAME are averaged as in the pivot table
+                df = df.T.groupby(level=0).mean().T.astype(Dtype)
+                df.columns.name = "NAME"
+                Frames[BasinName][element] = df.dropna(how="all").dropna(axis=1, how="all")
+
+        return Frames
+
+
+def stream_dly(archive, Matrices):
+    """Fill Matrices from the .dly members of a ghcnd_all tarball in one pass."""
+    start, end = Matrices.dates[0], Matrices.dates[-1]
+
+    with tarfile.open(archive, "r|gz") as tar:
+        for member in tar:
+            station = os.path.basename(member.name)[:-4]
+            if not member.name.endswith(".dly") or station not in Matrices.Columns:
+                continue
+
+            for line in tar.extractfile(member):
+                line = line.decode("ascii", "replace")
+                element = line[17:21]
+                if element not in Elements:
+                    continue
+
+                year, month = int(line[11:15]), int(line[15:17])
+                first = pd.Timestamp(year, month, 1)
+                if first > end or first + pd.offsets.MonthEnd(0) < start:
+                    continue
+
+                days = first.days_in_month
+                values = np.array([int(line[21 + 8 * d:26 + 8 * d]) for d in range(days)], dtype=float)
+                rows = (first - start).days + np.arange(days)
+
+                keep = (values != -9999) & (rows >= 0) & (rows < len(Matrices.dates))
+                Matrices.add(station, element, rows[keep], values[keep])
+
+
+def stream_by_year(folder, Matrices, chunksize=2_000_000):
+    """Fill Matrices from the {YYYY}.csv.gz by-year files of the years in Matrices.dates."""
+    Years = set(Matrices.dates.year)
+
+    Files = sorted(file for file in os.listdir(folder)
+                   if re.fullmatch(r"\d{4}\.csv(\.gz)?", file) and int(file[:4]) in Years)
+
+    for file in Files:
+        reader = pd.read_csv(os.path.join(folder, file), header=None, usecols=[0, 1, 2, 3],
+                             names=["Station", "Date", "Element", "Value"],
+                             dtype={"Station": str, "Date": str, "Element": str, "Value": float},
+                             chunksize=chunksize)
+
+        for chunk in reader:
+            chunk = chunk[chunk["Element"].isin(Elements) & chunk["Station"].isin(Matrices.Columns.keys())]
+            if chunk.empty:
+                continue
+
+            rows = (pd.to_datetime(chunk["Date"], format="%Y%m%d") - Matrices.start).dt.days.values
+            keep = (chunk["Value"].values != -9999) & (rows >= 0) & (rows < len(Matrices.dates))
+            chunk, rows = chunk[keep], rows[keep]
+
+            for (station, element), group in chunk.groupby(["Station", "Element"]):
+                Matrices.add(station, element, rows[chunk.index.get_indexer(group.index)], group["Value"].values)
+
+
+def ingest_archive(archive, BoundingBoxes, stations=None, output=None,
+                   start="1980-01-01", end=None, names="name"):
+    """
+    Build the climate matrices of every basin in BoundingBoxes from one pass
+    over a local GHCNd archive (a ghcnd_all tarball or a by_year folder) and
+    write them to {output}/{BasinName}. Returns {BasinName: {element: DataFrame}}.
+    """
+    stations = stations or os.path.join(os.path.dirname(os.path.abspath(archive)), "ghcnd-stations.txt")
+    output = output or f"{Paths.Data}/ClimateArchive"
+    end = end or f"{datetime.now().year}-12-31"
+
+    Selected = basin_stations(read_station_list(stations), BoundingBoxes)
+    Climate = Matrices(Selected, pd.date_range(start, end, freq="D"))
+
+    if os.path.isdir(archive):
+        stream_by_year(archive, Climate)
+    else:
+        stream_dly(archive, Climate)
+
+    Frames = Climate.frames(names)
+
+    for BasinName, Basin in Frames.items():
+        folder = os.path.join(output, BasinName)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        for element, df in Basin.items():
+            df.to_csv(os.path.join(folder, f"Climate{element}.csv"))
+
+        # Locations of the columns, averaged over stations sharing a NAME as the values are
+        Stations = Selected[BasinName]
+        Locations = Stations.groupby(Stations["NAME"] if names == "name" else Stations["Station"])[
+            ["Latitude", "Longitude", "Elevation"]].mean()
+        Locations.rename_axis("NAME").to_csv(os.path.join(folder, "StationLocations.csv"))
+
+    return Frames
+
+
+# %%
+
+if __name__ == "__main__":
+    from BasinConfig import BoundingBox
+
+    parser = argparse.ArgumentParser(description="Build the basin climate matrices from a local GHCNd archive")
+    parser.add_argument("archive", help="ghcnd_all.tar.gz or a folder of by-year {YYYY}.csv.gz files")
+    parser.add_argument("--basins", nargs="+", default=list(BoundingBox.keys()), choices=list(BoundingBox.keys()))
+    parser.add_argument("--stations", help="ghcnd-stations.txt (default next to the archive)")
+    parser.add_argument("--output", help="Folder of the basin folders (default Data/ClimateArchive)")
+    parser.add_argument("--names", choices=["name", "id"], default="name", help="Name the columns by station NAME or ID")
+    args = parser.parse_args()
+
+    Frames = ingest_archive(args.archive, {BasinName: BoundingBox[BasinName] for BasinName in args.basins},
+                            args.stations, args.output, names=args.names)
+
+    for BasinName, Basin in Frames.items():
+        print(f"{BasinName}: {Basin['TMAX'].shape[1]} TMAX, {Basin['TMIN'].shape[1]} TMIN, "
+              f"{Basin['PRCP'].shape[1]} PRCP stations")
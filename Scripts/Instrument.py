@@ -0,0 +1,204 @@
+"""
+Timing and memory instrumentation for the pipeline.
+
+Wrap a piece of work in `section` to record its wall time, CPU time, peak
+resident memory (RSS) and the bytes read and written by the process while it
+ran. Sections can be nested, a section opened inside another is recorded
+under the outer one's name, e.g. "ClimateDemand/Station search". Extra
+keyword arguments (Reach, Station, ...) are kept as labels on the record.
+
+    with section("ClimateDemand"):
+        with section("Station search", Reach=Reach):
+            ...
+
+Recording is off until `enable` is called so the scripts run unchanged on
+their own. `write_report` saves the records as JSON and CSV. Peak memory is
+sampled by a background thread every `interval` seconds so very short
+allocations can be missed.
+
+psutil is used for memory and I/O counters when it is installed. Without it
+the peak RSS falls back to the resource module and the I/O counters to
+/proc/self/io where they are available.
+"""
+# %%
+import cProfile
+import csv
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+Records = []
+Labels = {}
+
+_open = []
+_enabled = False
+_sampler = None
+
+
+def _rss():
+    """Current resident memory of the process in bytes, or None."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    if resource is not None:
+        # ru_maxrss is the peak rather than the current RSS (kB on Linux)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return None
+
+
+def _io():
+    """Bytes read and written by the process so far, or (None, None)."""
+    if psutil is not None:
+        try:
+            io = psutil.Process().io_counters()
+            return (getattr(io, "read_chars", io.read_bytes),
+                    getattr(io, "write_chars", io.write_bytes))
+        except (AttributeError, psutil.Error):
+            pass
+    try:
+        with open("/proc/self/io") as f:
+            counters = dict(line.split(": ") for line in f.read().splitlines())
+        return int(counters["rchar"]), int(counters["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+
+class _Sampler(threading.Thread):
+    """Background thread that keeps the peak RSS of every open section."""
+
+    def __init__(self, interval):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            rss = _rss()
+            if rss is None:
+                continue
+            for Open in list(_open):
+                Open["PeakRSS"] = max(Open["PeakRSS"], rss)
+
+
+def enable(interval=0.05, **labels):
+    """
+    Start recording sections. labels (e.g. Basin="SNK") are added to every
+    record.
+    """
+    global _enabled, _sampler
+    _enabled = True
+    Labels.update(labels)
+
+    if _sampler is None:
+        _sampler = _Sampler(interval)
+        _sampler.start()
+
+
+def disable():
+    global _enabled, _sampler
+    _enabled = False
+
+    if _sampler is not None:
+        _sampler.stopped.set()
+        _sampler = None
+
+
+def reset():
+    Records.clear()
+    Labels.clear()
+
+
+@contextmanager
+def section(name, **labels):
+    if not _enabled:
+        yield
+        return
+
+    rss = _rss() or 0
+    read, written = _io()
+
+    Open = {"Name": "/".join([o["Name"] for o in _open] + [name]),
+            "PeakRSS": rss,
+            "Labels": labels}
+    _open.append(Open)
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    status = "OK"
+
+    try:
+        yield
+    except BaseException:
+        status = "Failed"
+        raise
+    finally:
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        end_rss = _rss() or 0
+        end_read, end_written = _io()
+        _open.remove(Open)
+
+        # A nested section's peak also counts for the sections around it
+        peak = max(Open["PeakRSS"], end_rss)
+        for Outer in _open:
+            Outer["PeakRSS"] = max(Outer["PeakRSS"], peak)
+
+        Records.append({
+            **Labels,
+            "Section": Open["Name"],
+            **labels,
+            "Status": status,
+            "WallSeconds": wall,
+            "CPUSeconds": cpu,
+            "PeakRSSMB": peak / 2**20,
+            "RSSChangeMB": (end_rss - rss) / 2**20,
+            "BytesRead": None if read is None else end_read - read,
+            "BytesWritten": None if written is None else end_written - written,
+        })
+
+
+@contextmanager
+def profile(path=None):
+    """Run the block under cProfile and dump the stats to path (if given)."""
+    if path is None:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+
+def write_report(path):
+    """Write the records to {path}.json and {path}.csv."""
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+
+    with open(f"{path}.json", "w") as f:
+        json.dump(Records, f, indent=2)
+
+    columns = []
+    for Record in Records:
+        columns += [col for col in Record if col not in columns]
+
+    with open(f"{path}.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(Records)
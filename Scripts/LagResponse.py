@@ -0,0 +1,140 @@
+"""
+Lag response engine for the RiverWare Lag Coeff tables.
+
+Each reach's lagged return flow in the RiverWare model is the diversion
+series convolved with the reach's Lag Coeff table, 29,220 daily coefficients
+(80 years). This script reads the tables from a model file, convolves
+diversion series with them by overlap-add FFT (scipy.signal.oaconvolve)
+instead of directly, and for each table finds the shortest cutoff that keeps
+a target share of the total response.
+
+    python LagResponse.py ../../Comparison.mdl --share 0.999
+    python LagResponse.py ../../Comparison.mdl --share 0.999 --diversions ../Outputs/SNK/ReachDiversions.csv
+
+The per slot cutoffs are written to LagCutoffs.csv next to the model, with
+the time of the direct and FFT convolution of every table and the largest
+difference the cutoff makes to the response. ResponseCutoff.py uses the
+cutoffs to shorten each table in the model.
+"""
+# %%
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def object_name(line):
+    """Name of the object in a `set obj {Name}` line."""
+    if "{" in line:
+        return line[line.index("{") + 1:line.rindex("}")]
+    return line.split()[2]
+
+
+def read_lag_coeffs(path):
+    """Lag Coeff table of every object in a RiverWare model file, {object: coefficients}."""
+    Kernels = {}
+    obj = None
+    rows = None
+
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("set obj"):
+                obj = object_name(line)
+                rows = None
+            elif line.startswith("set s"):
+                rows = None
+                if '"$o.Lag Coeff"' in line:
+                    rows = Kernels.setdefault(obj, [])
+            elif rows is not None and line.startswith('"$s" resize'):
+                rows.extend([0.0] * int(line.split()[2]))
+            elif rows is not None and line.startswith('"$s" row'):
+                values = line.split()
+                rows[int(values[2])] = float(values[3])
+
+    return {obj: np.array(rows) for obj, rows in Kernels.items()}
+
+
+def lag_response(series, kernel):
+    """Lagged response of series to kernel by overlap-add FFT, the same length as series."""
+    from scipy.signal import oaconvolve
+
+    return oaconvolve(series, kernel)[:len(series)]
+
+
+def direct_response(series, kernel):
+    """Lagged response of series to kernel by direct convolution."""
+    return np.convolve(series, kernel)[:len(series)]
+
+
+def response_cutoff(kernel, share=0.999):
+    """Shortest number of coefficients that keeps share of the kernel's total response."""
+    total = np.abs(kernel).cumsum()
+    if total[-1] == 0:
+        return 1
+    return int(np.searchsorted(total, share * total[-1]) + 1)
+
+
+def cutoff_report(Kernels, series, share=0.999):
+    """
+    Cutoff of every kernel with the time of the direct and FFT convolution of
+    series and the largest change the cutoff makes to the response.
+    """
+    Report = []
+
+    for obj, kernel in Kernels.items():
+        n = response_cutoff(kernel, share)
+
+        start = time.perf_counter()
+        direct = direct_response(series, kernel)
+        DirectSeconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fft = lag_response(series, kernel)
+        FFTSeconds = time.perf_counter() - start
+
+        cut = lag_response(series, kernel[:n])
+        scale = max(np.abs(direct).max(), 1e-12)
+
+        Report.append({"Object": obj,
+                       "Rows": len(kernel),
+                       "Cutoff": n,
+                       "Years": n / 365,
+                       "Share": np.abs(kernel[:n]).sum() / max(np.abs(kernel).sum(), 1e-12),
+                       "DirectSeconds": DirectSeconds,
+                       "FFTSeconds": FFTSeconds,
+                       "SpeedUp": DirectSeconds / max(FFTSeconds, 1e-9),
+                       "FFTError": np.abs(fft - direct).max() / scale,
+                       "CutoffError": np.abs(cut - direct).max() / scale})
+
+    return pd.DataFrame(Report)
+
+
+# %%
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per slot Lag Coeff cutoffs and FFT convolution timing")
+    parser.add_argument("model", help="RiverWare model file (.mdl)")
+    parser.add_argument("--share", type=float, default=0.999, help="Share of the total response to keep")
+    parser.add_argument("--diversions", help="CSV of daily diversions, the first column is convolved (default random)")
+    parser.add_argument("--output", help="Cutoff report (default LagCutoffs.csv next to the model)")
+    args = parser.parse_args()
+
+    Kernels = read_lag_coeffs(args.model)
+
+    if args.diversions:
+        series = pd.read_csv(args.diversions, index_col=0).iloc[:, 0].fillna(0).values
+    else:
+        series = np.random.default_rng(0).gamma(2, 100, 365 * 39)
+
+    Report = cutoff_report(Kernels, series, args.share)
+
+    Output = args.output or os.path.join(os.path.dirname(args.model), "LagCutoffs.csv")
+    Report.to_csv(Output, index=False)
+
+    print(Report.to_string(index=False))
+    print(f"Direct {Report['DirectSeconds'].sum():.2f} s, FFT {Report['FFTSeconds'].sum():.2f} s, "
+          f"{Report['DirectSeconds'].sum() / max(Report['FFTSeconds'].sum(), 1e-9):.1f}x faster")
+    print(f"Saved {Output}")
@@ -0,0 +1,115 @@
+"""
+Registry of the full water supply demand models selected by ClimateDemand.py.
+
+ClimateDemand saves, for every reach of a basin, the climate station that
+predicts its diversions best together with the fitted GradientBoostingRegressor
+and QuantileTransformer to Outputs/{BasinName}/ModelRegistry.joblib. Reaches
+with too little diversion for a model (mean below 10 cfs) keep their median
+diversion by day of year instead. DemandService.py loads the registry once and
+predicts from it without re-reading the CSVs or retraining, and
+ClimateDemand's incremental mode extends its models when years are added.
+
+The registry is a dictionary:
+
+    {"Basin": "PAY",
+     "Created": "2024-06-01T08:00:00",
+     "Years": [2011, 2017, 2018],
+     "Features": ["TMAX", "TMIN", "PRCP", "DayOfYear"],
+     "Reaches": {Reach: {"Station": ..., "Model": ..., "Transformer": ...,
+                         "R2": ..., "SplitR2": ..., "SearchSeconds": ..., "UpdateSeconds": ...},
+                 LowFlowReach: {"Station": None, "Median": Series}}}
+
+R2 is the test R2 the station was picked on, the mean over the held out
+years when it was cross validated. SplitR2 is the R2 of the single 70/30
+split, which the incremental updates are compared on.
+"""
+# %%
+import os
+from datetime import datetime
+
+import numpy as np
+
+import Paths
+
+
+Features = ["TMAX", "TMIN", "PRCP", "DayOfYear"]
+
+
+def registry_path(BasinName):
+    return f"{Paths.Outputs}/{BasinName}/ModelRegistry.joblib"
+
+
+def save_registry(BasinName, Reaches, Years, path=None):
+    """
+    Save the models in Reaches for BasinName. The file is written next to the
+    old one and renamed over it so a running service never reads half of it.
+    """
+    import joblib
+
+    path = path or registry_path(BasinName)
+
+    Registry = {"Basin": BasinName,
+                "Created": datetime.now().isoformat(timespec="seconds"),
+                "Years": list(Years),
+                "Features": Features,
+                "Reaches": Reaches}
+
+    joblib.dump(Registry, f"{path}.tmp")
+    os.replace(f"{path}.tmp", path)
+
+    return Registry
+
+
+def read_registry(BasinName, path=None):
+    """The registry as it was saved, to update its models, or None if there is none yet."""
+    import joblib
+
+    path = path or registry_path(BasinName)
+    if not os.path.exists(path):
+        return None
+    return joblib.load(path)
+
+
+def load_registry(BasinName=None, path=None):
+    """
+    Load a registry for prediction from arrays. The feature names are checked
+    against Features and dropped from the models, scikit-learn validates a
+    DataFrame with names much slower than the prediction itself.
+    """
+    import joblib
+
+    Registry = joblib.load(path or registry_path(BasinName))
+
+    for Reach, Entry in Registry["Reaches"].items():
+        Model = Entry.get("Model")
+        if Model is None or not hasattr(Model, "feature_names_in_"):
+            continue
+        if list(Model.feature_names_in_) != Features:
+            raise ValueError(f"{Reach} model was fitted on {list(Model.feature_names_in_)}, not {Features}")
+        del Model.feature_names_in_
+
+    return Registry
+
+
+def climate_features(TMAX, TMIN, PRCP, index):
+    """
+    Model features for one station as an array with the Features columns, as
+    in ClimateDemand.ClimateStation. Precipitation is the 7 day mean, days
+    before the first 7 use the days available so send the six days before the
+    forecast to match the training.
+    """
+    PRCP = np.asarray(PRCP, dtype=float)
+    Sum = np.cumsum(PRCP)
+    Sum[7:] = Sum[7:] - Sum[:-7]
+    PRCP = Sum / np.minimum(np.arange(1, len(PRCP) + 1), 7)
+
+    return np.column_stack([TMAX, TMIN, PRCP, index.dayofyear]).astype(np.float32)
+
+
+def predict_reach(Entry, X):
+    """Full water supply demand (cfs) of one registry entry for the climate_features X."""
+    if Entry["Station"] is None:
+        return Entry["Median"].reindex(X[:, 3].astype(int)).fillna(0).values
+
+    Pred = Entry["Model"].predict(X)
+    return Entry["Transformer"].inverse_transform(Pred.reshape(-1, 1)).flatten()
@@ -0,0 +1,31 @@
+"""
+Data and output folders
+
+Every stage reads its inputs from Data and writes to Outputs. They default
+to the folders next to Scripts, relative to the Scripts folder the scripts
+are run from, and are set with the CROPWATER_DATA and CROPWATER_OUTPUTS
+environment variables or with configure() (CropWater.py --data and
+--outputs).
+
+The stages look the folders up when they run, as Paths.Data and
+Paths.Outputs, so configure() applies to modules that are already imported.
+"""
+# %%
+import os
+
+
+Data = os.environ.get("CROPWATER_DATA", "../Data")
+Outputs = os.environ.get("CROPWATER_OUTPUTS", "../Outputs")
+
+
+def configure(data=None, outputs=None):
+    """
+    Set the folders. They are made absolute, so the working directory can
+    change, and exported so the pipeline's worker processes use them too.
+    """
+    global Data, Outputs
+
+    if data:
+        Data = os.environ["CROPWATER_DATA"] = os.path.abspath(data)
+    if outputs:
+        Outputs = os.environ["CROPWATER_OUTPUTS"] = os.path.abspath(outputs)
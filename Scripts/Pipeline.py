@@ -0,0 +1,440 @@
+"""
+Multi-basin pipeline runner
+
+Runs the five stages of the pipeline (DiversionsDownload, ClimateClean,
+ClimateDemand, WaterSupplyAdjustment and RiverWareFormat) in order for each
+basin in BasinConfig.py. Every basin runs in its own process so the basins
+are processed concurrently and the total refresh time is that of the slowest
+basin instead of the sum of all of them.
+
+A failure in one basin is caught inside its process and reported at the end,
+the other basins carry on.
+
+Each stage declares its inputs, outputs and parameters in stage_graph. The
+hashes of those are kept in Outputs/{BasinName}/StageCache.json and a stage
+is skipped when nothing it depends on has changed (see StageCache.py). The
+download stages always run unless --no-download is given, as the cache has
+no way of telling that IDWR or NCEI published new data.
+
+Usage:
+    python Pipeline.py                    # all basins
+    python Pipeline.py --basins SNK BOI   # selected basins
+    python Pipeline.py --no-download      # reuse the downloaded data
+    python Pipeline.py --dry-run          # print the stages that would run
+    python Pipeline.py --force            # run every stage, ignoring the cache
+    python Pipeline.py --profile          # also dump cProfile stats per basin
+    python Pipeline.py --as-of-day 182    # in-season adjustments as of July 1
+    python Pipeline.py --ghcnd-archive /data/ghcnd/ghcnd_all.tar.gz   # climate from a local archive
+    python Pipeline.py --chunked-climate  # clean the climate out of core
+    python Pipeline.py --incremental      # update the saved demand models for added years
+    python Pipeline.py --no-quality-control   # use the raw data without screening it
+    python Pipeline.py --spatial-climate  # model the reaches on their interpolated climate
+    python Pipeline.py --incremental-export   # write only the RiverWare inputs that changed
+"""
+# %%
+import argparse
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import pandas as pd
+
+import Instrument
+import Paths
+from BasinConfig import Basins
+from StageCache import StageCache, plan
+
+
+Stages = ["DiversionsDownload", "ClimateClean", "ClimateDemand", "WaterSupplyAdjustment", "RiverWareFormat"]
+
+
+def run_stage(Stage, Config, download=True):
+    BasinName = Config["BasinName"]
+
+    # Each stage's module is imported when it runs, so a light command doesn't
+    # load sklearn, scipy, matplotlib and plotly
+    if Stage == "DiversionsDownload":
+        from DiversionsDownload import diversionsDownload, lakeLowellDiversions
+
+        diversionsDownload(BasinName)
+
+        # Lake Lowell fills from the Boise River and is not irrigation demand
+        if BasinName == "BOI":
+            lakeLowellDiversions()
+
+    elif Stage == "ClimateClean":
+        from ClimateClean import climateClean
+
+        climateClean(BasinName, Config["BoundingBox"], f"{Paths.Data}/Climate/{BasinName}", download=download,
+                     archive_dir=Config.get("ClimateArchive"), store=Config.get("ClimateStore"),
+                     quality_control=Config.get("QualityControl", True), thresholds=Config.get("QualityThresholds"),
+                     locations=Config.get("SpatialClimate", False))
+
+    elif Stage == "ClimateDemand":
+        from ClimateDemand import climateDemand
+
+        climateDemand(BasinName, Config["Years"], cross_validate=Config.get("CrossValidate", False),
+                      incremental=Config.get("Incremental", False), margin=Config.get("UpdateMargin", 0.05),
+                      quality_control=Config.get("QualityControl", True), thresholds=Config.get("QualityThresholds"),
+                      spatial=Config.get("SpatialClimate", False))
+
+    elif Stage == "WaterSupplyAdjustment":
+        from WaterSupplyAdjustment import HydrometURL, waterSupplyAdjustment
+
+        # A basin can read local copies of the Hydromet data, e.g. SyntheticData.py's
+        waterSupplyAdjustment(BasinName, Config["WaterSupply"], Config["StartDay"],
+                              url=Config.get("HydrometURL", HydrometURL), AsOfDay=Config.get("AsOfDay"))
+
+    elif Stage == "RiverWareFormat":
+        from RiverWareFormat import riverWareFormat
+
+        riverWareFormat(BasinName, incremental=Config.get("IncrementalExport", False))
+
+
+def stage_graph(Config, download=True):
+    """
+    Inputs, outputs and parameters of every stage for a basin. The stage's own
+    script is one of its inputs so editing it makes the stage stale. With
+    download the stages that fetch data have a Remote source and always run.
+    """
+    BasinName = Config["BasinName"]
+    Outputs = f"{Paths.Outputs}/{BasinName}"
+    RiverWareInputs = f"{Outputs}/RiverWareInputs"
+
+    Reaches = pd.read_csv(f"{Paths.Data}/RiverWareReaches.csv")
+    Reaches = Reaches.loc[Reaches["RiverWare Reach"].str.contains(f"_{BasinName}"), "RiverWare Reach"].unique()
+    Diversions = [f"{Paths.Data}/Diversions/{Reach}" for Reach in Reaches]
+
+    Climate = [f"{Outputs}/Climate/Climate{var}.csv" for var in ["TMAX", "TMIN", "PRCP"]]
+    ClimateSource = Config.get("ClimateArchive") or f"{Paths.Data}/Climate/{BasinName}"
+
+    # New data can be published at any time, the cache can't tell
+    DiversionsRemote = ["IDWR water rights accounting"] if download else []
+    ClimateRemote = ["NCEI GHCNd"] if download and not Config.get("ClimateArchive") else []
+
+    # The quality control reports are only written when it runs
+    QualityControl = Config.get("QualityControl", True)
+    Quality = {"QualityControl": QualityControl, "QualityThresholds": Config.get("QualityThresholds")}
+
+    # Locations of the stations and reaches for the interpolated reach climate,
+    # the station locations are only written by ClimateClean in spatial mode
+    # and not when the station files don't have them, the reach locations
+    # are provided. A missing file hashes to None, so providing it later makes
+    # ClimateDemand stale
+    Spatial = Config.get("SpatialClimate", False)
+    Locations = f"{Outputs}/Climate/StationLocations.csv"
+
+    # The manifest of the last export and the DMI of what it changed
+    IncrementalExport = Config.get("IncrementalExport", False)
+
+    return [
+        {"Name": "DiversionsDownload",
+         "Inputs": ["DiversionsDownload.py", f"{Paths.Data}/RiverWareReaches.csv"],
+         "Outputs": Diversions,
+         "Params": {"BasinName": BasinName},
+         "Remote": DiversionsRemote},
+        {"Name": "ClimateClean",
+         "Inputs": ["ClimateClean.py", "ClimateStore.py", "QualityControl.py", ClimateSource],
+         "Outputs": Climate + ([f"{Outputs}/QualityControlClimate.csv"] if QualityControl else []),
+         "Params": {"BoundingBox": Config["BoundingBox"], "SpatialClimate": Spatial, **Quality},
+         "Remote": ClimateRemote},
+        {"Name": "ClimateDemand",
+         "Inputs": ["ClimateDemand.py", "QualityControl.py", f"{Paths.Data}/RiverWareReaches.csv"]
+                   + Climate + Diversions
+                   + (["SpatialClimate.py", Locations, f"{Paths.Data}/ReachLocations.csv"] if Spatial else []),
+         "Outputs": [f"{Outputs}/ClimateRegressionResults.csv",
+                     f"{Outputs}/ReachDiversions.csv",
+                     f"{Outputs}/ObservedDiversions.csv",
+                     f"{Outputs}/ModelRegistry.joblib"]
+                    + ([f"{Outputs}/QualityControlDiversions.csv"] if QualityControl else []),
+         "Params": {"Years": Config["Years"], "CrossValidate": Config.get("CrossValidate", False),
+                    "Incremental": Config.get("Incremental", False), "UpdateMargin": Config.get("UpdateMargin", 0.05),
+                    "SpatialClimate": Spatial, **Quality}},
+        {"Name": "WaterSupplyAdjustment",
+         "Inputs": ["WaterSupplyAdjustment.py", f"{Paths.Data}/ReachSWSI.csv",
+                    f"{Outputs}/ObservedDiversions.csv", f"{Outputs}/ReachDiversions.csv"],
+         "Outputs": [f"{Outputs}/SlopeThreshold.csv",
+                     f"{RiverWareInputs}/WaterSupply.csv",
+                     f"{RiverWareInputs}/ReachGap.csv"],
+         "Params": {"WaterSupply": Config["WaterSupply"], "StartDay": Config["StartDay"],
+                    "AsOfDay": Config.get("AsOfDay"), "HydrometURL": Config.get("HydrometURL")}},
+        {"Name": "RiverWareFormat",
+         "Inputs": ["RiverWareFormat.py", "ExportManifest.py", f"{Paths.Data}/RiverWareReaches.csv",
+                    f"{Paths.Data}/ReachSWSI.csv",
+                    f"{Outputs}/ReachDiversions.csv", f"{Outputs}/ObservedDiversions.csv",
+                    f"{Outputs}/SlopeThreshold.csv", f"{RiverWareInputs}/ReachGap.csv"] + Diversions,
+         "Outputs": [f"{RiverWareInputs}/FullDiversions",
+                     f"{RiverWareInputs}/FullDiversions.DMI",
+                     f"{RiverWareInputs}/DiversionWeight.csv",
+                     f"{RiverWareInputs}/DivAdjPopulate.bak",
+                     f"{RiverWareInputs}/FullDiversionsImport.bak"]
+                    + ([f"{RiverWareInputs}/ExportManifest.json",
+                        f"{RiverWareInputs}/FullDiversionsChanged.DMI"] if IncrementalExport else []),
+         "Params": {"IncrementalExport": IncrementalExport}},
+    ]
+
+
+def archive_stage(Config, ghcnd_archive):
+    """
+    Building a basin's climate matrices from the local GHCNd archive, cached
+    with the basin's stages. The matrices run to the end of the current year.
+    """
+    stations = os.path.join(os.path.dirname(os.path.abspath(ghcnd_archive)), "ghcnd-stations.txt")
+
+    return {"Name": "GHCNdArchive",
+            "Inputs": ["GHCNdArchive.py", ghcnd_archive, stations],
+            "Outputs": [Config["ClimateArchive"]],
+            "Params": {"BoundingBox": Config["BoundingBox"], "Year": datetime.now().year}}
+
+
+def run_basin(Config, download=True, stages=Stages, cache=True, force=False, report=True, profile=False):
+    """
+    Run the stages for a single basin. Exceptions are caught and returned so
+    that one basin failing does not stop the others.
+
+    With cache, stages whose inputs, outputs and parameters haven't changed
+    since they last ran are skipped. force runs every stage regardless.
+
+    With report, the time and memory used by each stage and step are written
+    to Outputs/{BasinName}/RunReport.json and .csv (see Instrument.py).
+    profile also dumps cProfile stats to Outputs/{BasinName}/Profile.prof.
+    """
+    BasinName = Config["BasinName"]
+    Result = {"Basin": BasinName, "Status": "OK", "Stage": None, "Error": None, "Ran": []}
+    start = time.perf_counter()
+
+    if report:
+        Instrument.reset()
+        Instrument.enable(Basin=BasinName)
+
+    with Instrument.profile(f"{Paths.Outputs}/{BasinName}/Profile.prof" if profile else None):
+        _run_stages(Config, Result, download, stages, cache, force)
+
+    if report:
+        Instrument.disable()
+        Instrument.write_report(f"{Paths.Outputs}/{BasinName}/RunReport")
+
+    Result["Seconds"] = time.perf_counter() - start
+
+    return Result
+
+
+def _run_stages(Config, Result, download, stages, cache, force):
+    BasinName = Config["BasinName"]
+
+    try:
+        Graph = {Stage["Name"]: Stage for Stage in stage_graph(Config, download)}
+        Cache = StageCache(f"{Paths.Outputs}/{BasinName}/StageCache.json")
+    except Exception:
+        Result.update({"Status": "Failed", "Error": traceback.format_exc()})
+        return
+
+    for Stage in stages:
+        Result["Stage"] = Stage
+
+        if Stage == "DiversionsDownload" and not download:
+            continue
+
+        if cache and not force:
+            reason = Cache.stale_reason(Graph[Stage])
+            if reason is None:
+                print(f"{BasinName} {Stage}: up to date")
+                continue
+            print(f"{BasinName} {Stage}: {reason}")
+
+        try:
+            with Instrument.section(Stage):
+                run_stage(Stage, Config, download=download)
+        except Exception:
+            Result["Status"] = "Failed"
+            Result["Error"] = traceback.format_exc()
+
+            # The outputs may be half written
+            if cache:
+                Cache.forget(Graph[Stage])
+            break
+
+        Result["Ran"].append(Stage)
+
+        if cache:
+            Cache.record(Graph[Stage])
+
+
+def basin_configs(BasinNames, as_of_day=None, cross_validate=False, ghcnd_archive=None, chunked_climate=False,
+                  incremental=False, update_margin=0.05, quality_control=True, spatial_climate=False,
+                  incremental_export=False):
+    """
+    Configuration of each basin, with the in-season AsOfDay, station search
+    mode, the folder of the basin's matrices when the climate comes from a
+    local GHCNd archive, the store folder when it is cleaned out of core,
+    whether the demand models are updated incrementally, whether the raw
+    data is screened by QualityControl.py, whether the reaches are modeled
+    on their interpolated climate and whether only the RiverWare inputs that
+    changed are written.
+    """
+    return {BasinName: dict(Basins[BasinName], AsOfDay=as_of_day, CrossValidate=cross_validate,
+                            ClimateArchive=f"{Paths.Data}/ClimateArchive/{BasinName}" if ghcnd_archive else None,
+                            ClimateStore=f"{Paths.Outputs}/{BasinName}/ClimateStore" if chunked_climate else None,
+                            Incremental=incremental, UpdateMargin=update_margin, QualityControl=quality_control,
+                            SpatialClimate=spatial_climate, IncrementalExport=incremental_export)
+            for BasinName in BasinNames}
+
+
+def dry_run(BasinNames, download=True, stages=Stages, force=False, as_of_day=None, cross_validate=False,
+            ghcnd_archive=None, chunked_climate=False, incremental=False, update_margin=0.05, quality_control=True,
+            spatial_climate=False, incremental_export=False):
+    """Print the stages that would run for each basin and why."""
+    for BasinName, Config in basin_configs(BasinNames, as_of_day, cross_validate, ghcnd_archive,
+                                           chunked_climate, incremental, update_margin, quality_control,
+                                           spatial_climate, incremental_export).items():
+        Cache = StageCache(f"{Paths.Outputs}/{BasinName}/StageCache.json")
+        Graph = [Stage for Stage in stage_graph(Config, download) if Stage["Name"] in stages]
+
+        print(BasinName)
+        if not download and Graph[0]["Name"] == "DiversionsDownload":
+            print(f"  skip {'DiversionsDownload':22} download disabled")
+            Graph = Graph[1:]
+
+        if ghcnd_archive and "ClimateClean" in stages:
+            Graph = [archive_stage(Config, ghcnd_archive)] + Graph
+
+        for Stage, reason in plan(Graph, Cache, force=force):
+            action = "skip" if reason is None else "run"
+            print(f"  {action:4} {Stage['Name']:22} {reason or 'up to date'}")
+
+
+def ingest_stale(Configs, ghcnd_archive, cache=True, force=False):
+    """
+    Build the climate matrices of the basins whose archive stage is stale in
+    one pass over the GHCNd archive, before the basins' processes start.
+    """
+    from GHCNdArchive import ingest_archive
+
+    Caches = {BasinName: StageCache(f"{Paths.Outputs}/{BasinName}/StageCache.json") for BasinName in Configs}
+    Archive = {BasinName: archive_stage(Config, ghcnd_archive) for BasinName, Config in Configs.items()}
+
+    Stale = [BasinName for BasinName in Configs
+             if force or not cache or Caches[BasinName].stale_reason(Archive[BasinName]) is not None]
+    if not Stale:
+        print("GHCNd archive: up to date")
+        return
+
+    start = time.perf_counter()
+    ingest_archive(ghcnd_archive, {BasinName: Configs[BasinName]["BoundingBox"] for BasinName in Stale})
+    print(f"GHCNd archive ({', '.join(Stale)}): {time.perf_counter() - start:.1f} s")
+
+    if cache:
+        for BasinName in Stale:
+            Caches[BasinName].record(Archive[BasinName])
+
+
+def run_pipeline(BasinNames, download=True, stages=Stages, max_workers=None, cache=True, force=False,
+                 report=True, profile=False, as_of_day=None, cross_validate=False, ghcnd_archive=None,
+                 chunked_climate=False, incremental=False, update_margin=0.05, quality_control=True,
+                 spatial_climate=False, incremental_export=False):
+    """
+    Run every basin in BasinNames in a separate process. as_of_day fits the
+    water supply adjustments for an in-season update on that day of year and
+    cross_validate picks each reach's station by leave-one-year-out.
+
+    With ghcnd_archive the climate matrices of the basins are first built
+    from one pass over the local GHCNd archive (see GHCNdArchive.py), only
+    for the basins whose archive, station list or bounding box changed since
+    they were last built, and with chunked_climate they are cleaned out of core (see ClimateStore.py).
+    incremental updates the saved demand models for the years added since
+    they were fitted, searching the stations again only for the reaches whose
+    test R2 drops by more than update_margin. quality_control screens the raw
+    climate and diversions before they are used (see QualityControl.py) and
+    spatial_climate models each reach on the climate interpolated to it (see
+    SpatialClimate.py). incremental_export writes only the RiverWare inputs
+    that changed since the last export (see ExportManifest.py).
+    """
+    Results = []
+    Configs = basin_configs(BasinNames, as_of_day, cross_validate, ghcnd_archive, chunked_climate,
+                            incremental, update_margin, quality_control, spatial_climate, incremental_export)
+
+    if ghcnd_archive and "ClimateClean" in stages:
+        ingest_stale(Configs, ghcnd_archive, cache, force)
+
+    with ProcessPoolExecutor(max_workers=max_workers or len(BasinNames)) as pool:
+        futures = {pool.submit(run_basin, Config, download, stages, cache, force, report, profile): BasinName
+                   for BasinName, Config in Configs.items()}
+
+        for future in as_completed(futures):
+            try:
+                Result = future.result()
+            except Exception:
+                # The worker process itself died (e.g. out of memory)
+                Result = {"Basin": futures[future], "Status": "Failed", "Stage": None,
+                          "Error": traceback.format_exc(), "Ran": [], "Seconds": None}
+
+            print(f"{Result['Basin']}: {Result['Status']} ({Result['Seconds'] or 0:.1f} s)")
+            Results.append(Result)
+
+    return Results
+
+
+# %%
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the pipeline for several basins in parallel")
+    parser.add_argument("--basins", nargs="+", default=list(Basins.keys()), choices=list(Basins.keys()))
+    parser.add_argument("--stages", nargs="+", default=Stages, choices=Stages)
+    parser.add_argument("--no-download", action="store_true", help="Skip downloading diversion and climate data")
+    parser.add_argument("--workers", type=int, default=None, help="Number of basins to run at once")
+    parser.add_argument("--dry-run", action="store_true", help="Print the stages that would run and exit")
+    parser.add_argument("--force", action="store_true", help="Run every stage even if it is up to date")
+    parser.add_argument("--no-cache", action="store_true", help="Don't check or update the stage cache")
+    parser.add_argument("--no-report", action="store_true", help="Don't write the RunReport timing and memory files")
+    parser.add_argument("--profile", action="store_true", help="Dump cProfile stats to Outputs/{BasinName}/Profile.prof")
+    parser.add_argument("--as-of-day", type=int, default=None,
+                        help="Fit the water supply adjustments as of this day of year of the season")
+    parser.add_argument("--cross-validate", action="store_true",
+                        help="Pick each reach's climate station by leave-one-year-out cross validation of its "
+                        "best stations on the single split, about twice as slow")
+    parser.add_argument("--ghcnd-archive", default=None,
+                        help="Build the climate from a local ghcnd_all.tar.gz or by_year folder instead of downloading")
+    parser.add_argument("--chunked-climate", action="store_true",
+                        help="Clean the climate matrices on disk a block at a time, for large bounding boxes")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Update the saved demand models for added years instead of searching every station")
+    parser.add_argument("--update-margin", type=float, default=0.05,
+                        help="Search the stations again when an updated model loses more test R2 than this")
+    parser.add_argument("--no-quality-control", action="store_true",
+                        help="Don't mask the suspect values of the raw climate and diversions")
+    parser.add_argument("--spatial-climate", action="store_true",
+                        help="Model each reach on the climate interpolated to Data/ReachLocations.csv")
+    parser.add_argument("--incremental-export", action="store_true",
+                        help="Write only the RiverWare inputs that changed, with FullDiversionsChanged.DMI")
+    args = parser.parse_args()
+
+    # All of the stages use paths relative to the Scripts folder
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    # Keep the stages in pipeline order whatever order they were given in
+    stages = [Stage for Stage in Stages if Stage in args.stages]
+
+    if args.dry_run:
+        dry_run(args.basins, download=not args.no_download, stages=stages, force=args.force,
+                as_of_day=args.as_of_day, cross_validate=args.cross_validate, ghcnd_archive=args.ghcnd_archive,
+                chunked_climate=args.chunked_climate, incremental=args.incremental,
+                update_margin=args.update_margin, quality_control=not args.no_quality_control,
+                spatial_climate=args.spatial_climate, incremental_export=args.incremental_export)
+        sys.exit(0)
+
+    Results = run_pipeline(args.basins, download=not args.no_download, stages=stages,
+                           max_workers=args.workers, cache=not args.no_cache, force=args.force,
+                           report=not args.no_report, profile=args.profile, as_of_day=args.as_of_day,
+                           cross_validate=args.cross_validate, ghcnd_archive=args.ghcnd_archive,
+                           chunked_climate=args.chunked_climate, incremental=args.incremental,
+                           update_margin=args.update_margin, quality_control=not args.no_quality_control,
+                           spatial_climate=args.spatial_climate, incremental_export=args.incremental_export)
+
+    for Result in Results:
+        if Result["Status"] != "OK":
+            print(f"\n{Result['Basin']} failed in {Result['Stage']}:\n{Result['Error']}")
+
+    sys.exit(int(any(Result["Status"] != "OK" for Result in Results)))
@@ -0,0 +1,194 @@
+"""
+Data quality screening of the raw diversion and climate matrices
+
+The IDWR site files and GHCNd station files go into the models as they are,
+apart from the -9999 values. This screens the full sites x days and
+stations x days matrices, each check a single vectorized pass over the
+matrix:
+
+Range       values outside [Low, High], e.g. negative flows or a flow in the
+            wrong units
+Flatline    the same value on at least FlatlineDays consecutive days (a stuck
+            gauge or a copied record), runs of FlatlineIgnore (0 for the
+            diversions and precipitation) are left alone
+Spike       a day more than Spike away from both the day before and the day
+            after, in the same direction. For the diversions the limit of each
+            site is the larger of Spike (CFS) and SpikeRatio times the site's
+            median flow, so it scales with the size of the canal
+Conflict    TMIN above TMAX on the same day at the same station, both values
+            are flagged
+Duplicates  repeated HSTDate rows of a site (the first row is kept)
+
+The flags listed in a kind's Mask are set to NaN, the others are only
+reported. A flat diversion can be a headgate left at the same setting, so
+flatlines are reported but not masked by default.
+
+The thresholds below are the defaults, a basin's own values are set in
+BasinConfig.QualityThresholds. ClimateClean.py screens the climate after the
+pivot and ClimateDemand.py the IDWR sites before they are summed into reaches,
+each writing a report with a row for every site or station with a flag:
+Outputs/{BasinName}/QualityControlClimate.csv and QualityControlDiversions.csv.
+"""
+# %%
+import numpy as np
+import pandas as pd
+
+
+Thresholds = {"Diversions": {"Low": 0, "High": 10000, "FlatlineDays": 60, "FlatlineIgnore": 0,
+                             "Spike": 50, "SpikeRatio": 10, "Mask": ["Range", "Spike"]},
+              "TMAX": {"Low": -40, "High": 125, "FlatlineDays": 10, "FlatlineIgnore": None,
+                       "Spike": 40, "Mask": ["Range", "Flatline", "Spike", "Conflict"]},
+              "TMIN": {"Low": -60, "High": 100, "FlatlineDays": 10, "FlatlineIgnore": None,
+                       "Spike": 40, "Mask": ["Range", "Flatline", "Spike", "Conflict"]},
+              "PRCP": {"Low": 0, "High": 15, "FlatlineDays": 10, "FlatlineIgnore": 0,
+                       "Spike": None, "Mask": ["Range", "Flatline"]}}
+
+
+def limits(overrides=None):
+    """The default Thresholds updated with a basin's overrides, {kind: {threshold: value}}."""
+    overrides = overrides or {}
+    return {kind: dict(Limits, **overrides.get(kind, {})) for kind, Limits in Thresholds.items()}
+
+
+def out_of_range(X, low, high):
+    with np.errstate(invalid="ignore"):
+        return (X < low) | (X > high)
+
+
+def flatlines(X, days, ignore=None):
+    """Every day of a run of at least `days` equal values down each column."""
+    n, m = X.shape
+
+    # A run starts on every day that differs from the day before (NaN always
+    # does) and on the first day of each column. Down the columns in order the
+    # runs are then the gaps between starts, and the long ones are marked by
+    # +1 on their first day and -1 after their last
+    Start = np.ones((n, m), dtype=bool)
+    Start[1:] = X[1:] != X[:-1]
+
+    First = np.flatnonzero(Start.ravel(order="F"))
+    Length = np.diff(First, append=n * m)
+    Long = Length >= days
+
+    Edge = np.zeros(n * m + 1, dtype=np.int8)
+    Edge[First[Long]] += 1
+    Edge[First[Long] + Length[Long]] -= 1
+    Flat = np.cumsum(Edge[:-1], dtype=np.int8).reshape((n, m), order="F").astype(bool)
+
+    Flat &= ~np.isnan(X)
+    if ignore is not None:
+        Flat &= X != ignore
+
+    return Flat
+
+
+def spikes(X, limit):
+    """Days more than limit (a number or one per column) above or below both neighbours."""
+    Spike = np.zeros(X.shape, dtype=bool)
+
+    Before = X[1:-1] - X[:-2]
+    After = X[1:-1] - X[2:]
+    with np.errstate(invalid="ignore"):
+        Spike[1:-1] = (np.abs(Before) > limit) & (np.abs(After) > limit) & (np.sign(Before) == np.sign(After))
+
+    return Spike
+
+
+def flag(X, Limits):
+    """The Range, Flatline and Spike flags of a days x columns matrix."""
+    Flags = {"Range": out_of_range(X, Limits["Low"], Limits["High"]),
+             "Flatline": flatlines(X, Limits["FlatlineDays"], Limits["FlatlineIgnore"])}
+
+    if Limits["Spike"] is not None:
+        Flags["Spike"] = spikes(X, Limits["Spike"])
+
+    return Flags
+
+
+def column_report(X, Flags, Mask, columns):
+    """Days with a value, flagged days of each check and masked days of every column."""
+    Report = pd.DataFrame({"Days": (~np.isnan(X)).sum(axis=0)}, index=columns)
+    for name, Flag in Flags.items():
+        Report[name] = Flag.sum(axis=0)
+    Report["Masked"] = Mask.sum(axis=0)
+
+    return Report
+
+
+def screen(X, Flags, Limits, columns):
+    """Set the flags in Limits["Mask"] to NaN in X, returns the column report."""
+    Mask = np.zeros(X.shape, dtype=bool)
+    for name in Limits["Mask"]:
+        if name in Flags:
+            Mask |= Flags[name]
+
+    Report = column_report(X, Flags, Mask, columns)
+    X[Mask] = np.nan
+
+    return Report
+
+
+def screen_diversions(Sites, Duplicates=None, Limits=None):
+    """
+    Screen the days x sites flows of the IDWR sites. Duplicates is the number
+    of repeated HSTDate rows of each site. Returns the screened flows and the
+    report of every site.
+    """
+    Limits = (Limits or limits())["Diversions"]
+    X = Sites.to_numpy(copy=True)
+
+    # Spike limit of each site from its median flow
+    with np.errstate(invalid="ignore"):
+        Median = np.nanmedian(np.where(X > 0, X, np.nan), axis=0)
+    Limits = dict(Limits, Spike=np.fmax(Limits["Spike"], Limits["SpikeRatio"] * Median))
+
+    Report = screen(X, flag(X, Limits), Limits, Sites.columns)
+    Report.insert(1, "Duplicates", 0 if Duplicates is None else Duplicates.reindex(Sites.columns).fillna(0).values)
+
+    return pd.DataFrame(X, index=Sites.index, columns=Sites.columns), Report
+
+
+def screen_climate(ClimateTMAX, ClimateTMIN, ClimatePRCP, Limits=None):
+    """
+    Screen the date x station climate matrices, which can have different days
+    and stations. Returns the screened TMAX, TMIN and PRCP and the report of
+    every variable and station.
+    """
+    Limits = Limits or limits()
+    Frames = {"TMAX": ClimateTMAX, "TMIN": ClimateTMIN, "PRCP": ClimatePRCP}
+    Values = {var: df.to_numpy(copy=True) for var, df in Frames.items()}
+    Flags = {var: flag(Values[var], Limits[var]) for var in Frames}
+
+    # TMIN above TMAX on the days and stations the two have in common
+    for var in ["TMAX", "TMIN"]:
+        Flags[var]["Conflict"] = np.zeros(Values[var].shape, dtype=bool)
+
+    Days = ClimateTMAX.index.intersection(ClimateTMIN.index)
+    Stations = ClimateTMAX.columns.intersection(ClimateTMIN.columns)
+    if len(Days) and len(Stations):
+        Max = np.ix_(ClimateTMAX.index.get_indexer(Days), ClimateTMAX.columns.get_indexer(Stations))
+        Min = np.ix_(ClimateTMIN.index.get_indexer(Days), ClimateTMIN.columns.get_indexer(Stations))
+
+        with np.errstate(invalid="ignore"):
+            Conflict = Values["TMIN"][Min] > Values["TMAX"][Max]
+        Flags["TMAX"]["Conflict"][Max] = Conflict
+        Flags["TMIN"]["Conflict"][Min] = Conflict
+
+    Reports = {}
+    for var, df in Frames.items():
+        Reports[var] = screen(Values[var], Flags[var], Limits[var], df.columns)
+        Frames[var] = pd.DataFrame(Values[var], index=df.index, columns=df.columns)
+
+    Report = pd.concat(Reports, names=["Variable", "Station"])
+
+    return Frames["TMAX"], Frames["TMIN"], Frames["PRCP"], Report
+
+
+def write_report(Report, path):
+    """Write the rows of Report with a flag or duplicate, most masked first, and print a summary."""
+    Flagged = Report[Report.drop(columns="Days").fillna(0).gt(0).any(axis=1)].fillna(0).astype(int)
+    Flagged = Flagged.assign(**{"Masked %": (100 * Flagged["Masked"] / Flagged["Days"].clip(lower=1)).round(2)})
+    Flagged.sort_values("Masked", ascending=False).to_csv(path)
+
+    print(f"Quality control: {Report['Masked'].sum()} of {Report['Days'].sum()} values masked, "
+          f"{len(Flagged)} of {len(Report)} flagged ({path})")
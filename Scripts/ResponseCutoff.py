@@ -1,46 +1,91 @@
 """
-This script limits the amount of lag coefficients down to 
+This script limits the amount of lag coefficients down to a cutoff for each
+Lag Coeff slot of a RiverWare model, either a fixed number of days
+(365 * 40 by default) or, with --share, the shortest cutoff of each slot that
+keeps that share of the slot's total response (see LagResponse.py). The
+cutoffs of --share are written to ResponseCutoffs.csv next to the output, apart
+from the LagCutoffs.csv report of LagResponse.py.
 
+    python ResponseCutoff.py
+    python ResponseCutoff.py --share 0.999
 """
 
 # %%
-f = open("../../Comparison.mdl", "r")
-
-n = 365 * 40
-
-write = False
-
-all_lines = f.readlines()
-f.close()
-
-
-f2 = open("../../ComparisonCutoff40.mdl", "w")
-iterator = all_lines.__iter__()
-
-for line in iterator:
-    if 'set s "$o.Lag Coeff"' in line:
-        # Check next 5 lines
-        lines = [line]
-        for i in range(5):
-            lines.append(iterator.__next__())
-
-        if (
-            '"$s" setColumnLabels {Lag Coeff}' in lines[-1]
-            and '"$s" resize 29220 1' in lines[3]
-        ):
-            lines[3] = f'"$s" resize {n} 1 \n'
-            lines[-2] = '"$s" setRowLabels' + "".join([" {}"] * n) + "\n"
-            write = True
-        f2.writelines(lines)
-    elif ("set obj" in line) and write:
-        write = False
-        f2.write(line)
-    elif ('"$s" row' in line) and write:
-        if int(line.split(" ")[2]) < n:
+import argparse
+import os
+
+import pandas as pd
+
+from LagResponse import object_name, read_lag_coeffs, response_cutoff
+
+
+def cutoff_model(model, output, n):
+    """
+    Write model to output with each 29220 row Lag Coeff slot cut to n rows. n
+    is a number of rows for every slot or a dictionary of rows by object name.
+    """
+    f = open(model, "r")
+
+    write = False
+    obj = None
+    cut = None
+
+    all_lines = f.readlines()
+    f.close()
+
+
+    f2 = open(output, "w")
+    iterator = all_lines.__iter__()
+
+    for line in iterator:
+        if 'set s "$o.Lag Coeff"' in line:
+            # Check next 5 lines
+            lines = [line]
+            for i in range(5):
+                lines.append(iterator.__next__())
+
+            cut = n.get(obj) if isinstance(n, dict) else n
+
+            if (
+                '"$s" setColumnLabels {Lag Coeff}' in lines[-1]
+                and '"$s" resize 29220 1' in lines[3]
+                and cut is not None
+            ):
+                lines[3] = f'"$s" resize {cut} 1 \n'
+                lines[-2] = '"$s" setRowLabels' + "".join([" {}"] * cut) + "\n"
+                write = True
+            f2.writelines(lines)
+        elif "set obj" in line:
+            obj = object_name(line)
+            write = False
+            f2.write(line)
+        elif ('"$s" row' in line) and write:
+            if int(line.split(" ")[2]) < cut:
+                f2.write(line)
+        else:
             f2.write(line)
-    else:
-        f2.write(line)
 
-f.close()
-f2.close()
+    f2.close()
+
+
+# %%
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cut the Lag Coeff tables of a RiverWare model")
+    parser.add_argument("--model", default="../../Comparison.mdl")
+    parser.add_argument("--output", default="../../ComparisonCutoff40.mdl")
+    parser.add_argument("--days", type=int, default=365 * 40, help="Rows kept in every slot")
+    parser.add_argument("--share", type=float, help="Keep this share of each slot's response instead of --days")
+    args = parser.parse_args()
+
+    n = args.days
+
+    if args.share is not None:
+        Kernels = read_lag_coeffs(args.model)
+        n = {obj: response_cutoff(kernel, args.share) for obj, kernel in Kernels.items()}
+
+        pd.Series(n, name="Cutoff").rename_axis("Object").to_csv(
+            os.path.join(os.path.dirname(args.output), "ResponseCutoffs.csv"))
+
+    cutoff_model(args.model, args.output, n)
 # %%
@@ -28,101 +28,121 @@ import pandas as pd
 from datetime import datetime
 import os
 
-# Update this to the name of the basin
-BasinName = "PAY"
-
-DiversionTotal = pd.read_csv(
-    f"../Outputs/{BasinName}/ReachDiversions.csv", index_col=0, parse_dates=True
-)
-Reaches = pd.read_csv("../Data/RiverWareReaches.csv")
-HistoricalDiversions = pd.read_csv(
-    f"../Outputs/{BasinName}/ObservedDiversions.csv", index_col=0, parse_dates=True
-)
-SlopeThreshold = pd.read_csv(f"../Outputs/{BasinName}/SlopeThreshold.csv", index_col=0)
-
-f = open(f"../Outputs/{BasinName}/RiverWareInputs/FullDiversions.DMI", "w")
-
-PathName = os.path.dirname(os.getcwd()).replace("\\", "/")
-
-# if folder does not exist, create it
-if not os.path.exists(f"../Outputs/{BasinName}/RiverWareInputs/FullDiversions"):
-    os.makedirs(f"../Outputs/{BasinName}/RiverWareInputs/FullDiversions")
-
-for reach in DiversionTotal.columns:
-    div = DiversionTotal[reach].loc[datetime(1980, 9, 30) :]
-    div = div.resample("1D").ffill()
-    div.to_csv(
-        f"../Outputs/{BasinName}/RiverWareInputs/FullDiversions/{reach}.txt",
-        header=False,
-        index=False,
-        sep="\t",
-    )
+import Paths
+from DailyMatrix import Dtype, read_daily
+from ExportManifest import ExportManifest, hash_sections, hash_values, new_uuid, write_if_changed
+from Instrument import section
+
+
+def write_full_diversions(BasinName, DiversionTotal, Manifest=None):
+    """
+    Write the FullDiversions/{reach}.txt series and the DMI that imports them.
+    With a Manifest only the series whose values changed since the last export
+    are written, and FullDiversionsChanged.DMI imports just those. Returns the
+    reaches written.
+    """
+    RiverWareInputs = f"{Paths.Outputs}/{BasinName}/RiverWareInputs"
+    PathName = os.path.abspath(Paths.Outputs).replace("\\", "/")
+
+    # if folder does not exist, create it
+    if not os.path.exists(f"{RiverWareInputs}/FullDiversions"):
+        os.makedirs(f"{RiverWareInputs}/FullDiversions")
+
+    Series = {}
+    for reach in DiversionTotal.columns:
+        div = DiversionTotal[reach].loc[datetime(1980, 9, 30) :]
+        Series[reach] = div.resample("1D").ffill()
+
+    if Manifest is None:
+        Written = list(Series)
+    else:
+        Changed = set(Manifest.changed("FullDiversions", {reach: hash_values(div.to_numpy())
+                                                          for reach, div in Series.items()}))
+        Written = [reach for reach in Series if reach in Changed
+                   or not os.path.exists(f"{RiverWareInputs}/FullDiversions/{reach}.txt")]
+
+    for reach in Written:
+        Series[reach].to_csv(
+            f"{RiverWareInputs}/FullDiversions/{reach}.txt",
+            header=False,
+            index=False,
+            sep="\t",
+        )
 
-    f.write(
-        f"FullDiversionReach_{BasinName}.{reach}: file={PathName}/Outputs/{BasinName}/RiverWareInputs/FullDiversions/{reach}.txt import=resize\n"
-    )
+    def dmi(reaches):
+        return "".join(f"FullDiversionReach_{BasinName}.{reach}: file={PathName}/{BasinName}/RiverWareInputs/FullDiversions/{reach}.txt import=resize\n"
+                       for reach in reaches)
 
-f.close()
+    if Manifest is None:
+        with open(f"{RiverWareInputs}/FullDiversions.DMI", "w") as f:
+            f.write(dmi(Series))
+    else:
+        write_if_changed(f"{RiverWareInputs}/FullDiversions.DMI", dmi(Series))
+        with open(f"{RiverWareInputs}/FullDiversionsChanged.DMI", "w") as f:
+            f.write(dmi(Written))
 
+    return Written
 
-# Calculate the percentage of the diversions for each reach
-Perc = []
 
-for Reach in DiversionTotal.columns:
-    if BasinName not in Reach:
-        continue
+def diversion_weights(BasinName, DiversionTotal, Reaches, HistoricalDiversions, SlopeThreshold):
+    # Calculate the percentage of the diversions for each reach
+    Perc = []
 
-    for i, row in Reaches.loc[Reaches["RiverWare Reach"] == Reach].iterrows():
-        SiteCode = row["IDWR Site Code"]
-        try:
-            Diversions = pd.read_csv(
-                f"../Data/Diversions/{Reach}/{SiteCode}.csv",
-                index_col=4,
-                parse_dates=True,
-                engine="python",
-            )
-        except FileNotFoundError:
-            Perc.append([row["RiverWare Reach"], row["Diversion name"], 0])
+    for Reach in DiversionTotal.columns:
+        if BasinName not in Reach:
             continue
 
-        p = (
-            Diversions.loc[
-                datetime(2010, 1, 1) : datetime(2018, 1, 1), "Flow (CFS)"
-            ].sum()
-            / HistoricalDiversions.loc[
-                datetime(2010, 1, 1) : datetime(2018, 1, 1), Reach
-            ].sum()
-        )
+        for i, row in Reaches.loc[Reaches["RiverWare Reach"] == Reach].iterrows():
+            SiteCode = row["IDWR Site Code"]
+            try:
+                Diversions = pd.read_csv(
+                    f"{Paths.Data}/Diversions/{Reach}/{SiteCode}.csv",
+                    usecols=["HSTDate", "Flow (CFS)"],
+                    index_col="HSTDate",
+                    parse_dates=True,
+                    dtype={"Flow (CFS)": Dtype},
+                )
+            except FileNotFoundError:
+                Perc.append([row["RiverWare Reach"], row["Diversion name"], 0])
+                continue
+
+            p = (
+                Diversions.loc[
+                    datetime(2010, 1, 1) : datetime(2018, 1, 1), "Flow (CFS)"
+                ].sum()
+                / HistoricalDiversions.loc[
+                    datetime(2010, 1, 1) : datetime(2018, 1, 1), Reach
+                ].sum()
+            )
 
-        if p<0.01:
-            continue
+            if p<0.01:
+                continue
 
-        p = min(p, 1)
-
-        Perc.append(
-            [
-                row["RiverWare Reach"],
-                row["Diversion name"],
-                SlopeThreshold.loc[Reach, "Slope"],
-                SlopeThreshold.loc[Reach, "Break"],
-                SlopeThreshold.loc[Reach, "y2"],
-                p,
-            ]
-        )
+            p = min(p, 1)
+
+            Perc.append(
+                [
+                    row["RiverWare Reach"],
+                    row["Diversion name"],
+                    SlopeThreshold.loc[Reach, "Slope"],
+                    SlopeThreshold.loc[Reach, "Break"],
+                    SlopeThreshold.loc[Reach, "y2"],
+                    p,
+                ]
+            )
 
 
-Perc = pd.DataFrame(
-    Perc, columns=["Diversion", "Name", "Slope", "Break", "Offset", "Percentage"]
-)
-Perc.fillna(0, inplace=True)
-# This feeds into RiverWare
-Perc.to_csv(f"../Outputs/{BasinName}/RiverWareInputs/DiversionWeight.csv")
+    Perc = pd.DataFrame(
+        Perc, columns=["Diversion", "Name", "Slope", "Break", "Offset", "Percentage"]
+    )
+    Perc.fillna(0, inplace=True)
 
+    return Perc
 
-import uuid
 
-# Write Header for RiverWare Object
-header = f"""# RiverWare_Object 8.3.5 Patch
+def div_adj_object(BasinName, ReachGap, Perc, ReachWaterSupply, UUIDs=None):
+    # Write Header for RiverWare Object
+    header = f"""# RiverWare_Object 8.3.5 Patch
 # Created 13:38 July 3, 2023
 # CADSWES, University of Colorado at Boulder, http://cadswes.colorado.edu/
 # objects:  1
@@ -136,28 +156,26 @@ set o "$ws.AdjustmentTable_{BasinName}"
 $ws SimObj $obj {{DataObj}} 2447 2072 {{}} 50 1415 50 721
 "$o" webMapCoords 3050 2907
 "$o" geospatialCoords 0 0 357 50
-"$o" UUID {{{uuid.uuid4()}}}
+"$o" UUID {{{new_uuid(UUIDs, f'AdjustmentTable_{BasinName}')}}}
 "$o" objOrd wsList 6690
 "$o" objSlotOrderType ListOrder_DEFAULT 0 Ascend"""
 
-# Write the diversion shortage spread object
-
-ReachGap = pd.read_csv(f"../Outputs/{BasinName}/RiverWareInputs/ReachGap.csv", index_col=0)
+    # Write the diversion shortage spread object
 
-div_shortage = f"""
+    div_shortage = f"""
 "$o" {{PeriodicSlot}} {{DiversionShortageSpread}}
 set s "$o.DiversionShortageSpread"
 "$s" order 2 
-"$s" UUID {{{uuid.uuid4()}}}
+"$s" UUID {{{new_uuid(UUIDs, 'DiversionShortageSpread')}}}
 "$s" resize 366 {ReachGap.shape[1]}
 """
 
-div_shortage += '"$s" setRowLabels {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} {} '
-div_shortage += '\n"$s" setColumnLabels '
-for col in ReachGap.columns:
-    div_shortage += "{" + col + "} "
+    div_shortage += '"$s" setRowLabels ' + "".join(["{} "] * 366)
+    div_shortage += '\n"$s" setColumnLabels '
+    for col in ReachGap.columns:
+        div_shortage += "{" + col + "} "
 
-div_shortage += f"""
+    div_shortage += f"""
 "$s" setMaximums {' '.join(['NaN']*ReachGap.shape[1])}
 "$s" setMinimums {' '.join(['NaN']*ReachGap.shape[1])}
 "$s" setUnitTypes {' '.join(['{NONE}']*ReachGap.shape[1])}
@@ -168,30 +186,30 @@ div_shortage += f"""
 """
 
 
-for i, row in ReachGap.iterrows():
-    div_shortage += f'"$s" row {i} '
-    for obj in row:
-        div_shortage += f"{obj} "
-    div_shortage += "\n"
+    for i, row in ReachGap.iterrows():
+        div_shortage += f'"$s" row {i} '
+        for obj in row:
+            div_shortage += f"{obj} "
+        div_shortage += "\n"
     
-# Write footer
-div_shortage += """"$s" columnGuiEditEnabled 0
+    # Write footer
+    div_shortage += """"$s" columnGuiEditEnabled 0
 "$s" defaultAccessMethod 1
 "$s" rowMap3 Reg 1 YEAR  {StringVal: 1900} 1 DAY
 """
 
-# Write the DiversionWeight object
-div_weight = f"""
+    # Write the DiversionWeight object
+    div_weight = f"""
 "$o" {{TableSlot}} {{DiversionWeight}}
 set s "$o.DiversionWeight"
 "$s" order 500 
-"$s" UUID {{{uuid.uuid4()}}}
+"$s" UUID {{{new_uuid(UUIDs, 'DiversionWeight')}}}
 "$s" resize {len(Perc)} 4
 "$s" setRowLabels """
-for i, row in Perc.iterrows():
-    div_weight += "{" + row["Diversion"] + "__" + row["Name"] + "} "
+    for i, row in Perc.iterrows():
+        div_weight += "{" + row["Diversion"] + "__" + row["Name"] + "} "
 
-div_weight += """
+    div_weight += """
 "$s" setColumnLabels {Slope} {Threshold} {Percent} {Offset}
 "$s" setMaximums NaN NaN NaN NaN
 "$s" setMinimums NaN NaN NaN NaN
@@ -201,53 +219,38 @@ div_weight += """
 "$s" setUsrFormat {%f} {%f} {%f} {%f}
 "$s" setUsrPrecision {2} {2} {2} {2}
 """
-unit = 0.000810713193789912
+    unit = 0.000810713193789912
 
-for i, row in Perc.iterrows():
-    div_weight += f'"$s" row {i} {row["Slope"]} {row["Break"]/unit} {row["Percentage"]} {row["Offset"]/35.3147}\n'
+    for i, row in Perc.iterrows():
+        div_weight += f'"$s" row {i} {row["Slope"]} {row["Break"]/unit} {row["Percentage"]} {row["Offset"]/35.3147}\n'
 
-div_weight += """"$o" hideSlots 0 hideOff hideEmptyOff
+    div_weight += """"$o" hideSlots 0 hideOff hideEmptyOff
 # Section: Snapshot Object Relationships
 # Section: Links
 """
 
-ReachWaterSupply = pd.read_csv("../Data/ReachSWSI.csv")
-ReachWaterSupply = ReachWaterSupply[ReachWaterSupply['Reach'].str.contains(f"_{BasinName}")]
-
-ReachWaterSupply['Water Supply'] = ReachWaterSupply['Water Supply'].apply(lambda x: x.split('+'))
+    # Reach as index and Water Supply as columns and get the count
+    ReachWaterSupply = ReachWaterSupply.pivot_table(
+        index="Reach", columns="Water Supply", aggfunc="size"
+    ).fillna(0)
 
-ReachWaterSupply = ReachWaterSupply.explode('Water Supply')
-
-ReachWaterSupplyPivot = pd.DataFrame(index=ReachWaterSupply['Reach'].unique(), 
-                                     columns=ReachWaterSupply['Water Supply'].unique())
-
-for i, row in ReachWaterSupply.iterrows():
-    ReachWaterSupplyPivot.loc[row['Reach'], row['Water Supply']] = 1
-
-ReachWaterSupplyPivot.fillna(0, inplace=True)
-
-# Reach as index and Water Supply as columns and get the count
-ReachWaterSupply = ReachWaterSupply.pivot_table(
-    index="Reach", columns="Water Supply", aggfunc="size"
-).fillna(0)
-
-# Write the Water Supply object
-water_supply = f"""
+    # Write the Water Supply object
+    water_supply = f"""
 "$o" {{TableSlot}} {{WaterSupply}}
 set s "$o.WaterSupply"
 "$s" order 3 
-"$s" UUID {{{uuid.uuid4()}}}
+"$s" UUID {{{new_uuid(UUIDs, 'WaterSupply')}}}
 "$s" resize {ReachWaterSupply.shape[0]} {ReachWaterSupply.shape[1]} 
 "$s" setRowLabels """
-for idx in ReachWaterSupply.index:
-    water_supply += "{" + idx + "} "
+    for idx in ReachWaterSupply.index:
+        water_supply += "{" + idx + "} "
 
-water_supply += '\n "$s" setColumnLabels '
+    water_supply += '\n "$s" setColumnLabels '
 
-for col in ReachWaterSupply.columns:
-    water_supply += "{" + col + "} "
+    for col in ReachWaterSupply.columns:
+        water_supply += "{" + col + "} "
 
-water_supply += f"""
+    water_supply += f"""
 "$s" setMaximums {' '.join(['NaN']*ReachWaterSupply.shape[1])}
 "$s" setMinimums {' '.join(['NaN']*ReachWaterSupply.shape[1])}
 "$s" setUnitTypes {' '.join(['{NONE}']*ReachWaterSupply.shape[1])}
@@ -257,26 +260,24 @@ water_supply += f"""
 "$s" setUsrPrecision {' '.join(['{2}']*ReachWaterSupply.shape[1])}
 """
 
-for i, (idx, row) in enumerate(ReachWaterSupply.iterrows()):
-    water_supply += f'"$s" row {i} '
-    for obj in row:
-        water_supply += f"{obj} "
-    water_supply += "\n"
+    for i, (idx, row) in enumerate(ReachWaterSupply.iterrows()):
+        water_supply += f'"$s" row {i} '
+        for obj in row:
+            water_supply += f"{obj} "
+        water_supply += "\n"
 
-footer = """"$o" hideSlots 0 hideOff hideEmptyOff
+    footer = """"$o" hideSlots 0 hideOff hideEmptyOff
 # Section: Snapshot Object Relationships
 # Section: Links"""
 
-# Write the DiversionAdjustment object
-div_adj = header + div_shortage + div_weight + water_supply + footer
+    # Write the DiversionAdjustment object
+    div_adj = header + div_shortage + div_weight + water_supply + footer
 
-f = open(f"../Outputs/{BasinName}/RiverWareInputs/DivAdjPopulate.bak", "w")
-f.write(div_adj)
-f.close()
+    return div_adj
 
-DiversionTotal = pd.read_csv(f"../Outputs/{BasinName}/ReachDiversions.csv", index_col=0, parse_dates=True).dropna()
 
-header = f"""# RiverWare_Object 8.3.5 Patch
+def full_diversions_object(BasinName, DiversionTotal, UUIDs=None):
+    header = f"""# RiverWare_Object 8.3.5 Patch
 # Created 13:21 August 29, 2023
 # CADSWES, University of Colorado at Boulder, http://cadswes.colorado.edu/
 # objects:  1
@@ -290,42 +291,150 @@ set o "$ws.FullDiversionReach_{BasinName}"
 $ws SimObj $obj {{DataObj}} 2343 2064 {{}} 3632 696 683 502
 "$o" webMapCoords 2695 2142
 "$o" geospatialCoords 0 0 683 502
-"$o" UUID {{{uuid.uuid4()}}}
+"$o" UUID {{{new_uuid(UUIDs, f'FullDiversionReach_{BasinName}')}}}
 "$o" objOrd wsList 6689
 "$o" objSlotOrderType ListOrder_DEFAULT 0 Ascend
 """
 
 
-start = DiversionTotal.index[0].strftime('%d-%m-%Y %H:%M:%S')
-end = DiversionTotal.index[-1].strftime('%d-%m-%Y %H:%M:%S')
-n = len(DiversionTotal)
+    start = DiversionTotal.index[0].strftime('%d-%m-%Y %H:%M:%S')
+    end = DiversionTotal.index[-1].strftime('%d-%m-%Y %H:%M:%S')
+    n = len(DiversionTotal)
 
-data = ''
+    data = ''
 
-for i, col in enumerate(DiversionTotal.columns):
-    data += f""""$o" {{SeriesSlot}} {{{col}}}
+    for i, col in enumerate(DiversionTotal.columns):
+        data += f""""$o" {{SeriesSlot}} {{{col}}}
 set s "$o.{col}"
 "$s" order {i}
-"$s" UUID {{{uuid.uuid4()}}}
+"$s" UUID {{{new_uuid(UUIDs, col)}}}
 "$s" cvg 2 0.0001
 "$s" unit {{Flow}} 1 {{cms}} {{%f}} 2
 "$s" minMax NaN NaN
 "$s" setFSeries {{cms}} {{{start}}} {{{end}}} 1 DAY -1 1 @ {n}
 """
     
-    # data += r'"$s" setDSeries {cms} {10-01-1980 00:00:00} {08-04-2019 00:00:00} 1 DAY -1 0.3470977841658312 @ 2 0.27852410739929739 0.33607635559133608 0.25577282761473041 0.30785520624733959 0.31775762922768119 @ 2 0.25577282761473041 0.27869769136662276 0.34397584300270101 0.28950561959919374 0.27582538679440183 0.33226251531790651 0.28349311738965505 0 @ 3 0.040391578577109538 0.036758588924275609 0.070755400307175587 0.047591473080532194 0.37033206264799329 0.045695989108109951 0.15030874542829079 0.043796645368560608 0 @ 177 0.051108066882333672 0.02985340708924606 0.027480627486083899 0 @ 9 0.0026658964233348724 0 @ 6 0.099512895125552558 0.003575070252046772 0 0.034961761758081925 0.32657286103327915 0.054621675409910767 0.27763719420065008 0.49472942546247134 0.13354603910567048 0.34914467391007731 0.49005196087518726 0.89255999473545622 1.3920793464637993 1.146219684371425 1.0299751095201859 0.84941479447427126 0.77867516310460128 0.66896018119802603 1.4714791795061912 1.4422708578891634 1.0262015841112002 2.0170123341429584 2.0836126705551998 1.5339651733441459 1.8867472066489923 1.853752040813766 1.9155707671254729 @ 2 1.6068882575953729 1.6012507147900903 1.6292891053086664 @ 2 1.6349266481139488 1.610046164856844 1.673100521481619 1.5220733024539796 1.4032702241600468 1.6349266481139488 @ 2 1.6292891053086664 1.6349266481139488 1.7826757657689034 @ 2 1.7511548246040607 @ 3 1.753648614523466 1.8489245168444501 1.7511548246040607 @ 2 1.7092181248776392 1.8489245168444501 1.7511548246040607 @ 3 1.753648614523466 1.8489245168444501 @ 2 1.7511548246040607 1.2814206398500168 1.6800777367833706 1.7511548246040607 @ 2 1.7049582200404756 1.7039332936699036 @ 2 1.6639709046046485 1.6164820129219488 1.645622401016217 1.7019193178756662 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 @ 5 1.331282633073918 1.3160527005504377 1.3743834612812018 1.1712554278252605 0.92760731211049119 0.91591703528780832 0.91152815327545589 0.77402949504987828 0.80586101049787184 0.77511005855849857 0.70899236922189801 @ 2 0.81526555013254975 0.76436607695219927 @ 3 0.81526555013254975 0.76436607695219927 0.81710440006174656 0.70899236922189801 0.76436607695219927 0.70899236922189801 @ 2 0.76436607695219927 @ 2 0.77551541051558592 @ 2 0.69606998199482162 0.80234316290547381 @ 3 0.77551541051558592 0.69580361069054164 0.8039156415303903 0.75117731842084279 0.67481225865143191 0.46685311588704603 0.40237602713114723 0.46570183832373113 0.40237602713114723 @ 2 0.34585835578790869 @ 8 0.35933684696936752 0.37310239793433797 0.35933684696936752 @ 2 0.33402433775774887 0.37310239793433797 0.36108845666733541 0.38747038584528837 0.36850269190316964 0.38005862469655538 0.35933684696936752 0.31259119950128123 0.22498841562468916 0.30304975409625323 0.31540097812387008 0.31259119950128123 0.33860082817763243 0.31197346889142136 0.35933684696936752 0.39669390073248939 0.32771964908734719 0.33112389976669576 0.27874082631856584 0.27325379773676584 0.023496901719251308 0.39677800441994227 0.26524893425997137 0.32556004848951842 0 0.029322763421618554 0.29671596347558704 0.030028396119882339 0.017872119180257339 0.025626253955857874 0.23547546314430479 0.2665488149841963 0.35042042821097724 0.2688912772856813 0.093126672122670603 @ 2 0.4186951298470199 0.15030874542829079 0.25967357423095305 0.22404916240781528 0.041093499082619132 0 @ 197 0.031034233017260972 0.03900624075715238 0.1589901479990059 0.55020418242851277 0.050052818219411599 0.7522161644597124 0.49962521148255523 0.78660346266758152 1.0691254576032458 1.2183398097431617 0.55870125633135093 0.56680361141140301 @ 2 1.1623999513982777 1.3801979453784303 0.60402198965436404 0.59919235707274288 1.0221032129097982 1.6181475149259115 1.7434838937499015 1.6192059089801094 1.6524369113514046 1.5614761406685724 1.7023133464523335 1.5161337475382142 1.6404919585536659 1.6736968727689139 1.5164271202138957 1.6349266481139488 @ 4 1.6932587362148137 1.6349266481139488 @ 2 1.610046164856844 1.6349266481139488 @ 2 1.7511548246040607 1.6349266481139488 @ 2 1.5270509676494435 1.6349266481139488 @ 4 1.5146213903017793 1.7511548246040607 1.7414705307751843 1.7511548246040607 1.6349266481139488 1.4822025491839572 1.5270509676494435 1.6349266481139488 @ 2 1.6209990924912936 @ 2 1.6349266481139488 @ 2 1.6912248923434992 1.6214604198238578 @ 2 1.6639709046046485 1.645622401016217 @ 3 1.5423542858086474 1.6407310018987178 1.5740322485071747 1.3774928275111349 @ 2 1.4364724343170836 1.6470205318412938 @ 2 1.4729153694108448 1.4818459517073641 1.4874834945126467 1.3426862217874693 1.0866479005767897 0.99850518966606083 0.8356623574128117 0.80443688009788594 0.80586101049787184 0.82784838166804586 0.70899236922189801 @ 2 0.73939975426990545 @ 2 0.78974167367095316 0.73939975426990545 @ 4 0.7600558254329971 0.70899236922189801 0.81526555013254975 0.82022673883244435 0.76748841572289717 0.82022673883244435 0.81526555013254975 @ 2 0.75926903123765421 0.76436607695219927 @ 4 0.70907970790403496 @ 2 0.68899857183933499 0.60967762161780936 0.42617190369575914 0.35190676882472577 @ 2 0.35875793108728926 @ 2 0.30651034135776256 0.34585835578790869 @ 4 0.27797249648162614 0.39544538063913792 0.39785367036387009 0.42383894376947046 0.28855658201489792 0.31688715831156095 0.29053798248032475 0.29334776110291361 @ 4 0.23978039709107893 0.27859094731827178 0.27382524855992474 0.27101546993733588 0.45645849895661206 0.57133374923659053 0.548022610891165 0.43471693323482902 0.25418588138063503 0.30165407286946405 0.31802488419794378 0.31759590733600007 0.23185820541202204 0.31434870589822733 0.21781010814893517 0.32734447176441361 0.035006863306280354 0.032458746033382641 @ 2 0.16749299853328087 0.31962357235516464 0.22745580173308086 0.35862564517130097 0.30804614050742651 0.31511787174625222 0.29549881526420252 0.057149206343617913 0.037694368009163419 0.039816585149119087 0.32384239410724519 0.23048696054889445 0.28147707036039743 0.13401937826785226 0.21272036301643954 0.09030709525208977 0 @ 4 0.013398196527311737 0 @ 181 0.0010801035415283272 0 @ 2 0.033869379195786933 0 @ 2 0.15292297514869577 0.36695436377704499 0 @ 6 0.01497320290490624 0.14118660240509714 1.6538966013432714 0.84388375544871075 1.3734736214827359 0.73239849763961706 1.4542829333483371 1.4783901798897687 0.63348413151463423 0.82647063995008341 0.58335138636257133 0.49699916500207186 @ 3 0.99380179539298386 0.57903966128862916 1.7223312641275801 1.6542624490376092 1.7468971952517305 1.6822260615805005 1.6682282051282327 1.6292891053086664 @ 2 1.6349266481139488 @ 4 2.0264673069616861 1.773798816985082 1.6002267134529624 2.0361516007905629 1.921975554822869 1.9122912609939924 1.6068882575953729 1.8087766979895097 1.6705662778190813 1.6656037624650226 1.6292891053086664 1.6444885511518863 1.6349266481139488 @ 5 1.6292891053086664 1.6349266481139488 @ 3 1.6056329513428675 1.5270509676494435 1.6444885511518863 1.6912248923434992 @ 3 1.7511548246040607 2.2286335369710621 1.9920128941054402 2.1187175697771266 @ 2 2.068098610040741 @ 2 1.713729609555251 1.6122417951488039 1.6490758364880969 1.6199354483938282 1.6653840868380159 1.5878875205111478 1.5082829661255253 1.3774928275111349 @ 5 1.331282633073918 1.3160527005504377 1.2548070957237127 1.1127257017460472 0.95801469715849874 0.94632442033581599 0.8356623574128117 0.80443688009788594 0.78089468781557825 0.80048565527725235 0.78974167367095316 0.80234316290547381 0.7878163888797205 0.88464592591726088 @ 6 0.73939975426990545 @ 11 0.72226846643539133 @ 2 0.70907970790403496 @ 2 0.75117731842084279 0.67481225865143191 0.49454636822335252 0.40237602713114723 @ 3 0.39960283982049588 0.40430409649659843 0.34585835578790869 @ 2 0.37118476672395528 0.35151881183123451 0.33072793343791967 0.34585835578790869 0.30651034135776256 0.30304975409625323 0.33472424575855858 0.32016667688221717 0.30300042483494671 0.31540097812387008 0.31195463784777416 0.49996568988714124 0.3612898708694845 0.36497115061511648 0.36190035978258916 0.35933684696936752 0.3470977841658312 @ 2 0.31259119950128123 0.32999646062492349 0.16474712366169608 0.36451622844385911 0.40600206772832143 0.41824113053185769 0.34344972614909541 0.22594235704539595 0.25450553978077178 0.23450406861660628 0.32241277512368099 0.2815074699892115 0.26524893425997137 0.27027165275348014 0.32402470280843038 0.21340770446999399 0.39659906666242978 0.26902625839028382 0.020635978046930004 0.17866598709886292 0.15952481806263893 0.29356889502411671 0.37033206264799329 0.25617309583813841 0.33920662590445516 0.23170303484271701 0.24854560404968934 0.016871063991939262 0.078662701840253646 0.20206647894887045 0.19227366179618566 0.02990992132272572 0 0.21479022629891797 0.040688200443001248 0 @ 163 0.042583382123280659 0.039973306647769928 0.034471273065653181 0 @ 20 0.020210237757482517 0 @ 2 0.01195411578827788 0.0090289461059057247 0.019112633086130305 0.093750896950842044 0.0522638891217913 0.18164122428483551 0.14462244144220157 0.16595077420784074 0.21221688563157365 0.54098076816898999 0.59833102239254277 0.74771799995089638 0.43831341108516408 1.1034781213883711 0.55732880842404542 0.6346467755505133 0.74394127229833695 0.80081457122255972 0.57944998233405465 1.3745177146787715 0.61394615862149093 0.61557635425427037 1.6171519350762438 1.7046569587176801 1.4089079955413033 1.6228792295002517 1.7103298814597541 1.666442262089654 1.719718584579778 1.5687959386974619 1.4367505382269616 1.6450621309630433 1.3475447070979893 0.82577275013939455 1.6330250957349812 1.6012507147900903 1.7302512358498521 1.8371589732733116 1.7890880623221732 1.7794037684932968 1.7463478262319982 1.7794037684932968 1.7890880623221732 @ 2 1.7935255543881421 1.9014554502627539 1.6643237442917025 1.8032098482170187 1.7570872112810023 @ 2 1.7511548246040607 1.753648614523466 1.6349266481139488 @ 2 1.6444885511518863 1.6349266481139488 @ 3 1.6357616869577964 1.8489245168444501 1.7511548246040607 @ 3 1.7092181248776392 1.7511548246040607 1.7039332936699036 @ 2 1.6639709046046485 1.6164820129219488 1.645622401016217 1.6164820129219488 1.6035998906353723 1.584434085039268 1.515701487776411 1.5324905980638874 1.4715623644589626 1.4810656262002737 @ 3 1.4348554317630573 1.4196254992395765 @ 2 1.3960284330362263 1.187970218085785 1.1460385096373045 1.0245151676914463 0.99328969037652037 1.086274721474348 0.75014373587620486 0.73939975426990545 @ 5 0.70412456392339318 0.7600558254329971 0.76748841572289717 0.76436607695219927 @ 2 0.81710440006174656 0.76436607695219927 0.73939975426990545 0.68346849276030164 0.73939975426990545 @ 2 0.76682855554770413 0.73939975426990545 @ 2 0.76436607695219927 0.72226846643539133 @ 2 0.70907970790403496 @ 2 0.68899857183933499 0.66297543147097204 0.44237730825963367 0.34913358151407442 0.33966593195613626 0.35190676882472577 0.32123402430093839 0.31099045499231687 0.32558593749337028 0.32528403980806275 0.30174464259941547 @ 2 0.29893486397682661 0.30174464259941547 0.34478396239502523 0.36108845666733541 0.27852410739929739 0.36103564088713541 @ 6 0.32999646062492349 0.36016370074643606 0.34487650447001017 0.017388509630802369 0.22614958987718864 0.36016370074643606 0.31802488419794378 0.39525342831042021 0.3612898708694845 0.36499730301269329 0.32397798911062431 0.33563422059490461 0.28631333427258027 0.30242040906569612 0.28960594198300771 @ 2 0.29930910013876649 0.31912016741325361 0.32241277512368099 0.30345280256839841 0.19064053001433379 0.37766292671955043 0.025811705181242234 0.014053193792104292 0.020605047643398947 @ 2 0.019765456155586499 0.017037166690846133 0.032235334049163927 0.036433861869884093 0.035240370836065231 0.033823786394373362 0.014533162695308695 0.043796645368560608 0.04499013640237947 0 0.015788212176967985 0 0.02096099782640409 0 @ 189 0.007892519595775721 0.19972995958432371 0.36836385997041182 0 @ 4 0.034385229736589314 0.71969986799865504 0.71750705991544095 0.23624231258352574 @ 2 0.33121416772163925 0.45142325445584575 0.77336919309680641 0.48428812439405577 0.56479079965516599 0.63480710515966365 0.49381745719482689 0.60015859656979953 0.63987711459948082 0.51236390164272472 0.58216834805205586 1.3830746091494379 1.6512039359932176 1.7602645018456928 1.5489657983339946 1.8681943977203042 1.6506343252079125 1.7511548246040607 @ 3 1.7092181248776392 1.7511548246040607 @ 3 1.7092181248776392 1.7511548246040607 @ 6 1.753648614523466 1.7511548246040607 @ 4 1.8032098482170187 1.6736968727689139 1.4204315160820515 1.6349266481139488 @ 4 1.6357616869577964 1.8489245168444501 @ 6 1.7511548246040607 1.8489245168444501 @ 2 1.8524182981481438 1.7295470821979726 1.806618633457074 1.7080538093373625 1.7034179600038266 1.762580207865003 1.6850694564153954 @ 2 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 1.31624722268441 1.3774928275111349 1.31624722268441 1.433789744370584 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.95801469715849874 0.94632442033581599 0.8356623574128117 0.81308203962674042 0.78089468781557825 0.75014373587620486 0.73939975426990545 0.7915805236001503 0.73939975426990545 0.75926903123765421 0.76436607695219927 @ 2 0.81607478527194788 0.78966679944031515 @ 2 0.74187099976314363 0.76436607695219927 @ 7 0.78966679944031515 0.76436607695219927 0.81710440006174656 0.76436607695219927 0.70899236922189801 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.35190676882472577 0.37097839253701131 0.35190676882472577 @ 2 0.30174464259941547 0.29893486397682661 0.30174464259941547 0.34585835578790869 0.35068075631840406 0.34915126874235242 0.30347169268209229 0.28606643155845002 0.28036068612797987 0.27382524855992474 0.29983939304199464 0.2909345092904736 @ 2 0.41651945966174331 0.36804801600964882 0.384663257905414 0.41163938917784915 0.30890888200313388 0.39669390073248939 0.3961676920919186 0.33400901535467259 0.38747038584528837 0.38005862469655538 0.093126672122670603 0.39525342831042021 0.29873468469602527 0.39316722375740659 0.41556998409198626 0.25932309400552245 0.34893140377330162 0.33522724220636935 0.30521916609344585 0.010064976797899371 0.030336528893426994 0.032458746033382641 0.19221659822344206 0.32734447176441361 0.038556079009839733 0.053204184888060738 0.35852813671343653 0.32809337736654698 0.2375970453017317 0.26386855879217247 0.23481434376964658 0.27637366807417657 0.17770457861480729 0.023111334396171732 0.32644878550765111 0.040284856336045796 0.035356170513326304 0.01583896190111863 0.032092746408372119 0 @ 2 0.18646323531508321 0 @ 185 0.1172813218070707 0 @ 5 0.29695303434867781 0 @ 2 0.027685419974703935 0.045860948835066508 0.0030135498116523134 0.050090178633940871 0.49962521148255523 0.13354603910567048 0.12077361784026977 0.29854345326212006 0.72213825113118579 0.038931343856560427 0.4572441747880111 1.3362876421323295 1.0528843521959088 0.52696238697715359 0.47243544549376837 0.46046247203643065 0.49699916500207186 0.61557635425427037 1.6914264601925764 1.6171519350762438 @ 3 1.6970993829346501 1.7511548246040607 @ 3 1.719718584579778 1.56116773028778 1.6349266481139488 @ 6 1.8184609918183861 @ 3 1.8032098482170187 @ 2 1.7511548246040607 @ 2 1.753648614523466 @ 2 1.7511548246040607 1.753648614523466 1.8489245168444501 @ 2 1.7511548246040607 @ 3 1.8489245168444501 1.8524182981481438 1.7511548246040607 1.8494004266497956 1.6340208198830068 @ 2 1.7511548246040607 @ 5 1.7039332936699036 @ 2 1.6639709046046485 1.645622401016217 @ 3 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 @ 5 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.91152815327545589 0.82940320278017965 0.80586101049787184 0.7197363508281972 0.81526555013254975 0.76436607695219927 @ 3 0.70899236922189801 @ 2 0.76436607695219927 @ 3 0.81710440006174656 0.76436607695219927 0.81526555013254975 @ 2 0.81710440006174656 0.76436607695219927 @ 4 0.70899236922189801 0.76436607695219927 0.70899236922189801 0.81710440006174656 0.75117731842084279 @ 3 0.66971521293688685 0.46685311588704603 0.40237602713114723 @ 4 0.34585835578790869 @ 3 0.42729000721948329 0.32404267253978153 0.30050327533113419 @ 2 0.29769349670854539 0.32069504842364394 0.33348287849027736 0.35988068513584931 0.34432459685517991 0.35196896974084468 0.40986583422284023 0.43317697256826571 0.18258093510283196 0.25460948519658905 0.22826030936535288 0.3219364156919251 0.34309108393963267 0.33138689490152817 0.02116159389437549 0.035006863306280354 0.032674430190057557 0.32834455377709509 0.014978389343140823 0.33328901521672 0.028039443338341578 0.17800686902024801 0.27342079044155243 0.24707161461031626 0.33522724220636935 0.33918766451826554 0.34841918187330856 0.36297071702879696 0.03938884875478308 0.047556114987274523 0.2496809675229166 0.36234375954000148 0.34292775323685609 0.32179173490569829 0.29374255843559921 0.32806400432773658 0.3472309032844863 0.21102269484032363 0.18888964858304624 0.17549960367342582 0.17699880236087989 0.067199873702218305 0.053852764927271216 0.1731324927599612 0.25967357423095305 0.12274436648864011 0.21479022629891797 0.23878900219281154 0 @ 189 0.28345765996215566 0.12900446602344301 0 @ 2 0.016793480721219344 0.030367217980061669 0.032537200922804169 @ 2 0.057039019207481147 0.59101044999660579 0.38980004635114551 1.0937266914663393 1.0856947544127142 1.1571246290158563 1.084098819659399 0.70393487904442398 0.65979691519709849 1.5468766098631832 1.7297050191488115 1.023457101385439 0.96336386835402732 0.74816657989132984 0.89895486541767944 1.7655615972406091 1.427345721776754 1.6291217630276302 1.7259225903278117 1.6970993829346501 1.7511548246040607 @ 3 1.5917053957202127 1.6209990924912936 @ 4 1.6793311805921589 @ 2 1.8857984125580829 1.8184609918183861 @ 2 1.7511548246040607 @ 3 1.753648614523466 1.7414705307751843 1.7511548246040607 @ 3 1.753648614523466 1.7511548246040607 @ 3 1.6349266481139488 @ 7 1.7511548246040607 @ 3 1.6349266481139488 1.6736968727689139 1.6349266481139488 1.6214604198238578 1.5917033542514776 1.5870675049179419 1.654156306283229 1.2765434377519254 0.97342354575814904 1.5888205796151518 1.6529755948831537 1.6192742864655496 1.4810656262002737 @ 3 1.7099916424862454 @ 2 1.4348554317630573 1.2604005273243057 1.2745113622202264 1.3385254794593215 1.1342141242802353 1.1225238474575523 1.0118617845345481 0.80443688009788594 0.72496342630597432 0.8023245052064496 0.76436607695219927 @ 3 0.70899236922189801 0.76436607695219927 @ 4 0.76748841572289717 0.762391370008352 0.74499333853384142 @ 2 0.79278913821101304 0.71211470799259569 0.76748841572289717 0.76436607695219927 @ 4 0.76748841572289717 0.79278913821101304 @ 2 0.75429965719154068 @ 3 0.62256088969182832 0.43672553371073131 0.40237602713114723 @ 2 0.39960283982049588 0.46082176783983692 0.34585835578790869 0.33353771206050853 0.35962390675287925 0.34585835578790869 @ 2 0.33353771206050853 0.34585835578790869 @ 2 0.36108845666733541 0.33089770642774308 0.3470977841658312 0.36497115061511648 0.37286888220555697 0.27852410739929739 0.36108845666733541 0.36190035978258916 0.37310239793433797 0.35933684696936752 @ 4 0.39102714711952319 0.36497115061511648 0.37286888220555697 0.27852410739929739 0.37286888220555697 0.27852410739929739 0.36108845666733541 0.32228990723001277 0.35065150545050167 0.31775762922768119 0.33211593327943989 0.30785520624733959 0.32241277512368099 0.35200219460582899 0.36168870048747476 0.3737131192527397 0.3480118569633302 0.38768678045436372 0.47703685579113136 0.065779332847167693 0.3420321313004574 0.37446812753388353 0.26757290654859384 0.37624099419821022 0.32436352432224735 0.33965007275699149 0.23112233226725723 0.052957772988217529 0.10760025122885891 0.17094759102738261 0.18136884625503655 0.026646497217771566 0.030499991788549459 0.1809388026722786 0.027393610219577175 0 @ 190 0.20170500800302427 0.087907354420023606 0.1887740136590659 0.09960910884690552 0.021512849567746989 0.0021986540425169921 0.088828048304530047 0.071056030643397633 0.10807481348603182 0.70977300533406118 0.92528781924756232 0.8327433674091349 1.1183145561442984 0.93784073102278331 0.59523794929699247 0.46046247203643065 0.49699916500207186 @ 3 0.56680361141140301 0.61557635425427037 0.56386550055298645 1.7056650779275764 1.5408068121711516 1.5922545001717812 1.5979274229138549 1.6357616869577964 1.6349266481139488 @ 2 1.6444885511518863 1.6118754848702463 1.6340208198830068 1.7511548246040607 @ 4 1.7414705307751843 1.7511548246040607 @ 2 1.8524182981481438 1.7511548246040607 @ 2 1.753648614523466 1.8489245168444501 @ 5 1.6772973367208439 1.6209990924912936 @ 3 1.5917053957202127 1.6209990924912936 1.6793311805921589 1.8489245168444501 1.753648614523466 1.7511548246040607 @ 4 1.7049582200404756 1.8489245168444501 1.7511548246040607 1.7039332936699036 1.797105882590492 1.7273959979965636 1.7019193178756662 1.7039531617469814 1.645622401016217 1.6035998906353723 1.584434085039268 1.4544558829496861 1.31624722268441 1.433789744370584 @ 4 1.387579549933367 1.3160527005504377 1.3723496174098868 1.1127257017460472 1.0338804930211427 0.9712907430181098 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.70899236922189801 0.76436607695219927 @ 4 0.81526555013254975 0.70899236922189801 0.76436607695219927 @ 5 0.70899236922189801 0.76436607695219927 0.70899236922189801 0.76436607695219927 @ 3 0.70899236922189801 0.81526555013254975 @ 3 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.40237602713114723 @ 4 0.34585835578790869 @ 4 0.3203680022332942 0.34585835578790869 0.40304096848028459 0.30943337857799014 0.40985069393261953 0.35656365965871611 0.35933684696936752 0.34432459685517991 0.35656365965871611 0.45513742882606223 0.36415924749986278 0.39353648611038339 @ 2 0.37944886265215882 0.3789349824706521 0.36227448644853627 0.36715455693243043 @ 2 0.36108845666733541 0.39984308606689806 0.36108845666733541 0.36499730301269329 0.35620838618344125 0.37310239793433797 0.32228990723001277 0.30988935394108946 0.30785520624733959 0.31912016741325361 0.29390802327813487 0.33211593327943989 0.32241277512368099 0.30345280256839841 0.33167395191239485 0.33082483852742817 0.31516620435727466 0.26702845188353269 @ 3 0.29549881526420252 0.2981616835681698 0.26983823050612149 0.26328470715031638 0.33609531697752554 0.2639731147852532 0.1477060567431055 0.23964049552610769 0.22852724698819957 0.2564360221699406 0.046449790887171445 0 @ 2 0.0032439009249135209 0 @ 186 0.027547457638174958 0.014997217020269777 0.007892519595775721 0.059152266897879391 0.041992416988327994 0.059152266897879391 0 0.071137774808074941 0.082758726167378699 0.048922942410668267 0.03668444122498335 0.38961350903577341 0.53408577424797943 0.23624231258352574 0.60511715168991564 0.51657543672671413 0.40224019056755245 0.99871100816180103 0.56479079965516599 0.29277953124976558 0.55726149688139648 0.65603408004271124 0.49699916500207186 0.74028514984296279 0.80081457122255972 1.1716951093922341 1.5115280633585193 1.6333469607691309 1.6018164032097184 1.8903076584712721 2.0170731105690307 2.0361516007905629 1.6209990924912936 @ 4 1.7511548246040607 1.7092181248776392 1.7511548246040607 @ 3 1.8489245168444501 1.5270509676494435 1.6349266481139488 @ 3 1.155930025560902 1.5021704843923385 1.6292891053086664 1.7511548246040607 1.7092181248776392 @ 2 1.7511548246040607 @ 7 1.753648614523466 @ 2 1.7511548246040607 1.753648614523466 1.8489245168444501 1.7511548246040607 @ 4 1.7570872112810023 1.7073867291417835 @ 2 1.7333283846735061 1.6490758364880969 @ 3 1.6598968074948213 1.6407310018987178 1.515701487776411 1.3774928275111349 1.435823588241899 1.433789744370584 @ 3 1.3593490897476999 1.3301916016015645 1.5745623472536407 1.4277312306571484 1.2229826558822865 1.1351772306144505 1.0245151676914463 0.79184462312486159 0.78089468781557825 0.77511005855849857 0.70899236922189801 @ 2 0.78974167367095316 0.73939975426990545 @ 2 0.7915805236001503 0.73939975426990545 @ 3 0.76436607695219927 @ 2 0.7600558254329971 @ 6 0.73939975426990545 0.7889979767484756 0.85973331462454938 0.80920490998148897 0.80055975045263428 0.79601615145013238 0.78737099192127791 0.68899857183933499 0.67481225865143191 0.46685311588704603 0.40237602713114723 0.43050956600706813 0.46570183832373113 0.40237602713114723 0.34585835578790869 0.33072793343791967 0.34585835578790869 0.34308516847725734 0.36381311755096291 0.37527602848496538 0.38321540955103056 0.27785170627039085 0.36108845666733541 0.37310239793433797 0.35933684696936752 0.31540097812387008 0.37476951877870246 0.32031854324257408 0.32674867972067256 0.32955845834326142 0.31720723431564452 0.32955845834326142 0.32678776773321311 0.37310239793433797 0.35933684696936752 @ 4 0.40892387182059659 0.384663257905414 0.31540097812387008 0.2967096114298392 0.42479027549174952 0.18952107816979372 0.30488480699788184 0.28788084735728958 0.29173546795876942 0.28185213524549541 0.33607635559133608 0.32771352960049865 @ 2 0.33082483852742817 0.35073398814286538 0.052754175414918648 0.33965007275699149 0.32436352432224735 0.35852813671343653 0.23481434376964658 0.29834298235166767 0.29549881526420252 0.29791029757141457 0.2694399341907448 0.31845668529267424 0.30171962912679634 0.24954621421694942 0.016727352405016636 0 @ 187 0.41843586103115271 0 @ 2 0.014864425567508404 0.040721212306666969 0 @ 2 0.01546081578170834 0.00033606771464748882 0.008265631661582909 0 0.059996414036640848 0.18370280677494488 0.052574515480051168 0.23624231258352574 0.28607433113343356 0.44840998606744142 0.84864748678104274 0.82255829163785998 0.61866574910977112 0.70337774861119207 1.1486336268043504 0.54777910174869704 1.3060750235388856 1.1484723957756222 0.5387804928238511 1.0670322415393505 1.0642267077973573 1.3084852892446517 1.4235406878115404 1.5384776893761134 1.5362982821826225 1.9572360093076673 1.9741779970847948 1.6292891053086664 1.8087766979895097 1.7092181248776392 1.7511548246040607 1.6349266481139488 1.5131234120267882 1.547240174665125 1.0106576313829263 1.8780628501316932 1.8508404071213376 1.9837270708715111 1.6209990924912936 1.6349266481139488 @ 3 1.7826757657689034 1.753648614523466 1.7511548246040607 1.753648614523466 1.8489245168444501 1.753648614523466 1.7511548246040607 @ 2 1.8489245168444501 @ 2 1.8548569035213907 1.7570872112810023 @ 2 1.7595810012004074 1.8548569035213907 1.7570872112810023 @ 2 1.7511548246040607 @ 3 1.8243722169660304 @ 2 1.772553582712072 @ 2 1.7059751281631148 1.689660468445999 1.6579540238295267 1.645622401016217 1.6035998906353723 1.584434085039268 1.515701487776411 1.31624722268441 1.435823588241899 1.433789744370584 1.3774928275111349 @ 2 1.331282633073918 1.3160527005504377 1.2548070957237127 1.1127257017460472 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.82940320278017965 0.75048730276757059 0.82600953173884917 0.81526555013254975 0.70899236922189801 0.81526555013254975 @ 2 0.7600558254329971 @ 4 0.81039774483404514 0.7915805236001503 0.73939975426990545 @ 3 0.73430270855536051 0.73939975426990545 0.74804491379876015 0.73939975426990545 @ 2 0.73430270855536051 0.73939975426990545 0.74969726771319001 0.72226846643539133 0.70907970790403496 0.65314844639443093 0.73934049124038237 0.63328958323301543 0.43672553371073131 0.40237602713114723 0.40407482104891507 0.40844212739624225 @ 2 0.35192445605300376 0.31324445470853074 @ 2 0.37241162275674533 0.34585835578790869 0.3203680022332942 0.34585835578790869 @ 2 0.33402433775774887 0.35933684696936752 @ 4 0.3061610630231828 @ 2 0.32016667688221717 @ 4 0.30300042483494671 0.35933684696936752 0.37310239793433797 0.35933684696936752 0.3470977841658312 0.37310239793433797 0.3470977841658312 0.35933684696936752 0.27770584637973295 0.33623709019921755 0.33522724220636935 0.53211914004133953 0.093126672122670603 0.10112474780717355 0.38228447230113272 0.33918766451826554 0.48593411214799953 0.36274459682977184 0.37653850520338455 0.39258920261223668 0.29791029757141457 0.27847039889614628 0.032458746033382641 0.17281774795951163 0.39944341180158377 0.033823786394373362 0.17169393304080463 0.3472309032844863 0.17281774795951163 0.17110237209829224 0.21139142784296519 0.22531820081091444 0.23100777937321051 0.022335649851301344 0.010638979437386181 0 0.092785178015960756 0 @ 173 0.052380351185070048 0 @ 11 0.10043624052395915 0.054634697979896771 0.2463468274390008 0.087641172575780885 0 @ 3 0.0049539199486062372 0.17926290319342714 0.14179841795076628 0.26575666650498814 0.20177275563712652 0.23624231258352574 0.56916627954326626 0.54600481894521469 0.83689752287312147 @ 2 0.57882651594910173 0.69129954083885681 0.74726060520905724 0.53026691844576157 0.72634839765157455 0.75015609052792143 0.68527493278019058 1.2930479026583563 0.69328279160369866 1.5603171447269355 1.6333469607691309 1.6914264601925764 1.6171519350762438 1.7417606282114051 1.8500834472262002 2.692932110899199 @ 6 1.6349266481139488 1.7511548246040607 1.7414705307751843 1.7324787398436672 1.7511548246040607 @ 7 1.7092181248776392 1.7511548246040607 1.7414705307751843 1.6890524347788021 1.8494004266497956 1.7511548246040607 @ 2 1.7414705307751843 1.7511548246040607 @ 2 1.753648614523466 @ 2 1.7511548246040607 @ 4 1.6349266481139488 @ 3 1.6932587362148137 1.5917033542514776 1.6214604198238578 1.6725048098716599 1.689660468445999 1.7019193178756662 1.645622401016217 1.6035998906353723 1.556820302331712 1.4880877050688548 1.3498790448035789 @ 5 1.331282633073918 1.2548070957237127 1.3723496174098868 1.2275523446847094 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.81526555013254975 0.81710440006174656 0.70899236922189801 @ 2 0.76436607695219927 0.81710440006174656 0.76436607695219927 0.81710440006174656 0.76436607695219927 @ 4 0.70899236922189801 0.76436607695219927 0.68346849276030164 @ 2 0.78974167367095316 @ 4 0.72226846643539133 @ 2 0.70907970790403496 @ 2 0.63306731032973096 0.66481428140016863 0.44426156716970716 0.36999643229867385 @ 2 0.40237602713114723 @ 2 0.34585835578790869 @ 2 0.34308516847725734 0.29893486397682661 0.33229706376285056 0.17006559231445628 0.153061632673864 0.1465261951058088 0.16014371731002716 0.10445075659347101 0.26641848597193279 0.31540097812387008 0.38747038584528837 0.36108845666733541 0.3470977841658312 0.38557163591625981 0.37338276238706386 0.33400901535467259 0.33089770642774308 0.37310239793433797 0.36190035978258916 0.35933684696936752 @ 2 0.3219364156919251 0.30300042483494671 0.31540097812387008 0.30300042483494671 0.31110552446280765 0.1966190019023831 0.29883339169135936 0.35989992619626959 0.31912016741325361 0.33211593327943989 0.25577282761473041 0.33211593327943989 0.31471776373431243 0.32771352960049865 0.31801037144473981 0.33082483852742817 0.23170303484271701 0.29505037464124029 0.26702845188353269 0.2688912772856813 0.30815305232454648 0.26386855879217247 0.33920662590445516 0.32336233545257592 0.044720691318673678 0.038449631714037549 0.030631230325089655 0.29822348657914921 0 @ 178 0.03383357058546136 0 @ 12 0.14280009417113995 0.007892519595775721 0.048461456822676253 0.059152266897879391 0.031367478512206413 0.039716737256360539 0.18563492906268567 0.31174046484882151 0.18164122428483551 @ 2 0.13354603910567048 @ 2 0.062820545544790163 0.15779240068290362 0.26152467041948591 0.33225016398036616 0.60327563469168 0.56479079965516599 0.59523794929699247 0.49699916500207186 @ 4 0.99380179539298386 0.61557635425427037 1.6914264601925764 @ 2 1.7259225903278117 1.6914264601925764 1.6970993829346501 1.7511548246040607 1.7992257355551988 1.7511548246040607 @ 6 1.7992257355551988 1.6276008371813593 1.5848447413933462 1.5895145311871486 1.9866554738910271 1.8893325140984902 1.8990168079273668 @ 4 2.1165917188898962 1.8489245168444501 @ 2 1.7570872112810023 1.7295470821979726 @ 4 1.7723121322556805 @ 2 1.8990168079273668 1.6209990924912936 @ 2 1.5917053957202127 1.6209990924912936 1.7570872112810023 @ 4 1.7511548246040607 1.6214604198238578 @ 2 1.6168245704903221 1.5984760669018909 @ 3 1.5759861079278161 1.584434085039268 1.5280331105897205 1.3898244503244446 1.3019545293834278 1.3898244503244446 @ 3 1.3436142558872275 1.2548070957237127 1.3723496174098868 1.1712554278252605 0.98298101984079245 0.91591703528780832 0.91152815327545589 0.88030267596053013 0.85676048367822255 0.7197363508281972 0.81710440006174656 @ 2 0.81526555013254975 0.76436607695219927 @ 2 0.81526555013254975 0.70899236922189801 0.81526555013254975 0.70899236922189801 0.81526555013254975 0.76436607695219927 @ 4 0.70899236922189801 0.76436607695219927 @ 3 0.75926903123765421 0.83302736429475055 0.50145479339046795 0.50935252498090844 0.80423112451676093 0.75117731842084279 @ 2 0.67481225865143191 0.51204822341055223 0.43778308853951886 @ 4 0.30653113568595874 0.33007053289460603 0.33182401306904236 0.30996169239199928 0.34161229983135616 0.30996169239199928 0.34585835578790869 @ 2 0.39225884574656072 0.37286888220555697 0.36108845666733541 0.36499730301269329 0.36108845666733541 0.37310239793433797 0.35933684696936752 @ 5 0.35656365965871611 0.40892387182059659 0.30890888200313388 0.36108845666733541 0.37286888220555697 0.35620838618344125 @ 2 0.35933684696936752 0.3470977841658312 0.24808146260316441 0.33180888618411908 0.13394787794368024 0.1644742275992076 0.28602343602844804 0.17674712757618219 0.16949694609271668 0.26907644815476395 0.31335522554874007 0.25137042393578918 0.35904134702995166 0.37208804958736558 0.053059952744568983 0.3344749488412474 0.35430185552253951 0.23481434376964658 0.29679914538259733 0.31200656281932265 0.26983823050612149 0.27637366807417657 0.25438987966207333 0.17844485524201725 0.30571306493490336 0.24317430959784114 0.035607022409624017 0.030499991788549459 0 0.063696906130584749 0 @ 191 0.20761487781860238 0.31852273080570231 0.0024657189546777587 0.030352770733084525 0.080536403774129212 0.18164122428483551 0.062820545544790163 0.13354603910567048 0.062820545544790163 0.15779240068290362 0.26152467041948591 0.40224019056755245 0.58744755596178355 1.2584294233588169 1.1989718755906713 1.0384518223977799 0.53035415016046838 0.58216834805205586 0.49699916500207186 0.56680361141140301 0.61557635425427037 1.6171519350762438 1.7223312641275801 1.5500261399050248 1.5861163573680912 1.5308185793899942 1.4262463311947988 1.5622855122842318 1.5947258698480842 1.6221524896358299 1.5315909507875076 1.7063348312175952 @ 2 1.5366144403347144 1.4412153346455134 1.6444885511518863 1.6349266481139488 1.6292891053086664 1.6349266481139488 1.8032098482170187 1.7511548246040607 @ 3 1.6349266481139488 1.56116773028778 1.5226696537412747 1.6349266481139488 @ 4 1.7414705307751843 1.7511548246040607 @ 3 1.6262229276702385 1.5270509676494435 1.6292891053086664 1.6736968727689139 1.6056329513428675 1.6444885511518863 1.6349266481139488 @ 2 1.7511548246040607 @ 2 1.6930613365471383 1.7039332936699036 1.6919545472909017 1.645622401016217 @ 2 1.6736060437024705 1.6035998906353723 1.584434085039268 1.513517380443008 1.3442415019982965 1.6235696934435464 1.5933186497412388 1.5989561925465214 1.2722845674382781 1.2317119158063439 1.4254197691461972 1.4576854368873644 1.1436416451177047 0.95801469715849874 0.94632442033581599 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 0.77551541051558592 @ 2 0.73939975426990545 @ 2 0.98595318128065745 0.81246902581183811 @ 4 0.95825041658924859 0.82111418534069269 0.73939975426990545 @ 7 0.73430270855536051 0.75866670957204818 0.79597834369440101 0.77647804090895878 0.75117731842084279 0.79526168265790287 0.72786606474734983 0.49571849204545665 0.40237602713114723 @ 4 0.34585835578790869 @ 2 0.35962390675287925 0.33353771206050853 0.34585835578790869 0.33022530529883654 0.3333366142257661 0.39827106350293318 0.36108845666733541 0.35656365965871611 0.35933684696936752 0.3718532748110121 0.33894037533251742 0.33745470029404384 0.34401388952499606 0.33860082817763243 0.35762847346080878 0.30102092455735152 0.22826030936535288 0.33400901535467259 0.37286888220555697 @ 3 0.36499730301269329 0.35620838618344125 @ 2 0.36499730301269329 0.36108845666733541 0.33211593327943989 0.31912016741325361 0.269037668162807 0.24360236371827176 0.32734447176441361 0.018694137555842264 0.34048345096766985 0.17908186326753892 0.32556004848951842 0.11771198198134304 0.19047052266417566 0.16659867666492062 0.29783420343629746 @ 2 0.026194847676223234 0.37761700494934497 0.1972452336976446 0.29622152506812754 0.27461595809971778 0.33920662590445516 0.16683120393313125 0.15403859847259044 0.046525138456827167 0.26769879269681962 0.45320613312627883 0.0057766401019670559 0.0030445725316623107 0.0010664638036309341 0 @ 163 0.0098627164469254729 0 @ 12 0.034720287345728365 0.032387854229505568 0.034720287345728365 0.038517345848866263 0.026091151095924733 0 @ 6 0.047325766664447724 0.041579439091873248 0.047144264961401776 0 @ 2 0.016793480721219344 0.0038721376520616342 0.054383412040883213 0.025432503498310114 0.35076941582282034 1.3455417561280369 1.0609024436457288 0.58797270506631993 1.169253697247927 1.4733406857826032 2.692932110899199 1.3534951221373765 1.1721784301162157 1.0384518223977799 0.49699916500207186 0.58216834805205586 0.57531718578949242 0.50551273938016128 0.58755323566671835 1.8701885694215867 1.8470708062873926 1.9233554365285104 1.8352580584573965 1.5839998672911999 1.6209990924912936 @ 2 1.5942241513550863 1.6483051006358258 1.7890880623221732 1.7704119775617797 1.7890880623221732 @ 3 1.6794444651605116 1.6402633534103856 1.7414705307751843 1.6340208198830068 1.7511548246040607 1.753648614523466 @ 2 1.8524182981481438 1.8489245168444501 1.7511548246040607 @ 2 1.753648614523466 1.7511548246040607 @ 2 1.7109083784332908 1.7414705307751843 1.8489245168444501 1.7511548246040607 @ 3 1.7992257355551988 1.7511548246040607 1.6292891053086664 @ 2 1.6349266481139488 1.6912248923434992 1.6349266481139488 @ 2 1.6292891053086664 1.5960576132053983 @ 2 1.6639709046046485 1.645622401016217 @ 2 1.6164820129219488 1.6035998906353723 1.584434085039268 1.4544558829496861 1.433789744370584 1.4372431798424641 @ 4 1.3930668292765616 1.3758030528817671 @ 2 1.2275523446847094 1.0338804930211427 1.2015951632573036 1.0848682723672327 1.10380258466217 1.0802603923798622 1.0133300385544675 0.98503589790071722 @ 2 0.76436607695219927 @ 6 0.81526555013254975 @ 2 0.76436607695219927 0.81526555013254975 @ 3 0.73939975426990545 0.81246902581183811 0.79231314128545516 @ 3 0.73619974998466653 0.45960324560205595 0.77518185345094082 0.76199309491958434 @ 2 0.74191195885488437 0.66337201920469935 0.46181204327048786 0.38754690839945438 @ 2 0.39960283982049588 0.46570183832373113 0.34585835578790869 0.3203680022332942 0.37844192476166899 0.34585835578790869 @ 2 0.35962390675287925 0.33353771206050853 @ 2 0.3522850972947027 0.33070403615758243 0.32032878254988073 0.34758637941612092 0.34270630893222681 0.34758637941612092 @ 2 0.35620838618344125 0.27852410739929739 0.36108845666733541 @ 2 0.37310239793433797 @ 2 0.35933684696936752 @ 2 0.27502414451074114 0.36202600011219527 0.29736464576857202 0.36525016461764198 0.24603285196569374 0.10902131781013419 0.31252167924496327 0.28601368301050378 0.27957340718414936 0.29437873902861539 0.26207820821467426 0.24512202003659178 0.24250221822658846 0.165977505454628 0.25346869578561559 0.24116080694786157 0 0.22357380605145752 0.0072541406379651729 0.13406331000004232 0.20036810716750456 0.24720646672963714 0.32917368958100585 0.038556079009839733 0.31691915776196117 0.080377468830592727 0.14528602693478199 0.16515184701049829 0.30571306493490336 0.042558344209899429 0.0036544229620114059 0.00092235539170666377 0.16813966706793487 0 @ 187 0.0033676321716781059 0 0.035035827410189402 0.47728957361745905 0.012777208152482577 0.058862220236873028 0 0.0086045093913190446 0.034182872821856988 0.16193428063853813 0.53408577424797943 0.18337805765557805 0.44867381317173516 0.72871916609201026 0.29854345326212006 0.60327563469168 1.3166662914256508 1.4462345608230687 0.74028514984296279 1.5773611595952579 1.6238855199884137 1.3980662386673961 0.58216834805205586 0.76742170127134868 1.6018164032097184 1.5932670316688065 1.4416348521503564 1.8787132179771591 2.692932110899199 1.6382134561967088 1.3875416318541443 0.38256922361573142 1.5592482750928862 @ 2 1.759188356705081 1.7131458976891221 2.01691823317497 2.0361516007905629 @ 2 1.7511548246040607 @ 3 1.6292891053086664 1.6674497847992995 1.7723121322556805 1.6685857235921666 1.58155629177628 1.6941487390031682 @ 2 2.1315880305239272 1.6209990924912936 @ 2 1.7511548246040607 1.7092181248776392 1.7511548246040607 1.7414705307751843 1.7511548246040607 1.7429654253861571 1.7365531288328875 @ 4 1.8332634790687978 @ 2 1.8524182981481438 1.8489245168444501 1.7511548246040607 1.7039332936699036 @ 2 1.6639709046046485 1.645622401016217 @ 3 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 @ 4 1.31624722268441 1.331282633073918 1.3723496174098868 1.2265766355380452 1.1380360410795098 0.96665985668735344 0.94632442033581599 0.8356623574128117 0.74850561858828191 0.78089468781557825 0.98772872648050136 0.8183878889032471 @ 2 0.76748841572289717 0.8205422218188152 0.8183878889032471 0.76436607695219927 @ 3 0.74187099976314363 0.70899236922189801 0.81526555013254975 0.72680749729688121 @ 2 0.76320574043353806 0.64838115859822165 0.72680749729688121 @ 3 0.73939975426990545 @ 2 0.72226846643539133 0.66633720492578752 0.65314844639443093 0.70907970790403496 0.69764373136818947 0.67481225865143191 0.49454636822335252 0.40237602713114723 0.43006927946745371 0.35190676882472577 @ 2 0.2893440893104921 0.30174464259941547 0.29893486397682661 0.29744918893835304 0.28939341857179862 0.34272989500198253 0.33353771206050853 0.35962390675287925 0.35933684696936752 0.33402433775774887 0.35933684696936752 @ 4 0.36578717454591708 0.29779563346522581 0.35821908003695707 0.33400901535467259 @ 2 0.28163541632622691 0.36415924749986278 0.38747038584528837 0.36190035978258916 0.032884646166324714 0.22592746685548828 @ 2 0.36016370074643606 0.30953586240300174 0.29356889502411671 0.37033206264799329 0.35200219460582899 0.27394919127757439 0.36668883139749747 0.36455611385902126 0.36596602646136456 0.33782009241357186 0.37990857171114062 0.28489655157344335 0.3590633170841398 0.33609531697752554 0.33920662590445516 0.32498206843961747 0.32809337736654698 0.086889403209973237 0.32436352432224735 0.36174973657640852 0.032674430190057557 0.032458746033382641 0.059679836136759111 0.054374338294185039 0.21272036301643954 0.28903557529533175 0.033882240410528015 0 @ 190 0.0041956410219676221 0.031190840990025837 0.070708576279094604 0.015956642821678326 0.035633792759410678 0.2594995072199468 0.39392585082010023 0.18164122428483551 0.30151255946050476 0.25966776780465051 0.56240205009048716 0.5231857966723924 0.61692084804642922 1.024405018513296 0.58443907829794284 1.4407498830298058 1.3133742699989794 1.7177502682348342 1.6002591846036065 0.72634839765157455 0.27965024293196633 0.74479560661620658 0.8746661396562313 0.64705208172567064 1.3826316873237667 1.1326015061782042 1.6590022078870699 1.9792741008808201 1.6044238232410457 1.6349266481139488 1.8032098482170187 1.6340208198830068 1.7992257355551988 1.8524182981481438 1.7511548246040607 @ 4 1.6349266481139488 @ 3 1.6912248923434992 1.6349266481139488 @ 2 1.1638269401809056 1.7092181248776392 1.7992257355551988 1.8809213678146384 1.7826757657689034 1.8307466767200415 1.7846240397840252 1.7365531288328875 @ 2 1.6292891053086664 1.7365531288328875 @ 2 1.7379875767478137 1.8332634790687978 1.7379875767478137 1.8332634790687978 1.7511548246040607 @ 3 1.7049582200404756 1.8489245168444501 1.7414705307751843 1.7511548246040607 1.6747929055756354 1.7039332936699036 1.6348305165103796 1.645622401016217 @ 2 1.6490758364880969 1.6070533261072519 1.5878875205111478 1.4942744399911858 1.3809462629830147 @ 2 1.3197006581562898 1.31624722268441 1.433789744370584 1.387579549933367 1.3723496174098868 @ 2 1.1712554278252605 1.03571934295034 1.0221902161984602 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 2 0.78966679944031515 0.70899236922189801 0.76436607695219927 0.70899236922189801 @ 2 0.81526555013254975 @ 2 0.81710440006174656 0.76436607695219927 0.81526555013254975 0.76436607695219927 @ 2 0.81741988304811741 0.76436607695219927 @ 2 0.78966679944031515 0.76436607695219927 0.70899236922189801 @ 3 0.75117731842084279 0.70907970790403496 0.68899857183933499 0.58609784930104647 0.43302306595832263 0.35875793108728926 0.36346156688862441 0.34651886828375306 0.39013696432761097 0.39875228069767849 0.34915126874235242 0.35192445605300376 0.37827133791753298 0.35192445605300376 @ 3 0.34585835578790869 0.31540097812387008 0.31259119950128123 0.3061610630231828 0.40129581927887997 0.43861621847725929 0.31953823760727296 0.44496261628364203 0.3226234051635995 0.34224941341628473 0.43860385761079967 0.31197346889142136 0.37593967303808445 0.37637734495092323 0.37800120170240831 0.37637734495092323 0.36108845666733541 0.35620838618344125 0.3470977841658312 0.35933684696936752 0.36108845666733541 0.33623709019921755 @ 2 0.29390802327813487 @ 2 0.30785520624733959 0.25577282761473041 0.35989992619626959 0.34458633191580562 0.31335522554874007 0.31471776373431243 0.25448173286271869 0.35430421715951521 0.27498180733008065 0.086908027926332065 0.086889403209973237 0.47632576478917582 0.43232776033182196 0.082068932326731445 0.28000452582358948 0.086908027926332065 0.017799746213639132 0.0040651599050187635 0 @ 5 0.01355802545845752 0 @ 182 0.060382944197066524 0 0.02442227697015387 0 0.028730438732663486 0.0063539997701749038 0 @ 3 0.071137774808074941 0.077591678149159807 0.2401868015333504 0.39392585082010023 0.18164122428483551 @ 2 0.062820545544790163 0.13354603910567048 @ 2 0.59325458001662201 0.45414156599541361 0.38433711958608241 0.56954448498031351 1.1463717880866515 1.1055953625059292 1.52484640714011 0.9964294744019031 0.57877658486874106 0.54223989190309985 0.74110632726063208 0.73653048868315563 1.9628484555631751 1.8894219370371794 1.9628484555631751 @ 2 1.9725935258181237 1.6012507147900903 1.6068882575953729 1.7414705307751843 1.7511548246040607 @ 2 1.56116773028778 1.6349266481139488 1.5131234120267882 @ 2 1.6209990924912936 1.5917053957202127 1.6209990924912936 1.6349266481139488 1.6209990924912936 1.6349266481139488 @ 4 1.6292891053086664 1.1638269401809056 1.7324787398436672 1.7511548246040607 @ 5 1.6262229276702385 1.7432022999129761 1.5763979313360506 1.7511548246040607 1.753648614523466 1.7511548246040607 1.7324787398436672 1.753648614523466 1.8489245168444501 1.6349266481139488 1.9906875960053287 1.6293898471515116 1.7830176582712665 @ 2 1.8703567800742746 1.8388373209396924 1.69921008141129 1.5984760669018909 1.6035998906353723 1.584434085039268 1.5719984046358604 1.433789744370584 1.4054764701973883 1.4025901316162279 1.3774928275111349 @ 2 1.331282633073918 1.3160527005504377 1.4196254992395765 1.2748282265143993 1.0766238191836626 0.982598904683332 0.92805023306111611 0.94698454535605325 0.92528120300294292 0.96317024894460468 0.93487610829085432 0.78974167367095316 0.73939975426990545 @ 3 0.72680749729688121 0.73430270855536051 0.73939975426990545 @ 5 0.7600558254329971 0.76748841572289717 0.73429309171001378 0.7600558254329971 0.81039774483404514 0.7600558254329971 0.73939975426990545 0.68346849276030164 0.77261038583643893 @ 2 0.67380451755752258 0.7297357790671265 0.70965464300242653 0.67481225865143191 0.43302306595832263 0.35875793108728926 @ 2 0.40135444827206773 0.43778308853951886 0.30653113568595874 @ 2 0.30174464259941547 @ 3 0.33048663504514086 0.30653113568595874 @ 2 0.31361322032212191 0.30121266703319854 0.32475206424184594 0.31837891908046895 0.35933684696936752 0.37338276238706386 0.41556998409198626 0.32914775405397478 0.34224941341628473 0.30121266703319854 0.31361322032212191 @ 2 0.27382524855992474 0.27101546993733588 0.22826030936535288 0.33472424575855858 0.32016667688221717 0.31259119950128123 0.18868491227247985 0.33472424575855858 0.26885636937930912 0.3082013110767316 0.35362100939094382 0.27010428636270284 0.35350763457564188 0.026194847676223234 0.29520554521054526 0.070337727776281112 0.024920894885622991 0.018303544930707204 0.11173354070992383 0.053085885971627479 0.17581950767766197 0.071195211938004127 0.30248387691316903 0.31115744943435608 0.35042042821097724 0.26013870574787284 @ 2 0.34103706436968179 0.017497625212577844 0.01452143642227741 0.01685386953850021 0.0051308172665509881 0.022525302382015236 0 0.052082551296006523 0.092785178015960756 0 @ 156 0.018570211332982811 0.012440719713622109 0.041303682118652173 0 @ 28 0.0035297722479770066 0.05101266391392776 @ 2 0 0.033953786063535482 0.12571877098379444 0.17999830633368077 0.033591159507093661 0.5762406635827404 0.61176912222592017 1.1081038025716592 1.153931664499168 1.1854384340773441 0.7604838303828958 0.63218508436587939 1.8510766772579264 1.6549255367707219 0.97830313963937754 0.79774282459346313 0.60015859656979953 1.2695030993464915 1.2805646247337503 1.2741354969751892 1.3774280058267769 1.5115280633585193 0.98926198800063514 1.6181475149259115 1.6625552823861587 1.5556990626470986 0.38222359225323549 1.5437541098493601 1.6055754977480274 1.5270509676494435 1.6292891053086664 1.488698949511148 1.730259573456248 1.7295470821979726 @ 2 1.6153615496860114 @ 2 1.5223596914080202 1.5705555938231877 1.8171857481616331 1.7295470821979726 1.719862788369096 1.6030205097274002 @ 2 1.5024995645912409 1.7826757657689034 @ 2 1.56116773028778 1.5226696537412747 1.6736968727689139 1.6444885511518863 @ 2 1.6349266481139488 @ 2 1.8489245168444501 1.753648614523466 @ 2 1.7511548246040607 @ 7 1.7039332936699036 @ 2 1.6639709046046485 1.6164820129219488 1.7019193178756662 @ 2 1.6598968074948213 1.6407310018987178 1.5719984046358604 1.435823588241899 1.433789744370584 @ 2 1.3774928275111349 @ 2 1.389613393804682 1.3743834612812018 1.3600907679802194 1.1835870506385704 1.0227969557232637 1.0271514048983548 0.86375101886580319 0.83252554155087732 0.80898334926856985 0.77511005855849857 0.81526555013254975 @ 2 0.76436607695219927 @ 2 0.70899236922189801 @ 2 0.81526555013254975 @ 2 0.70899236922189801 0.81526555013254975 0.75668090009050293 @ 7 0.76436607695219927 @ 5 0.75117731842084279 @ 2 0.69580361069054164 0.67481225865143191 0.46685311588704603 0.40237602713114723 @ 2 0.43006927946745371 @ 2 0.37844192476166899 0.30174464259941547 @ 4 0.30653113568595874 0.26674316392376163 0.41890557552497221 0.34128338116023327 @ 3 0.28867674471738797 0.27783392313333 0.31259119950128123 0.36415924749986278 0.35927917701596868 0.39446031194053577 0.3577856872616666 0.33167379828300836 0.35509079101281493 0.33894037533251742 0.33612608090420981 0.33472424575855858 0.30799421553587808 @ 2 0.31259119950128123 @ 2 0.40892387182059659 0.063367850539956444 @ 2 0.37805819111023575 0.25577282761473041 0.37805819111023575 @ 3 0.28248506926623118 0.34765712274833305 0.25137042393578918 0.35862564517130097 0.28000452582358948 0.075850288130392907 0.093126672122670603 @ 2 0.28310799716652246 @ 2 0.37946259406118216 0.27637366807417657 0.26565593181345798 0.183943356893569 0.20962410573753804 0.054522789444285708 0.081231380632053499 0.016378599920297207 0 @ 190 0.28820042214906694 0.11425597828073777 0 @ 4 0.27273159495585902 0 @ 3 0.77818930248195417 0.28607433113343356 0.33121416772163925 0.77336919309680641 0.40224019056755245 1.1137754846080419 1.193184870532616 0.59523794929699247 0.49699916500207186 0.59810903627409751 1.3551308208238892 0.59810903627409751 0.4758272086770835 0.63987711459948082 1.7019383982269338 1.8603941619755706 2.0073280403140821 1.5452513561202139 1.3505232922187382 1.9455198769595647 2.0048833548522409 1.8854964463925956 1.8234998847109918 1.0803990939014343 1.3351488491391603 1.6118754848702463 1.6349266481139488 @ 2 1.7511548246040607 @ 2 1.6349266481139488 @ 7 1.8087766979895097 1.7511548246040607 @ 2 1.6272310468801345 1.7511548246040607 1.7432022999129761 1.7511548246040607 @ 6 1.8494004266497956 1.7511548246040607 1.753648614523466 1.7511548246040607 1.7992257355551988 1.7324787398436672 1.7511548246040607 @ 2 1.7039332936699036 @ 2 1.6639709046046485 1.645622401016217 @ 3 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 @ 2 1.433789744370584 1.3774928275111349 @ 2 1.2700370282471933 1.3723496174098868 1.3743834612812018 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.88030267596053013 0.85373152830891452 0.76742488169680223 0.7600558254329971 @ 5 0.75668090009050293 0.77191135874125461 0.73939975426990545 @ 6 0.78974167367095316 0.76436607695219927 0.7915805236001503 0.73939975426990545 @ 4 0.72226846643539133 @ 2 0.70907970790403496 @ 2 0.68899857183933499 0.60428972107683654 0.48190335237990245 0.41609261794876523 0.38705306968677583 0.52167057703048125 0.41121254746487107 0.2893440893104921 0.30174464259941547 0.23693312442709019 0.29829830232331966 0.30651034135776256 0.35962390675287925 0.37399189466382959 0.28096301519732036 0.36108845666733541 @ 3 0.35933684696936752 @ 3 0.34432459685517991 0.3470977841658312 0.37310239793433797 0.35933684696936752 0.3470977841658312 0.35656365965871611 0.36850269190316964 0.093126672122670603 @ 2 0.49207177190386042 0.36497115061511648 0.27852410739929739 0.35821908003695707 0.36497115061511648 0.38228447230113272 0.31912016741325361 0.33211593327943989 0.38088357706088061 0.34120140174088026 0.33918766451826554 0.33607635559133608 0.32771352960049865 0.33082483852742817 @ 2 0.32771352960049865 0.3654310163220405 0.075850288130392907 0.090067008011234392 0.093126672122670603 0.36445200595011901 0.28310799716652246 0.33965007275699149 0.32436352432224735 @ 2 0.25944365460948876 0.25270616912564098 0.2564360221699406 0.26443796178091922 0.031030477279410964 0 @ 171 0.0097875391426074671 0 @ 17 0.0039304172795770354 0 @ 2 0.036026755794383671 0.41006578816710193 0.035021750197221452 0.0036583924004792482 0 0.0014653005830098076 0.0024916240838610514 0.34075567437737392 0.53408577424797943 0.55428623243367381 0.89713111877224183 0.92669694457502383 0.83689752287312147 0.58744755596178355 0.70714478680647941 0.76310585117667984 0.60015859656979953 0.56680361141140301 0.54563165508641442 0.58216834805205586 0.51236390164272472 0.70026821560923858 1.5115280633585193 1.473754972271728 1.0586651571827728 1.0863289970015866 1.0977390821885999 1.7092181248776392 1.7511548246040607 @ 5 1.7396910134824977 1.8873336643679084 1.7890880623221732 1.56116773028778 1.6292891053086664 1.6349266481139488 1.6444885511518863 1.5164271202138957 1.7890880623221732 @ 2 1.6340208198830068 1.7414705307751843 1.7511548246040607 @ 4 1.7092181248776392 @ 3 1.7511548246040607 @ 6 1.7992257355551988 1.7511548246040607 @ 6 1.7039332936699036 1.6747929055756354 1.7273959979965636 1.645622401016217 @ 2 1.5984760669018909 1.5759861079278161 1.556820302331712 1.4880877050688548 1.3498790448035789 1.2880167624987424 1.4055592841849169 1.3498790448035789 1.3774928275111349 1.387579549933367 1.3160527005504377 1.3743834612812018 1.2275523446847094 1.0338804930211427 1.0221902161984602 0.91152815327545589 0.88030267596053013 0.85859933360741925 0.82913187050954651 0.76748841572289717 @ 4 0.8183878889032471 @ 2 0.81526555013254975 0.76436607695219927 @ 12 0.81710440006174656 0.76436607695219927 @ 2 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.35598474377663791 0.35875793108728926 0.47586773023659334 0.45561834430101622 0.31590212281880675 0.33944152002745409 0.30849536023081475 0.29433788001142352 0.30651034135776256 0.37878035456510201 0.33403275416750566 0.31704770063312776 0.34583476971815302 @ 2 0.32003674991284858 @ 3 0.35933684696936752 @ 2 0.38747038584528837 @ 2 0.39707607010276441 0.39345762557697622 0.082068932326731445 0.29406578042092613 0.37637734495092323 0.33400901535467259 0.33089770642774308 0.3470977841658312 0.35656365965871611 0.35933684696936752 0.38747038584528837 0.33554993869917038 0.3859657520467647 0.28688747294517236 @ 2 0.31912016741325361 0.2815074699892115 0.34832091486019695 0.30345280256839841 0.40793547291964488 0.021147421194461034 0.02020455229648014 0.32644878550765111 0.33457242274818377 0.054486103506532338 0.24565492227511657 0.1283586546115181 0.11582915563446546 0.34285168316272335 0.2981616835681698 0.075850288130392907 0.19180000479212614 0.28165451053042651 0.13401937826785226 0.23485340927371717 @ 2 0 0.0045785180926391352 0.0082131177558838805 0 @ 189 0.050297972470259321 0.041992416988327994 0.19300487507527969 0.015956642821678326 0.39392585082010023 0.09960910884690552 0.25236671784571563 0.21534793500308147 0.21573681970432809 0.53457408946609941 0.54319457967394458 0.60709616404263445 0.3953890283049889 0.35377563616420044 0.52000760068966223 0.70337774861119207 0.61997189444270739 0.49699916500207186 @ 3 0.56426527707058571 @ 2 1.4285639841170306 1.7602645018456928 1.7699487956745692 1.6392341080418318 1.6625552823861587 1.4851698285427732 1.3755830976165653 1.6055754977480274 1.6736968727689139 1.6349266481139488 @ 5 1.3830153374049534 1.1604294826060702 1.6292891053086664 1.5226696537412747 1.6349266481139488 @ 2 1.6623455263759728 1.7992257355551988 1.7511548246040607 @ 2 1.8489245168444501 1.7511548246040607 @ 3 1.6292891053086664 1.6349266481139488 @ 3 1.6357616869577964 1.6932587362148137 1.6912248923434992 1.8489245168444501 @ 2 1.7570872112810023 1.7723383548823699 1.7365531288328875 1.7429654253861571 2.0361516007905629 @ 2 2.01691823317497 1.9855326410541771 1.9662992734385847 1.9583357104745407 1.8089148260923551 1.5984760669018909 @ 2 1.5759861079278161 1.556820302331712 1.4880877050688548 1.3498790448035789 1.3774928275111349 @ 4 1.331282633073918 1.2548070957237127 1.3160527005504377 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.88030267596053013 0.80586101049787184 0.77511005855849857 0.70899236922189801 0.81526555013254975 @ 2 0.81710440006174656 0.76436607695219927 @ 4 0.73939975426990545 @ 4 0.78974167367095316 0.73939975426990545 @ 2 0.75668090009050293 @ 2 0.76436607695219927 @ 4 0.70899236922189801 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.40237602713114723 @ 4 0.34585835578790869 0.50755292059914281 0.36379790501803899 0.33000599473212172 0.32871270414211284 0.31313143220875855 @ 2 0.29893486397682661 0.32609259349591291 0.33849314678483627 @ 2 0.32890237211850171 0.33849314678483627 0.34128338116023327 0.31279859426571122 0.35316388443092633 0.37916849819943305 @ 2 0.37310239793433797 0.35933684696936752 @ 2 0.3470977841658312 @ 2 0.35656365965871611 0.36415924749986278 0.36108845666733541 0.37310239793433797 0.35620838618344125 0.32223147634018312 0.37805819111023575 0.3634083889416358 0.25888413654165993 0.32086893815461071 0.33522724220636935 0.063367850539956444 @ 2 0.035240370836065231 0.032674430190057557 0.33642525609735374 0.19351538065334498 @ 2 0.24241798968327088 0.038556079009839733 0.063367850539956444 0.33121084100736736 0.2688912772856813 0.35852813671343653 0.37493319339700537 0.014748846851983613 0.013240094904070267 0.018849569544972283 0.21553997328181851 0.036269024689389438 0.0073469830865176122 0 @ 189 0.050345467134672785 0 @ 6 0.2957355895136089 0 0.06401645251824914 0.59486265360361401 0.51971778633702914 0.26048867416075921 0.29854345326212006 0.70295474365536104 2.692932110899199 0.31434186707201583 0.45068714840924268 1.5170785522379011 1.4338176543137418 0.61664369671668728 0.80825981292274152 0.52173311014778656 0.61557635425427037 1.6171519350762438 @ 2 1.5922545001717812 1.5463895891042807 1.6543006495055774 1.6209990924912936 @ 3 1.6597693171462586 1.4906384961834542 0.4911410452183721 1.6918577061574058 1.5380252157511629 1.8494004266497956 1.7511548246040607 @ 6 1.6402633534103856 1.7511548246040607 1.8032098482170187 1.8087766979895097 1.8184609918183861 @ 2 1.7595810012004074 1.8548569035213907 1.7595810012004074 1.7511548246040607 @ 5 1.8524182981481438 1.7511548246040607 @ 2 1.8489245168444501 @ 2 1.7511548246040607 @ 2 1.8489245168444501 @ 2 1.6747929055756354 1.797105882590492 1.7273959979965636 1.6965353244263253 1.6408550850449879 @ 2 1.5988325746641432 1.556820302331712 1.4880877050688548 1.3498790448035789 @ 2 1.4055592841849169 @ 2 1.3498790448035789 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 2 0.75926903123765421 0.82306391624886133 0.80845044118925924 @ 2 0.76436607695219927 @ 7 0.78966679944031515 0.76436607695219927 @ 2 0.81607478527194788 0.76436607695219927 @ 2 0.74187099976314363 @ 2 0.76436607695219927 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.40237602713114723 @ 4 0.34585835578790869 0.26393338530117277 0.28133864642481493 0.28606643155845002 0.26244771026269914 0.26674316392376163 @ 3 0.35933684696936752 @ 2 0.35656365965871611 @ 2 0.32999646062492349 0.30165407286946405 0.32045074065345153 0.30019064621235786 0.36079640923207218 0.30487554515883136 0.22514900043842337 0.35620838618344125 0.36415924749986278 @ 2 0.38557163591625981 0.39225884574656072 0.41885844004934986 0.047505635187559722 0.036004612042497157 0.042110351616246586 0.038556079009839733 0.2986535367053581 0.30934743896032019 0.23807256936338464 0.40942559068199752 0.30934743896032019 0.30702201639351356 0.33082483852742817 0.46566348296602078 0.10112474780717355 0.39565225792841047 0.26516142424138162 0.37624099419821022 0.35852813671343653 @ 2 0.32498206843961747 0.35852813671343653 0.26013870574787284 0.35852813671343653 0.053059952744568983 0.039378357820174334 0.038085290028935903 0.039278781062754765 0.040813783117202462 @ 2 0 @ 177 0.01294884828771758 0 0.012001219893403432 0 @ 2 0.0065017411516081298 0.14770063807751191 0 @ 12 0.01609799371908294 0.019744388809144291 0.11677356152206127 0.051959762177760709 0.5220120428794035 0.29189131776415572 0.1801771460386502 0.48239985165907523 0.46661551907969717 1.0691254576032458 0.93784073102278331 0.59523794929699247 0.49699916500207186 @ 2 0.53026691844576157 0.49699916500207186 0.49771328486275834 0.57903966128862916 1.6171519350762438 @ 2 1.7320155579564565 1.6924389916896017 1.8400062302571401 1.7035805820723566 1.1802848399623442 1.7324787398436672 1.7511548246040607 1.7992257355551988 1.7511548246040607 @ 3 1.7992257355551988 1.7511548246040607 1.7324787398436672 1.7511548246040607 @ 3 1.8524182981481438 1.6340208198830068 1.7890880623221732 1.56116773028778 1.5266103166442047 1.4204315160820515 1.555521126965119 1.6056329513428675 1.6349266481139488 @ 4 1.7570872112810023 1.7511548246040607 @ 9 1.8489245168444501 @ 2 1.797105882590492 1.7039332936699036 1.6639709046046485 1.6164820129219488 1.7019193178756662 @ 2 1.6598968074948213 1.6407310018987178 1.5719984046358604 1.433789744370584 @ 4 1.3689927049008266 1.3265153171026889 1.3112853845792085 @ 2 1.2221683512353685 1.029012687722638 1.0139474855574613 0.91152815327545589 0.80443688009788594 0.75554446642097794 0.72479351448160456 0.80693452626031392 0.75659260685926577 0.80877337618951062 0.80693452626031392 0.77714941669792881 0.81526555013254975 @ 2 0.76436607695219927 0.81526555013254975 @ 3 0.76436607695219927 @ 5 0.7600558254329971 0.73939975426990545 @ 3 0.72226846643539133 0.77261038583643893 0.70907970790403496 @ 2 0.68899857183933499 0.61652878388037291 0.43302306595832263 0.35190676882472577 0.40135444827206773 @ 2 0.36811217338860025 0.30174464259941547 @ 2 0.30653113568595874 0.33007053289460603 0.30728741305448953 0.32112661818701221 0.30066601996509051 0.30966511612888825 0.32622395662318815 0.36605440185333121 0.31540097812387008 0.36431430590001596 0.33138689490152817 0.33435175880586027 0.22826030936535288 @ 2 0.31506594677470379 0.30799421553587808 @ 2 0.36108845666733541 @ 2 0.37310239793433797 0.3470977841658312 0.37310239793433797 @ 2 0.35933684696936752 @ 2 0.35656365965871611 0.32228990723001277 0.33623709019921755 0.2815074699892115 0.30785520624733959 0.29109824465554601 0.30785520624733959 0.29109824465554601 0.086908027926332065 0.28248506926623118 0.49133700544232689 0.086908027926332065 0.36713074117908301 0.26516142424138162 0.2830982619752791 0.30804614050742651 0.29505037464124029 @ 2 0.30804614050742651 @ 3 0.34652781247598174 0.04499013640237947 0.043793070886522428 0.15030874542829079 0.041093499082619132 0.014309504872046233 0.023832602530047719 0 @ 172 0.010318098894341425 @ 3 0 @ 2 0.011673674570396423 0 @ 10 0.014997217020269777 0.041992416988327994 0.059152266897879391 0.030925617247635248 0.031190840990025837 0.014128581500751454 0 0.024549957584570712 0.30319125658126556 0.57129685736122038 0.87355328866597637 0.57404496232669255 0.78079602754420807 0.59602965339971781 1.1555043889591696 0.91314306799393241 1.5240038085231877 0.90690871269748896 1.4028423139481694 0.90541392649062735 0.86689147771588027 0.68069053463067442 0.83519279113279765 1.0670322415393505 1.3579461913995434 1.3505139516111551 1.4434066883376329 1.6007338944874911 1.5979274229138549 1.6349266481139488 1.8032098482170187 @ 2 1.7935255543881421 1.8032098482170187 1.7935255543881421 1.610046164856844 1.4822025491839572 1.56116773028778 1.5226696537412747 1.6292891053086664 @ 2 1.5270509676494435 1.6402633534103856 1.8494004266497956 1.6153615496860114 1.7295470821979726 0.62676982153160044 1.7295470821979726 @ 4 1.6349266481139488 1.7365531288328875 @ 2 1.6349266481139488 @ 7 1.7511548246040607 @ 6 1.7039332936699036 @ 2 1.6639709046046485 1.6965353244263253 1.6408550850449879 1.6965353244263253 1.6545128140454803 1.556820302331712 1.4945841053960454 1.3563754451307697 1.4364724343170836 @ 4 1.3036688503663618 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.80525497236480392 0.77402949504987828 0.80586101049787184 0.77511005855849857 0.81710440006174656 0.76436607695219927 @ 8 0.70899236922189801 0.76436607695219927 @ 2 0.76748841572289717 0.77551541051558592 @ 2 0.73939975426990545 @ 3 0.92810211651066976 0.97080348191388532 0.90587378296161047 @ 2 0.89702724495460584 0.79056917699239249 0.71492012926009418 0.67793459742212969 0.46685311588704603 0.40237602713114723 @ 2 0.42770243806719371 0.48286977816894849 0.44035455605971802 0.3458006858345099 0.34760996548587658 0.33353771206050853 0.34585835578790869 @ 3 0.33353771206050853 0.35656365965871611 0.3522850972947027 0.43181755999888954 0.3506571702486484 0.33070403615758243 0.32003674991284858 0.34583476971815302 0.34341017714752159 0.29598959229283489 0.035006863306280354 0.22498841562468916 0.31110552446280765 @ 2 0.30799421553587808 0.32016667688221717 0.35933684696936752 0.37310239793433797 0.33894037533251742 0.33612608090420981 0.30019064621235786 0.27528650585740755 0.27874082631856584 0.26885636937930912 0.269037668162807 0.3304695855357952 0.29109824465554601 0.31912016741325361 0.29604105716724877 0.2855407608522138 0.20838498597648544 0.30379890739779036 0.32275194438764132 0.27708035603190356 @ 2 0.26339290047016101 0.24352288555618054 0.23807256936338464 0.39273716223845562 0.035195863279103741 0.018694137555842264 0 0.042871915360289864 0 @ 2 0.18606224996238716 0 @ 182 0.052394811437896677 0 @ 4 0.03748387370442368 0.039820944566184568 0 0.0042811210693071838 0.099694481649886688 0 0.028147707659032822 0 @ 4 0.076161724496395009 0.048922942410668267 0.096527256263036321 0.66710534892701223 0.63748013644088619 0.27834991279369165 0.7371231546479331 @ 2 1.1326537873795612 0.58905798443755497 0.63023018962779698 0.72948777379732854 0.83547683055355837 1.1495871039810595 0.56680361141140301 0.49699916500207186 0.61557635425427037 1.6285735696152668 1.6042199593032562 1.6165965692056834 1.3505139516111551 1.4351520554570516 1.4882429287696834 2.692932110899199 @ 2 1.4767109405607992 1.1465019269834149 1.2065542487602461 1.2871045308781688 1.5131234120267882 1.6093636327029475 1.4032702241600468 1.6349266481139488 @ 3 1.56116773028778 1.6402633534103856 1.6340208198830068 1.7511548246040607 @ 8 1.6262229276702385 1.7414705307751843 1.7511548246040607 @ 6 1.753648614523466 1.7429654253861571 1.6995742265911347 1.7429654253861571 @ 3 1.7878571413681092 @ 2 1.6639709046046485 1.6164820129219488 1.645622401016217 @ 2 1.6035998906353723 1.6407310018987178 1.5719984046358604 1.31624722268441 1.4284057509212431 1.3727255115399057 @ 3 1.3265153171026889 1.3112853845792085 1.3669656239605459 1.2275523446847094 0.98298101984079245 0.9712907430181098 0.91152815327545589 0.8217180259184832 0.79817583363617561 0.76742488169680223 0.80886166942074766 0.80702281949155086 @ 2 0.75668090009050293 0.81710440006174656 0.76436607695219927 @ 3 0.78966679944031515 0.76436607695219927 @ 2 0.75125528757816307 0.73939975426990545 @ 4 0.68346849276030164 0.73939975426990545 @ 2 0.75926903123765421 0.76436607695219927 @ 2 0.75117731842084279 @ 3 0.66652740874189997 0.41395215735651081 0.46082176783983692 0.3722484449548325 0.40237602713114723 @ 2 0.35962390675287925 @ 2 0.34585835578790869 @ 2 0.31313143220875855 0.33847317135774618 0.31006919209083189 0.31288348651913944 0.33745470029404384 0.23760552555599673 0.31540097812387008 @ 2 0.32851078558644992 0.25460948519658905 0.32399331120561203 0.31195463784777416 0.32999646062492349 0.32016667688221717 0.30300042483494671 0.43317697256826571 0.27549054968183129 0.36912519268585864 0.34139411723200458 0.23760552555599673 0.30487554515883136 0.35620838618344125 0.31540097812387008 0.29148530430452002 0.32639738617167335 0.29671596347558704 0.031444980561574201 0.1866045993310074 0.017872119180257339 0.29671596347558704 0.028483281279246455 0.42286784979882913 0.19723931671695097 0.36550243006637223 0.32588592420020612 0.25093637535258756 0.26983823050612149 0.37208804958736558 0.37639953874500842 0.31511787174625222 0.30768819854231161 0.37208804958736558 0.26386855879217247 0.36220941645906857 0.23526473247204741 0.22514179018599073 0.24490350396747032 0.183943356893569 0.25242438215054552 0.034116742129020536 0.013162856241404661 0 @ 187 0.0086709643035076181 0 @ 6 0.06318975881848822 0.18190448343147617 0.054383412040883213 0.062820545544790163 @ 3 0.15779240068290362 0.26152467041948591 0.36888520540915587 0.48428812439405577 0.56479079965516599 0.79219744572921369 0.49699916500207186 0.56680361141140301 1.3725704994835422 1.6444417525343322 1.2175253747998576 0.96409101933609176 1.1609181787271721 1.9196112537410854 2.0747105306141846 1.9628484555631751 1.6294579804732678 1.7511548246040607 @ 3 1.6349266481139488 2.0361516007905629 2.692932110899199 @ 4 1.4866243371439878 1.8692352467184465 1.8715555093923006 1.6153615496860114 1.6209990924912936 1.6305609955292311 1.6209990924912936 1.8087766979895097 1.7092181248776392 1.7324787398436672 1.7511548246040607 @ 11 1.753648614523466 1.7511548246040607 1.7570872112810023 @ 5 1.8548569035213907 1.7073867291417835 1.7039332936699036 1.7273959979965636 1.7019193178756662 @ 2 1.645622401016217 1.6598968074948213 1.6407310018987178 1.5719984046358604 1.433789744370584 @ 3 1.3774928275111349 1.433789744370584 1.331282633073918 1.3723496174098868 @ 2 1.2275523446847094 0.98298101984079245 0.94632442033581599 0.8356623574128117 0.80443688009788594 0.7683024308425539 0.91294006657101134 0.88464592591726088 @ 2 0.92642448298629165 0.88464592591726088 @ 2 0.70066134534966173 0.73939975426990545 @ 3 0.76436607695219927 @ 5 0.78966679944031515 0.76436607695219927 @ 6 0.78737094382384354 0.73983157479517403 0.76232665198422955 0.75722960626968461 0.74465943151148073 0.46789938835090999 0.4365756662721631 0.40237602713114723 @ 2 0.3722484449548325 0.34585835578790869 @ 5 0.33353771206050853 0.34585835578790869 0.33353771206050853 0.47147621339982265 0.548022610891165 0.093126672122670603 0.29779563346522581 0.33400901535467259 0.37310239793433797 0.57133374923659053 0.50487809216127189 0.55079478874077992 0.48593411214799953 0.29779563346522581 0.36804801600964882 0.28163541632622691 0.36499730301269329 0.36415924749986278 0.35620838618344125 0.36108845666733541 0.35933684696936752 0.3470977841658312 0.43983059800716889 0.30707957531850061 0.30988935394108946 0.29390802327813487 0.31956860803621584 0.053059952744568983 0.25932309400552245 0.42440417530816793 0.32547669734939616 0.28119220381702209 0.35164236615371125 0.31471776373431243 0.29679914538259733 0.2981616835681698 0.086908027926332065 0.082068932326731445 0.093126672122670603 0.47632576478917582 0.093126672122670603 @ 2 0.26386855879217247 0.26317350765378844 0.2196222700281561 0.020644111720397592 0.042867919262423823 0.15403859847259044 0.0049501281907615279 0 @ 177 0.011446150043300976 0 @ 12 0.023820919823141194 0.030925617247635248 0.041992416988327994 @ 2 0.09960910884690552 @ 2 0.47488967472048721 0.30465164405688627 0.062820545544790163 @ 2 0.049165478074963839 0.15779240068290362 0.29854345326212006 0.36888520540915587 0.21559957076825817 0.54339669770832089 0.59917349513811324 0.56680361141140301 @ 3 0.49699916500207186 1.3689442892344181 1.2802350552411386 1.8302611600021914 1.7133394731960629 1.6665459769354714 1.6914264601925764 1.6970993829346501 1.8032098482170187 1.6207967819164797 1.5881520505302686 1.6028648377520787 1.6145542483891011 1.5253484172601286 1.7063348312175952 1.7131458976891221 1.6209990924912936 1.7511548246040607 @ 3 1.6262229276702385 1.7035805820723566 1.7511548246040607 1.753648614523466 1.7511548246040607 @ 2 1.753648614523466 1.7511548246040607 @ 2 1.6890524347788021 1.6340208198830068 1.753648614523466 @ 2 1.7511548246040607 @ 6 1.8489245168444501 @ 2 1.7511548246040607 @ 5 1.7039332936699036 1.797105882590492 1.7273959979965636 1.7039531617469814 1.645622401016217 @ 2 1.6598968074948213 1.584434085039268 1.5719984046358604 1.31624722268441 @ 2 1.433789744370584 1.3689927049008266 1.3498790448035789 1.3036688503663618 1.2884389178428817 1.3441191572242195 1.1993218844990423 1.0083566165595468 0.94632442033581599 0.8356623574128117 0.80443688009788594 0.78089468781557825 0.75014373587620486 0.73939975426990545 @ 6 0.68346849276030164 0.81526555013254975 @ 4 0.8183878889032471 0.81769103828714851 @ 5 0.75149556114472071 0.75659260685926577 0.7600558254329971 0.74292453759848287 @ 2 0.7297357790671265 @ 2 0.8039156415303903 0.67793459742212969 0.46855190980481382 0.40407482104891507 0.43176807338522183 0.3955020733218953 0.41317135679543587 0.30513405728987214 0.278784881458636 0.2815946600812248 0.3009179277159133 0.27729920642016237 0.29744918893835304 0.34760996548587658 0.33353771206050853 0.35933684696936752 @ 2 0.37310239793433797 @ 2 0.3863620518231819 0.35790718010120909 0.36097797093373646 @ 2 0.34879657808359904 0.36103564088713541 0.31259119950128123 0.3388682492288923 0.18258093510283196 0.18351998633363154 0.23760552555599673 0.30799421553587808 0.36912519268585864 0.28836611517175026 0.057149206343617913 0.30890888200313388 0.26091633631947425 0.39154393492212641 0.035601769894557982 0.018303544930707204 0.25247283166012996 0.26528729874281837 0.23582681398465269 0.18839187742386873 0.053777004262466996 0.035006863306280354 0.25042018726275117 0.18725958553648753 0.35624470236579642 0.023496901719251308 0.035240370836065231 0.2855407608522138 0.2592332008442777 0.0084487707037739484 0.023215123118909678 0.0049217075217423733 0.013854451899049183 0 @ 2 0.039278781062754765 0.15403859847259044 0 @ 189 0.046280736388402216 0.1230728028451453 0.10184678798766035 0.026891768181026426 0.051085419943053684 0 0.015956642821678326 0.036861763242091429 0.061318622914187527 0.047679196252811522 0.44178881360182987 0.4501055703291208 0.062820545544790163 0.15779240068290362 0.29854345326212006 @ 2 0.48428812439405577 1.4342101272554315 1.3911427791412727 1.2550115402471764 1.3649004669895619 0.56680361141140301 0.74394127229833695 0.61598667529969597 0.80081457122255972 1.6534540528723713 1.7223312641275801 1.6914264601925764 1.8302611600021914 1.7320763343825287 1.6528943345574916 1.9284240212328374 1.6280138513003868 1.6918577061574058 @ 2 1.418625786169935 1.1791825021907938 1.2751781063226379 1.6918577061574058 1.418625786169935 1.7511548246040607 1.7092181248776392 1.7511548246040607 @ 6 1.8489245168444501 1.7511548246040607 @ 7 1.8489245168444501 @ 2 1.7511548246040607 @ 2 1.8489245168444501 1.7511548246040607 @ 7 1.8005996638941859 1.7039332936699036 1.6390904213475435 1.645622401016217 1.5984760669018909 1.6561901501545433 1.5759861079278161 1.556820302331712 1.4880877050688548 1.4055592841849169 1.4075931280562315 1.3498790448035789 @ 3 1.2418065680615256 1.3441191572242195 1.3461530010955343 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.88214152588972705 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 2 0.81526555013254975 0.76436607695219927 0.81710440006174656 0.76436607695219927 @ 9 0.70899236922189801 0.76436607695219927 @ 5 0.81526555013254975 @ 2 0.75117731842084279 0.79526168265790287 0.75117731842084279 0.67481225865143191 0.46685311588704603 0.35875793108728926 0.35755467354636511 0.35598474377663791 @ 2 0.35469487612163259 0.29744918893835304 0.32106791023410397 0.34585835578790869 0.35962390675287925 0.34585835578790869 @ 2 0.3458006858345099 0.36415924749986278 0.38747038584528837 0.35620838618344125 0.37310239793433797 0.35933684696936752 @ 3 0.36540294723446248 0.31540097812387008 0.33093551185572301 0.33464040586573629 0.33745470029404384 0.30799421553587808 0.30300042483494671 0.30304975409625323 0.35620838618344125 0.36108845666733541 0.37310239793433797 0.35933684696936752 @ 2 0.32228990723001277 0.24050598522222849 0.2247594605880949 0.33527374001187299 0.25395000598320239 0.23058297513525189 0.24028613329101076 0.024583242751898705 0.036433861869884093 0.030597394241004643 0.035008478139449545 0.090067008011234392 0.46566348296602078 0.30815305232454648 0.2325743268082229 0.30804614050742651 0.29679914538259733 0.30804614050742651 0.31115744943435608 0.30768819854231161 0.044160987053662247 0.24392254113392578 0.15030874542829079 0.25876564271613361 0.027119836343386577 0.0023132767262071855 0.0013509169049602267 0 @ 158 0.011910433749932194 0 @ 29 0.157935729065483 0.050074904077535808 0 @ 4 0.26648713713646527 0.10408436954618804 0 0.49682994019708215 0.38848394198355884 0.79724221016857522 0.45872625055357397 0.26023638408845273 0.40793344758368549 0.67978369665884342 0.43463449991623976 1.05962762989392 0.73020047515941255 0.66035046367433237 0.59330743430723609 0.57531718578949242 @ 2 0.50551273938016128 0.62653069828130792 1.5783269445491264 1.5495105326148613 1.7655615972406091 1.7531728656080765 1.8866464854102396 1.9502045603826783 2.0649505786358664 1.6638705624101706 1.6864093586118762 1.6133329729396038 1.6814543479604904 1.6382134561967088 1.8007845636527822 1.7063348312175952 1.8508404071213376 2.692932110899199 1.7648933667134534 1.9405202665538015 2.1219037366950508 2.692932110899199 2.0361516007905629 1.9922388960993871 2.0048833548522409 2.1764864603974128 1.9280269603193805 1.8990168079273668 @ 3 2.01691823317497 1.7511548246040607 @ 4 1.6349266481139488 @ 6 1.6292891053086664 1.7295981187921947 1.7092181248776392 1.7511548246040607 1.7073867291417835 1.7017491863365009 1.6674243400765278 1.6490758364880969 1.6199354483938282 1.7074065972188608 1.6633502429667015 1.584434085039268 1.515701487776411 1.3774928275111349 1.433789744370584 @ 2 1.3774928275111349 1.433789744370584 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.77402949504987828 0.85676048367822255 0.77511005855849857 0.76436607695219927 @ 2 0.73430270855536051 0.76757999165545532 0.73939975426990545 @ 5 0.76748841572289717 0.86772111160326559 0.81409447439000315 0.80845044118925924 0.74187099976314363 0.76436607695219927 0.70899236922189801 0.81526555013254975 0.76436607695219927 0.73939975426990545 @ 2 0.72226846643539133 @ 2 0.70907970790403496 @ 2 0.68899857183933499 0.67481225865143191 0.46685311588704603 0.40237602713114723 @ 4 0.34585835578790869 @ 2 0.35458960266376199 0.28096301519732036 0.34760996548587658 0.34585835578790869 @ 2 0.33353771206050853 0.35933684696936752 0.31540097812387008 @ 6 0.33745470029404384 0.3961676920919186 0.27852410739929739 0.36108845666733541 0.37310239793433797 0.3470977841658312 0.35933684696936752 0.36108845666733541 @ 2 0.26548269910571315 0.021147421194461034 0.018814988078238233 0.14894670577628527 0.14379846092363494 0 0.040250009011680694 0.017565842796922457 0.031640685514776015 0.013869597363431995 0.029030610039265284 0.030080912981413886 0.041181625510109794 0.063367850539956444 0.2688513940578246 0.24854560404968934 0.28349311738965505 0.20405375444604376 0.25800810659141321 0.22844538713019522 0.30670105778358081 0.035240370836065231 0.037362587976020885 0.026867959363281665 0.2410911574669139 0.013455779060745186 0.013240094904070267 0.015788212176967985 0.019337427880527364 0 @ 187 0.049431858439337457 0 @ 6 0.10216000970463497 0.050322128583424067 0.43594594356017058 0.40005058997156751 0.78638405120206978 0.34339271091715962 0.53672281078776529 0.23624231258352574 0.51590556081204197 0.5193241688313418 0.053991440116091062 1.1921753150125265 0.16173604557425908 0.2564933785809646 1.2952191551696686 1.080173443279647 1.3830746091494379 0.76453757977838122 1.3792338304102578 1.3990571531091343 1.2013617991359298 1.501981821644033 1.4878709867481124 @ 2 1.5396380960862197 1.547240174665125 @ 2 1.6209990924912936 1.5331293397692041 1.5131234120267882 1.6153615496860114 1.5131234120267882 1.56116773028778 1.555521126965119 1.5270509676494435 1.8184609918183861 1.6483051006358258 1.4340745686732317 0.70978731157848018 1.5087420981186193 1.6209990924912936 1.6153615496860114 1.5131234120267882 1.6153615496860114 1.8184609918183861 @ 2 1.7429654253861571 1.7723383548823699 1.7570872112810023 @ 2 1.8243722169660304 1.7723383548823699 @ 2 1.7511548246040607 1.7432022999129761 @ 2 1.7511548246040607 1.7092181248776392 1.7992257355551988 1.7092181248776392 1.7511548246040607 @ 3 1.7039332936699036 1.6790528104127991 1.6390904213475435 1.645622401016217 1.7019193178756662 1.645622401016217 1.6035998906353723 1.584434085039268 1.490821004519306 1.3774928275111349 @ 4 1.31624722268441 1.3347360685457978 1.3283843233637473 1.3461530010955343 1.1436416451177047 1.0083566165595468 0.99666633973686358 0.8356623574128117 0.79184462312486159 0.78089468781557825 0.69421247436660094 0.77898826662712606 0.68346849276030164 0.73939975426990545 @ 5 0.73430270855536051 0.73939975426990545 @ 2 0.75668090009050293 0.76748841572289717 @ 2 0.76436607695219927 @ 3 0.75668090009050293 0.77445289963039288 0.78144203060730644 0.77579799740656241 0.72226846643539133 0.77261038583643893 0.70907970790403496 0.70398266218948991 0.73169993724255045 0.63283980028408382 0.43947339353487225 0.41121254746487107 0.41302182711623781 @ 2 0.35875793108728926 0.33942009847040766 0.34850828809703283 0.35151881183123451 0.34442868891975031 0.39785367036387009 0.30487862304234492 0.32106791023410397 0.30651034135776256 0.31540097812387008 0.32016667688221717 0.30304975409625323 0.3470977841658312 0.35933684696936752 @ 3 0.39225884574656072 0.36108845666733541 0.384663257905414 0.38747038584528837 0.36108845666733541 0.37310239793433797 0.35933684696936752 0.37310239793433797 0.3470977841658312 0.35620838618344125 @ 2 0.37310239793433797 0.3470977841658312 0.32228990723001277 0.3288253447980678 0.29109824465554601 0.29562923223361898 0.27838288435345082 0.30521916609344585 @ 2 0.2867949477571981 0.037362587976020885 0.38375466470520586 0.32704709845270563 0.28304878303957193 0.25404768427951707 0.24123321719682869 0.20405375444604376 0.2688912772856813 0.26013870574787284 0.33965007275699149 @ 2 0.37208804958736558 0.40993053675118402 0.022814473428398541 0 @ 193 0.0041392434819918821 0 @ 4 0.028977552868417522 0.034452885484867808 0.12685619206938148 0.18062049554072837 0.37874522761710194 0.1801771460386502 0.29189131776415572 0.74044842564146718 0.84864748678104274 0.94898462972139286 1.1095872161909399 0.83835539135426407 1.2129708840904565 1.7138806342632955 1.0756607933867648 1.1933063305618188 1.1141623809611356 1.3266996241568485 1.1948574211403091 1.4194513992771063 1.4698452039559504 2.692932110899199 0.90969995404659609 1.1280676728438106 1.6305609955292311 1.6349266481139488 @ 2 1.4573220659268527 1.5439154554403571 1.46217648713007 1.9837270708715111 1.9094469251188764 @ 2 1.7366643611536441 1.6012507147900903 1.6292891053086664 1.5027441811355555 1.6292891053086664 1.5972579477508462 1.5362872470306752 1.6292891053086664 1.6349266481139488 @ 3 1.8184609918183861 1.7570872112810023 1.8494004266497956 1.7511548246040607 @ 3 1.7414705307751843 1.7511548246040607 @ 9 1.7570872112810023 1.6349266481139488 1.6214604198238578 @ 2 1.6168245704903221 1.5984760669018909 @ 3 1.6598968074948213 1.584434085039268 1.515701487776411 1.3774928275111349 @ 3 1.31624722268441 1.433789744370584 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.94122737462127093 0.8356623574128117 0.80443688009788594 0.78089468781557825 0.82843501989344781 0.81769103828714851 @ 2 0.73939975426990545 @ 4 0.76436607695219927 @ 2 0.70899236922189801 0.76436607695219927 @ 6 0.7600558254329971 0.81039774483404514 0.70412456392339318 0.7600558254329971 0.81039774483404514 0.79326645699953091 0.78989153165703663 0.75117731842084279 0.7297357790671265 0.70965464300242653 0.63328958323301543 0.44426156716970716 0.3549841821844863 0.42844217300736354 0.43332224349125764 0.46570183832373113 0.34585835578790869 @ 6 0.30174464259941547 @ 2 0.31540097812387008 @ 3 0.33894037533251742 0.30953586240300174 0.33472424575855858 @ 2 0.3061610630231828 0.33472424575855858 0.30304975409625323 0.35933684696936752 @ 3 0.35656365965871611 0.35933684696936752 0.3470977841658312 0.35620838618344125 0.35933684696936752 @ 3 0.32228990723001277 0.31948012860742397 0.50908494169626073 0.17590281694850959 0.37522977104767419 0 0.059554042186489839 0.16365686247056216 0.044166408947984501 0.09600078567458728 0.22185198001302189 0.24123321719682869 0.2505784333874726 0.15002685505880006 0.032674430190057557 0.17281774795951163 0.19608405944514509 0.31948783655376134 0.32275194438764132 0.15367657892328707 0.1477060567431055 0.26148014850048107 0.041670853746566781 0.044402921316871527 @ 2 0.0057766401019670559 0.0030481470137004975 0.019122426231711599 0 @ 190 0.021704264930759588 0.050315832486668752 0 @ 2 0.047679196252811522 0.14981540495326273 0.35761637928154832 0.062820545544790163 @ 2 0.22851789424378383 0.50053358949340121 0.45324623330044583 0.48428812439405577 0.56479079965516599 0.92084546488887709 1.4167698695708244 1.4263871172600342 1.2821920342891395 1.2419980674804605 1.2393031744410061 0.50151414380884229 1.5043609267377769 1.8798775412797626 @ 2 1.9782181213768339 1.6970993829346501 1.7511548246040607 @ 2 1.4906384961834542 0.93265883438417152 1.5164271202138957 1.6044086220515617 0.85112297153399474 1.2047618295624734 1.5164271202138957 1.7511548246040607 1.7414705307751843 1.7511548246040607 1.8494004266497956 1.7092181248776392 1.7511548246040607 @ 2 1.5763979313360506 1.7432022999129761 1.7992257355551988 1.7511548246040607 @ 2 1.753648614523466 @ 2 1.6402633534103856 1.7992257355551988 1.7511548246040607 @ 10 1.8489245168444501 1.8548569035213907 @ 2 1.772553582712072 1.8030382692674325 1.6168245704903221 1.5845485112792357 1.6049724672290817 1.7435346361726405 1.7071726893245112 1.6880068837284072 1.6747530827852739 1.4810656262002737 1.6545128461665206 1.2779221102435609 1.3809462629830147 @ 2 1.3347360685457978 1.3723496174098868 @ 2 1.2275523446847094 1.03571934295034 1.0221902161984602 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 0.70899236922189801 0.76436607695219927 0.81526555013254975 @ 3 0.75668090009050293 @ 2 0.80702281949155086 @ 2 0.75668090009050293 @ 3 0.76436607695219927 0.70899236922189801 0.76436607695219927 @ 5 0.78966679944031515 @ 2 0.76232665198422955 0.79099325430331402 0.78915440437411732 0.68596159221481867 0.472919216152141 0.43778308853951886 0.47782962745048696 0.27907097471475195 @ 2 0.1465261951058088 @ 3 0.30651034135776256 0.33353771206050853 0.34585835578790869 @ 2 0.27785170627039085 0.36415924749986278 0.36499730301269329 0.36108845666733541 0.35933684696936752 0.37310239793433797 0.35927917701596868 0.37310239793433797 @ 2 0.36108845666733541 0.35821908003695707 @ 2 0.30799421553587808 0.27549054968183129 0.31110552446280765 0.3531673633430189 0.30300042483494671 0.36720045431333598 0.30799421553587808 0.35509079101281493 0.35821908003695707 0.31912016741325361 0.37800120170240831 0.28688747294517236 0.10112474780717355 @ 2 0.29059870127311299 0.38112124642640954 0.38162068018926876 0.34397584300270101 0.34090505217017364 0.36168870048747476 0.28310799716652246 0.33965007275699149 0.32681334573233739 0.1972452336976446 0.030336528893426994 0.17169393304080463 0.29509771014942027 0.40942559068199752 0.032458746033382641 0.01768506846915328 0 @ 195 0.016818341932994599 0 0.099082449433313693 0.21291355551544772 @ 2 0.39392585082010023 0.09960910884690552 0.14462244144220157 0.21534793500308147 0.096527256263036321 0.47702666681726924 0.31551454767752418 0.44050936868823687 0.85530251763313525 0.45142325445584575 0.58744755596178355 1.2363984945777327 1.2982937400757095 1.3203246688567938 1.2082670335846282 0.56680361141140301 0.61598667529969597 0.96243508655182064 0.94181962531834096 1.6563081944165443 1.7531728656080765 1.6905327654464828 1.8257136626999797 1.7805960481066045 1.8494004266497956 1.7511548246040607 @ 5 1.8489245168444501 1.7511548246040607 1.6292891053086664 @ 2 1.6055754977480274 1.3970276906326684 1.6349266481139488 @ 3 1.56116773028778 1.4204315160820515 1.5270509676494435 @ 2 1.610046164856844 1.6292891053086664 1.6349266481139488 @ 2 1.6357616869577964 1.6912248923434992 @ 3 1.8489245168444501 @ 3 1.7511548246040607 @ 2 1.7429654253861571 @ 4 1.8396757756220676 1.6349266481139488 1.6214604198238578 1.7205197206284113 1.6674243400765278 1.6561901501545433 1.5984760669018909 1.6561901501545433 1.6337001911804685 1.4949580200268755 1.5437679444501922 1.3498790448035789 1.2880167624987424 1.3774928275111349 @ 3 1.387579549933367 1.3160527005504377 1.546463248566686 1.4407831321554192 1.2360345573805573 1.2495816452518016 1.0780942805870481 1.0468688032721225 1.0233266109898147 0.76742488169680223 0.81710440006174656 0.76436607695219927 0.70899236922189801 0.76436607695219927 @ 4 0.81710440006174656 0.76436607695219927 @ 2 0.81526555013254975 0.70899236922189801 0.81526555013254975 0.76436607695219927 @ 4 0.75668090009050293 0.73939975426990545 @ 2 0.72226846643539133 @ 2 0.70907970790403496 0.85432587955139028 0.76206784338126754 0.68570278361185655 0.50654057030180277 0.43227543543076941 0.46511219488295408 0.38754690839945438 0.24090343355681865 0.33422084077126191 @ 4 0.30653113568595874 0.30174464259941547 @ 3 0.31259119950128123 0.31540097812387008 @ 4 0.32851078558644992 0.32045074065345153 0.32856248935607879 0.31438721444428991 0.36355358575396363 0.35019009942051982 0.34306158240750168 0.041710977511403333 0.035006863306280354 0.40986583422284023 0.33894037533251742 @ 2 0.31550627921382662 0.33745470029404384 0.40498576373894607 0.30846808544912102 0.037723987034513635 0.36748074412227211 0.28022125880922411 0.24707161461031626 0.035006863306280354 0.19454379666330254 0.34433101080249723 0.43552688346068291 0.31313591498202503 0.26902625839028382 0.020778901279948931 0.030447194480957153 @ 2 0.32258735839304797 0.027898950925673217 0.05130806458423532 0.19608405944514509 0.37639953874500842 0.35430185552253951 0.24637798100995553 0.25876564271613361 @ 2 0.23964049552610769 0.038960628626000471 0.031611931533943302 0.028984025447672736 0.038665490859437365 0 @ 175 0.049301512000036143 0 @ 11 0.38209394831032278 0.40155247281321521 0.010600738965101598 0.0069628989754220152 0.043242427486410287 0.17904011301562153 0.031585569266110829 0.010562966185614702 0.18653723516872847 0.35784912490105941 0.13354603910567048 @ 2 0.27834991279369165 0.48806274732536603 0.72871916609201026 0.55409257080338692 0.56479079965516599 0.59523794929699247 0.56680361141140301 @ 2 0.46046247203643065 0.49699916500207186 0.46046247203643065 0.74028514984296279 1.6805545030698112 1.7320155579564565 1.7223312641275801 1.6914264601925764 1.6970993829346501 1.7511548246040607 @ 2 1.7092181248776392 1.7511548246040607 @ 6 1.7414705307751843 1.6645956432551265 1.7414705307751843 1.6720164138880067 1.7188383631379511 2.0477281170415984 2.0525772461082075 2.0361516007905629 @ 3 1.6349266481139488 @ 3 1.6292891053086664 @ 3 1.6349266481139488 @ 3 1.753648614523466 1.7511548246040607 1.8548569035213907 1.7570872112810023 1.7595810012004074 1.7570872112810023 @ 4 1.8524182981481438 1.7039332936699036 1.797105882590492 1.7273959979965636 1.645622401016217 @ 2 1.7019193178756662 1.6035998906353723 1.584434085039268 1.515701487776411 1.3727255115399057 1.4284057509212431 @ 2 1.3727255115399057 @ 2 1.3265153171026889 1.3669656239605459 1.3160527005504377 1.1747088632971401 0.98610335861149023 0.97441308178880748 0.86375101886580319 0.88342501473122736 0.83123660721662573 0.75014373587620486 0.78721609557090988 @ 2 0.79231314128545516 @ 4 0.8443117808245153 0.72680749729688121 0.81246902581183811 0.93487610829085432 @ 5 0.56893287487721667 0.95825041658924859 0.69513989746440585 0.82049337867100491 0.83501450668867072 0.78721609557090988 0.81788321885415627 0.77518185345094082 0.76199309491958434 0.59010691447469399 0.68899857183933499 0.61652878388037291 0.43024987864767128 0.39960283982049588 0.40237602713114723 0.47311607355956531 0.46389255867236429 0.35962390675287925 0.34585835578790869 @ 4 0.38321540955103056 0.27797249648162614 0.3333366142257661 0.35933684696936752 @ 4 0.34583476971815302 @ 4 0.31540097812387008 0.31259119950128123 0.31540097812387008 @ 3 0.27382524855992474 0.14404716469243778 0.16914281347382498 0.23158146179008637 0.41824113053185769 0.41638586281877887 0.35514928374216598 0.26528729874281837 0.27820158556995295 0.23450406861660628 0.24690462190552964 0.29562923223361898 0.30785520624733959 0.32241277512368099 0.32735558763538369 @ 2 0.52490913901054048 0.28295209624338846 0.26702845188353269 0.32050266562499991 0.31949381559228934 0.24415955996029046 0.33962781281502585 0.31511787174625222 0.25743767721719818 0.31208569381734153 0.28000452582358948 0.26876723603386138 0.26443796178091922 0.30812454724211541 0.30089498031787121 0.013455779060745186 0.045839554679292335 0 0.015991612603985801 0 @ 186 0.0039304172795770354 0.050522104656853369 0.0031309542121328864 0.035248177695141034 0.028634234130747234 0 0.030209320638757038 0.029034983699104781 0.18190448343147617 0.034483977734514122 0.42163259596799596 0.1704736707696379 0.58456499949803775 0.61692084804642922 0.64850839499820179 @ 2 0.9592987157132925 1.0301860953428952 1.0263889638126251 1.0300364444713339 0.70202578724590181 0.95394773186891657 0.57531718578949242 0.62728485762645658 0.76742170127134868 1.5179799750554488 @ 2 1.6304663793230834 1.8867472066489923 1.6098928820453302 1.6209990924912936 1.6153615496860114 1.6209990924912936 1.6349266481139488 1.8032098482170187 1.7511548246040607 @ 17 1.8489245168444501 @ 4 1.8524182981481438 1.7511548246040607 1.8489245168444501 @ 2 1.7570872112810023 @ 2 1.7511548246040607 1.6349266481139488 @ 3 1.6209990924912936 @ 2 1.6075328642012028 @ 2 1.6028970148676669 1.5845485112792357 @ 2 1.5984760669018909 1.5759861079278161 1.556820302331712 1.4880877050688548 1.3774928275111349 1.3498790448035789 @ 2 1.3359514891809239 @ 2 1.289741294743707 1.5280128038445127 1.576286290240789 1.2397969376691462 0.9454224401854745 0.89039315882621217 0.77973109590320766 0.85477879949893343 0.80586101049787184 0.76742488169680223 0.73939975426990545 @ 3 0.75125528757816307 0.73939975426990545 @ 2 0.78974167367095316 0.73939975426990545 0.86803295768819611 @ 2 0.81769103828714851 0.72680749729688121 @ 4 0.73939975426990545 0.76436607695219927 0.74187099976314363 0.80845044118925924 0.76436607695219927 0.81526555013254975 0.76436607695219927 0.75117731842084279 0.8039156415303903 0.73934049124038237 0.61652878388037291 0.43302306595832263 0.35875793108728926 @ 4 0.32821565357195087 0.39036350256640423 0.35068075631840406 0.37399189466382959 0.33353771206050853 0.34585835578790869 @ 3 0.35933684696936752 0.31540097812387008 0.29336845686518287 0.35200321320947964 0.37348701604467482 0.33434918818331266 0.28867674471738797 @ 2 0.27783392313333 0.31540097812387008 @ 2 0.32678776773321311 0.39192041594312776 0.35933684696936752 @ 5 0.31540097812387008 0.3219364156919251 0.2780962844799964 0.27528650585740755 0.2497144005281185 @ 4 0.29562923223361898 0.28950561959919374 0.31801037144473981 0.30345280256839841 0.27710506631027038 0.25743767721719818 0.30804614050742651 @ 2 0.22667564832048728 0.24544934677078753 0.37493319339700537 0.23807256936338464 0.32343405632898953 0.28349311738965505 0.30377685567355428 0.183943356893569 0.20962410573753804 0.26389163080769257 0.043796645368560608 0 0.0085652827522072848 0 @ 187 0.048658000945404616 0 0.0044249307030233519 0 @ 2 0.02730199984979035 0 @ 2 0.035352206944026465 0.046110938181646445 0.038386024918918321 0.16551681902264573 0.31551454767752418 0.61938864762193369 0.77336919309680641 0.6933674823334639 0.86890153119670155 1.0652642412187689 0.18585740018318941 @ 2 1.0277887570089228 1.4333859382179772 1.9819751938896726 1.3923165691909318 1.2617218158833154 1.5326125194666049 1.6237850577311939 1.5268836253684077 1.7240630332653719 1.6970993829346501 1.7511548246040607 @ 5 1.7890880623221732 @ 2 1.6349266481139488 @ 2 1.6093636327029475 1.6292891053086664 1.6349266481139488 1.6292891053086664 1.6349266481139488 1.4545482787203881 1.6349266481139488 1.8032098482170187 1.8489245168444501 @ 2 1.7511548246040607 @ 3 1.7432022999129761 1.7992257355551988 1.7511548246040607 1.753648614523466 1.8524182981481438 @ 2 1.7511548246040607 @ 6 1.7414705307751843 1.7511548246040607 1.7429654253861571 1.6349266481139488 1.5477015019976887 1.6158228770185752 1.6168245704903221 1.5735955836447861 1.5984760669018909 1.6490758364880969 1.6035998906353723 1.584434085039268 1.515701487776411 1.31624722268441 @ 2 1.433789744370584 1.3774928275111349 @ 2 1.331282633073918 1.2548070957237127 @ 2 1.1712554278252605 0.98298101984079245 1.024029066127657 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 2 0.73939975426990545 @ 4 0.73430270855536051 0.73939975426990545 @ 2 0.76436607695219927 0.70899236922189801 0.76436607695219927 0.81526555013254975 0.76436607695219927 @ 6 0.74187099976314363 0.76436607695219927 @ 2 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.40237602713114723 0.35875793108728926 0.35598474377663791 0.38199077837091505 0.43516170869578996 0.31453818864072969 0.30140961125024918 0.29893486397682661 0.29744918893835304 0.28506197499370084 0.22447659930951677 0.34760996548587658 0.384663257905414 0.3219364156919251 0.32672302778470175 @ 2 0.30931776666105942 0.31837891908046895 0.31361322032212191 @ 2 0.31540097812387008 @ 2 0.24210226770696375 0.012777866262012603 0.33108872527043864 0.28540836048460472 0.24704299197491802 0.25836249106675607 0.29334776110291361 0.30803289550736418 0.35933684696936752 0.31259119950128123 0.27528650585740755 0.3083782890874025 0.032674430190057557 @ 2 0.39396236337301466 @ 2 0.30934743896032019 0.2216748997220454 0.34344570612631642 0.44797195370875026 0.28047162002775039 0.35430185552253951 0.12789380880152262 0.14205128902091405 0.1935279497113086 0 0.042506587610581167 0.030467908378200077 0.25090917308077137 0.052359170144875247 0 0.10760025122885891 0.054459797511630804 0.039218414475110305 0 @ 2 0.020370494496586386 0 @ 176 0.049810280485554609 0 0.013490599946798468 0 @ 8 0.014608733929408689 0.014997217020269777 0.14280009417113995 0.20727476790555557 0.10174827579491025 0.25624379568762629 0.42624193326372606 0.32415031853405968 0.41450454750648325 0.10415021296515702 0.078263749736634955 0.46617948140463428 0.58723961305092354 0.29697219829090565 0.39016801278037816 0.26160270072986924 1.4381864940810825 1.1580730164171646 1.5969573515218232 0.78809566121411478 0.60015859656979953 0.77062943960277286 0.33148685927641991 1.2741354969751892 1.1336849623669205 0.63912295525433216 1.5922545001717812 1.5179799750554488 1.6181475149259115 1.6924389916896017 1.6970993829346501 1.7511548246040607 1.8494004266497956 1.7511548246040607 @ 3 1.4822025491839572 1.6055754977480274 1.6292891053086664 1.498571926125629 1.5608303332319076 1.8893325140984902 1.8990168079273668 2.0361516007905629 2.0264673069616861 2.0361516007905629 1.6349266481139488 1.7511548246040607 @ 2 1.6340208198830068 1.7092181248776392 1.7511548246040607 @ 2 1.7570872112810023 @ 2 1.8051581222321404 1.8553328133267375 1.7570872112810023 @ 3 1.7511548246040607 1.8489245168444501 @ 4 1.6912248923434992 @ 2 1.6349266481139488 @ 2 1.6214604198238578 @ 2 1.6745386537429747 1.7019193178756662 1.645622401016217 @ 2 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 @ 3 1.435823588241899 1.3498790448035789 1.289741294743707 1.2745113622202264 @ 2 1.1305408298210307 0.9454224401854745 0.94632442033581599 0.87177801365849217 0.77402949504987828 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 3 0.7600558254329971 @ 6 0.76757999165545532 0.77551541051558592 0.76748841572289717 @ 5 0.76436607695219927 @ 2 0.76748841572289717 @ 4 0.75429965719154068 0.80519913037189073 @ 2 0.67793459742212969 0.472919216152141 0.40844212739624225 0.36521766628647806 @ 2 0.40844212739624225 0.35192445605300376 0.34585835578790869 @ 2 0.30174464259941547 @ 5 0.31540097812387008 @ 2 0.40986583422284023 0.4253290615318232 0.31110552446280765 0.30019064621235786 0.34341017714752159 0.22293611272124902 0.1934174014231208 0 0.17577142555661016 0.18946404030514233 0.05566975853391818 0.086087482131039755 0.26681251646073822 0.33563422059490461 0.38747038584528837 0.41241100740977193 0.026867959363281665 0.03915098559811736 0.035391553918290831 0.040767994539009783 0.047578369464928758 0.23625856742807164 0.27458250479475749 0.038663127262562276 0.032458746033382641 0.19014139298436133 0.20838498597648544 0.033823786394373362 0.035946003534329002 0.030336528893426994 0.035946003534329002 0.30331944880071743 0.27921756542753534 0.26393101699279115 0.30530126100272537 0.40096925487393126 0.39741297619760452 0.49079149969584407 0.03404651525628373 0.10340076184260281 0.20525986224985446 0.026207408660708715 0.36005164941500806 0 @ 165 0.079725564459816115 0 @ 22 0.034979578779117261 0.1430359107940169 0.072310417233136859 0.074452593552778126 0.041992416988327994 0.059152266897879391 0.0038129551865828354 0 0.0014109175817013772 0.0012551998028715395 0.17129765832327443 0.094057802050115311 0.34385779923775844 0.59832718672487795 0.60709616404263445 0.40224019056755245 0.3953890283049889 0.58059639369922 0.69455252983345517 0.75051359420365571 0.59330743430723609 0.53035415016046838 0.58216834805205586 0.7595719809870296 0.58216834805205586 0.83903101905376098 1.5438729898095787 1.5957466672126179 1.4430225682826263 1.5664529704415366 1.8520126921530344 1.9155707671254729 @ 2 1.6209990924912936 1.6349266481139488 @ 2 1.6444885511518863 1.6112791335829519 1.3351488491391603 1.6349266481139488 @ 2 1.7414705307751843 1.9122912609939924 1.9094469251188764 2.692932110899199 @ 5 1.6349266481139488 1.6292891053086664 1.8032098482170187 1.7511548246040607 @ 4 1.7474029174521259 @ 2 1.7570872112810023 @ 2 1.6306844823520146 1.7570872112810023 1.8548569035213907 1.7511548246040607 @ 2 1.8489245168444501 @ 2 1.7511548246040607 @ 2 1.7039332936699036 @ 2 1.6639709046046485 1.6408550850449879 1.5984760669018909 @ 2 1.5141238256229796 1.556820302331712 1.5458017883215074 1.4075931280562315 1.3498790448035789 1.3774928275111349 @ 3 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.91336700320465281 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 3 0.70899236922189801 @ 2 0.81526555013254975 @ 2 0.76436607695219927 @ 5 0.72680749729688121 @ 3 0.81769103828714851 0.89273530142091484 0.83941020695522461 @ 2 0.81769103828714851 0.80055975045263428 0.79546270473808944 0.99002504813917369 0.75112198424143584 0.77960037967965656 0.67481225865143191 0.46855190980481382 0.43220835992483592 0.41784037201388552 0.40237602713114723 @ 2 0.34585835578790869 @ 7 0.34308516847725734 0.35933684696936752 @ 4 0.38747038584528837 @ 2 0.34432459685517991 0.3961676920919186 0.27852410739929739 0.39225884574656072 0.29779563346522581 0.38005862469655538 0.37637734495092323 0.36804801600964882 0.36108845666733541 0.37310239793433797 @ 2 0.36415924749986278 0.36108845666733541 0.35933684696936752 0.28463172204805148 0.28600606232745629 0.38131477711095946 0.041082473794810476 0.042890211678965437 0.045222644795188234 0.32822903546954108 0.36727971159683753 0 @ 3 0.015139837234299106 0 0.35239845492460975 0.11970194496731085 0.17281774795951163 0.19608405944514509 0.33962781281502585 0.29614823432968901 0.26758239302806486 0.29822348657914921 0.18201689567896231 0.29822348657914921 0.183943356893569 0.031030477279410964 0 @ 64 1.6653977699471878 1.1780431949743797 1.8193104617795122 1.6877490677152187 1.8886385002899353 1.6457405807015233 1.8209461336609996 @ 2 1.7067470777165856 1.3431147276806852 1.794152034014779 1.0085461794858943 1.7958174440761647 1.4780184595451418 1.6597332770035507 @ 2 1.8346716424208298 1.5749418617821633 1.2387585935329002 1.3921349998170076 1.6963208000226244 1.7479364805488824 1.6963208000226244 1.7479364805488824 1.7244173327556049 1.7009018108402121 1.6921960863945986 1.6597332770035507 1.6743615055226764 1.8027537931331741 1.6060052487006646 @ 3 1.7372139151292896 1.6739845728637845 1.7548127366860435 @ 2 1.7401848027331621 1.7669876903623307 1.7439728567647523 @ 2 1.7401848027331621 1.721562583510154 @ 2 1.7411358667855181 1.6867608644200711 1.6535575867730334 1.6458544236425368 1.67696411614161 @ 2 1.631787409732264 1.5293805558950369 1.4015822202232713 @ 3 1.3704725277241976 1.3933991265701577 1.3611309647298839 1.2897076556609328 @ 2 1.1195429084691124 0.99047295221626497 0.89831110052920882 0.8207966527558036 0.80975864451171931 0.81290617083904482 0.77441082399127847 0.73157247366849409 @ 2 0.7636233565388546 @ 2 0.75661328399375816 0.7636233565388546 0.77241788198809969 0.7636233565388546 0.73157247366849409 0.72277794821924901 @ 2 0.7636233565388546 0.75452010646501888 0.77241788198809969 @ 2 0.80490539313911069 0.76405998481950521 0.74801538791732414 0.79757156978987398 0.80490539313911069 0.77222422045523575 @ 2 0.70485021605725551 0.56618266473678813 0.73519734648460222 @ 2 0.44812676470583096 0.37906082238056898 @ 2 0.35848056451553362 0.38362412930662992 0.34625665264533489 @ 3 0.33288978872085495 0.35330751713061936 0.34169334571927384 0.33501224323363116 0.35729768457067679 0.33501224323363116 0.3238255284538567 0.34705689555285679 0.33234732836499842 0.34169334571927384 0.33234732836499842 0.34169334571927384 0.34590588631259861 0.33234732836499842 0.33501224323363116 @ 2 0.27934674819486427 0.22855133020052856 0.25969125578277263 0.33234732836499842 0.38695203202979495 0.33501224323363116 0.34590588631259861 0.34260756996727798 0.34980340317115799 0.38953927146643574 0.37062797734354452 0.035757405518935671 0.3633277949101939 0.34752155957338243 0.43396217539291498 0.037462397776155523 0.027502130025098874 0.066077218162774995 @ 2 0.015829990340546173 0.025059556372756444 0.1972546805133982 0.248571790584421 @ 2 0.21743186500217696 0.33486695782571013 0.30720579676044257 @ 2 0.27375957886690411 0.25566340002591931 0.28567427057780331 0.31642246581416089 0.26688153228932254 0.097227365402883278 0.024337484224060051 0 @ 63 '
+        # data += r'"$s" setDSeries {cms} {10-01-1980 00:00:00} {08-04-2019 00:00:00} 1 DAY -1 0.3470977841658312 @ 2 0.27852410739929739 0.33607635559133608 0.25577282761473041 0.30785520624733959 0.31775762922768119 @ 2 0.25577282761473041 0.27869769136662276 0.34397584300270101 0.28950561959919374 0.27582538679440183 0.33226251531790651 0.28349311738965505 0 @ 3 0.040391578577109538 0.036758588924275609 0.070755400307175587 0.047591473080532194 0.37033206264799329 0.045695989108109951 0.15030874542829079 0.043796645368560608 0 @ 177 0.051108066882333672 0.02985340708924606 0.027480627486083899 0 @ 9 0.0026658964233348724 0 @ 6 0.099512895125552558 0.003575070252046772 0 0.034961761758081925 0.32657286103327915 0.054621675409910767 0.27763719420065008 0.49472942546247134 0.13354603910567048 0.34914467391007731 0.49005196087518726 0.89255999473545622 1.3920793464637993 1.146219684371425 1.0299751095201859 0.84941479447427126 0.77867516310460128 0.66896018119802603 1.4714791795061912 1.4422708578891634 1.0262015841112002 2.0170123341429584 2.0836126705551998 1.5339651733441459 1.8867472066489923 1.853752040813766 1.9155707671254729 @ 2 1.6068882575953729 1.6012507147900903 1.6292891053086664 @ 2 1.6349266481139488 1.610046164856844 1.673100521481619 1.5220733024539796 1.4032702241600468 1.6349266481139488 @ 2 1.6292891053086664 1.6349266481139488 1.7826757657689034 @ 2 1.7511548246040607 @ 3 1.753648614523466 1.8489245168444501 1.7511548246040607 @ 2 1.7092181248776392 1.8489245168444501 1.7511548246040607 @ 3 1.753648614523466 1.8489245168444501 @ 2 1.7511548246040607 1.2814206398500168 1.6800777367833706 1.7511548246040607 @ 2 1.7049582200404756 1.7039332936699036 @ 2 1.6639709046046485 1.6164820129219488 1.645622401016217 1.7019193178756662 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 @ 5 1.331282633073918 1.3160527005504377 1.3743834612812018 1.1712554278252605 0.92760731211049119 0.91591703528780832 0.91152815327545589 0.77402949504987828 0.80586101049787184 0.77511005855849857 0.70899236922189801 @ 2 0.81526555013254975 0.76436607695219927 @ 3 0.81526555013254975 0.76436607695219927 0.81710440006174656 0.70899236922189801 0.76436607695219927 0.70899236922189801 @ 2 0.76436607695219927 @ 2 0.77551541051558592 @ 2 0.69606998199482162 0.80234316290547381 @ 3 0.77551541051558592 0.69580361069054164 0.8039156415303903 0.75117731842084279 0.67481225865143191 0.46685311588704603 0.40237602713114723 0.46570183832373113 0.40237602713114723 @ 2 0.34585835578790869 @ 8 0.35933684696936752 0.37310239793433797 0.35933684696936752 @ 2 0.33402433775774887 0.37310239793433797 0.36108845666733541 0.38747038584528837 0.36850269190316964 0.38005862469655538 0.35933684696936752 0.31259119950128123 0.22498841562468916 0.30304975409625323 0.31540097812387008 0.31259119950128123 0.33860082817763243 0.31197346889142136 0.35933684696936752 0.39669390073248939 0.32771964908734719 0.33112389976669576 0.27874082631856584 0.27325379773676584 0.023496901719251308 0.39677800441994227 0.26524893425997137 0.32556004848951842 0 0.029322763421618554 0.29671596347558704 0.030028396119882339 0.017872119180257339 0.025626253955857874 0.23547546314430479 0.2665488149841963 0.35042042821097724 0.2688912772856813 0.093126672122670603 @ 2 0.4186951298470199 0.15030874542829079 0.25967357423095305 0.22404916240781528 0.041093499082619132 0 @ 197 0.031034233017260972 0.03900624075715238 0.1589901479990059 0.55020418242851277 0.050052818219411599 0.7522161644597124 0.49962521148255523 0.78660346266758152 1.0691254576032458 1.2183398097431617 0.55870125633135093 0.56680361141140301 @ 2 1.1623999513982777 1.3801979453784303 0.60402198965436404 0.59919235707274288 1.0221032129097982 1.6181475149259115 1.7434838937499015 1.6192059089801094 1.6524369113514046 1.5614761406685724 1.7023133464523335 1.5161337475382142 1.6404919585536659 1.6736968727689139 1.5164271202138957 1.6349266481139488 @ 4 1.6932587362148137 1.6349266481139488 @ 2 1.610046164856844 1.6349266481139488 @ 2 1.7511548246040607 1.6349266481139488 @ 2 1.5270509676494435 1.6349266481139488 @ 4 1.5146213903017793 1.7511548246040607 1.7414705307751843 1.7511548246040607 1.6349266481139488 1.4822025491839572 1.5270509676494435 1.6349266481139488 @ 2 1.6209990924912936 @ 2 1.6349266481139488 @ 2 1.6912248923434992 1.6214604198238578 @ 2 1.6639709046046485 1.645622401016217 @ 3 1.5423542858086474 1.6407310018987178 1.5740322485071747 1.3774928275111349 @ 2 1.4364724343170836 1.6470205318412938 @ 2 1.4729153694108448 1.4818459517073641 1.4874834945126467 1.3426862217874693 1.0866479005767897 0.99850518966606083 0.8356623574128117 0.80443688009788594 0.80586101049787184 0.82784838166804586 0.70899236922189801 @ 2 0.73939975426990545 @ 2 0.78974167367095316 0.73939975426990545 @ 4 0.7600558254329971 0.70899236922189801 0.81526555013254975 0.82022673883244435 0.76748841572289717 0.82022673883244435 0.81526555013254975 @ 2 0.75926903123765421 0.76436607695219927 @ 4 0.70907970790403496 @ 2 0.68899857183933499 0.60967762161780936 0.42617190369575914 0.35190676882472577 @ 2 0.35875793108728926 @ 2 0.30651034135776256 0.34585835578790869 @ 4 0.27797249648162614 0.39544538063913792 0.39785367036387009 0.42383894376947046 0.28855658201489792 0.31688715831156095 0.29053798248032475 0.29334776110291361 @ 4 0.23978039709107893 0.27859094731827178 0.27382524855992474 0.27101546993733588 0.45645849895661206 0.57133374923659053 0.548022610891165 0.43471693323482902 0.25418588138063503 0.30165407286946405 0.31802488419794378 0.31759590733600007 0.23185820541202204 0.31434870589822733 0.21781010814893517 0.32734447176441361 0.035006863306280354 0.032458746033382641 @ 2 0.16749299853328087 0.31962357235516464 0.22745580173308086 0.35862564517130097 0.30804614050742651 0.31511787174625222 0.29549881526420252 0.057149206343617913 0.037694368009163419 0.039816585149119087 0.32384239410724519 0.23048696054889445 0.28147707036039743 0.13401937826785226 0.21272036301643954 0.09030709525208977 0 @ 4 0.013398196527311737 0 @ 181 0.0010801035415283272 0 @ 2 0.033869379195786933 0 @ 2 0.15292297514869577 0.36695436377704499 0 @ 6 0.01497320290490624 0.14118660240509714 1.6538966013432714 0.84388375544871075 1.3734736214827359 0.73239849763961706 1.4542829333483371 1.4783901798897687 0.63348413151463423 0.82647063995008341 0.58335138636257133 0.49699916500207186 @ 3 0.99380179539298386 0.57903966128862916 1.7223312641275801 1.6542624490376092 1.7468971952517305 1.6822260615805005 1.6682282051282327 1.6292891053086664 @ 2 1.6349266481139488 @ 4 2.0264673069616861 1.773798816985082 1.6002267134529624 2.0361516007905629 1.921975554822869 1.9122912609939924 1.6068882575953729 1.8087766979895097 1.6705662778190813 1.6656037624650226 1.6292891053086664 1.6444885511518863 1.6349266481139488 @ 5 1.6292891053086664 1.6349266481139488 @ 3 1.6056329513428675 1.5270509676494435 1.6444885511518863 1.6912248923434992 @ 3 1.7511548246040607 2.2286335369710621 1.9920128941054402 2.1187175697771266 @ 2 2.068098610040741 @ 2 1.713729609555251 1.6122417951488039 1.6490758364880969 1.6199354483938282 1.6653840868380159 1.5878875205111478 1.5082829661255253 1.3774928275111349 @ 5 1.331282633073918 1.3160527005504377 1.2548070957237127 1.1127257017460472 0.95801469715849874 0.94632442033581599 0.8356623574128117 0.80443688009788594 0.78089468781557825 0.80048565527725235 0.78974167367095316 0.80234316290547381 0.7878163888797205 0.88464592591726088 @ 6 0.73939975426990545 @ 11 0.72226846643539133 @ 2 0.70907970790403496 @ 2 0.75117731842084279 0.67481225865143191 0.49454636822335252 0.40237602713114723 @ 3 0.39960283982049588 0.40430409649659843 0.34585835578790869 @ 2 0.37118476672395528 0.35151881183123451 0.33072793343791967 0.34585835578790869 0.30651034135776256 0.30304975409625323 0.33472424575855858 0.32016667688221717 0.30300042483494671 0.31540097812387008 0.31195463784777416 0.49996568988714124 0.3612898708694845 0.36497115061511648 0.36190035978258916 0.35933684696936752 0.3470977841658312 @ 2 0.31259119950128123 0.32999646062492349 0.16474712366169608 0.36451622844385911 0.40600206772832143 0.41824113053185769 0.34344972614909541 0.22594235704539595 0.25450553978077178 0.23450406861660628 0.32241277512368099 0.2815074699892115 0.26524893425997137 0.27027165275348014 0.32402470280843038 0.21340770446999399 0.39659906666242978 0.26902625839028382 0.020635978046930004 0.17866598709886292 0.15952481806263893 0.29356889502411671 0.37033206264799329 0.25617309583813841 0.33920662590445516 0.23170303484271701 0.24854560404968934 0.016871063991939262 0.078662701840253646 0.20206647894887045 0.19227366179618566 0.02990992132272572 0 0.21479022629891797 0.040688200443001248 0 @ 163 0.042583382123280659 0.039973306647769928 0.034471273065653181 0 @ 20 0.020210237757482517 0 @ 2 0.01195411578827788 0.0090289461059057247 0.019112633086130305 0.093750896950842044 0.0522638891217913 0.18164122428483551 0.14462244144220157 0.16595077420784074 0.21221688563157365 0.54098076816898999 0.59833102239254277 0.74771799995089638 0.43831341108516408 1.1034781213883711 0.55732880842404542 0.6346467755505133 0.74394127229833695 0.80081457122255972 0.57944998233405465 1.3745177146787715 0.61394615862149093 0.61557635425427037 1.6171519350762438 1.7046569587176801 1.4089079955413033 1.6228792295002517 1.7103298814597541 1.666442262089654 1.719718584579778 1.5687959386974619 1.4367505382269616 1.6450621309630433 1.3475447070979893 0.82577275013939455 1.6330250957349812 1.6012507147900903 1.7302512358498521 1.8371589732733116 1.7890880623221732 1.7794037684932968 1.7463478262319982 1.7794037684932968 1.7890880623221732 @ 2 1.7935255543881421 1.9014554502627539 1.6643237442917025 1.8032098482170187 1.7570872112810023 @ 2 1.7511548246040607 1.753648614523466 1.6349266481139488 @ 2 1.6444885511518863 1.6349266481139488 @ 3 1.6357616869577964 1.8489245168444501 1.7511548246040607 @ 3 1.7092181248776392 1.7511548246040607 1.7039332936699036 @ 2 1.6639709046046485 1.6164820129219488 1.645622401016217 1.6164820129219488 1.6035998906353723 1.584434085039268 1.515701487776411 1.5324905980638874 1.4715623644589626 1.4810656262002737 @ 3 1.4348554317630573 1.4196254992395765 @ 2 1.3960284330362263 1.187970218085785 1.1460385096373045 1.0245151676914463 0.99328969037652037 1.086274721474348 0.75014373587620486 0.73939975426990545 @ 5 0.70412456392339318 0.7600558254329971 0.76748841572289717 0.76436607695219927 @ 2 0.81710440006174656 0.76436607695219927 0.73939975426990545 0.68346849276030164 0.73939975426990545 @ 2 0.76682855554770413 0.73939975426990545 @ 2 0.76436607695219927 0.72226846643539133 @ 2 0.70907970790403496 @ 2 0.68899857183933499 0.66297543147097204 0.44237730825963367 0.34913358151407442 0.33966593195613626 0.35190676882472577 0.32123402430093839 0.31099045499231687 0.32558593749337028 0.32528403980806275 0.30174464259941547 @ 2 0.29893486397682661 0.30174464259941547 0.34478396239502523 0.36108845666733541 0.27852410739929739 0.36103564088713541 @ 6 0.32999646062492349 0.36016370074643606 0.34487650447001017 0.017388509630802369 0.22614958987718864 0.36016370074643606 0.31802488419794378 0.39525342831042021 0.3612898708694845 0.36499730301269329 0.32397798911062431 0.33563422059490461 0.28631333427258027 0.30242040906569612 0.28960594198300771 @ 2 0.29930910013876649 0.31912016741325361 0.32241277512368099 0.30345280256839841 0.19064053001433379 0.37766292671955043 0.025811705181242234 0.014053193792104292 0.020605047643398947 @ 2 0.019765456155586499 0.017037166690846133 0.032235334049163927 0.036433861869884093 0.035240370836065231 0.033823786394373362 0.014533162695308695 0.043796645368560608 0.04499013640237947 0 0.015788212176967985 0 0.02096099782640409 0 @ 189 0.007892519595775721 0.19972995958432371 0.36836385997041182 0 @ 4 0.034385229736589314 0.71969986799865504 0.71750705991544095 0.23624231258352574 @ 2 0.33121416772163925 0.45142325445584575 0.77336919309680641 0.48428812439405577 0.56479079965516599 0.63480710515966365 0.49381745719482689 0.60015859656979953 0.63987711459948082 0.51236390164272472 0.58216834805205586 1.3830746091494379 1.6512039359932176 1.7602645018456928 1.5489657983339946 1.8681943977203042 1.6506343252079125 1.7511548246040607 @ 3 1.7092181248776392 1.7511548246040607 @ 3 1.7092181248776392 1.7511548246040607 @ 6 1.753648614523466 1.7511548246040607 @ 4 1.8032098482170187 1.6736968727689139 1.4204315160820515 1.6349266481139488 @ 4 1.6357616869577964 1.8489245168444501 @ 6 1.7511548246040607 1.8489245168444501 @ 2 1.8524182981481438 1.7295470821979726 1.806618633457074 1.7080538093373625 1.7034179600038266 1.762580207865003 1.6850694564153954 @ 2 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 1.31624722268441 1.3774928275111349 1.31624722268441 1.433789744370584 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.95801469715849874 0.94632442033581599 0.8356623574128117 0.81308203962674042 0.78089468781557825 0.75014373587620486 0.73939975426990545 0.7915805236001503 0.73939975426990545 0.75926903123765421 0.76436607695219927 @ 2 0.81607478527194788 0.78966679944031515 @ 2 0.74187099976314363 0.76436607695219927 @ 7 0.78966679944031515 0.76436607695219927 0.81710440006174656 0.76436607695219927 0.70899236922189801 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.35190676882472577 0.37097839253701131 0.35190676882472577 @ 2 0.30174464259941547 0.29893486397682661 0.30174464259941547 0.34585835578790869 0.35068075631840406 0.34915126874235242 0.30347169268209229 0.28606643155845002 0.28036068612797987 0.27382524855992474 0.29983939304199464 0.2909345092904736 @ 2 0.41651945966174331 0.36804801600964882 0.384663257905414 0.41163938917784915 0.30890888200313388 0.39669390073248939 0.3961676920919186 0.33400901535467259 0.38747038584528837 0.38005862469655538 0.093126672122670603 0.39525342831042021 0.29873468469602527 0.39316722375740659 0.41556998409198626 0.25932309400552245 0.34893140377330162 0.33522724220636935 0.30521916609344585 0.010064976797899371 0.030336528893426994 0.032458746033382641 0.19221659822344206 0.32734447176441361 0.038556079009839733 0.053204184888060738 0.35852813671343653 0.32809337736654698 0.2375970453017317 0.26386855879217247 0.23481434376964658 0.27637366807417657 0.17770457861480729 0.023111334396171732 0.32644878550765111 0.040284856336045796 0.035356170513326304 0.01583896190111863 0.032092746408372119 0 @ 2 0.18646323531508321 0 @ 185 0.1172813218070707 0 @ 5 0.29695303434867781 0 @ 2 0.027685419974703935 0.045860948835066508 0.0030135498116523134 0.050090178633940871 0.49962521148255523 0.13354603910567048 0.12077361784026977 0.29854345326212006 0.72213825113118579 0.038931343856560427 0.4572441747880111 1.3362876421323295 1.0528843521959088 0.52696238697715359 0.47243544549376837 0.46046247203643065 0.49699916500207186 0.61557635425427037 1.6914264601925764 1.6171519350762438 @ 3 1.6970993829346501 1.7511548246040607 @ 3 1.719718584579778 1.56116773028778 1.6349266481139488 @ 6 1.8184609918183861 @ 3 1.8032098482170187 @ 2 1.7511548246040607 @ 2 1.753648614523466 @ 2 1.7511548246040607 1.753648614523466 1.8489245168444501 @ 2 1.7511548246040607 @ 3 1.8489245168444501 1.8524182981481438 1.7511548246040607 1.8494004266497956 1.6340208198830068 @ 2 1.7511548246040607 @ 5 1.7039332936699036 @ 2 1.6639709046046485 1.645622401016217 @ 3 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 @ 5 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.91152815327545589 0.82940320278017965 0.80586101049787184 0.7197363508281972 0.81526555013254975 0.76436607695219927 @ 3 0.70899236922189801 @ 2 0.76436607695219927 @ 3 0.81710440006174656 0.76436607695219927 0.81526555013254975 @ 2 0.81710440006174656 0.76436607695219927 @ 4 0.70899236922189801 0.76436607695219927 0.70899236922189801 0.81710440006174656 0.75117731842084279 @ 3 0.66971521293688685 0.46685311588704603 0.40237602713114723 @ 4 0.34585835578790869 @ 3 0.42729000721948329 0.32404267253978153 0.30050327533113419 @ 2 0.29769349670854539 0.32069504842364394 0.33348287849027736 0.35988068513584931 0.34432459685517991 0.35196896974084468 0.40986583422284023 0.43317697256826571 0.18258093510283196 0.25460948519658905 0.22826030936535288 0.3219364156919251 0.34309108393963267 0.33138689490152817 0.02116159389437549 0.035006863306280354 0.032674430190057557 0.32834455377709509 0.014978389343140823 0.33328901521672 0.028039443338341578 0.17800686902024801 0.27342079044155243 0.24707161461031626 0.33522724220636935 0.33918766451826554 0.34841918187330856 0.36297071702879696 0.03938884875478308 0.047556114987274523 0.2496809675229166 0.36234375954000148 0.34292775323685609 0.32179173490569829 0.29374255843559921 0.32806400432773658 0.3472309032844863 0.21102269484032363 0.18888964858304624 0.17549960367342582 0.17699880236087989 0.067199873702218305 0.053852764927271216 0.1731324927599612 0.25967357423095305 0.12274436648864011 0.21479022629891797 0.23878900219281154 0 @ 189 0.28345765996215566 0.12900446602344301 0 @ 2 0.016793480721219344 0.030367217980061669 0.032537200922804169 @ 2 0.057039019207481147 0.59101044999660579 0.38980004635114551 1.0937266914663393 1.0856947544127142 1.1571246290158563 1.084098819659399 0.70393487904442398 0.65979691519709849 1.5468766098631832 1.7297050191488115 1.023457101385439 0.96336386835402732 0.74816657989132984 0.89895486541767944 1.7655615972406091 1.427345721776754 1.6291217630276302 1.7259225903278117 1.6970993829346501 1.7511548246040607 @ 3 1.5917053957202127 1.6209990924912936 @ 4 1.6793311805921589 @ 2 1.8857984125580829 1.8184609918183861 @ 2 1.7511548246040607 @ 3 1.753648614523466 1.7414705307751843 1.7511548246040607 @ 3 1.753648614523466 1.7511548246040607 @ 3 1.6349266481139488 @ 7 1.7511548246040607 @ 3 1.6349266481139488 1.6736968727689139 1.6349266481139488 1.6214604198238578 1.5917033542514776 1.5870675049179419 1.654156306283229 1.2765434377519254 0.97342354575814904 1.5888205796151518 1.6529755948831537 1.6192742864655496 1.4810656262002737 @ 3 1.7099916424862454 @ 2 1.4348554317630573 1.2604005273243057 1.2745113622202264 1.3385254794593215 1.1342141242802353 1.1225238474575523 1.0118617845345481 0.80443688009788594 0.72496342630597432 0.8023245052064496 0.76436607695219927 @ 3 0.70899236922189801 0.76436607695219927 @ 4 0.76748841572289717 0.762391370008352 0.74499333853384142 @ 2 0.79278913821101304 0.71211470799259569 0.76748841572289717 0.76436607695219927 @ 4 0.76748841572289717 0.79278913821101304 @ 2 0.75429965719154068 @ 3 0.62256088969182832 0.43672553371073131 0.40237602713114723 @ 2 0.39960283982049588 0.46082176783983692 0.34585835578790869 0.33353771206050853 0.35962390675287925 0.34585835578790869 @ 2 0.33353771206050853 0.34585835578790869 @ 2 0.36108845666733541 0.33089770642774308 0.3470977841658312 0.36497115061511648 0.37286888220555697 0.27852410739929739 0.36108845666733541 0.36190035978258916 0.37310239793433797 0.35933684696936752 @ 4 0.39102714711952319 0.36497115061511648 0.37286888220555697 0.27852410739929739 0.37286888220555697 0.27852410739929739 0.36108845666733541 0.32228990723001277 0.35065150545050167 0.31775762922768119 0.33211593327943989 0.30785520624733959 0.32241277512368099 0.35200219460582899 0.36168870048747476 0.3737131192527397 0.3480118569633302 0.38768678045436372 0.47703685579113136 0.065779332847167693 0.3420321313004574 0.37446812753388353 0.26757290654859384 0.37624099419821022 0.32436352432224735 0.33965007275699149 0.23112233226725723 0.052957772988217529 0.10760025122885891 0.17094759102738261 0.18136884625503655 0.026646497217771566 0.030499991788549459 0.1809388026722786 0.027393610219577175 0 @ 190 0.20170500800302427 0.087907354420023606 0.1887740136590659 0.09960910884690552 0.021512849567746989 0.0021986540425169921 0.088828048304530047 0.071056030643397633 0.10807481348603182 0.70977300533406118 0.92528781924756232 0.8327433674091349 1.1183145561442984 0.93784073102278331 0.59523794929699247 0.46046247203643065 0.49699916500207186 @ 3 0.56680361141140301 0.61557635425427037 0.56386550055298645 1.7056650779275764 1.5408068121711516 1.5922545001717812 1.5979274229138549 1.6357616869577964 1.6349266481139488 @ 2 1.6444885511518863 1.6118754848702463 1.6340208198830068 1.7511548246040607 @ 4 1.7414705307751843 1.7511548246040607 @ 2 1.8524182981481438 1.7511548246040607 @ 2 1.753648614523466 1.8489245168444501 @ 5 1.6772973367208439 1.6209990924912936 @ 3 1.5917053957202127 1.6209990924912936 1.6793311805921589 1.8489245168444501 1.753648614523466 1.7511548246040607 @ 4 1.7049582200404756 1.8489245168444501 1.7511548246040607 1.7039332936699036 1.797105882590492 1.7273959979965636 1.7019193178756662 1.7039531617469814 1.645622401016217 1.6035998906353723 1.584434085039268 1.4544558829496861 1.31624722268441 1.433789744370584 @ 4 1.387579549933367 1.3160527005504377 1.3723496174098868 1.1127257017460472 1.0338804930211427 0.9712907430181098 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.70899236922189801 0.76436607695219927 @ 4 0.81526555013254975 0.70899236922189801 0.76436607695219927 @ 5 0.70899236922189801 0.76436607695219927 0.70899236922189801 0.76436607695219927 @ 3 0.70899236922189801 0.81526555013254975 @ 3 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.40237602713114723 @ 4 0.34585835578790869 @ 4 0.3203680022332942 0.34585835578790869 0.40304096848028459 0.30943337857799014 0.40985069393261953 0.35656365965871611 0.35933684696936752 0.34432459685517991 0.35656365965871611 0.45513742882606223 0.36415924749986278 0.39353648611038339 @ 2 0.37944886265215882 0.3789349824706521 0.36227448644853627 0.36715455693243043 @ 2 0.36108845666733541 0.39984308606689806 0.36108845666733541 0.36499730301269329 0.35620838618344125 0.37310239793433797 0.32228990723001277 0.30988935394108946 0.30785520624733959 0.31912016741325361 0.29390802327813487 0.33211593327943989 0.32241277512368099 0.30345280256839841 0.33167395191239485 0.33082483852742817 0.31516620435727466 0.26702845188353269 @ 3 0.29549881526420252 0.2981616835681698 0.26983823050612149 0.26328470715031638 0.33609531697752554 0.2639731147852532 0.1477060567431055 0.23964049552610769 0.22852724698819957 0.2564360221699406 0.046449790887171445 0 @ 2 0.0032439009249135209 0 @ 186 0.027547457638174958 0.014997217020269777 0.007892519595775721 0.059152266897879391 0.041992416988327994 0.059152266897879391 0 0.071137774808074941 0.082758726167378699 0.048922942410668267 0.03668444122498335 0.38961350903577341 0.53408577424797943 0.23624231258352574 0.60511715168991564 0.51657543672671413 0.40224019056755245 0.99871100816180103 0.56479079965516599 0.29277953124976558 0.55726149688139648 0.65603408004271124 0.49699916500207186 0.74028514984296279 0.80081457122255972 1.1716951093922341 1.5115280633585193 1.6333469607691309 1.6018164032097184 1.8903076584712721 2.0170731105690307 2.0361516007905629 1.6209990924912936 @ 4 1.7511548246040607 1.7092181248776392 1.7511548246040607 @ 3 1.8489245168444501 1.5270509676494435 1.6349266481139488 @ 3 1.155930025560902 1.5021704843923385 1.6292891053086664 1.7511548246040607 1.7092181248776392 @ 2 1.7511548246040607 @ 7 1.753648614523466 @ 2 1.7511548246040607 1.753648614523466 1.8489245168444501 1.7511548246040607 @ 4 1.7570872112810023 1.7073867291417835 @ 2 1.7333283846735061 1.6490758364880969 @ 3 1.6598968074948213 1.6407310018987178 1.515701487776411 1.3774928275111349 1.435823588241899 1.433789744370584 @ 3 1.3593490897476999 1.3301916016015645 1.5745623472536407 1.4277312306571484 1.2229826558822865 1.1351772306144505 1.0245151676914463 0.79184462312486159 0.78089468781557825 0.77511005855849857 0.70899236922189801 @ 2 0.78974167367095316 0.73939975426990545 @ 2 0.7915805236001503 0.73939975426990545 @ 3 0.76436607695219927 @ 2 0.7600558254329971 @ 6 0.73939975426990545 0.7889979767484756 0.85973331462454938 0.80920490998148897 0.80055975045263428 0.79601615145013238 0.78737099192127791 0.68899857183933499 0.67481225865143191 0.46685311588704603 0.40237602713114723 0.43050956600706813 0.46570183832373113 0.40237602713114723 0.34585835578790869 0.33072793343791967 0.34585835578790869 0.34308516847725734 0.36381311755096291 0.37527602848496538 0.38321540955103056 0.27785170627039085 0.36108845666733541 0.37310239793433797 0.35933684696936752 0.31540097812387008 0.37476951877870246 0.32031854324257408 0.32674867972067256 0.32955845834326142 0.31720723431564452 0.32955845834326142 0.32678776773321311 0.37310239793433797 0.35933684696936752 @ 4 0.40892387182059659 0.384663257905414 0.31540097812387008 0.2967096114298392 0.42479027549174952 0.18952107816979372 0.30488480699788184 0.28788084735728958 0.29173546795876942 0.28185213524549541 0.33607635559133608 0.32771352960049865 @ 2 0.33082483852742817 0.35073398814286538 0.052754175414918648 0.33965007275699149 0.32436352432224735 0.35852813671343653 0.23481434376964658 0.29834298235166767 0.29549881526420252 0.29791029757141457 0.2694399341907448 0.31845668529267424 0.30171962912679634 0.24954621421694942 0.016727352405016636 0 @ 187 0.41843586103115271 0 @ 2 0.014864425567508404 0.040721212306666969 0 @ 2 0.01546081578170834 0.00033606771464748882 0.008265631661582909 0 0.059996414036640848 0.18370280677494488 0.052574515480051168 0.23624231258352574 0.28607433113343356 0.44840998606744142 0.84864748678104274 0.82255829163785998 0.61866574910977112 0.70337774861119207 1.1486336268043504 0.54777910174869704 1.3060750235388856 1.1484723957756222 0.5387804928238511 1.0670322415393505 1.0642267077973573 1.3084852892446517 1.4235406878115404 1.5384776893761134 1.5362982821826225 1.9572360093076673 1.9741779970847948 1.6292891053086664 1.8087766979895097 1.7092181248776392 1.7511548246040607 1.6349266481139488 1.5131234120267882 1.547240174665125 1.0106576313829263 1.8780628501316932 1.8508404071213376 1.9837270708715111 1.6209990924912936 1.6349266481139488 @ 3 1.7826757657689034 1.753648614523466 1.7511548246040607 1.753648614523466 1.8489245168444501 1.753648614523466 1.7511548246040607 @ 2 1.8489245168444501 @ 2 1.8548569035213907 1.7570872112810023 @ 2 1.7595810012004074 1.8548569035213907 1.7570872112810023 @ 2 1.7511548246040607 @ 3 1.8243722169660304 @ 2 1.772553582712072 @ 2 1.7059751281631148 1.689660468445999 1.6579540238295267 1.645622401016217 1.6035998906353723 1.584434085039268 1.515701487776411 1.31624722268441 1.435823588241899 1.433789744370584 1.3774928275111349 @ 2 1.331282633073918 1.3160527005504377 1.2548070957237127 1.1127257017460472 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.82940320278017965 0.75048730276757059 0.82600953173884917 0.81526555013254975 0.70899236922189801 0.81526555013254975 @ 2 0.7600558254329971 @ 4 0.81039774483404514 0.7915805236001503 0.73939975426990545 @ 3 0.73430270855536051 0.73939975426990545 0.74804491379876015 0.73939975426990545 @ 2 0.73430270855536051 0.73939975426990545 0.74969726771319001 0.72226846643539133 0.70907970790403496 0.65314844639443093 0.73934049124038237 0.63328958323301543 0.43672553371073131 0.40237602713114723 0.40407482104891507 0.40844212739624225 @ 2 0.35192445605300376 0.31324445470853074 @ 2 0.37241162275674533 0.34585835578790869 0.3203680022332942 0.34585835578790869 @ 2 0.33402433775774887 0.35933684696936752 @ 4 0.3061610630231828 @ 2 0.32016667688221717 @ 4 0.30300042483494671 0.35933684696936752 0.37310239793433797 0.35933684696936752 0.3470977841658312 0.37310239793433797 0.3470977841658312 0.35933684696936752 0.27770584637973295 0.33623709019921755 0.33522724220636935 0.53211914004133953 0.093126672122670603 0.10112474780717355 0.38228447230113272 0.33918766451826554 0.48593411214799953 0.36274459682977184 0.37653850520338455 0.39258920261223668 0.29791029757141457 0.27847039889614628 0.032458746033382641 0.17281774795951163 0.39944341180158377 0.033823786394373362 0.17169393304080463 0.3472309032844863 0.17281774795951163 0.17110237209829224 0.21139142784296519 0.22531820081091444 0.23100777937321051 0.022335649851301344 0.010638979437386181 0 0.092785178015960756 0 @ 173 0.052380351185070048 0 @ 11 0.10043624052395915 0.054634697979896771 0.2463468274390008 0.087641172575780885 0 @ 3 0.0049539199486062372 0.17926290319342714 0.14179841795076628 0.26575666650498814 0.20177275563712652 0.23624231258352574 0.56916627954326626 0.54600481894521469 0.83689752287312147 @ 2 0.57882651594910173 0.69129954083885681 0.74726060520905724 0.53026691844576157 0.72634839765157455 0.75015609052792143 0.68527493278019058 1.2930479026583563 0.69328279160369866 1.5603171447269355 1.6333469607691309 1.6914264601925764 1.6171519350762438 1.7417606282114051 1.8500834472262002 2.692932110899199 @ 6 1.6349266481139488 1.7511548246040607 1.7414705307751843 1.7324787398436672 1.7511548246040607 @ 7 1.7092181248776392 1.7511548246040607 1.7414705307751843 1.6890524347788021 1.8494004266497956 1.7511548246040607 @ 2 1.7414705307751843 1.7511548246040607 @ 2 1.753648614523466 @ 2 1.7511548246040607 @ 4 1.6349266481139488 @ 3 1.6932587362148137 1.5917033542514776 1.6214604198238578 1.6725048098716599 1.689660468445999 1.7019193178756662 1.645622401016217 1.6035998906353723 1.556820302331712 1.4880877050688548 1.3498790448035789 @ 5 1.331282633073918 1.2548070957237127 1.3723496174098868 1.2275523446847094 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.81526555013254975 0.81710440006174656 0.70899236922189801 @ 2 0.76436607695219927 0.81710440006174656 0.76436607695219927 0.81710440006174656 0.76436607695219927 @ 4 0.70899236922189801 0.76436607695219927 0.68346849276030164 @ 2 0.78974167367095316 @ 4 0.72226846643539133 @ 2 0.70907970790403496 @ 2 0.63306731032973096 0.66481428140016863 0.44426156716970716 0.36999643229867385 @ 2 0.40237602713114723 @ 2 0.34585835578790869 @ 2 0.34308516847725734 0.29893486397682661 0.33229706376285056 0.17006559231445628 0.153061632673864 0.1465261951058088 0.16014371731002716 0.10445075659347101 0.26641848597193279 0.31540097812387008 0.38747038584528837 0.36108845666733541 0.3470977841658312 0.38557163591625981 0.37338276238706386 0.33400901535467259 0.33089770642774308 0.37310239793433797 0.36190035978258916 0.35933684696936752 @ 2 0.3219364156919251 0.30300042483494671 0.31540097812387008 0.30300042483494671 0.31110552446280765 0.1966190019023831 0.29883339169135936 0.35989992619626959 0.31912016741325361 0.33211593327943989 0.25577282761473041 0.33211593327943989 0.31471776373431243 0.32771352960049865 0.31801037144473981 0.33082483852742817 0.23170303484271701 0.29505037464124029 0.26702845188353269 0.2688912772856813 0.30815305232454648 0.26386855879217247 0.33920662590445516 0.32336233545257592 0.044720691318673678 0.038449631714037549 0.030631230325089655 0.29822348657914921 0 @ 178 0.03383357058546136 0 @ 12 0.14280009417113995 0.007892519595775721 0.048461456822676253 0.059152266897879391 0.031367478512206413 0.039716737256360539 0.18563492906268567 0.31174046484882151 0.18164122428483551 @ 2 0.13354603910567048 @ 2 0.062820545544790163 0.15779240068290362 0.26152467041948591 0.33225016398036616 0.60327563469168 0.56479079965516599 0.59523794929699247 0.49699916500207186 @ 4 0.99380179539298386 0.61557635425427037 1.6914264601925764 @ 2 1.7259225903278117 1.6914264601925764 1.6970993829346501 1.7511548246040607 1.7992257355551988 1.7511548246040607 @ 6 1.7992257355551988 1.6276008371813593 1.5848447413933462 1.5895145311871486 1.9866554738910271 1.8893325140984902 1.8990168079273668 @ 4 2.1165917188898962 1.8489245168444501 @ 2 1.7570872112810023 1.7295470821979726 @ 4 1.7723121322556805 @ 2 1.8990168079273668 1.6209990924912936 @ 2 1.5917053957202127 1.6209990924912936 1.7570872112810023 @ 4 1.7511548246040607 1.6214604198238578 @ 2 1.6168245704903221 1.5984760669018909 @ 3 1.5759861079278161 1.584434085039268 1.5280331105897205 1.3898244503244446 1.3019545293834278 1.3898244503244446 @ 3 1.3436142558872275 1.2548070957237127 1.3723496174098868 1.1712554278252605 0.98298101984079245 0.91591703528780832 0.91152815327545589 0.88030267596053013 0.85676048367822255 0.7197363508281972 0.81710440006174656 @ 2 0.81526555013254975 0.76436607695219927 @ 2 0.81526555013254975 0.70899236922189801 0.81526555013254975 0.70899236922189801 0.81526555013254975 0.76436607695219927 @ 4 0.70899236922189801 0.76436607695219927 @ 3 0.75926903123765421 0.83302736429475055 0.50145479339046795 0.50935252498090844 0.80423112451676093 0.75117731842084279 @ 2 0.67481225865143191 0.51204822341055223 0.43778308853951886 @ 4 0.30653113568595874 0.33007053289460603 0.33182401306904236 0.30996169239199928 0.34161229983135616 0.30996169239199928 0.34585835578790869 @ 2 0.39225884574656072 0.37286888220555697 0.36108845666733541 0.36499730301269329 0.36108845666733541 0.37310239793433797 0.35933684696936752 @ 5 0.35656365965871611 0.40892387182059659 0.30890888200313388 0.36108845666733541 0.37286888220555697 0.35620838618344125 @ 2 0.35933684696936752 0.3470977841658312 0.24808146260316441 0.33180888618411908 0.13394787794368024 0.1644742275992076 0.28602343602844804 0.17674712757618219 0.16949694609271668 0.26907644815476395 0.31335522554874007 0.25137042393578918 0.35904134702995166 0.37208804958736558 0.053059952744568983 0.3344749488412474 0.35430185552253951 0.23481434376964658 0.29679914538259733 0.31200656281932265 0.26983823050612149 0.27637366807417657 0.25438987966207333 0.17844485524201725 0.30571306493490336 0.24317430959784114 0.035607022409624017 0.030499991788549459 0 0.063696906130584749 0 @ 191 0.20761487781860238 0.31852273080570231 0.0024657189546777587 0.030352770733084525 0.080536403774129212 0.18164122428483551 0.062820545544790163 0.13354603910567048 0.062820545544790163 0.15779240068290362 0.26152467041948591 0.40224019056755245 0.58744755596178355 1.2584294233588169 1.1989718755906713 1.0384518223977799 0.53035415016046838 0.58216834805205586 0.49699916500207186 0.56680361141140301 0.61557635425427037 1.6171519350762438 1.7223312641275801 1.5500261399050248 1.5861163573680912 1.5308185793899942 1.4262463311947988 1.5622855122842318 1.5947258698480842 1.6221524896358299 1.5315909507875076 1.7063348312175952 @ 2 1.5366144403347144 1.4412153346455134 1.6444885511518863 1.6349266481139488 1.6292891053086664 1.6349266481139488 1.8032098482170187 1.7511548246040607 @ 3 1.6349266481139488 1.56116773028778 1.5226696537412747 1.6349266481139488 @ 4 1.7414705307751843 1.7511548246040607 @ 3 1.6262229276702385 1.5270509676494435 1.6292891053086664 1.6736968727689139 1.6056329513428675 1.6444885511518863 1.6349266481139488 @ 2 1.7511548246040607 @ 2 1.6930613365471383 1.7039332936699036 1.6919545472909017 1.645622401016217 @ 2 1.6736060437024705 1.6035998906353723 1.584434085039268 1.513517380443008 1.3442415019982965 1.6235696934435464 1.5933186497412388 1.5989561925465214 1.2722845674382781 1.2317119158063439 1.4254197691461972 1.4576854368873644 1.1436416451177047 0.95801469715849874 0.94632442033581599 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 0.77551541051558592 @ 2 0.73939975426990545 @ 2 0.98595318128065745 0.81246902581183811 @ 4 0.95825041658924859 0.82111418534069269 0.73939975426990545 @ 7 0.73430270855536051 0.75866670957204818 0.79597834369440101 0.77647804090895878 0.75117731842084279 0.79526168265790287 0.72786606474734983 0.49571849204545665 0.40237602713114723 @ 4 0.34585835578790869 @ 2 0.35962390675287925 0.33353771206050853 0.34585835578790869 0.33022530529883654 0.3333366142257661 0.39827106350293318 0.36108845666733541 0.35656365965871611 0.35933684696936752 0.3718532748110121 0.33894037533251742 0.33745470029404384 0.34401388952499606 0.33860082817763243 0.35762847346080878 0.30102092455735152 0.22826030936535288 0.33400901535467259 0.37286888220555697 @ 3 0.36499730301269329 0.35620838618344125 @ 2 0.36499730301269329 0.36108845666733541 0.33211593327943989 0.31912016741325361 0.269037668162807 0.24360236371827176 0.32734447176441361 0.018694137555842264 0.34048345096766985 0.17908186326753892 0.32556004848951842 0.11771198198134304 0.19047052266417566 0.16659867666492062 0.29783420343629746 @ 2 0.026194847676223234 0.37761700494934497 0.1972452336976446 0.29622152506812754 0.27461595809971778 0.33920662590445516 0.16683120393313125 0.15403859847259044 0.046525138456827167 0.26769879269681962 0.45320613312627883 0.0057766401019670559 0.0030445725316623107 0.0010664638036309341 0 @ 163 0.0098627164469254729 0 @ 12 0.034720287345728365 0.032387854229505568 0.034720287345728365 0.038517345848866263 0.026091151095924733 0 @ 6 0.047325766664447724 0.041579439091873248 0.047144264961401776 0 @ 2 0.016793480721219344 0.0038721376520616342 0.054383412040883213 0.025432503498310114 0.35076941582282034 1.3455417561280369 1.0609024436457288 0.58797270506631993 1.169253697247927 1.4733406857826032 2.692932110899199 1.3534951221373765 1.1721784301162157 1.0384518223977799 0.49699916500207186 0.58216834805205586 0.57531718578949242 0.50551273938016128 0.58755323566671835 1.8701885694215867 1.8470708062873926 1.9233554365285104 1.8352580584573965 1.5839998672911999 1.6209990924912936 @ 2 1.5942241513550863 1.6483051006358258 1.7890880623221732 1.7704119775617797 1.7890880623221732 @ 3 1.6794444651605116 1.6402633534103856 1.7414705307751843 1.6340208198830068 1.7511548246040607 1.753648614523466 @ 2 1.8524182981481438 1.8489245168444501 1.7511548246040607 @ 2 1.753648614523466 1.7511548246040607 @ 2 1.7109083784332908 1.7414705307751843 1.8489245168444501 1.7511548246040607 @ 3 1.7992257355551988 1.7511548246040607 1.6292891053086664 @ 2 1.6349266481139488 1.6912248923434992 1.6349266481139488 @ 2 1.6292891053086664 1.5960576132053983 @ 2 1.6639709046046485 1.645622401016217 @ 2 1.6164820129219488 1.6035998906353723 1.584434085039268 1.4544558829496861 1.433789744370584 1.4372431798424641 @ 4 1.3930668292765616 1.3758030528817671 @ 2 1.2275523446847094 1.0338804930211427 1.2015951632573036 1.0848682723672327 1.10380258466217 1.0802603923798622 1.0133300385544675 0.98503589790071722 @ 2 0.76436607695219927 @ 6 0.81526555013254975 @ 2 0.76436607695219927 0.81526555013254975 @ 3 0.73939975426990545 0.81246902581183811 0.79231314128545516 @ 3 0.73619974998466653 0.45960324560205595 0.77518185345094082 0.76199309491958434 @ 2 0.74191195885488437 0.66337201920469935 0.46181204327048786 0.38754690839945438 @ 2 0.39960283982049588 0.46570183832373113 0.34585835578790869 0.3203680022332942 0.37844192476166899 0.34585835578790869 @ 2 0.35962390675287925 0.33353771206050853 @ 2 0.3522850972947027 0.33070403615758243 0.32032878254988073 0.34758637941612092 0.34270630893222681 0.34758637941612092 @ 2 0.35620838618344125 0.27852410739929739 0.36108845666733541 @ 2 0.37310239793433797 @ 2 0.35933684696936752 @ 2 0.27502414451074114 0.36202600011219527 0.29736464576857202 0.36525016461764198 0.24603285196569374 0.10902131781013419 0.31252167924496327 0.28601368301050378 0.27957340718414936 0.29437873902861539 0.26207820821467426 0.24512202003659178 0.24250221822658846 0.165977505454628 0.25346869578561559 0.24116080694786157 0 0.22357380605145752 0.0072541406379651729 0.13406331000004232 0.20036810716750456 0.24720646672963714 0.32917368958100585 0.038556079009839733 0.31691915776196117 0.080377468830592727 0.14528602693478199 0.16515184701049829 0.30571306493490336 0.042558344209899429 0.0036544229620114059 0.00092235539170666377 0.16813966706793487 0 @ 187 0.0033676321716781059 0 0.035035827410189402 0.47728957361745905 0.012777208152482577 0.058862220236873028 0 0.0086045093913190446 0.034182872821856988 0.16193428063853813 0.53408577424797943 0.18337805765557805 0.44867381317173516 0.72871916609201026 0.29854345326212006 0.60327563469168 1.3166662914256508 1.4462345608230687 0.74028514984296279 1.5773611595952579 1.6238855199884137 1.3980662386673961 0.58216834805205586 0.76742170127134868 1.6018164032097184 1.5932670316688065 1.4416348521503564 1.8787132179771591 2.692932110899199 1.6382134561967088 1.3875416318541443 0.38256922361573142 1.5592482750928862 @ 2 1.759188356705081 1.7131458976891221 2.01691823317497 2.0361516007905629 @ 2 1.7511548246040607 @ 3 1.6292891053086664 1.6674497847992995 1.7723121322556805 1.6685857235921666 1.58155629177628 1.6941487390031682 @ 2 2.1315880305239272 1.6209990924912936 @ 2 1.7511548246040607 1.7092181248776392 1.7511548246040607 1.7414705307751843 1.7511548246040607 1.7429654253861571 1.7365531288328875 @ 4 1.8332634790687978 @ 2 1.8524182981481438 1.8489245168444501 1.7511548246040607 1.7039332936699036 @ 2 1.6639709046046485 1.645622401016217 @ 3 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 @ 4 1.31624722268441 1.331282633073918 1.3723496174098868 1.2265766355380452 1.1380360410795098 0.96665985668735344 0.94632442033581599 0.8356623574128117 0.74850561858828191 0.78089468781557825 0.98772872648050136 0.8183878889032471 @ 2 0.76748841572289717 0.8205422218188152 0.8183878889032471 0.76436607695219927 @ 3 0.74187099976314363 0.70899236922189801 0.81526555013254975 0.72680749729688121 @ 2 0.76320574043353806 0.64838115859822165 0.72680749729688121 @ 3 0.73939975426990545 @ 2 0.72226846643539133 0.66633720492578752 0.65314844639443093 0.70907970790403496 0.69764373136818947 0.67481225865143191 0.49454636822335252 0.40237602713114723 0.43006927946745371 0.35190676882472577 @ 2 0.2893440893104921 0.30174464259941547 0.29893486397682661 0.29744918893835304 0.28939341857179862 0.34272989500198253 0.33353771206050853 0.35962390675287925 0.35933684696936752 0.33402433775774887 0.35933684696936752 @ 4 0.36578717454591708 0.29779563346522581 0.35821908003695707 0.33400901535467259 @ 2 0.28163541632622691 0.36415924749986278 0.38747038584528837 0.36190035978258916 0.032884646166324714 0.22592746685548828 @ 2 0.36016370074643606 0.30953586240300174 0.29356889502411671 0.37033206264799329 0.35200219460582899 0.27394919127757439 0.36668883139749747 0.36455611385902126 0.36596602646136456 0.33782009241357186 0.37990857171114062 0.28489655157344335 0.3590633170841398 0.33609531697752554 0.33920662590445516 0.32498206843961747 0.32809337736654698 0.086889403209973237 0.32436352432224735 0.36174973657640852 0.032674430190057557 0.032458746033382641 0.059679836136759111 0.054374338294185039 0.21272036301643954 0.28903557529533175 0.033882240410528015 0 @ 190 0.0041956410219676221 0.031190840990025837 0.070708576279094604 0.015956642821678326 0.035633792759410678 0.2594995072199468 0.39392585082010023 0.18164122428483551 0.30151255946050476 0.25966776780465051 0.56240205009048716 0.5231857966723924 0.61692084804642922 1.024405018513296 0.58443907829794284 1.4407498830298058 1.3133742699989794 1.7177502682348342 1.6002591846036065 0.72634839765157455 0.27965024293196633 0.74479560661620658 0.8746661396562313 0.64705208172567064 1.3826316873237667 1.1326015061782042 1.6590022078870699 1.9792741008808201 1.6044238232410457 1.6349266481139488 1.8032098482170187 1.6340208198830068 1.7992257355551988 1.8524182981481438 1.7511548246040607 @ 4 1.6349266481139488 @ 3 1.6912248923434992 1.6349266481139488 @ 2 1.1638269401809056 1.7092181248776392 1.7992257355551988 1.8809213678146384 1.7826757657689034 1.8307466767200415 1.7846240397840252 1.7365531288328875 @ 2 1.6292891053086664 1.7365531288328875 @ 2 1.7379875767478137 1.8332634790687978 1.7379875767478137 1.8332634790687978 1.7511548246040607 @ 3 1.7049582200404756 1.8489245168444501 1.7414705307751843 1.7511548246040607 1.6747929055756354 1.7039332936699036 1.6348305165103796 1.645622401016217 @ 2 1.6490758364880969 1.6070533261072519 1.5878875205111478 1.4942744399911858 1.3809462629830147 @ 2 1.3197006581562898 1.31624722268441 1.433789744370584 1.387579549933367 1.3723496174098868 @ 2 1.1712554278252605 1.03571934295034 1.0221902161984602 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 2 0.78966679944031515 0.70899236922189801 0.76436607695219927 0.70899236922189801 @ 2 0.81526555013254975 @ 2 0.81710440006174656 0.76436607695219927 0.81526555013254975 0.76436607695219927 @ 2 0.81741988304811741 0.76436607695219927 @ 2 0.78966679944031515 0.76436607695219927 0.70899236922189801 @ 3 0.75117731842084279 0.70907970790403496 0.68899857183933499 0.58609784930104647 0.43302306595832263 0.35875793108728926 0.36346156688862441 0.34651886828375306 0.39013696432761097 0.39875228069767849 0.34915126874235242 0.35192445605300376 0.37827133791753298 0.35192445605300376 @ 3 0.34585835578790869 0.31540097812387008 0.31259119950128123 0.3061610630231828 0.40129581927887997 0.43861621847725929 0.31953823760727296 0.44496261628364203 0.3226234051635995 0.34224941341628473 0.43860385761079967 0.31197346889142136 0.37593967303808445 0.37637734495092323 0.37800120170240831 0.37637734495092323 0.36108845666733541 0.35620838618344125 0.3470977841658312 0.35933684696936752 0.36108845666733541 0.33623709019921755 @ 2 0.29390802327813487 @ 2 0.30785520624733959 0.25577282761473041 0.35989992619626959 0.34458633191580562 0.31335522554874007 0.31471776373431243 0.25448173286271869 0.35430421715951521 0.27498180733008065 0.086908027926332065 0.086889403209973237 0.47632576478917582 0.43232776033182196 0.082068932326731445 0.28000452582358948 0.086908027926332065 0.017799746213639132 0.0040651599050187635 0 @ 5 0.01355802545845752 0 @ 182 0.060382944197066524 0 0.02442227697015387 0 0.028730438732663486 0.0063539997701749038 0 @ 3 0.071137774808074941 0.077591678149159807 0.2401868015333504 0.39392585082010023 0.18164122428483551 @ 2 0.062820545544790163 0.13354603910567048 @ 2 0.59325458001662201 0.45414156599541361 0.38433711958608241 0.56954448498031351 1.1463717880866515 1.1055953625059292 1.52484640714011 0.9964294744019031 0.57877658486874106 0.54223989190309985 0.74110632726063208 0.73653048868315563 1.9628484555631751 1.8894219370371794 1.9628484555631751 @ 2 1.9725935258181237 1.6012507147900903 1.6068882575953729 1.7414705307751843 1.7511548246040607 @ 2 1.56116773028778 1.6349266481139488 1.5131234120267882 @ 2 1.6209990924912936 1.5917053957202127 1.6209990924912936 1.6349266481139488 1.6209990924912936 1.6349266481139488 @ 4 1.6292891053086664 1.1638269401809056 1.7324787398436672 1.7511548246040607 @ 5 1.6262229276702385 1.7432022999129761 1.5763979313360506 1.7511548246040607 1.753648614523466 1.7511548246040607 1.7324787398436672 1.753648614523466 1.8489245168444501 1.6349266481139488 1.9906875960053287 1.6293898471515116 1.7830176582712665 @ 2 1.8703567800742746 1.8388373209396924 1.69921008141129 1.5984760669018909 1.6035998906353723 1.584434085039268 1.5719984046358604 1.433789744370584 1.4054764701973883 1.4025901316162279 1.3774928275111349 @ 2 1.331282633073918 1.3160527005504377 1.4196254992395765 1.2748282265143993 1.0766238191836626 0.982598904683332 0.92805023306111611 0.94698454535605325 0.92528120300294292 0.96317024894460468 0.93487610829085432 0.78974167367095316 0.73939975426990545 @ 3 0.72680749729688121 0.73430270855536051 0.73939975426990545 @ 5 0.7600558254329971 0.76748841572289717 0.73429309171001378 0.7600558254329971 0.81039774483404514 0.7600558254329971 0.73939975426990545 0.68346849276030164 0.77261038583643893 @ 2 0.67380451755752258 0.7297357790671265 0.70965464300242653 0.67481225865143191 0.43302306595832263 0.35875793108728926 @ 2 0.40135444827206773 0.43778308853951886 0.30653113568595874 @ 2 0.30174464259941547 @ 3 0.33048663504514086 0.30653113568595874 @ 2 0.31361322032212191 0.30121266703319854 0.32475206424184594 0.31837891908046895 0.35933684696936752 0.37338276238706386 0.41556998409198626 0.32914775405397478 0.34224941341628473 0.30121266703319854 0.31361322032212191 @ 2 0.27382524855992474 0.27101546993733588 0.22826030936535288 0.33472424575855858 0.32016667688221717 0.31259119950128123 0.18868491227247985 0.33472424575855858 0.26885636937930912 0.3082013110767316 0.35362100939094382 0.27010428636270284 0.35350763457564188 0.026194847676223234 0.29520554521054526 0.070337727776281112 0.024920894885622991 0.018303544930707204 0.11173354070992383 0.053085885971627479 0.17581950767766197 0.071195211938004127 0.30248387691316903 0.31115744943435608 0.35042042821097724 0.26013870574787284 @ 2 0.34103706436968179 0.017497625212577844 0.01452143642227741 0.01685386953850021 0.0051308172665509881 0.022525302382015236 0 0.052082551296006523 0.092785178015960756 0 @ 156 0.018570211332982811 0.012440719713622109 0.041303682118652173 0 @ 28 0.0035297722479770066 0.05101266391392776 @ 2 0 0.033953786063535482 0.12571877098379444 0.17999830633368077 0.033591159507093661 0.5762406635827404 0.61176912222592017 1.1081038025716592 1.153931664499168 1.1854384340773441 0.7604838303828958 0.63218508436587939 1.8510766772579264 1.6549255367707219 0.97830313963937754 0.79774282459346313 0.60015859656979953 1.2695030993464915 1.2805646247337503 1.2741354969751892 1.3774280058267769 1.5115280633585193 0.98926198800063514 1.6181475149259115 1.6625552823861587 1.5556990626470986 0.38222359225323549 1.5437541098493601 1.6055754977480274 1.5270509676494435 1.6292891053086664 1.488698949511148 1.730259573456248 1.7295470821979726 @ 2 1.6153615496860114 @ 2 1.5223596914080202 1.5705555938231877 1.8171857481616331 1.7295470821979726 1.719862788369096 1.6030205097274002 @ 2 1.5024995645912409 1.7826757657689034 @ 2 1.56116773028778 1.5226696537412747 1.6736968727689139 1.6444885511518863 @ 2 1.6349266481139488 @ 2 1.8489245168444501 1.753648614523466 @ 2 1.7511548246040607 @ 7 1.7039332936699036 @ 2 1.6639709046046485 1.6164820129219488 1.7019193178756662 @ 2 1.6598968074948213 1.6407310018987178 1.5719984046358604 1.435823588241899 1.433789744370584 @ 2 1.3774928275111349 @ 2 1.389613393804682 1.3743834612812018 1.3600907679802194 1.1835870506385704 1.0227969557232637 1.0271514048983548 0.86375101886580319 0.83252554155087732 0.80898334926856985 0.77511005855849857 0.81526555013254975 @ 2 0.76436607695219927 @ 2 0.70899236922189801 @ 2 0.81526555013254975 @ 2 0.70899236922189801 0.81526555013254975 0.75668090009050293 @ 7 0.76436607695219927 @ 5 0.75117731842084279 @ 2 0.69580361069054164 0.67481225865143191 0.46685311588704603 0.40237602713114723 @ 2 0.43006927946745371 @ 2 0.37844192476166899 0.30174464259941547 @ 4 0.30653113568595874 0.26674316392376163 0.41890557552497221 0.34128338116023327 @ 3 0.28867674471738797 0.27783392313333 0.31259119950128123 0.36415924749986278 0.35927917701596868 0.39446031194053577 0.3577856872616666 0.33167379828300836 0.35509079101281493 0.33894037533251742 0.33612608090420981 0.33472424575855858 0.30799421553587808 @ 2 0.31259119950128123 @ 2 0.40892387182059659 0.063367850539956444 @ 2 0.37805819111023575 0.25577282761473041 0.37805819111023575 @ 3 0.28248506926623118 0.34765712274833305 0.25137042393578918 0.35862564517130097 0.28000452582358948 0.075850288130392907 0.093126672122670603 @ 2 0.28310799716652246 @ 2 0.37946259406118216 0.27637366807417657 0.26565593181345798 0.183943356893569 0.20962410573753804 0.054522789444285708 0.081231380632053499 0.016378599920297207 0 @ 190 0.28820042214906694 0.11425597828073777 0 @ 4 0.27273159495585902 0 @ 3 0.77818930248195417 0.28607433113343356 0.33121416772163925 0.77336919309680641 0.40224019056755245 1.1137754846080419 1.193184870532616 0.59523794929699247 0.49699916500207186 0.59810903627409751 1.3551308208238892 0.59810903627409751 0.4758272086770835 0.63987711459948082 1.7019383982269338 1.8603941619755706 2.0073280403140821 1.5452513561202139 1.3505232922187382 1.9455198769595647 2.0048833548522409 1.8854964463925956 1.8234998847109918 1.0803990939014343 1.3351488491391603 1.6118754848702463 1.6349266481139488 @ 2 1.7511548246040607 @ 2 1.6349266481139488 @ 7 1.8087766979895097 1.7511548246040607 @ 2 1.6272310468801345 1.7511548246040607 1.7432022999129761 1.7511548246040607 @ 6 1.8494004266497956 1.7511548246040607 1.753648614523466 1.7511548246040607 1.7992257355551988 1.7324787398436672 1.7511548246040607 @ 2 1.7039332936699036 @ 2 1.6639709046046485 1.645622401016217 @ 3 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 @ 2 1.433789744370584 1.3774928275111349 @ 2 1.2700370282471933 1.3723496174098868 1.3743834612812018 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.88030267596053013 0.85373152830891452 0.76742488169680223 0.7600558254329971 @ 5 0.75668090009050293 0.77191135874125461 0.73939975426990545 @ 6 0.78974167367095316 0.76436607695219927 0.7915805236001503 0.73939975426990545 @ 4 0.72226846643539133 @ 2 0.70907970790403496 @ 2 0.68899857183933499 0.60428972107683654 0.48190335237990245 0.41609261794876523 0.38705306968677583 0.52167057703048125 0.41121254746487107 0.2893440893104921 0.30174464259941547 0.23693312442709019 0.29829830232331966 0.30651034135776256 0.35962390675287925 0.37399189466382959 0.28096301519732036 0.36108845666733541 @ 3 0.35933684696936752 @ 3 0.34432459685517991 0.3470977841658312 0.37310239793433797 0.35933684696936752 0.3470977841658312 0.35656365965871611 0.36850269190316964 0.093126672122670603 @ 2 0.49207177190386042 0.36497115061511648 0.27852410739929739 0.35821908003695707 0.36497115061511648 0.38228447230113272 0.31912016741325361 0.33211593327943989 0.38088357706088061 0.34120140174088026 0.33918766451826554 0.33607635559133608 0.32771352960049865 0.33082483852742817 @ 2 0.32771352960049865 0.3654310163220405 0.075850288130392907 0.090067008011234392 0.093126672122670603 0.36445200595011901 0.28310799716652246 0.33965007275699149 0.32436352432224735 @ 2 0.25944365460948876 0.25270616912564098 0.2564360221699406 0.26443796178091922 0.031030477279410964 0 @ 171 0.0097875391426074671 0 @ 17 0.0039304172795770354 0 @ 2 0.036026755794383671 0.41006578816710193 0.035021750197221452 0.0036583924004792482 0 0.0014653005830098076 0.0024916240838610514 0.34075567437737392 0.53408577424797943 0.55428623243367381 0.89713111877224183 0.92669694457502383 0.83689752287312147 0.58744755596178355 0.70714478680647941 0.76310585117667984 0.60015859656979953 0.56680361141140301 0.54563165508641442 0.58216834805205586 0.51236390164272472 0.70026821560923858 1.5115280633585193 1.473754972271728 1.0586651571827728 1.0863289970015866 1.0977390821885999 1.7092181248776392 1.7511548246040607 @ 5 1.7396910134824977 1.8873336643679084 1.7890880623221732 1.56116773028778 1.6292891053086664 1.6349266481139488 1.6444885511518863 1.5164271202138957 1.7890880623221732 @ 2 1.6340208198830068 1.7414705307751843 1.7511548246040607 @ 4 1.7092181248776392 @ 3 1.7511548246040607 @ 6 1.7992257355551988 1.7511548246040607 @ 6 1.7039332936699036 1.6747929055756354 1.7273959979965636 1.645622401016217 @ 2 1.5984760669018909 1.5759861079278161 1.556820302331712 1.4880877050688548 1.3498790448035789 1.2880167624987424 1.4055592841849169 1.3498790448035789 1.3774928275111349 1.387579549933367 1.3160527005504377 1.3743834612812018 1.2275523446847094 1.0338804930211427 1.0221902161984602 0.91152815327545589 0.88030267596053013 0.85859933360741925 0.82913187050954651 0.76748841572289717 @ 4 0.8183878889032471 @ 2 0.81526555013254975 0.76436607695219927 @ 12 0.81710440006174656 0.76436607695219927 @ 2 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.35598474377663791 0.35875793108728926 0.47586773023659334 0.45561834430101622 0.31590212281880675 0.33944152002745409 0.30849536023081475 0.29433788001142352 0.30651034135776256 0.37878035456510201 0.33403275416750566 0.31704770063312776 0.34583476971815302 @ 2 0.32003674991284858 @ 3 0.35933684696936752 @ 2 0.38747038584528837 @ 2 0.39707607010276441 0.39345762557697622 0.082068932326731445 0.29406578042092613 0.37637734495092323 0.33400901535467259 0.33089770642774308 0.3470977841658312 0.35656365965871611 0.35933684696936752 0.38747038584528837 0.33554993869917038 0.3859657520467647 0.28688747294517236 @ 2 0.31912016741325361 0.2815074699892115 0.34832091486019695 0.30345280256839841 0.40793547291964488 0.021147421194461034 0.02020455229648014 0.32644878550765111 0.33457242274818377 0.054486103506532338 0.24565492227511657 0.1283586546115181 0.11582915563446546 0.34285168316272335 0.2981616835681698 0.075850288130392907 0.19180000479212614 0.28165451053042651 0.13401937826785226 0.23485340927371717 @ 2 0 0.0045785180926391352 0.0082131177558838805 0 @ 189 0.050297972470259321 0.041992416988327994 0.19300487507527969 0.015956642821678326 0.39392585082010023 0.09960910884690552 0.25236671784571563 0.21534793500308147 0.21573681970432809 0.53457408946609941 0.54319457967394458 0.60709616404263445 0.3953890283049889 0.35377563616420044 0.52000760068966223 0.70337774861119207 0.61997189444270739 0.49699916500207186 @ 3 0.56426527707058571 @ 2 1.4285639841170306 1.7602645018456928 1.7699487956745692 1.6392341080418318 1.6625552823861587 1.4851698285427732 1.3755830976165653 1.6055754977480274 1.6736968727689139 1.6349266481139488 @ 5 1.3830153374049534 1.1604294826060702 1.6292891053086664 1.5226696537412747 1.6349266481139488 @ 2 1.6623455263759728 1.7992257355551988 1.7511548246040607 @ 2 1.8489245168444501 1.7511548246040607 @ 3 1.6292891053086664 1.6349266481139488 @ 3 1.6357616869577964 1.6932587362148137 1.6912248923434992 1.8489245168444501 @ 2 1.7570872112810023 1.7723383548823699 1.7365531288328875 1.7429654253861571 2.0361516007905629 @ 2 2.01691823317497 1.9855326410541771 1.9662992734385847 1.9583357104745407 1.8089148260923551 1.5984760669018909 @ 2 1.5759861079278161 1.556820302331712 1.4880877050688548 1.3498790448035789 1.3774928275111349 @ 4 1.331282633073918 1.2548070957237127 1.3160527005504377 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.88030267596053013 0.80586101049787184 0.77511005855849857 0.70899236922189801 0.81526555013254975 @ 2 0.81710440006174656 0.76436607695219927 @ 4 0.73939975426990545 @ 4 0.78974167367095316 0.73939975426990545 @ 2 0.75668090009050293 @ 2 0.76436607695219927 @ 4 0.70899236922189801 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.40237602713114723 @ 4 0.34585835578790869 0.50755292059914281 0.36379790501803899 0.33000599473212172 0.32871270414211284 0.31313143220875855 @ 2 0.29893486397682661 0.32609259349591291 0.33849314678483627 @ 2 0.32890237211850171 0.33849314678483627 0.34128338116023327 0.31279859426571122 0.35316388443092633 0.37916849819943305 @ 2 0.37310239793433797 0.35933684696936752 @ 2 0.3470977841658312 @ 2 0.35656365965871611 0.36415924749986278 0.36108845666733541 0.37310239793433797 0.35620838618344125 0.32223147634018312 0.37805819111023575 0.3634083889416358 0.25888413654165993 0.32086893815461071 0.33522724220636935 0.063367850539956444 @ 2 0.035240370836065231 0.032674430190057557 0.33642525609735374 0.19351538065334498 @ 2 0.24241798968327088 0.038556079009839733 0.063367850539956444 0.33121084100736736 0.2688912772856813 0.35852813671343653 0.37493319339700537 0.014748846851983613 0.013240094904070267 0.018849569544972283 0.21553997328181851 0.036269024689389438 0.0073469830865176122 0 @ 189 0.050345467134672785 0 @ 6 0.2957355895136089 0 0.06401645251824914 0.59486265360361401 0.51971778633702914 0.26048867416075921 0.29854345326212006 0.70295474365536104 2.692932110899199 0.31434186707201583 0.45068714840924268 1.5170785522379011 1.4338176543137418 0.61664369671668728 0.80825981292274152 0.52173311014778656 0.61557635425427037 1.6171519350762438 @ 2 1.5922545001717812 1.5463895891042807 1.6543006495055774 1.6209990924912936 @ 3 1.6597693171462586 1.4906384961834542 0.4911410452183721 1.6918577061574058 1.5380252157511629 1.8494004266497956 1.7511548246040607 @ 6 1.6402633534103856 1.7511548246040607 1.8032098482170187 1.8087766979895097 1.8184609918183861 @ 2 1.7595810012004074 1.8548569035213907 1.7595810012004074 1.7511548246040607 @ 5 1.8524182981481438 1.7511548246040607 @ 2 1.8489245168444501 @ 2 1.7511548246040607 @ 2 1.8489245168444501 @ 2 1.6747929055756354 1.797105882590492 1.7273959979965636 1.6965353244263253 1.6408550850449879 @ 2 1.5988325746641432 1.556820302331712 1.4880877050688548 1.3498790448035789 @ 2 1.4055592841849169 @ 2 1.3498790448035789 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 2 0.75926903123765421 0.82306391624886133 0.80845044118925924 @ 2 0.76436607695219927 @ 7 0.78966679944031515 0.76436607695219927 @ 2 0.81607478527194788 0.76436607695219927 @ 2 0.74187099976314363 @ 2 0.76436607695219927 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.40237602713114723 @ 4 0.34585835578790869 0.26393338530117277 0.28133864642481493 0.28606643155845002 0.26244771026269914 0.26674316392376163 @ 3 0.35933684696936752 @ 2 0.35656365965871611 @ 2 0.32999646062492349 0.30165407286946405 0.32045074065345153 0.30019064621235786 0.36079640923207218 0.30487554515883136 0.22514900043842337 0.35620838618344125 0.36415924749986278 @ 2 0.38557163591625981 0.39225884574656072 0.41885844004934986 0.047505635187559722 0.036004612042497157 0.042110351616246586 0.038556079009839733 0.2986535367053581 0.30934743896032019 0.23807256936338464 0.40942559068199752 0.30934743896032019 0.30702201639351356 0.33082483852742817 0.46566348296602078 0.10112474780717355 0.39565225792841047 0.26516142424138162 0.37624099419821022 0.35852813671343653 @ 2 0.32498206843961747 0.35852813671343653 0.26013870574787284 0.35852813671343653 0.053059952744568983 0.039378357820174334 0.038085290028935903 0.039278781062754765 0.040813783117202462 @ 2 0 @ 177 0.01294884828771758 0 0.012001219893403432 0 @ 2 0.0065017411516081298 0.14770063807751191 0 @ 12 0.01609799371908294 0.019744388809144291 0.11677356152206127 0.051959762177760709 0.5220120428794035 0.29189131776415572 0.1801771460386502 0.48239985165907523 0.46661551907969717 1.0691254576032458 0.93784073102278331 0.59523794929699247 0.49699916500207186 @ 2 0.53026691844576157 0.49699916500207186 0.49771328486275834 0.57903966128862916 1.6171519350762438 @ 2 1.7320155579564565 1.6924389916896017 1.8400062302571401 1.7035805820723566 1.1802848399623442 1.7324787398436672 1.7511548246040607 1.7992257355551988 1.7511548246040607 @ 3 1.7992257355551988 1.7511548246040607 1.7324787398436672 1.7511548246040607 @ 3 1.8524182981481438 1.6340208198830068 1.7890880623221732 1.56116773028778 1.5266103166442047 1.4204315160820515 1.555521126965119 1.6056329513428675 1.6349266481139488 @ 4 1.7570872112810023 1.7511548246040607 @ 9 1.8489245168444501 @ 2 1.797105882590492 1.7039332936699036 1.6639709046046485 1.6164820129219488 1.7019193178756662 @ 2 1.6598968074948213 1.6407310018987178 1.5719984046358604 1.433789744370584 @ 4 1.3689927049008266 1.3265153171026889 1.3112853845792085 @ 2 1.2221683512353685 1.029012687722638 1.0139474855574613 0.91152815327545589 0.80443688009788594 0.75554446642097794 0.72479351448160456 0.80693452626031392 0.75659260685926577 0.80877337618951062 0.80693452626031392 0.77714941669792881 0.81526555013254975 @ 2 0.76436607695219927 0.81526555013254975 @ 3 0.76436607695219927 @ 5 0.7600558254329971 0.73939975426990545 @ 3 0.72226846643539133 0.77261038583643893 0.70907970790403496 @ 2 0.68899857183933499 0.61652878388037291 0.43302306595832263 0.35190676882472577 0.40135444827206773 @ 2 0.36811217338860025 0.30174464259941547 @ 2 0.30653113568595874 0.33007053289460603 0.30728741305448953 0.32112661818701221 0.30066601996509051 0.30966511612888825 0.32622395662318815 0.36605440185333121 0.31540097812387008 0.36431430590001596 0.33138689490152817 0.33435175880586027 0.22826030936535288 @ 2 0.31506594677470379 0.30799421553587808 @ 2 0.36108845666733541 @ 2 0.37310239793433797 0.3470977841658312 0.37310239793433797 @ 2 0.35933684696936752 @ 2 0.35656365965871611 0.32228990723001277 0.33623709019921755 0.2815074699892115 0.30785520624733959 0.29109824465554601 0.30785520624733959 0.29109824465554601 0.086908027926332065 0.28248506926623118 0.49133700544232689 0.086908027926332065 0.36713074117908301 0.26516142424138162 0.2830982619752791 0.30804614050742651 0.29505037464124029 @ 2 0.30804614050742651 @ 3 0.34652781247598174 0.04499013640237947 0.043793070886522428 0.15030874542829079 0.041093499082619132 0.014309504872046233 0.023832602530047719 0 @ 172 0.010318098894341425 @ 3 0 @ 2 0.011673674570396423 0 @ 10 0.014997217020269777 0.041992416988327994 0.059152266897879391 0.030925617247635248 0.031190840990025837 0.014128581500751454 0 0.024549957584570712 0.30319125658126556 0.57129685736122038 0.87355328866597637 0.57404496232669255 0.78079602754420807 0.59602965339971781 1.1555043889591696 0.91314306799393241 1.5240038085231877 0.90690871269748896 1.4028423139481694 0.90541392649062735 0.86689147771588027 0.68069053463067442 0.83519279113279765 1.0670322415393505 1.3579461913995434 1.3505139516111551 1.4434066883376329 1.6007338944874911 1.5979274229138549 1.6349266481139488 1.8032098482170187 @ 2 1.7935255543881421 1.8032098482170187 1.7935255543881421 1.610046164856844 1.4822025491839572 1.56116773028778 1.5226696537412747 1.6292891053086664 @ 2 1.5270509676494435 1.6402633534103856 1.8494004266497956 1.6153615496860114 1.7295470821979726 0.62676982153160044 1.7295470821979726 @ 4 1.6349266481139488 1.7365531288328875 @ 2 1.6349266481139488 @ 7 1.7511548246040607 @ 6 1.7039332936699036 @ 2 1.6639709046046485 1.6965353244263253 1.6408550850449879 1.6965353244263253 1.6545128140454803 1.556820302331712 1.4945841053960454 1.3563754451307697 1.4364724343170836 @ 4 1.3036688503663618 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.80525497236480392 0.77402949504987828 0.80586101049787184 0.77511005855849857 0.81710440006174656 0.76436607695219927 @ 8 0.70899236922189801 0.76436607695219927 @ 2 0.76748841572289717 0.77551541051558592 @ 2 0.73939975426990545 @ 3 0.92810211651066976 0.97080348191388532 0.90587378296161047 @ 2 0.89702724495460584 0.79056917699239249 0.71492012926009418 0.67793459742212969 0.46685311588704603 0.40237602713114723 @ 2 0.42770243806719371 0.48286977816894849 0.44035455605971802 0.3458006858345099 0.34760996548587658 0.33353771206050853 0.34585835578790869 @ 3 0.33353771206050853 0.35656365965871611 0.3522850972947027 0.43181755999888954 0.3506571702486484 0.33070403615758243 0.32003674991284858 0.34583476971815302 0.34341017714752159 0.29598959229283489 0.035006863306280354 0.22498841562468916 0.31110552446280765 @ 2 0.30799421553587808 0.32016667688221717 0.35933684696936752 0.37310239793433797 0.33894037533251742 0.33612608090420981 0.30019064621235786 0.27528650585740755 0.27874082631856584 0.26885636937930912 0.269037668162807 0.3304695855357952 0.29109824465554601 0.31912016741325361 0.29604105716724877 0.2855407608522138 0.20838498597648544 0.30379890739779036 0.32275194438764132 0.27708035603190356 @ 2 0.26339290047016101 0.24352288555618054 0.23807256936338464 0.39273716223845562 0.035195863279103741 0.018694137555842264 0 0.042871915360289864 0 @ 2 0.18606224996238716 0 @ 182 0.052394811437896677 0 @ 4 0.03748387370442368 0.039820944566184568 0 0.0042811210693071838 0.099694481649886688 0 0.028147707659032822 0 @ 4 0.076161724496395009 0.048922942410668267 0.096527256263036321 0.66710534892701223 0.63748013644088619 0.27834991279369165 0.7371231546479331 @ 2 1.1326537873795612 0.58905798443755497 0.63023018962779698 0.72948777379732854 0.83547683055355837 1.1495871039810595 0.56680361141140301 0.49699916500207186 0.61557635425427037 1.6285735696152668 1.6042199593032562 1.6165965692056834 1.3505139516111551 1.4351520554570516 1.4882429287696834 2.692932110899199 @ 2 1.4767109405607992 1.1465019269834149 1.2065542487602461 1.2871045308781688 1.5131234120267882 1.6093636327029475 1.4032702241600468 1.6349266481139488 @ 3 1.56116773028778 1.6402633534103856 1.6340208198830068 1.7511548246040607 @ 8 1.6262229276702385 1.7414705307751843 1.7511548246040607 @ 6 1.753648614523466 1.7429654253861571 1.6995742265911347 1.7429654253861571 @ 3 1.7878571413681092 @ 2 1.6639709046046485 1.6164820129219488 1.645622401016217 @ 2 1.6035998906353723 1.6407310018987178 1.5719984046358604 1.31624722268441 1.4284057509212431 1.3727255115399057 @ 3 1.3265153171026889 1.3112853845792085 1.3669656239605459 1.2275523446847094 0.98298101984079245 0.9712907430181098 0.91152815327545589 0.8217180259184832 0.79817583363617561 0.76742488169680223 0.80886166942074766 0.80702281949155086 @ 2 0.75668090009050293 0.81710440006174656 0.76436607695219927 @ 3 0.78966679944031515 0.76436607695219927 @ 2 0.75125528757816307 0.73939975426990545 @ 4 0.68346849276030164 0.73939975426990545 @ 2 0.75926903123765421 0.76436607695219927 @ 2 0.75117731842084279 @ 3 0.66652740874189997 0.41395215735651081 0.46082176783983692 0.3722484449548325 0.40237602713114723 @ 2 0.35962390675287925 @ 2 0.34585835578790869 @ 2 0.31313143220875855 0.33847317135774618 0.31006919209083189 0.31288348651913944 0.33745470029404384 0.23760552555599673 0.31540097812387008 @ 2 0.32851078558644992 0.25460948519658905 0.32399331120561203 0.31195463784777416 0.32999646062492349 0.32016667688221717 0.30300042483494671 0.43317697256826571 0.27549054968183129 0.36912519268585864 0.34139411723200458 0.23760552555599673 0.30487554515883136 0.35620838618344125 0.31540097812387008 0.29148530430452002 0.32639738617167335 0.29671596347558704 0.031444980561574201 0.1866045993310074 0.017872119180257339 0.29671596347558704 0.028483281279246455 0.42286784979882913 0.19723931671695097 0.36550243006637223 0.32588592420020612 0.25093637535258756 0.26983823050612149 0.37208804958736558 0.37639953874500842 0.31511787174625222 0.30768819854231161 0.37208804958736558 0.26386855879217247 0.36220941645906857 0.23526473247204741 0.22514179018599073 0.24490350396747032 0.183943356893569 0.25242438215054552 0.034116742129020536 0.013162856241404661 0 @ 187 0.0086709643035076181 0 @ 6 0.06318975881848822 0.18190448343147617 0.054383412040883213 0.062820545544790163 @ 3 0.15779240068290362 0.26152467041948591 0.36888520540915587 0.48428812439405577 0.56479079965516599 0.79219744572921369 0.49699916500207186 0.56680361141140301 1.3725704994835422 1.6444417525343322 1.2175253747998576 0.96409101933609176 1.1609181787271721 1.9196112537410854 2.0747105306141846 1.9628484555631751 1.6294579804732678 1.7511548246040607 @ 3 1.6349266481139488 2.0361516007905629 2.692932110899199 @ 4 1.4866243371439878 1.8692352467184465 1.8715555093923006 1.6153615496860114 1.6209990924912936 1.6305609955292311 1.6209990924912936 1.8087766979895097 1.7092181248776392 1.7324787398436672 1.7511548246040607 @ 11 1.753648614523466 1.7511548246040607 1.7570872112810023 @ 5 1.8548569035213907 1.7073867291417835 1.7039332936699036 1.7273959979965636 1.7019193178756662 @ 2 1.645622401016217 1.6598968074948213 1.6407310018987178 1.5719984046358604 1.433789744370584 @ 3 1.3774928275111349 1.433789744370584 1.331282633073918 1.3723496174098868 @ 2 1.2275523446847094 0.98298101984079245 0.94632442033581599 0.8356623574128117 0.80443688009788594 0.7683024308425539 0.91294006657101134 0.88464592591726088 @ 2 0.92642448298629165 0.88464592591726088 @ 2 0.70066134534966173 0.73939975426990545 @ 3 0.76436607695219927 @ 5 0.78966679944031515 0.76436607695219927 @ 6 0.78737094382384354 0.73983157479517403 0.76232665198422955 0.75722960626968461 0.74465943151148073 0.46789938835090999 0.4365756662721631 0.40237602713114723 @ 2 0.3722484449548325 0.34585835578790869 @ 5 0.33353771206050853 0.34585835578790869 0.33353771206050853 0.47147621339982265 0.548022610891165 0.093126672122670603 0.29779563346522581 0.33400901535467259 0.37310239793433797 0.57133374923659053 0.50487809216127189 0.55079478874077992 0.48593411214799953 0.29779563346522581 0.36804801600964882 0.28163541632622691 0.36499730301269329 0.36415924749986278 0.35620838618344125 0.36108845666733541 0.35933684696936752 0.3470977841658312 0.43983059800716889 0.30707957531850061 0.30988935394108946 0.29390802327813487 0.31956860803621584 0.053059952744568983 0.25932309400552245 0.42440417530816793 0.32547669734939616 0.28119220381702209 0.35164236615371125 0.31471776373431243 0.29679914538259733 0.2981616835681698 0.086908027926332065 0.082068932326731445 0.093126672122670603 0.47632576478917582 0.093126672122670603 @ 2 0.26386855879217247 0.26317350765378844 0.2196222700281561 0.020644111720397592 0.042867919262423823 0.15403859847259044 0.0049501281907615279 0 @ 177 0.011446150043300976 0 @ 12 0.023820919823141194 0.030925617247635248 0.041992416988327994 @ 2 0.09960910884690552 @ 2 0.47488967472048721 0.30465164405688627 0.062820545544790163 @ 2 0.049165478074963839 0.15779240068290362 0.29854345326212006 0.36888520540915587 0.21559957076825817 0.54339669770832089 0.59917349513811324 0.56680361141140301 @ 3 0.49699916500207186 1.3689442892344181 1.2802350552411386 1.8302611600021914 1.7133394731960629 1.6665459769354714 1.6914264601925764 1.6970993829346501 1.8032098482170187 1.6207967819164797 1.5881520505302686 1.6028648377520787 1.6145542483891011 1.5253484172601286 1.7063348312175952 1.7131458976891221 1.6209990924912936 1.7511548246040607 @ 3 1.6262229276702385 1.7035805820723566 1.7511548246040607 1.753648614523466 1.7511548246040607 @ 2 1.753648614523466 1.7511548246040607 @ 2 1.6890524347788021 1.6340208198830068 1.753648614523466 @ 2 1.7511548246040607 @ 6 1.8489245168444501 @ 2 1.7511548246040607 @ 5 1.7039332936699036 1.797105882590492 1.7273959979965636 1.7039531617469814 1.645622401016217 @ 2 1.6598968074948213 1.584434085039268 1.5719984046358604 1.31624722268441 @ 2 1.433789744370584 1.3689927049008266 1.3498790448035789 1.3036688503663618 1.2884389178428817 1.3441191572242195 1.1993218844990423 1.0083566165595468 0.94632442033581599 0.8356623574128117 0.80443688009788594 0.78089468781557825 0.75014373587620486 0.73939975426990545 @ 6 0.68346849276030164 0.81526555013254975 @ 4 0.8183878889032471 0.81769103828714851 @ 5 0.75149556114472071 0.75659260685926577 0.7600558254329971 0.74292453759848287 @ 2 0.7297357790671265 @ 2 0.8039156415303903 0.67793459742212969 0.46855190980481382 0.40407482104891507 0.43176807338522183 0.3955020733218953 0.41317135679543587 0.30513405728987214 0.278784881458636 0.2815946600812248 0.3009179277159133 0.27729920642016237 0.29744918893835304 0.34760996548587658 0.33353771206050853 0.35933684696936752 @ 2 0.37310239793433797 @ 2 0.3863620518231819 0.35790718010120909 0.36097797093373646 @ 2 0.34879657808359904 0.36103564088713541 0.31259119950128123 0.3388682492288923 0.18258093510283196 0.18351998633363154 0.23760552555599673 0.30799421553587808 0.36912519268585864 0.28836611517175026 0.057149206343617913 0.30890888200313388 0.26091633631947425 0.39154393492212641 0.035601769894557982 0.018303544930707204 0.25247283166012996 0.26528729874281837 0.23582681398465269 0.18839187742386873 0.053777004262466996 0.035006863306280354 0.25042018726275117 0.18725958553648753 0.35624470236579642 0.023496901719251308 0.035240370836065231 0.2855407608522138 0.2592332008442777 0.0084487707037739484 0.023215123118909678 0.0049217075217423733 0.013854451899049183 0 @ 2 0.039278781062754765 0.15403859847259044 0 @ 189 0.046280736388402216 0.1230728028451453 0.10184678798766035 0.026891768181026426 0.051085419943053684 0 0.015956642821678326 0.036861763242091429 0.061318622914187527 0.047679196252811522 0.44178881360182987 0.4501055703291208 0.062820545544790163 0.15779240068290362 0.29854345326212006 @ 2 0.48428812439405577 1.4342101272554315 1.3911427791412727 1.2550115402471764 1.3649004669895619 0.56680361141140301 0.74394127229833695 0.61598667529969597 0.80081457122255972 1.6534540528723713 1.7223312641275801 1.6914264601925764 1.8302611600021914 1.7320763343825287 1.6528943345574916 1.9284240212328374 1.6280138513003868 1.6918577061574058 @ 2 1.418625786169935 1.1791825021907938 1.2751781063226379 1.6918577061574058 1.418625786169935 1.7511548246040607 1.7092181248776392 1.7511548246040607 @ 6 1.8489245168444501 1.7511548246040607 @ 7 1.8489245168444501 @ 2 1.7511548246040607 @ 2 1.8489245168444501 1.7511548246040607 @ 7 1.8005996638941859 1.7039332936699036 1.6390904213475435 1.645622401016217 1.5984760669018909 1.6561901501545433 1.5759861079278161 1.556820302331712 1.4880877050688548 1.4055592841849169 1.4075931280562315 1.3498790448035789 @ 3 1.2418065680615256 1.3441191572242195 1.3461530010955343 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.88214152588972705 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 2 0.81526555013254975 0.76436607695219927 0.81710440006174656 0.76436607695219927 @ 9 0.70899236922189801 0.76436607695219927 @ 5 0.81526555013254975 @ 2 0.75117731842084279 0.79526168265790287 0.75117731842084279 0.67481225865143191 0.46685311588704603 0.35875793108728926 0.35755467354636511 0.35598474377663791 @ 2 0.35469487612163259 0.29744918893835304 0.32106791023410397 0.34585835578790869 0.35962390675287925 0.34585835578790869 @ 2 0.3458006858345099 0.36415924749986278 0.38747038584528837 0.35620838618344125 0.37310239793433797 0.35933684696936752 @ 3 0.36540294723446248 0.31540097812387008 0.33093551185572301 0.33464040586573629 0.33745470029404384 0.30799421553587808 0.30300042483494671 0.30304975409625323 0.35620838618344125 0.36108845666733541 0.37310239793433797 0.35933684696936752 @ 2 0.32228990723001277 0.24050598522222849 0.2247594605880949 0.33527374001187299 0.25395000598320239 0.23058297513525189 0.24028613329101076 0.024583242751898705 0.036433861869884093 0.030597394241004643 0.035008478139449545 0.090067008011234392 0.46566348296602078 0.30815305232454648 0.2325743268082229 0.30804614050742651 0.29679914538259733 0.30804614050742651 0.31115744943435608 0.30768819854231161 0.044160987053662247 0.24392254113392578 0.15030874542829079 0.25876564271613361 0.027119836343386577 0.0023132767262071855 0.0013509169049602267 0 @ 158 0.011910433749932194 0 @ 29 0.157935729065483 0.050074904077535808 0 @ 4 0.26648713713646527 0.10408436954618804 0 0.49682994019708215 0.38848394198355884 0.79724221016857522 0.45872625055357397 0.26023638408845273 0.40793344758368549 0.67978369665884342 0.43463449991623976 1.05962762989392 0.73020047515941255 0.66035046367433237 0.59330743430723609 0.57531718578949242 @ 2 0.50551273938016128 0.62653069828130792 1.5783269445491264 1.5495105326148613 1.7655615972406091 1.7531728656080765 1.8866464854102396 1.9502045603826783 2.0649505786358664 1.6638705624101706 1.6864093586118762 1.6133329729396038 1.6814543479604904 1.6382134561967088 1.8007845636527822 1.7063348312175952 1.8508404071213376 2.692932110899199 1.7648933667134534 1.9405202665538015 2.1219037366950508 2.692932110899199 2.0361516007905629 1.9922388960993871 2.0048833548522409 2.1764864603974128 1.9280269603193805 1.8990168079273668 @ 3 2.01691823317497 1.7511548246040607 @ 4 1.6349266481139488 @ 6 1.6292891053086664 1.7295981187921947 1.7092181248776392 1.7511548246040607 1.7073867291417835 1.7017491863365009 1.6674243400765278 1.6490758364880969 1.6199354483938282 1.7074065972188608 1.6633502429667015 1.584434085039268 1.515701487776411 1.3774928275111349 1.433789744370584 @ 2 1.3774928275111349 1.433789744370584 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.8606286800951054 0.77402949504987828 0.85676048367822255 0.77511005855849857 0.76436607695219927 @ 2 0.73430270855536051 0.76757999165545532 0.73939975426990545 @ 5 0.76748841572289717 0.86772111160326559 0.81409447439000315 0.80845044118925924 0.74187099976314363 0.76436607695219927 0.70899236922189801 0.81526555013254975 0.76436607695219927 0.73939975426990545 @ 2 0.72226846643539133 @ 2 0.70907970790403496 @ 2 0.68899857183933499 0.67481225865143191 0.46685311588704603 0.40237602713114723 @ 4 0.34585835578790869 @ 2 0.35458960266376199 0.28096301519732036 0.34760996548587658 0.34585835578790869 @ 2 0.33353771206050853 0.35933684696936752 0.31540097812387008 @ 6 0.33745470029404384 0.3961676920919186 0.27852410739929739 0.36108845666733541 0.37310239793433797 0.3470977841658312 0.35933684696936752 0.36108845666733541 @ 2 0.26548269910571315 0.021147421194461034 0.018814988078238233 0.14894670577628527 0.14379846092363494 0 0.040250009011680694 0.017565842796922457 0.031640685514776015 0.013869597363431995 0.029030610039265284 0.030080912981413886 0.041181625510109794 0.063367850539956444 0.2688513940578246 0.24854560404968934 0.28349311738965505 0.20405375444604376 0.25800810659141321 0.22844538713019522 0.30670105778358081 0.035240370836065231 0.037362587976020885 0.026867959363281665 0.2410911574669139 0.013455779060745186 0.013240094904070267 0.015788212176967985 0.019337427880527364 0 @ 187 0.049431858439337457 0 @ 6 0.10216000970463497 0.050322128583424067 0.43594594356017058 0.40005058997156751 0.78638405120206978 0.34339271091715962 0.53672281078776529 0.23624231258352574 0.51590556081204197 0.5193241688313418 0.053991440116091062 1.1921753150125265 0.16173604557425908 0.2564933785809646 1.2952191551696686 1.080173443279647 1.3830746091494379 0.76453757977838122 1.3792338304102578 1.3990571531091343 1.2013617991359298 1.501981821644033 1.4878709867481124 @ 2 1.5396380960862197 1.547240174665125 @ 2 1.6209990924912936 1.5331293397692041 1.5131234120267882 1.6153615496860114 1.5131234120267882 1.56116773028778 1.555521126965119 1.5270509676494435 1.8184609918183861 1.6483051006358258 1.4340745686732317 0.70978731157848018 1.5087420981186193 1.6209990924912936 1.6153615496860114 1.5131234120267882 1.6153615496860114 1.8184609918183861 @ 2 1.7429654253861571 1.7723383548823699 1.7570872112810023 @ 2 1.8243722169660304 1.7723383548823699 @ 2 1.7511548246040607 1.7432022999129761 @ 2 1.7511548246040607 1.7092181248776392 1.7992257355551988 1.7092181248776392 1.7511548246040607 @ 3 1.7039332936699036 1.6790528104127991 1.6390904213475435 1.645622401016217 1.7019193178756662 1.645622401016217 1.6035998906353723 1.584434085039268 1.490821004519306 1.3774928275111349 @ 4 1.31624722268441 1.3347360685457978 1.3283843233637473 1.3461530010955343 1.1436416451177047 1.0083566165595468 0.99666633973686358 0.8356623574128117 0.79184462312486159 0.78089468781557825 0.69421247436660094 0.77898826662712606 0.68346849276030164 0.73939975426990545 @ 5 0.73430270855536051 0.73939975426990545 @ 2 0.75668090009050293 0.76748841572289717 @ 2 0.76436607695219927 @ 3 0.75668090009050293 0.77445289963039288 0.78144203060730644 0.77579799740656241 0.72226846643539133 0.77261038583643893 0.70907970790403496 0.70398266218948991 0.73169993724255045 0.63283980028408382 0.43947339353487225 0.41121254746487107 0.41302182711623781 @ 2 0.35875793108728926 0.33942009847040766 0.34850828809703283 0.35151881183123451 0.34442868891975031 0.39785367036387009 0.30487862304234492 0.32106791023410397 0.30651034135776256 0.31540097812387008 0.32016667688221717 0.30304975409625323 0.3470977841658312 0.35933684696936752 @ 3 0.39225884574656072 0.36108845666733541 0.384663257905414 0.38747038584528837 0.36108845666733541 0.37310239793433797 0.35933684696936752 0.37310239793433797 0.3470977841658312 0.35620838618344125 @ 2 0.37310239793433797 0.3470977841658312 0.32228990723001277 0.3288253447980678 0.29109824465554601 0.29562923223361898 0.27838288435345082 0.30521916609344585 @ 2 0.2867949477571981 0.037362587976020885 0.38375466470520586 0.32704709845270563 0.28304878303957193 0.25404768427951707 0.24123321719682869 0.20405375444604376 0.2688912772856813 0.26013870574787284 0.33965007275699149 @ 2 0.37208804958736558 0.40993053675118402 0.022814473428398541 0 @ 193 0.0041392434819918821 0 @ 4 0.028977552868417522 0.034452885484867808 0.12685619206938148 0.18062049554072837 0.37874522761710194 0.1801771460386502 0.29189131776415572 0.74044842564146718 0.84864748678104274 0.94898462972139286 1.1095872161909399 0.83835539135426407 1.2129708840904565 1.7138806342632955 1.0756607933867648 1.1933063305618188 1.1141623809611356 1.3266996241568485 1.1948574211403091 1.4194513992771063 1.4698452039559504 2.692932110899199 0.90969995404659609 1.1280676728438106 1.6305609955292311 1.6349266481139488 @ 2 1.4573220659268527 1.5439154554403571 1.46217648713007 1.9837270708715111 1.9094469251188764 @ 2 1.7366643611536441 1.6012507147900903 1.6292891053086664 1.5027441811355555 1.6292891053086664 1.5972579477508462 1.5362872470306752 1.6292891053086664 1.6349266481139488 @ 3 1.8184609918183861 1.7570872112810023 1.8494004266497956 1.7511548246040607 @ 3 1.7414705307751843 1.7511548246040607 @ 9 1.7570872112810023 1.6349266481139488 1.6214604198238578 @ 2 1.6168245704903221 1.5984760669018909 @ 3 1.6598968074948213 1.584434085039268 1.515701487776411 1.3774928275111349 @ 3 1.31624722268441 1.433789744370584 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.94122737462127093 0.8356623574128117 0.80443688009788594 0.78089468781557825 0.82843501989344781 0.81769103828714851 @ 2 0.73939975426990545 @ 4 0.76436607695219927 @ 2 0.70899236922189801 0.76436607695219927 @ 6 0.7600558254329971 0.81039774483404514 0.70412456392339318 0.7600558254329971 0.81039774483404514 0.79326645699953091 0.78989153165703663 0.75117731842084279 0.7297357790671265 0.70965464300242653 0.63328958323301543 0.44426156716970716 0.3549841821844863 0.42844217300736354 0.43332224349125764 0.46570183832373113 0.34585835578790869 @ 6 0.30174464259941547 @ 2 0.31540097812387008 @ 3 0.33894037533251742 0.30953586240300174 0.33472424575855858 @ 2 0.3061610630231828 0.33472424575855858 0.30304975409625323 0.35933684696936752 @ 3 0.35656365965871611 0.35933684696936752 0.3470977841658312 0.35620838618344125 0.35933684696936752 @ 3 0.32228990723001277 0.31948012860742397 0.50908494169626073 0.17590281694850959 0.37522977104767419 0 0.059554042186489839 0.16365686247056216 0.044166408947984501 0.09600078567458728 0.22185198001302189 0.24123321719682869 0.2505784333874726 0.15002685505880006 0.032674430190057557 0.17281774795951163 0.19608405944514509 0.31948783655376134 0.32275194438764132 0.15367657892328707 0.1477060567431055 0.26148014850048107 0.041670853746566781 0.044402921316871527 @ 2 0.0057766401019670559 0.0030481470137004975 0.019122426231711599 0 @ 190 0.021704264930759588 0.050315832486668752 0 @ 2 0.047679196252811522 0.14981540495326273 0.35761637928154832 0.062820545544790163 @ 2 0.22851789424378383 0.50053358949340121 0.45324623330044583 0.48428812439405577 0.56479079965516599 0.92084546488887709 1.4167698695708244 1.4263871172600342 1.2821920342891395 1.2419980674804605 1.2393031744410061 0.50151414380884229 1.5043609267377769 1.8798775412797626 @ 2 1.9782181213768339 1.6970993829346501 1.7511548246040607 @ 2 1.4906384961834542 0.93265883438417152 1.5164271202138957 1.6044086220515617 0.85112297153399474 1.2047618295624734 1.5164271202138957 1.7511548246040607 1.7414705307751843 1.7511548246040607 1.8494004266497956 1.7092181248776392 1.7511548246040607 @ 2 1.5763979313360506 1.7432022999129761 1.7992257355551988 1.7511548246040607 @ 2 1.753648614523466 @ 2 1.6402633534103856 1.7992257355551988 1.7511548246040607 @ 10 1.8489245168444501 1.8548569035213907 @ 2 1.772553582712072 1.8030382692674325 1.6168245704903221 1.5845485112792357 1.6049724672290817 1.7435346361726405 1.7071726893245112 1.6880068837284072 1.6747530827852739 1.4810656262002737 1.6545128461665206 1.2779221102435609 1.3809462629830147 @ 2 1.3347360685457978 1.3723496174098868 @ 2 1.2275523446847094 1.03571934295034 1.0221902161984602 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 0.70899236922189801 0.76436607695219927 0.81526555013254975 @ 3 0.75668090009050293 @ 2 0.80702281949155086 @ 2 0.75668090009050293 @ 3 0.76436607695219927 0.70899236922189801 0.76436607695219927 @ 5 0.78966679944031515 @ 2 0.76232665198422955 0.79099325430331402 0.78915440437411732 0.68596159221481867 0.472919216152141 0.43778308853951886 0.47782962745048696 0.27907097471475195 @ 2 0.1465261951058088 @ 3 0.30651034135776256 0.33353771206050853 0.34585835578790869 @ 2 0.27785170627039085 0.36415924749986278 0.36499730301269329 0.36108845666733541 0.35933684696936752 0.37310239793433797 0.35927917701596868 0.37310239793433797 @ 2 0.36108845666733541 0.35821908003695707 @ 2 0.30799421553587808 0.27549054968183129 0.31110552446280765 0.3531673633430189 0.30300042483494671 0.36720045431333598 0.30799421553587808 0.35509079101281493 0.35821908003695707 0.31912016741325361 0.37800120170240831 0.28688747294517236 0.10112474780717355 @ 2 0.29059870127311299 0.38112124642640954 0.38162068018926876 0.34397584300270101 0.34090505217017364 0.36168870048747476 0.28310799716652246 0.33965007275699149 0.32681334573233739 0.1972452336976446 0.030336528893426994 0.17169393304080463 0.29509771014942027 0.40942559068199752 0.032458746033382641 0.01768506846915328 0 @ 195 0.016818341932994599 0 0.099082449433313693 0.21291355551544772 @ 2 0.39392585082010023 0.09960910884690552 0.14462244144220157 0.21534793500308147 0.096527256263036321 0.47702666681726924 0.31551454767752418 0.44050936868823687 0.85530251763313525 0.45142325445584575 0.58744755596178355 1.2363984945777327 1.2982937400757095 1.3203246688567938 1.2082670335846282 0.56680361141140301 0.61598667529969597 0.96243508655182064 0.94181962531834096 1.6563081944165443 1.7531728656080765 1.6905327654464828 1.8257136626999797 1.7805960481066045 1.8494004266497956 1.7511548246040607 @ 5 1.8489245168444501 1.7511548246040607 1.6292891053086664 @ 2 1.6055754977480274 1.3970276906326684 1.6349266481139488 @ 3 1.56116773028778 1.4204315160820515 1.5270509676494435 @ 2 1.610046164856844 1.6292891053086664 1.6349266481139488 @ 2 1.6357616869577964 1.6912248923434992 @ 3 1.8489245168444501 @ 3 1.7511548246040607 @ 2 1.7429654253861571 @ 4 1.8396757756220676 1.6349266481139488 1.6214604198238578 1.7205197206284113 1.6674243400765278 1.6561901501545433 1.5984760669018909 1.6561901501545433 1.6337001911804685 1.4949580200268755 1.5437679444501922 1.3498790448035789 1.2880167624987424 1.3774928275111349 @ 3 1.387579549933367 1.3160527005504377 1.546463248566686 1.4407831321554192 1.2360345573805573 1.2495816452518016 1.0780942805870481 1.0468688032721225 1.0233266109898147 0.76742488169680223 0.81710440006174656 0.76436607695219927 0.70899236922189801 0.76436607695219927 @ 4 0.81710440006174656 0.76436607695219927 @ 2 0.81526555013254975 0.70899236922189801 0.81526555013254975 0.76436607695219927 @ 4 0.75668090009050293 0.73939975426990545 @ 2 0.72226846643539133 @ 2 0.70907970790403496 0.85432587955139028 0.76206784338126754 0.68570278361185655 0.50654057030180277 0.43227543543076941 0.46511219488295408 0.38754690839945438 0.24090343355681865 0.33422084077126191 @ 4 0.30653113568595874 0.30174464259941547 @ 3 0.31259119950128123 0.31540097812387008 @ 4 0.32851078558644992 0.32045074065345153 0.32856248935607879 0.31438721444428991 0.36355358575396363 0.35019009942051982 0.34306158240750168 0.041710977511403333 0.035006863306280354 0.40986583422284023 0.33894037533251742 @ 2 0.31550627921382662 0.33745470029404384 0.40498576373894607 0.30846808544912102 0.037723987034513635 0.36748074412227211 0.28022125880922411 0.24707161461031626 0.035006863306280354 0.19454379666330254 0.34433101080249723 0.43552688346068291 0.31313591498202503 0.26902625839028382 0.020778901279948931 0.030447194480957153 @ 2 0.32258735839304797 0.027898950925673217 0.05130806458423532 0.19608405944514509 0.37639953874500842 0.35430185552253951 0.24637798100995553 0.25876564271613361 @ 2 0.23964049552610769 0.038960628626000471 0.031611931533943302 0.028984025447672736 0.038665490859437365 0 @ 175 0.049301512000036143 0 @ 11 0.38209394831032278 0.40155247281321521 0.010600738965101598 0.0069628989754220152 0.043242427486410287 0.17904011301562153 0.031585569266110829 0.010562966185614702 0.18653723516872847 0.35784912490105941 0.13354603910567048 @ 2 0.27834991279369165 0.48806274732536603 0.72871916609201026 0.55409257080338692 0.56479079965516599 0.59523794929699247 0.56680361141140301 @ 2 0.46046247203643065 0.49699916500207186 0.46046247203643065 0.74028514984296279 1.6805545030698112 1.7320155579564565 1.7223312641275801 1.6914264601925764 1.6970993829346501 1.7511548246040607 @ 2 1.7092181248776392 1.7511548246040607 @ 6 1.7414705307751843 1.6645956432551265 1.7414705307751843 1.6720164138880067 1.7188383631379511 2.0477281170415984 2.0525772461082075 2.0361516007905629 @ 3 1.6349266481139488 @ 3 1.6292891053086664 @ 3 1.6349266481139488 @ 3 1.753648614523466 1.7511548246040607 1.8548569035213907 1.7570872112810023 1.7595810012004074 1.7570872112810023 @ 4 1.8524182981481438 1.7039332936699036 1.797105882590492 1.7273959979965636 1.645622401016217 @ 2 1.7019193178756662 1.6035998906353723 1.584434085039268 1.515701487776411 1.3727255115399057 1.4284057509212431 @ 2 1.3727255115399057 @ 2 1.3265153171026889 1.3669656239605459 1.3160527005504377 1.1747088632971401 0.98610335861149023 0.97441308178880748 0.86375101886580319 0.88342501473122736 0.83123660721662573 0.75014373587620486 0.78721609557090988 @ 2 0.79231314128545516 @ 4 0.8443117808245153 0.72680749729688121 0.81246902581183811 0.93487610829085432 @ 5 0.56893287487721667 0.95825041658924859 0.69513989746440585 0.82049337867100491 0.83501450668867072 0.78721609557090988 0.81788321885415627 0.77518185345094082 0.76199309491958434 0.59010691447469399 0.68899857183933499 0.61652878388037291 0.43024987864767128 0.39960283982049588 0.40237602713114723 0.47311607355956531 0.46389255867236429 0.35962390675287925 0.34585835578790869 @ 4 0.38321540955103056 0.27797249648162614 0.3333366142257661 0.35933684696936752 @ 4 0.34583476971815302 @ 4 0.31540097812387008 0.31259119950128123 0.31540097812387008 @ 3 0.27382524855992474 0.14404716469243778 0.16914281347382498 0.23158146179008637 0.41824113053185769 0.41638586281877887 0.35514928374216598 0.26528729874281837 0.27820158556995295 0.23450406861660628 0.24690462190552964 0.29562923223361898 0.30785520624733959 0.32241277512368099 0.32735558763538369 @ 2 0.52490913901054048 0.28295209624338846 0.26702845188353269 0.32050266562499991 0.31949381559228934 0.24415955996029046 0.33962781281502585 0.31511787174625222 0.25743767721719818 0.31208569381734153 0.28000452582358948 0.26876723603386138 0.26443796178091922 0.30812454724211541 0.30089498031787121 0.013455779060745186 0.045839554679292335 0 0.015991612603985801 0 @ 186 0.0039304172795770354 0.050522104656853369 0.0031309542121328864 0.035248177695141034 0.028634234130747234 0 0.030209320638757038 0.029034983699104781 0.18190448343147617 0.034483977734514122 0.42163259596799596 0.1704736707696379 0.58456499949803775 0.61692084804642922 0.64850839499820179 @ 2 0.9592987157132925 1.0301860953428952 1.0263889638126251 1.0300364444713339 0.70202578724590181 0.95394773186891657 0.57531718578949242 0.62728485762645658 0.76742170127134868 1.5179799750554488 @ 2 1.6304663793230834 1.8867472066489923 1.6098928820453302 1.6209990924912936 1.6153615496860114 1.6209990924912936 1.6349266481139488 1.8032098482170187 1.7511548246040607 @ 17 1.8489245168444501 @ 4 1.8524182981481438 1.7511548246040607 1.8489245168444501 @ 2 1.7570872112810023 @ 2 1.7511548246040607 1.6349266481139488 @ 3 1.6209990924912936 @ 2 1.6075328642012028 @ 2 1.6028970148676669 1.5845485112792357 @ 2 1.5984760669018909 1.5759861079278161 1.556820302331712 1.4880877050688548 1.3774928275111349 1.3498790448035789 @ 2 1.3359514891809239 @ 2 1.289741294743707 1.5280128038445127 1.576286290240789 1.2397969376691462 0.9454224401854745 0.89039315882621217 0.77973109590320766 0.85477879949893343 0.80586101049787184 0.76742488169680223 0.73939975426990545 @ 3 0.75125528757816307 0.73939975426990545 @ 2 0.78974167367095316 0.73939975426990545 0.86803295768819611 @ 2 0.81769103828714851 0.72680749729688121 @ 4 0.73939975426990545 0.76436607695219927 0.74187099976314363 0.80845044118925924 0.76436607695219927 0.81526555013254975 0.76436607695219927 0.75117731842084279 0.8039156415303903 0.73934049124038237 0.61652878388037291 0.43302306595832263 0.35875793108728926 @ 4 0.32821565357195087 0.39036350256640423 0.35068075631840406 0.37399189466382959 0.33353771206050853 0.34585835578790869 @ 3 0.35933684696936752 0.31540097812387008 0.29336845686518287 0.35200321320947964 0.37348701604467482 0.33434918818331266 0.28867674471738797 @ 2 0.27783392313333 0.31540097812387008 @ 2 0.32678776773321311 0.39192041594312776 0.35933684696936752 @ 5 0.31540097812387008 0.3219364156919251 0.2780962844799964 0.27528650585740755 0.2497144005281185 @ 4 0.29562923223361898 0.28950561959919374 0.31801037144473981 0.30345280256839841 0.27710506631027038 0.25743767721719818 0.30804614050742651 @ 2 0.22667564832048728 0.24544934677078753 0.37493319339700537 0.23807256936338464 0.32343405632898953 0.28349311738965505 0.30377685567355428 0.183943356893569 0.20962410573753804 0.26389163080769257 0.043796645368560608 0 0.0085652827522072848 0 @ 187 0.048658000945404616 0 0.0044249307030233519 0 @ 2 0.02730199984979035 0 @ 2 0.035352206944026465 0.046110938181646445 0.038386024918918321 0.16551681902264573 0.31551454767752418 0.61938864762193369 0.77336919309680641 0.6933674823334639 0.86890153119670155 1.0652642412187689 0.18585740018318941 @ 2 1.0277887570089228 1.4333859382179772 1.9819751938896726 1.3923165691909318 1.2617218158833154 1.5326125194666049 1.6237850577311939 1.5268836253684077 1.7240630332653719 1.6970993829346501 1.7511548246040607 @ 5 1.7890880623221732 @ 2 1.6349266481139488 @ 2 1.6093636327029475 1.6292891053086664 1.6349266481139488 1.6292891053086664 1.6349266481139488 1.4545482787203881 1.6349266481139488 1.8032098482170187 1.8489245168444501 @ 2 1.7511548246040607 @ 3 1.7432022999129761 1.7992257355551988 1.7511548246040607 1.753648614523466 1.8524182981481438 @ 2 1.7511548246040607 @ 6 1.7414705307751843 1.7511548246040607 1.7429654253861571 1.6349266481139488 1.5477015019976887 1.6158228770185752 1.6168245704903221 1.5735955836447861 1.5984760669018909 1.6490758364880969 1.6035998906353723 1.584434085039268 1.515701487776411 1.31624722268441 @ 2 1.433789744370584 1.3774928275111349 @ 2 1.331282633073918 1.2548070957237127 @ 2 1.1712554278252605 0.98298101984079245 1.024029066127657 0.8606286800951054 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 2 0.73939975426990545 @ 4 0.73430270855536051 0.73939975426990545 @ 2 0.76436607695219927 0.70899236922189801 0.76436607695219927 0.81526555013254975 0.76436607695219927 @ 6 0.74187099976314363 0.76436607695219927 @ 2 0.75117731842084279 @ 3 0.67481225865143191 0.46685311588704603 0.40237602713114723 0.35875793108728926 0.35598474377663791 0.38199077837091505 0.43516170869578996 0.31453818864072969 0.30140961125024918 0.29893486397682661 0.29744918893835304 0.28506197499370084 0.22447659930951677 0.34760996548587658 0.384663257905414 0.3219364156919251 0.32672302778470175 @ 2 0.30931776666105942 0.31837891908046895 0.31361322032212191 @ 2 0.31540097812387008 @ 2 0.24210226770696375 0.012777866262012603 0.33108872527043864 0.28540836048460472 0.24704299197491802 0.25836249106675607 0.29334776110291361 0.30803289550736418 0.35933684696936752 0.31259119950128123 0.27528650585740755 0.3083782890874025 0.032674430190057557 @ 2 0.39396236337301466 @ 2 0.30934743896032019 0.2216748997220454 0.34344570612631642 0.44797195370875026 0.28047162002775039 0.35430185552253951 0.12789380880152262 0.14205128902091405 0.1935279497113086 0 0.042506587610581167 0.030467908378200077 0.25090917308077137 0.052359170144875247 0 0.10760025122885891 0.054459797511630804 0.039218414475110305 0 @ 2 0.020370494496586386 0 @ 176 0.049810280485554609 0 0.013490599946798468 0 @ 8 0.014608733929408689 0.014997217020269777 0.14280009417113995 0.20727476790555557 0.10174827579491025 0.25624379568762629 0.42624193326372606 0.32415031853405968 0.41450454750648325 0.10415021296515702 0.078263749736634955 0.46617948140463428 0.58723961305092354 0.29697219829090565 0.39016801278037816 0.26160270072986924 1.4381864940810825 1.1580730164171646 1.5969573515218232 0.78809566121411478 0.60015859656979953 0.77062943960277286 0.33148685927641991 1.2741354969751892 1.1336849623669205 0.63912295525433216 1.5922545001717812 1.5179799750554488 1.6181475149259115 1.6924389916896017 1.6970993829346501 1.7511548246040607 1.8494004266497956 1.7511548246040607 @ 3 1.4822025491839572 1.6055754977480274 1.6292891053086664 1.498571926125629 1.5608303332319076 1.8893325140984902 1.8990168079273668 2.0361516007905629 2.0264673069616861 2.0361516007905629 1.6349266481139488 1.7511548246040607 @ 2 1.6340208198830068 1.7092181248776392 1.7511548246040607 @ 2 1.7570872112810023 @ 2 1.8051581222321404 1.8553328133267375 1.7570872112810023 @ 3 1.7511548246040607 1.8489245168444501 @ 4 1.6912248923434992 @ 2 1.6349266481139488 @ 2 1.6214604198238578 @ 2 1.6745386537429747 1.7019193178756662 1.645622401016217 @ 2 1.6035998906353723 1.584434085039268 1.515701487776411 1.3774928275111349 @ 3 1.435823588241899 1.3498790448035789 1.289741294743707 1.2745113622202264 @ 2 1.1305408298210307 0.9454224401854745 0.94632442033581599 0.87177801365849217 0.77402949504987828 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 3 0.7600558254329971 @ 6 0.76757999165545532 0.77551541051558592 0.76748841572289717 @ 5 0.76436607695219927 @ 2 0.76748841572289717 @ 4 0.75429965719154068 0.80519913037189073 @ 2 0.67793459742212969 0.472919216152141 0.40844212739624225 0.36521766628647806 @ 2 0.40844212739624225 0.35192445605300376 0.34585835578790869 @ 2 0.30174464259941547 @ 5 0.31540097812387008 @ 2 0.40986583422284023 0.4253290615318232 0.31110552446280765 0.30019064621235786 0.34341017714752159 0.22293611272124902 0.1934174014231208 0 0.17577142555661016 0.18946404030514233 0.05566975853391818 0.086087482131039755 0.26681251646073822 0.33563422059490461 0.38747038584528837 0.41241100740977193 0.026867959363281665 0.03915098559811736 0.035391553918290831 0.040767994539009783 0.047578369464928758 0.23625856742807164 0.27458250479475749 0.038663127262562276 0.032458746033382641 0.19014139298436133 0.20838498597648544 0.033823786394373362 0.035946003534329002 0.030336528893426994 0.035946003534329002 0.30331944880071743 0.27921756542753534 0.26393101699279115 0.30530126100272537 0.40096925487393126 0.39741297619760452 0.49079149969584407 0.03404651525628373 0.10340076184260281 0.20525986224985446 0.026207408660708715 0.36005164941500806 0 @ 165 0.079725564459816115 0 @ 22 0.034979578779117261 0.1430359107940169 0.072310417233136859 0.074452593552778126 0.041992416988327994 0.059152266897879391 0.0038129551865828354 0 0.0014109175817013772 0.0012551998028715395 0.17129765832327443 0.094057802050115311 0.34385779923775844 0.59832718672487795 0.60709616404263445 0.40224019056755245 0.3953890283049889 0.58059639369922 0.69455252983345517 0.75051359420365571 0.59330743430723609 0.53035415016046838 0.58216834805205586 0.7595719809870296 0.58216834805205586 0.83903101905376098 1.5438729898095787 1.5957466672126179 1.4430225682826263 1.5664529704415366 1.8520126921530344 1.9155707671254729 @ 2 1.6209990924912936 1.6349266481139488 @ 2 1.6444885511518863 1.6112791335829519 1.3351488491391603 1.6349266481139488 @ 2 1.7414705307751843 1.9122912609939924 1.9094469251188764 2.692932110899199 @ 5 1.6349266481139488 1.6292891053086664 1.8032098482170187 1.7511548246040607 @ 4 1.7474029174521259 @ 2 1.7570872112810023 @ 2 1.6306844823520146 1.7570872112810023 1.8548569035213907 1.7511548246040607 @ 2 1.8489245168444501 @ 2 1.7511548246040607 @ 2 1.7039332936699036 @ 2 1.6639709046046485 1.6408550850449879 1.5984760669018909 @ 2 1.5141238256229796 1.556820302331712 1.5458017883215074 1.4075931280562315 1.3498790448035789 1.3774928275111349 @ 3 1.331282633073918 1.3160527005504377 @ 2 1.1712554278252605 0.98298101984079245 0.9712907430181098 0.91336700320465281 0.82940320278017965 0.80586101049787184 0.77511005855849857 0.76436607695219927 @ 3 0.70899236922189801 @ 2 0.81526555013254975 @ 2 0.76436607695219927 @ 5 0.72680749729688121 @ 3 0.81769103828714851 0.89273530142091484 0.83941020695522461 @ 2 0.81769103828714851 0.80055975045263428 0.79546270473808944 0.99002504813917369 0.75112198424143584 0.77960037967965656 0.67481225865143191 0.46855190980481382 0.43220835992483592 0.41784037201388552 0.40237602713114723 @ 2 0.34585835578790869 @ 7 0.34308516847725734 0.35933684696936752 @ 4 0.38747038584528837 @ 2 0.34432459685517991 0.3961676920919186 0.27852410739929739 0.39225884574656072 0.29779563346522581 0.38005862469655538 0.37637734495092323 0.36804801600964882 0.36108845666733541 0.37310239793433797 @ 2 0.36415924749986278 0.36108845666733541 0.35933684696936752 0.28463172204805148 0.28600606232745629 0.38131477711095946 0.041082473794810476 0.042890211678965437 0.045222644795188234 0.32822903546954108 0.36727971159683753 0 @ 3 0.015139837234299106 0 0.35239845492460975 0.11970194496731085 0.17281774795951163 0.19608405944514509 0.33962781281502585 0.29614823432968901 0.26758239302806486 0.29822348657914921 0.18201689567896231 0.29822348657914921 0.183943356893569 0.031030477279410964 0 @ 64 1.6653977699471878 1.1780431949743797 1.8193104617795122 1.6877490677152187 1.8886385002899353 1.6457405807015233 1.8209461336609996 @ 2 1.7067470777165856 1.3431147276806852 1.794152034014779 1.0085461794858943 1.7958174440761647 1.4780184595451418 1.6597332770035507 @ 2 1.8346716424208298 1.5749418617821633 1.2387585935329002 1.3921349998170076 1.6963208000226244 1.7479364805488824 1.6963208000226244 1.7479364805488824 1.7244173327556049 1.7009018108402121 1.6921960863945986 1.6597332770035507 1.6743615055226764 1.8027537931331741 1.6060052487006646 @ 3 1.7372139151292896 1.6739845728637845 1.7548127366860435 @ 2 1.7401848027331621 1.7669876903623307 1.7439728567647523 @ 2 1.7401848027331621 1.721562583510154 @ 2 1.7411358667855181 1.6867608644200711 1.6535575867730334 1.6458544236425368 1.67696411614161 @ 2 1.631787409732264 1.5293805558950369 1.4015822202232713 @ 3 1.3704725277241976 1.3933991265701577 1.3611309647298839 1.2897076556609328 @ 2 1.1195429084691124 0.99047295221626497 0.89831110052920882 0.8207966527558036 0.80975864451171931 0.81290617083904482 0.77441082399127847 0.73157247366849409 @ 2 0.7636233565388546 @ 2 0.75661328399375816 0.7636233565388546 0.77241788198809969 0.7636233565388546 0.73157247366849409 0.72277794821924901 @ 2 0.7636233565388546 0.75452010646501888 0.77241788198809969 @ 2 0.80490539313911069 0.76405998481950521 0.74801538791732414 0.79757156978987398 0.80490539313911069 0.77222422045523575 @ 2 0.70485021605725551 0.56618266473678813 0.73519734648460222 @ 2 0.44812676470583096 0.37906082238056898 @ 2 0.35848056451553362 0.38362412930662992 0.34625665264533489 @ 3 0.33288978872085495 0.35330751713061936 0.34169334571927384 0.33501224323363116 0.35729768457067679 0.33501224323363116 0.3238255284538567 0.34705689555285679 0.33234732836499842 0.34169334571927384 0.33234732836499842 0.34169334571927384 0.34590588631259861 0.33234732836499842 0.33501224323363116 @ 2 0.27934674819486427 0.22855133020052856 0.25969125578277263 0.33234732836499842 0.38695203202979495 0.33501224323363116 0.34590588631259861 0.34260756996727798 0.34980340317115799 0.38953927146643574 0.37062797734354452 0.035757405518935671 0.3633277949101939 0.34752155957338243 0.43396217539291498 0.037462397776155523 0.027502130025098874 0.066077218162774995 @ 2 0.015829990340546173 0.025059556372756444 0.1972546805133982 0.248571790584421 @ 2 0.21743186500217696 0.33486695782571013 0.30720579676044257 @ 2 0.27375957886690411 0.25566340002591931 0.28567427057780331 0.31642246581416089 0.26688153228932254 0.097227365402883278 0.024337484224060051 0 @ 63 '
 
 
-    data += '"$s" alt {Volume} 1 {m3} {%f} 2\n'
+        data += '"$s" alt {Volume} 1 {m3} {%f} 2\n'
 
-footer = """"$o" hideSlots 0 hideOff hideEmptyOff
+    footer = """"$o" hideSlots 0 hideOff hideEmptyOff
 # Section: Snapshot Object Relationships
 # Section: Links"""
 
-f = open(f"../Outputs/{BasinName}/RiverWareInputs/FullDiversionsImport.bak", "w")
+    return header + data + footer
+
+
+def reach_water_supply(BasinName):
+    ReachWaterSupply = pd.read_csv(f"{Paths.Data}/ReachSWSI.csv")
+    ReachWaterSupply = ReachWaterSupply[ReachWaterSupply['Reach'].str.contains(f"_{BasinName}")]
+
+    ReachWaterSupply['Water Supply'] = ReachWaterSupply['Water Supply'].apply(lambda x: x.split('+'))
+
+    ReachWaterSupply = ReachWaterSupply.explode('Water Supply')
+
+    return ReachWaterSupply
+
+
+def riverWareFormat(BasinName, incremental=False):
+    """
+    Write the RiverWare inputs for BasinName: the full supply diversion series
+    and DMI, the diversion weights and the adjustment table objects. With
+    incremental only what changed since the last export is written again (see
+    ExportManifest.py).
+    """
+    DiversionTotal = read_daily(f"{Paths.Outputs}/{BasinName}/ReachDiversions.csv")
+    Reaches = pd.read_csv(f"{Paths.Data}/RiverWareReaches.csv")
+    HistoricalDiversions = read_daily(f"{Paths.Outputs}/{BasinName}/ObservedDiversions.csv")
+    SlopeThreshold = pd.read_csv(f"{Paths.Outputs}/{BasinName}/SlopeThreshold.csv", index_col=0)
+
+    Manifest = ExportManifest(f"{Paths.Outputs}/{BasinName}/RiverWareInputs/ExportManifest.json") if incremental else None
+
+    with section("Full diversion files"):
+        Written = write_full_diversions(BasinName, DiversionTotal, Manifest)
+
+    with section("Diversion weights"):
+        Perc = diversion_weights(BasinName, DiversionTotal, Reaches, HistoricalDiversions, SlopeThreshold)
+        # This feeds into RiverWare
+        Perc.to_csv(f"{Paths.Outputs}/{BasinName}/RiverWareInputs/DiversionWeight.csv")
+
+    ReachGap = pd.read_csv(f"{Paths.Outputs}/{BasinName}/RiverWareInputs/ReachGap.csv", index_col=0)
+
+    Objects = write_objects(BasinName, DiversionTotal, Perc, ReachGap, Manifest)
+
+    if incremental:
+        Manifest.save()
+        print(f"{BasinName}: {len(Written)} of {DiversionTotal.shape[1]} full diversion series changed, "
+              f"objects written: {', '.join(Objects) or 'none'}")
+
+
+def write_object(path, text, Manifest=None):
+    """
+    Write a RiverWare object. With a Manifest only when its header or one of
+    its slots changed since the last export. Returns True if written.
+    """
+    if Manifest is not None:
+        Changed = Manifest.changed(os.path.basename(path), hash_sections(text))
+        if not Changed and os.path.exists(path):
+            return False
+
+    with open(path, "w") as f:
+        f.write(text)
+
+    return True
+
+
+def write_objects(BasinName, DiversionTotal, Perc, ReachGap, Manifest=None):
+    """
+    Write the DivAdjPopulate.bak and FullDiversionsImport.bak RiverWare
+    objects. With a Manifest their UUIDs are kept from the last export and
+    each is written only if it changed. Returns the objects written.
+    """
+    RiverWareInputs = f"{Paths.Outputs}/{BasinName}/RiverWareInputs"
+
+    def uuids(file):
+        return None if Manifest is None else Manifest.uuids(file)
+
+    Written = []
+
+    with section("Adjustment table object"):
+        div_adj = div_adj_object(BasinName, ReachGap, Perc, reach_water_supply(BasinName),
+                                 uuids("DivAdjPopulate.bak"))
+        if write_object(f"{RiverWareInputs}/DivAdjPopulate.bak", div_adj, Manifest):
+            Written.append("DivAdjPopulate.bak")
+
+    DiversionTotal = DiversionTotal.dropna()
+
+    with section("Full diversion object"):
+        full_diversions = full_diversions_object(BasinName, DiversionTotal, uuids("FullDiversionsImport.bak"))
+        if write_object(f"{RiverWareInputs}/FullDiversionsImport.bak", full_diversions, Manifest):
+            Written.append("FullDiversionsImport.bak")
+
+    return Written
+
+
+def export_objects(BasinName, incremental=False):
+    """
+    Rewrite the RiverWare objects from the diversions, weights and gaps that
+    riverWareFormat and WaterSupplyAdjustment already wrote, without reading
+    the site files again.
+    """
+    RiverWareInputs = f"{Paths.Outputs}/{BasinName}/RiverWareInputs"
+
+    DiversionTotal = read_daily(f"{Paths.Outputs}/{BasinName}/ReachDiversions.csv")
+    Perc = pd.read_csv(f"{RiverWareInputs}/DiversionWeight.csv", index_col=0)
+    ReachGap = pd.read_csv(f"{RiverWareInputs}/ReachGap.csv", index_col=0)
+
+    Manifest = ExportManifest(f"{RiverWareInputs}/ExportManifest.json") if incremental else None
+
+    write_objects(BasinName, DiversionTotal, Perc, ReachGap, Manifest)
+
+    if incremental:
+        Manifest.save()
 
-f.write(header)
-f.write(data)
-f.write(footer)
+if __name__ == "__main__":
+    # Update this to the name of the basin
+    BasinName = "PAY"
 
-f.close()
+    riverWareFormat(BasinName)
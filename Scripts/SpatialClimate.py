@@ -0,0 +1,116 @@
+"""
+Climate of each reach interpolated from the stations around it
+
+ClimateDemand.py normally models each reach on the single station whose
+climate fits its diversions best, searching every station of the basin for
+it. With --spatial-climate each reach is modeled on its own series instead,
+interpolated from the stations nearest to it, so it doesn't depend on one
+gauge's gaps and quirks and no search is needed.
+
+For every reach the Neighbours nearest stations with a value on the day are
+weighted by the inverse of their distance to the Power. When the reach and
+the stations have elevations, the temperatures of each station are moved to
+the reach's elevation with the Lapse rate first. The neighbours of all the
+reaches come from one KD-tree query and the series of a block of reaches
+are computed at once as a days x reaches x neighbours array.
+
+The locations are read from:
+
+Outputs/{BasinName}/Climate/StationLocations.csv
+    written by ClimateClean.py in spatial mode from the station files (or
+    the GHCNd archive), NAME, Latitude, Longitude and Elevation (m) of every
+    station
+Data/ReachLocations.csv
+    to be provided, one row per reach with the location of its diversions
+    (e.g. the demand weighted centre of its IDWR sites):
+
+    RiverWare Reach,Latitude,Longitude,Elevation
+    Reach8Diversions_PAY,44.05,-116.13,760
+
+    Elevation (m) is optional, without it the series are inverse distance
+    weighted only. Reaches that aren't listed keep the station search.
+"""
+# %%
+import numpy as np
+import pandas as pd
+
+import Paths
+from DailyMatrix import Dtype
+
+
+# F per m of elevation (6.5 C per km), precipitation is not adjusted
+Lapse = {"TMAX": -0.0117, "TMIN": -0.0117, "PRCP": 0.0}
+
+Neighbours = 8
+Power = 2
+
+# Reaches interpolated at once
+ReachBlock = 64
+
+
+def read_locations(path, index_col):
+    """Latitude, Longitude and Elevation (NaN if not given) indexed by index_col."""
+    Locations = pd.read_csv(path, index_col=index_col, encoding="utf-8-sig")
+    if "Elevation" not in Locations.columns:
+        Locations["Elevation"] = np.nan
+
+    return Locations[["Latitude", "Longitude", "Elevation"]].astype(float)
+
+
+def project(Locations, latitude):
+    """x, y (km) of the locations on a plane tangent at latitude, close enough over a basin."""
+    return np.column_stack([Locations["Longitude"].values * 111.32 * np.cos(np.radians(latitude)),
+                            Locations["Latitude"].values * 110.57])
+
+
+def interpolate(Climate, Stations, Points, lapse=0.0, k=Neighbours, power=Power):
+    """
+    The date x station Climate at the Points, from the inverse distance
+    weighted k nearest of the located Stations with a value on each day.
+    """
+    from scipy.spatial import cKDTree
+
+    Stations = Stations.loc[Stations.index.intersection(Climate.columns)]
+    if Stations.empty:
+        raise ValueError("None of the climate stations have a location")
+
+    latitude = Points["Latitude"].mean()
+    k = min(k, len(Stations))
+    Distance, Nearest = cKDTree(project(Stations, latitude)).query(project(Points, latitude), k=k)
+    Distance, Nearest = Distance.reshape(len(Points), k), Nearest.reshape(len(Points), k)
+
+    # A station on the point (within 10 m) takes all the weight
+    Weight = (1 / np.maximum(Distance, 0.01) ** power).astype(Dtype)
+
+    # Shift of each neighbour's values to the elevation of the point, none
+    # where either elevation is missing
+    Shift = lapse * (Points["Elevation"].values[:, None] - Stations["Elevation"].values[Nearest])
+    Shift = np.nan_to_num(Shift).astype(Dtype)
+
+    X = Climate[Stations.index].to_numpy(dtype=Dtype)
+    Y = np.empty((len(Climate), len(Points)), dtype=Dtype)
+
+    for start in range(0, len(Points), ReachBlock):
+        b = slice(start, start + ReachBlock)
+
+        # days x points x neighbours, the weights of the days without a value are 0
+        V = X[:, Nearest[b]] + Shift[b]
+        W = np.where(np.isnan(V), 0, Weight[b])
+
+        with np.errstate(invalid="ignore"):
+            Y[:, b] = np.nansum(V * W, axis=2) / W.sum(axis=2)
+
+    return pd.DataFrame(Y, index=Climate.index, columns=Points.index)
+
+
+def reach_climate(BasinName, ClimateTMAX, ClimateTMIN, ClimatePRCP, Reaches, k=Neighbours, power=Power):
+    """
+    TMAX, TMIN and PRCP of the Reaches listed in Data/ReachLocations.csv,
+    with a column per reach, interpolated from the cleaned station climate.
+    """
+    Stations = read_locations(f"{Paths.Outputs}/{BasinName}/Climate/StationLocations.csv", "NAME")
+    Points = read_locations(f"{Paths.Data}/ReachLocations.csv", "RiverWare Reach")
+    Points = Points.loc[Points.index.intersection(Reaches)]
+
+    return [interpolate(Climate, Stations, Points, Lapse[var], k, power)
+            for var, Climate in zip(["TMAX", "TMIN", "PRCP"], [ClimateTMAX, ClimateTMIN, ClimatePRCP])]
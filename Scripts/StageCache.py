@@ -0,0 +1,149 @@
+"""
+Content-hashed cache of pipeline stage results.
+
+Every stage declares the files (or folders) it reads, the files it writes and
+the parameters it uses. After a stage runs, the SHA-256 hash of each input,
+each output and of the parameters is recorded in
+Outputs/{BasinName}/StageCache.json. On the next run a stage is only re-run
+if one of those hashes changed, one of its outputs is missing, or a stage
+upstream of it is re-run. A stage that reads from a remote service (its
+Remote list, e.g. the download stages) always runs.
+
+Folders are hashed from the names and contents of every file inside them, so
+adding a station file to Data/Climate/{BasinName} makes ClimateClean stale.
+"""
+# %%
+import hashlib
+import json
+import os
+
+
+# Hashes of the files already read by this process, by path, size and
+# modification time, so a large input (e.g. the GHCNd archive) checked for
+# several basins is only read once
+_Hashes = {}
+
+
+def hash_file(path, block_size=2**20):
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+    if key not in _Hashes:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                h.update(block)
+        _Hashes[key] = h.hexdigest()
+
+    return _Hashes[key]
+
+
+def hash_path(path):
+    """Hash a file or every file in a folder. Returns None if path doesn't exist."""
+    if os.path.isfile(path):
+        return hash_file(path)
+
+    if not os.path.isdir(path):
+        return None
+
+    h = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for file in sorted(files):
+            full = os.path.join(root, file)
+            h.update(os.path.relpath(full, path).replace("\\", "/").encode())
+            h.update(hash_file(full).encode())
+    return h.hexdigest()
+
+
+def hash_params(params):
+    return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class StageCache:
+    """Record of the input, output and parameter hashes of each stage for one basin."""
+
+    def __init__(self, path):
+        self.path = path
+
+        if os.path.exists(path):
+            with open(path) as f:
+                self.records = json.load(f)
+        else:
+            self.records = {}
+
+    def save(self):
+        folder = os.path.dirname(self.path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+
+        # Write to a temporary file first so a crash can't leave half a cache
+        with open(self.path + ".tmp", "w") as f:
+            json.dump(self.records, f, indent=2, sort_keys=True)
+        os.replace(self.path + ".tmp", self.path)
+
+    def stale_reason(self, Stage):
+        """
+        Return why the stage has to run, or None if its recorded result is
+        still current. Stage is a dictionary with Name, Inputs, Outputs,
+        Params and optionally Remote (inputs that can't be hashed).
+        """
+        Record = self.records.get(Stage["Name"])
+
+        if Record is None:
+            return "never run"
+
+        # Data fetched from a service can change without anything local changing
+        if Stage.get("Remote"):
+            return f"remote {Stage['Remote'][0]}"
+
+        if Record["Params"] != hash_params(Stage["Params"]):
+            return "parameters changed"
+
+        for path in Stage["Outputs"]:
+            current = hash_path(path)
+            if Record["Outputs"].get(path) != current:
+                return f"missing {path}" if current is None else f"changed {path}"
+
+        for path in Stage["Inputs"]:
+            if Record["Inputs"].get(path) != hash_path(path):
+                return f"changed {path}"
+
+        return None
+
+    def record(self, Stage):
+        """Store the hashes of a stage that has just run successfully."""
+        self.records[Stage["Name"]] = {
+            "Params": hash_params(Stage["Params"]),
+            "Inputs": {path: hash_path(path) for path in Stage["Inputs"]},
+            "Outputs": {path: hash_path(path) for path in Stage["Outputs"]},
+        }
+        self.save()
+
+    def forget(self, Stage):
+        self.records.pop(Stage["Name"], None)
+        self.save()
+
+
+def plan(Graph, Cache, force=False):
+    """
+    Work out which stages in Graph have to run, in order. A stage runs if it
+    is stale or if any of its inputs is an output of a stage that runs before
+    it. Returns a list of (Stage, reason) with reason None for cached stages.
+    """
+    Changed = set()
+    Plan = []
+
+    for Stage in Graph:
+        if force:
+            reason = "forced"
+        else:
+            upstream = [path for path in Stage["Inputs"] if path in Changed]
+            reason = f"upstream {upstream[0]}" if upstream else Cache.stale_reason(Stage)
+
+        if reason is not None:
+            Changed.update(Stage["Outputs"])
+
+        Plan.append((Stage, reason))
+
+    return Plan
@@ -0,0 +1,152 @@
+"""
+Synthetic data for benchmarking the pipeline offline.
+
+Writes a Data/ and Outputs/ tree under a root folder laid out like the real
+one, so the pipeline functions can be run from root/Scripts without network
+access or the real data:
+
+Data/Climate/{BasinName}/{Station}.csv   GHCNd access style station files
+                                         (tenths of degrees C and mm)
+Data/Diversions/{Reach}/{Site}.csv       IDWR accounting history style files
+Data/Hydromet/{Station}_{pcode}.csv      Hydromet daily unregulated flow (qu)
+                                         and storage (af) series
+Data/RiverWareReaches.csv                reach and IDWR site list
+Data/ReachSWSI.csv                       water supply group of each reach
+
+The climate follows a seasonal cycle with station to station noise and gaps,
+and the diversions follow the temperature during the irrigation season, so
+the demand models and piecewise fits behave like they do on the real data.
+"""
+# %%
+import os
+
+import numpy as np
+import pandas as pd
+
+
+def seasonal(doy, low, high, peak=200):
+    return low + (high - low) * (0.5 + 0.5 * np.cos(2 * np.pi * (doy - peak) / 365.25))
+
+
+def generate(root, BasinName="SYN", n_stations=10, n_sites=50, n_reaches=None,
+             start=1980, end=2018, missing=0.05, seed=0):
+    """
+    Write a synthetic data tree under root and return the basin configuration
+    (same keys as BasinConfig.basin_config) for it.
+    """
+    root = os.path.abspath(root)
+    rng = np.random.default_rng(seed)
+    n_reaches = n_reaches or max(2, n_sites // 10)
+
+    Data = os.path.join(root, "Data")
+    for folder in [f"Climate/{BasinName}", "Diversions", "Hydromet"]:
+        os.makedirs(os.path.join(Data, folder), exist_ok=True)
+    for folder in ["Climate", "Figures", "RiverWareInputs"]:
+        os.makedirs(os.path.join(root, "Outputs", BasinName, folder), exist_ok=True)
+    os.makedirs(os.path.join(root, "Scripts"), exist_ok=True)
+
+    dates = pd.date_range(f"{start}-01-01", f"{end}-12-31", freq="D")
+    doy = dates.dayofyear.values
+
+    # Basin wide weather, every station sees it with its own bias and noise
+    tmax = seasonal(doy, 30, 90) + rng.normal(0, 6, len(dates))
+    tmin = tmax - 25 + rng.normal(0, 4, len(dates))
+    prcp = rng.gamma(0.3, 0.15, len(dates)) * (rng.random(len(dates)) < 0.3)
+
+    # Station records start a few years before the pipeline period
+    station_dates = pd.date_range(f"{start - 5}-01-01", f"{end}-12-31", freq="D")
+    offset = len(station_dates) - len(dates)
+
+    for i in range(n_stations):
+        station = f"USC00{i:06d}"
+        bias = rng.normal(0, 3)
+
+        values = {}
+        for var, series, noise in [("TMAX", tmax, 2), ("TMIN", tmin, 2), ("PRCP", prcp, 0)]:
+            full = np.concatenate([series[-offset:], series])
+            if var == "PRCP":
+                full = full * rng.uniform(0.5, 1.5)
+                raw = np.round(full * 254)
+            else:
+                full = full + bias + rng.normal(0, noise, len(full))
+                raw = np.round((full - 32) * 5 / 9 * 10)
+            raw[rng.random(len(raw)) < missing] = np.nan
+            values[var] = raw
+
+        df = pd.DataFrame({
+            "STATION": station,
+            "DATE": station_dates.strftime("%Y-%m-%d"),
+            "LATITUDE": 43 + rng.random(),
+            "LONGITUDE": -116 + rng.random(),
+            "ELEVATION": rng.uniform(700, 2000),
+            "NAME": f"SYNTHETIC {i}, ID US",
+            "PRCP": values["PRCP"],
+            "PRCP_ATTRIBUTES": ",,7",
+            "TMAX": values["TMAX"],
+            "TMAX_ATTRIBUTES": ",,7",
+            "TMIN": values["TMIN"],
+            "TMIN_ATTRIBUTES": ",,7",
+        })
+        df.to_csv(os.path.join(Data, "Climate", BasinName, f"{station}.csv"))
+
+    # Reaches and the IDWR sites in each of them
+    Reaches = [f"Reach{i}Diversions_{BasinName}" for i in range(1, n_reaches + 1)]
+    Sites = pd.DataFrame({
+        "RiverWare Reach": [Reaches[i % n_reaches] for i in range(n_sites)],
+        "IDWR Site Code": 13000000 + np.arange(n_sites),
+        "Diversion name": [f"Canal{i}" for i in range(n_sites)],
+    })
+    Sites["MODSIM Diversion Demand Group"] = Sites["Diversion name"]
+    Sites["Fractional Return"] = ""
+    Sites["Average Annual Demand (acre-feet)"] = rng.integers(1000, 100000, n_sites)
+    Sites.to_csv(os.path.join(Data, "RiverWareReaches.csv"), index=False)
+
+    # Water supply for each year, dry years cut the late season diversions
+    supply = rng.uniform(0.3, 1.2, end - start + 1)
+    demand = np.clip(tmax - 50, 0, None) * ((doy >= 91) & (doy <= 290))
+    short = np.where(doy > 180, np.minimum(1, supply[dates.year - start]), 1)
+
+    for _, row in Sites.iterrows():
+        folder = os.path.join(Data, "Diversions", row["RiverWare Reach"])
+        os.makedirs(folder, exist_ok=True)
+
+        flow = demand * short * rng.uniform(0.5, 3) + rng.normal(0, 2, len(dates))
+        flow = np.round(np.clip(flow, 0, None), 2)
+        df = pd.DataFrame({
+            "SiteID": row["IDWR Site Code"],
+            "SiteName": row["Diversion name"],
+            "IrrYear": dates.year,
+            "DayOfYear": doy,
+            "HSTDate": dates.strftime("%Y-%m-%d"),
+            "Flow (CFS)": flow,
+        })
+        df.to_csv(os.path.join(folder, f"{row['IDWR Site Code']}.csv"), index=False)
+
+    # Two water supply components and a group combining them
+    Groups = [f"{BasinName}A", f"{BasinName}B", f"{BasinName}A+{BasinName}B"]
+    pd.DataFrame({"Reach": Reaches,
+                  "Water Supply": [Groups[i % len(Groups)] for i in range(n_reaches)]}
+                 ).to_csv(os.path.join(Data, "ReachSWSI.csv"), index=False)
+
+    Sources = {f"{BasinName}A": {"Inflow": [f"{BasinName}AI"], "Reservoirs": [f"{BasinName}AR"]},
+               f"{BasinName}B": {"Inflow": [f"{BasinName}BI"], "Reservoirs": [f"{BasinName}BR1", f"{BasinName}BR2"]}}
+
+    hydromet = pd.date_range("1980-01-01", "2018-12-31", freq="D")
+    scale = supply[np.clip(hydromet.year - start, 0, len(supply) - 1)]
+    for source in Sources.values():
+        for station in source["Inflow"]:
+            flow = seasonal(hydromet.dayofyear.values, 200, 5000, peak=150) * scale
+            pd.DataFrame({station: np.round(flow, 1)}, index=hydromet.rename("DateTime")).to_csv(
+                os.path.join(Data, "Hydromet", f"{station}_qu.csv"))
+        for station in source["Reservoirs"]:
+            storage = seasonal(hydromet.dayofyear.values, 50000, 300000, peak=160) * scale
+            pd.DataFrame({station: np.round(storage)}, index=hydromet.rename("DateTime")).to_csv(
+                os.path.join(Data, "Hydromet", f"{station}_af.csv"))
+
+    return {"BasinName": BasinName,
+            "BoundingBox": [[-116, -115], [43, 44]],
+            "Years": [year for year in range(2000, end + 1) if supply[year - start] >= 1][:5] or [end],
+            "StartDay": 60,
+            "WaterSupply": Sources,
+            "QualityThresholds": {},
+            "HydrometURL": os.path.join(Data, "Hydromet", "{station}_{pcode}.csv")}
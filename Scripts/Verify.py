@@ -0,0 +1,277 @@
+"""
+Golden output regression check
+
+Compares the outputs of a run with a golden set saved from an earlier run, so
+a refactor can be checked for changes in its results without reading CSVs:
+
+    python Verify.py --basins SNK BOI PAY --save     # keep the current outputs as golden
+    ...change the pipeline and run it again...
+    python Verify.py --basins SNK BOI PAY            # compare, exit 1 on any change
+
+The golden set is a copy of the files in Files for each basin, by default in
+Outputs/Golden/{BasinName}.
+
+CSV tables     the index and columns must match, then every numeric column
+               is compared at once with np.isclose at the file's (atol, rtol)
+               in Files, NaN equal to NaN. The columns that differ are
+               reported with the number of values over the tolerance, the
+               largest difference and the mean of the golden and new values.
+RiverWare      the .bak objects, the DMI and the FullDiversions series are
+files          compared as text after the volatile parts are taken out: the
+               uuid4 UUIDs, the "# Created" lines and the Outputs folder in
+               the DMI. The numbers are then split from the rest of the text,
+               the rest has to be the same and the numbers are compared with
+               the tolerance in one array.
+
+Files that are byte for byte the same are not parsed. Files missing from
+the run are reported as Missing and FullDiversions series that aren't in the
+golden set as Extra. The result of every file (and of every changed column)
+is written to Outputs/Verify.csv.
+"""
+# %%
+import argparse
+import filecmp
+import fnmatch
+import glob
+import os
+import re
+import shutil
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import Paths
+
+
+# Outputs of each basin compared and their (atol, rtol)
+Files = {"Climate/ClimateTMAX.csv": (1e-3, 0),
+         "Climate/ClimateTMIN.csv": (1e-3, 0),
+         "Climate/ClimatePRCP.csv": (1e-5, 0),
+         "ObservedDiversions.csv": (1e-3, 1e-6),
+         "ReachDiversions.csv": (1e-2, 1e-4),
+         "SlopeThreshold.csv": (1e-6, 1e-6),
+         "RiverWareInputs/WaterSupply.csv": (1e-6, 1e-6),
+         "RiverWareInputs/ReachGap.csv": (1e-6, 1e-6),
+         "RiverWareInputs/DiversionWeight.csv": (1e-6, 1e-6),
+         "RiverWareInputs/FullDiversions.DMI": (0, 0),
+         "RiverWareInputs/DivAdjPopulate.bak": (1e-6, 1e-6),
+         "RiverWareInputs/FullDiversionsImport.bak": (1e-6, 1e-6),
+         "RiverWareInputs/FullDiversions/*.txt": (1e-2, 1e-4)}
+
+UUID = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+Created = re.compile(r"^# Created .*$", re.MULTILINE)
+DMIPath = re.compile(r"file=\S*/(\w+/RiverWareInputs/)")
+
+# Numbers standing on their own, not the digits in a name like Reach10Diversions
+Number = re.compile(r"(?<![\w.])[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?(?![\w.])")
+
+
+def basin_files(folder):
+    """The files of Files in a basin folder, relative to it."""
+    Found = []
+    for pattern in Files:
+        Found += sorted(os.path.relpath(path, folder).replace("\\", "/")
+                        for path in glob.glob(os.path.join(folder, pattern)))
+    return Found
+
+
+def tolerance(file):
+    for pattern, tol in Files.items():
+        if fnmatch.fnmatch(file, pattern):
+            return tol
+
+
+def compare_csv(golden, path, atol, rtol):
+    """Rows of the report for a CSV table, one for the file and one for each changed column."""
+    A = pd.read_csv(golden, index_col=0)
+    B = pd.read_csv(path, index_col=0)
+
+    if not A.index.equals(B.index) or list(A.columns) != list(B.columns):
+        Missing = [col for col in A.columns if col not in B.columns]
+        Extra = [col for col in B.columns if col not in A.columns]
+        return [{"Status": "Structure", "Values": A.size,
+                 "Detail": f"{len(A)} -> {len(B)} rows, missing columns {Missing[:5]}, extra columns {Extra[:5]}"}]
+
+    Numeric = A.select_dtypes("number").columns.intersection(B.select_dtypes("number").columns)
+    Text = A.columns.difference(Numeric, sort=False)
+
+    Rows = []
+    if len(Numeric):
+        a = A[Numeric].to_numpy(dtype=float)
+        b = B[Numeric].to_numpy(dtype=float)
+        Over = ~np.isclose(b, a, atol=atol, rtol=rtol, equal_nan=True)
+
+        with np.errstate(invalid="ignore"):
+            Diff = np.where(np.isnan(a) & np.isnan(b), 0, np.abs(b - a))
+        Diff[np.isnan(a) != np.isnan(b)] = np.inf
+
+        for j in np.flatnonzero(Over.any(axis=0)):
+            Rows.append({"Column": Numeric[j], "Status": "Changed", "Values": len(a), "Differ": Over[:, j].sum(),
+                         "MaxDiff": Diff[:, j].max(), "GoldenMean": np.nanmean(a[:, j]), "Mean": np.nanmean(b[:, j])})
+
+    for col in Text:
+        Differ = (A[col].fillna("") != B[col].fillna("")).sum()
+        if Differ:
+            Rows.append({"Column": col, "Status": "Changed", "Values": len(A), "Differ": Differ})
+
+    File = {"Status": "Changed" if Rows else "OK", "Values": A.size, "Differ": sum(Row["Differ"] for Row in Rows),
+            "MaxDiff": max((Row["MaxDiff"] for Row in Rows if "MaxDiff" in Row), default=0)}
+
+    return [File] + Rows
+
+
+def normalize(text):
+    """The text of a RiverWare file without its UUIDs, creation time and Outputs folder."""
+    text = UUID.sub("<uuid>", text)
+    text = Created.sub("# Created", text)
+    return DMIPath.sub(r"file=<Outputs>/\1", text)
+
+
+def compare_text(golden, path, atol, rtol):
+    """Rows of the report for a RiverWare text file, the numbers compared with the tolerance."""
+    with open(golden) as f:
+        A = normalize(f.read())
+    with open(path) as f:
+        B = normalize(f.read())
+
+    if A == B:
+        return [{"Status": "OK", "Values": 0, "Differ": 0, "MaxDiff": 0}]
+
+    # The text around the numbers has to match line for line
+    a, b = Number.findall(A), Number.findall(B)
+    SkeletonA, SkeletonB = Number.sub("#", A).splitlines(), Number.sub("#", B).splitlines()
+
+    if SkeletonA != SkeletonB:
+        line = next((i for i, (x, y) in enumerate(zip(SkeletonA, SkeletonB)) if x != y),
+                    min(len(SkeletonA), len(SkeletonB)))
+        Lines = A.splitlines(), B.splitlines()
+        return [{"Status": "Structure", "Values": len(a),
+                 "Detail": f"line {line + 1}: {Lines[0][line][:80] if line < len(Lines[0]) else '<end>'!r} -> "
+                           f"{Lines[1][line][:80] if line < len(Lines[1]) else '<end>'!r}"}]
+
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    Over = ~np.isclose(b, a, atol=atol, rtol=rtol)
+
+    return [{"Status": "Changed" if Over.any() else "OK", "Values": len(a), "Differ": Over.sum(),
+             "MaxDiff": np.abs(b - a).max(initial=0), "GoldenMean": a.mean() if len(a) else np.nan,
+             "Mean": b.mean() if len(b) else np.nan}]
+
+
+def verify_basin(BasinName, golden_dir, atol=None, rtol=None):
+    """Report rows of every golden file of a basin."""
+    Golden = os.path.join(golden_dir, BasinName)
+    Run = f"{Paths.Outputs}/{BasinName}"
+
+    if not os.path.isdir(Golden):
+        return [{"Basin": BasinName, "File": Golden, "Status": "Missing", "Detail": "no golden set"}]
+
+    GoldenFiles = basin_files(Golden)
+    Rows = []
+
+    for file in GoldenFiles:
+        path = os.path.join(Run, file)
+        tol = tolerance(file)
+        tol = (tol[0] if atol is None else atol, tol[1] if rtol is None else rtol)
+
+        if not os.path.exists(path):
+            Result = [{"Status": "Missing"}]
+        elif filecmp.cmp(os.path.join(Golden, file), path, shallow=False):
+            # Identical files aren't parsed
+            Result = [{"Status": "OK", "Differ": 0, "MaxDiff": 0}]
+        elif file.endswith(".csv"):
+            Result = compare_csv(os.path.join(Golden, file), path, *tol)
+        else:
+            Result = compare_text(os.path.join(Golden, file), path, *tol)
+
+        Rows += [dict(Row, Basin=BasinName, File=file) for Row in Result]
+
+    for file in sorted(set(basin_files(Run)) - set(GoldenFiles)):
+        Rows.append({"Basin": BasinName, "File": file, "Status": "Extra"})
+
+    return Rows
+
+
+def verify(BasinNames, golden_dir=None, atol=None, rtol=None):
+    """
+    Compare the outputs of each basin with its golden set. atol and rtol
+    replace the tolerances of Files. Returns the report, written to
+    Outputs/Verify.csv.
+    """
+    golden_dir = golden_dir or f"{Paths.Outputs}/Golden"
+
+    Rows = []
+    for BasinName in BasinNames:
+        Rows += verify_basin(BasinName, golden_dir, atol, rtol)
+
+    Report = pd.DataFrame(Rows, columns=["Basin", "File", "Column", "Status", "Values", "Differ", "MaxDiff",
+                                         "GoldenMean", "Mean", "Detail"])
+    Report.to_csv(f"{Paths.Outputs}/Verify.csv", index=False)
+
+    return Report
+
+
+def save_golden(BasinNames, golden_dir=None):
+    """Copy the files of Files of each basin to the golden set."""
+    golden_dir = golden_dir or f"{Paths.Outputs}/Golden"
+
+    for BasinName in BasinNames:
+        Run = f"{Paths.Outputs}/{BasinName}"
+        Golden = os.path.join(golden_dir, BasinName)
+        if os.path.exists(Golden):
+            shutil.rmtree(Golden)
+
+        Found = basin_files(Run)
+        for file in Found:
+            os.makedirs(os.path.dirname(os.path.join(Golden, file)), exist_ok=True)
+            shutil.copy2(os.path.join(Run, file), os.path.join(Golden, file))
+
+        print(f"{BasinName}: {len(Found)} files saved to {Golden}")
+
+
+def summary(Report):
+    """Print the files that changed, returns True if nothing did."""
+    FileRows = Report[Report["Column"].isna()]
+    Changed = FileRows[FileRows["Status"] != "OK"]
+
+    for _, Row in Changed.iterrows():
+        Detail = Row["Detail"] if isinstance(Row["Detail"], str) else \
+            f"{Row['Differ']:.0f} of {Row['Values']:.0f} values, max diff {Row['MaxDiff']:.6g}"
+        print(f"  {Row['Status']:9} {Row['Basin']} {Row['File']}: {Detail}")
+
+        Columns = Report[(Report["Basin"] == Row["Basin"]) & (Report["File"] == Row["File"]) & Report["Column"].notna()]
+        for _, Column in Columns.head(5).iterrows():
+            print(f"            {Column['Column']}: {Column['Differ']:.0f} values, max diff {Column['MaxDiff']:.6g}, "
+                  f"mean {Column['GoldenMean']:.6g} -> {Column['Mean']:.6g}")
+        if len(Columns) > 5:
+            print(f"            ... {len(Columns) - 5} more columns")
+
+    print(f"{len(FileRows) - len(Changed)} of {len(FileRows)} files match the golden set")
+
+    return Changed.empty
+
+
+# %%
+
+if __name__ == "__main__":
+    from BasinConfig import Basins
+
+    parser = argparse.ArgumentParser(description="Compare the outputs with a golden set")
+    parser.add_argument("--basins", nargs="+", default=list(Basins.keys()), choices=list(Basins.keys()))
+    parser.add_argument("--golden", default=None, help="Folder of the golden set (default Outputs/Golden)")
+    parser.add_argument("--save", action="store_true", help="Save the current outputs as the golden set")
+    parser.add_argument("--atol", type=float, default=None, help="Absolute tolerance of every file")
+    parser.add_argument("--rtol", type=float, default=None, help="Relative tolerance of every file")
+    args = parser.parse_args()
+
+    if args.save:
+        save_golden(args.basins, args.golden)
+        sys.exit(0)
+
+    start = time.perf_counter()
+    Report = verify(args.basins, args.golden, args.atol, args.rtol)
+    Same = summary(Report)
+    print(f"Verified in {time.perf_counter() - start:.1f} s")
+
+    sys.exit(0 if Same else 1)
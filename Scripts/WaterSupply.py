@@ -0,0 +1,222 @@
+"""
+Water supply engine
+
+The water supply of a group of reaches is the unregulated inflow over the
+irrigation season (StartDay to day 273) plus the reservoir storage on
+StartDay, summed over the sources feeding the group. Each basin's
+WaterSupply in BasinConfig.py lists the sources of its components (e.g. HEII,
+HEN, AMF) and Data/ReachSWSI.csv gives the group of each reach as components
+joined by '+' (e.g. HEII+HEN+AMF).
+
+Every Hydromet source is read once into a sources x days matrix, masked to
+the season and reduced to a sources x years matrix of seasonal volumes. A
+sparse groups x sources membership matrix, built from the group names, then
+gives the water supply of every group in a single product, so the cost
+grows with the number of sources rather than groups times sources and a new
+group or basin is a data change.
+
+water_supply_cube gives the water supply as it stood on any day of the
+season of every year (storage on the day plus the inflow to date and the
+inflow still to come) for in-season updates of the adjustments, see
+water_supply_as_of.
+"""
+# %%
+import numpy as np
+import pandas as pd
+
+
+# USBR Hydromet daily data, pcode is qu for unregulated flow and af for storage
+HydrometURL = "https://www.usbr.gov/pn-bin/daily.pl?station={station}&format=html&year=1980&month=1&day=1&year=2018&month=12&day=31&pcode={pcode}"
+
+# Last day of the irrigation season
+EndDay = 273
+
+
+def read_hydromet(station, pcode, url=HydrometURL):
+    """Read a daily Hydromet series. url can also point to local .csv copies."""
+    url = url.format(station=station, pcode=pcode)
+
+    if url.endswith(".csv"):
+        return pd.read_csv(url, index_col=0, parse_dates=True)
+
+    return pd.read_html(url, index_col=0, parse_dates=True)[0]
+
+
+def water_supply_sources(WaterSupply):
+    """Unique (station, pcode) sources of every component, inflows then reservoirs."""
+    Sources = []
+    for Component in WaterSupply.values():
+        Sources += [(station, "qu") for station in Component["Inflow"]]
+        Sources += [(station, "af") for station in Component["Reservoirs"]]
+
+    return list(dict.fromkeys(Sources))
+
+
+def membership(Groups, Components):
+    """Sparse groups x components matrix, 1 where the '+' separated group contains the component."""
+    from scipy import sparse
+
+    Column = {Component: j for j, Component in enumerate(Components)}
+
+    rows, cols = [], []
+    for i, Group in enumerate(Groups):
+        for Component in Group.split("+"):
+            if Component not in Column:
+                raise KeyError(f"Water supply {Component} of {Group} is not in the basin's WaterSupply")
+            rows.append(i)
+            cols.append(Column[Component])
+
+    return sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(Groups), len(Components)))
+
+
+def group_sources(Groups, WaterSupply, Sources):
+    """Sparse groups x sources matrix, a source shared by two components of a group counts once."""
+    from scipy import sparse
+
+    Column = {Source: j for j, Source in enumerate(Sources)}
+
+    rows, cols = [], []
+    for j, Component in enumerate(WaterSupply.values()):
+        for Source in [(station, "qu") for station in Component["Inflow"]] + \
+                      [(station, "af") for station in Component["Reservoirs"]]:
+            rows.append(j)
+            cols.append(Column[Source])
+
+    ComponentSources = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)),
+                                         shape=(len(WaterSupply), len(Sources)))
+
+    Members = membership(Groups, list(WaterSupply.keys())) @ ComponentSources
+    Members.data[:] = 1
+
+    return Members
+
+
+def read_sources(Sources, dates, url=HydrometURL):
+    """Sources x days matrix of the daily Hydromet values (cfs or AF), missing days are 0."""
+    S = np.zeros((len(Sources), len(dates)))
+
+    for i, (station, pcode) in enumerate(Sources):
+        df = read_hydromet(station, pcode, url)
+        S[i] = df.iloc[:, 0].reindex(dates).fillna(0).values
+
+    return S
+
+
+def inflow_sources(Sources):
+    """Boolean mask of the unregulated inflow (qu) sources, the rest are reservoir storage."""
+    return np.array([pcode == "qu" for station, pcode in Sources])
+
+
+def source_matrix(Sources, StartDay, dates, url=HydrometURL):
+    """
+    Sources x days matrix of the water supply on each day (AF): inflow over the
+    season and reservoir storage on StartDay, 0 on every other day.
+    """
+    S = read_sources(Sources, dates, url)
+
+    doy = dates.dayofyear
+    Season = ((doy >= StartDay) & (doy <= EndDay)).astype(float)
+    First = (doy == StartDay).astype(float)
+
+    # Inflow is in cfs, 1 cfs for a day is 1.9835 AF
+    Inflow = inflow_sources(Sources)[:, None]
+    return np.where(Inflow, S * 1.9835 * Season, S * First)
+
+
+def seasonal_volume(S, dates):
+    """Sources x years matrix of the yearly sums of the sources x days matrix S."""
+    Years = dates.year
+    Starts = np.flatnonzero(np.r_[True, Years[1:] != Years[:-1]])
+
+    return np.add.reduceat(S, Starts, axis=1), Years[Starts]
+
+
+def water_supply_total(WaterSupply, StartDay, url=HydrometURL, Groups=None,
+                       start="1980-01-01", end="2018-12-31"):
+    """
+    Seasonal water supply (AF) of each group for every year, indexed by the
+    end of the year. Groups default to the components of WaterSupply.
+    """
+    Groups = list(dict.fromkeys(Groups)) if Groups is not None else list(WaterSupply.keys())
+    dates = pd.date_range(start, end, freq="D")
+
+    Sources = water_supply_sources(WaterSupply)
+    V, Years = seasonal_volume(source_matrix(Sources, StartDay, dates, url), dates)
+
+    SWSITotal = group_sources(Groups, WaterSupply, Sources) @ V
+
+    return pd.DataFrame(SWSITotal.T, index=pd.to_datetime([f"{year}-12-31" for year in Years]), columns=Groups)
+
+
+def water_supply_cube(WaterSupply, StartDay, url=HydrometURL, Groups=None,
+                      start="1980-01-01", end="2018-12-31"):
+    """
+    Water supply of each group as it stood on every day of the season of
+    every year, as groups x years x days arrays where the days run from
+    StartDay to EndDay:
+
+    Storage          reservoir storage on the day (AF)
+    InflowToDate     inflow from StartDay up to the day before
+    RemainingInflow  inflow from the day to the end of the season
+    Supply           Storage + InflowToDate + RemainingInflow
+
+    The inflow to date has left the reservoirs or been diverted by the day
+    but was part of the season's supply, so it is counted with the storage
+    it didn't end up in. On StartDay the inflow to date is 0 and Supply is
+    the water_supply_total definition. Every day is
+    computed at once from cumulative sums of a sources x years x day-of-year
+    grid, the groups are a single sparse product as in water_supply_total.
+    """
+    Groups = list(dict.fromkeys(Groups)) if Groups is not None else list(WaterSupply.keys())
+    dates = pd.date_range(start, end, freq="D")
+    Sources = water_supply_sources(WaterSupply)
+    Inflow = inflow_sources(Sources)
+
+    S = read_sources(Sources, dates, url)
+
+    # Sources x years x day of year, day 366 is 0 outside leap years
+    Years = np.unique(dates.year)
+    Grid = np.zeros((len(Sources), len(Years), 366))
+    Grid[:, dates.year - Years[0], dates.dayofyear - 1] = S
+
+    Days = np.arange(StartDay, EndDay + 1)
+    Season = Grid[:, :, StartDay - 1:EndDay]
+
+    # Inflow in AF before the day and from the day on, from the cumulative sum over the season
+    Daily = np.where(Inflow[:, None, None], Season * 1.9835, 0)
+    ToDate = np.cumsum(Daily, axis=2) - Daily
+    Remaining = Daily.sum(axis=2, keepdims=True) - ToDate
+    Storage = np.where(Inflow[:, None, None], 0, Season)
+
+    Members = group_sources(Groups, WaterSupply, Sources)
+    shape = (len(Groups), len(Years), len(Days))
+
+    def groups(X):
+        return (Members @ X.reshape(len(Sources), -1)).reshape(shape)
+
+    Cube = {"Storage": groups(Storage),
+            "InflowToDate": groups(ToDate),
+            "RemainingInflow": groups(Remaining)}
+    Cube["Supply"] = Cube["Storage"] + Cube["InflowToDate"] + Cube["RemainingInflow"]
+    Cube.update({"Groups": Groups, "Years": Years, "Days": Days})
+
+    return Cube
+
+
+def water_supply_as_of(Cube, day, name="Supply"):
+    """Years x groups frame of Cube[name] on day of year day, indexed like water_supply_total."""
+    if day not in Cube["Days"]:
+        raise ValueError(f"Day {day} is outside the season {Cube['Days'][0]} - {Cube['Days'][-1]}")
+
+    values = Cube[name][:, :, day - Cube["Days"][0]]
+
+    return pd.DataFrame(values.T, index=pd.to_datetime([f"{year}-12-31" for year in Cube["Years"]]),
+                        columns=Cube["Groups"])
+
+
+def reach_membership(ReachWaterSupply, WaterSupply):
+    """Reaches x components table of 0 and 1 from the 'Water Supply' group of each reach."""
+    Components = list(WaterSupply.keys())
+    Members = membership(ReachWaterSupply["Water Supply"], Components)
+
+    return pd.DataFrame(Members.toarray().astype(int), index=ReachWaterSupply.index, columns=Components)
@@ -26,221 +26,227 @@ matplotlib.
 # %%
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import re
-from scipy.optimize import curve_fit
-from sklearn.metrics import r2_score
 import os
 
+import Paths
+from DailyMatrix import read_daily
+from Instrument import section
+from WaterSupply import (HydrometURL, read_hydromet, reach_membership, water_supply_total,
+                         water_supply_cube, water_supply_as_of)
+
 
 def piecewise_linear(x, m, b, y2):
     return np.piecewise(x, [x < b, x >= b], [lambda x: m * (x - b) + y2, y2])
 
 
-# Update this to the name of the basin
-BasinName = "BOI"
-
-# Dictionary of water supply sources for each reach
-WaterSupplyDict = {'SNK': {'HEII': {'Inflow': ['HEII'], 'Reservoirs': ['JCK', 'PAL']},
-                           'HEN': {'Inflow': ['ISLI'], 'Reservoirs': ['ISL', 'GRS', 'HEN']},
-                           'HEII+HEN' : {'Inflow': ['HEII', 'ISLI'], 'Reservoirs': ['JCK', 'PAL', 'ISL', 'GRS', 'HEN']}, 
-                           'HEII+HEN+AMF': {'Inflow': ['ISLI', 'HEII'], 'Reservoirs': ['JCK', 'PAL', 'ISL', 'GRS', 'HEN', 'AMF']},
-                            'RIR': {'Inflow': [], 'Reservoirs': ['RIR']}},
-                    'BOI': {'BOI': {'Inflow': ['LUC'], 'Reservoirs': ['LUC', 'ARK', 'AND']}},
-                    'PAY': {'PAY': {'Inflow': ['HRSI'], 'Reservoirs': ['CSC', 'DED']}}}
+def fit_water_supply(Flow, WaterSupply, WaterSupplyName, reach, Outputs, BasinName, OutputFolder, UpdateOutputs=True):
+    import matplotlib.pyplot as plt
+    from scipy.optimize import curve_fit
+    from sklearn.metrics import r2_score
 
-StartDay = {'SNK': 60, 'BOI': 60, 'PAY': 60}
+    # curve_fit and the plots work in float64 whatever dtype the diversions were read in
+    Flow = Flow.astype(float)
 
-SWSITotal = pd.DataFrame(index=pd.date_range('1980-01-01', '2018-12-31', freq='D'), columns=WaterSupplyDict[BasinName].keys()).fillna(0)
+    # Get the avaiable water supply for the reach
+    WaterSupply = WaterSupply.reindex(Flow.index).astype(float)
 
-WaterSupply = WaterSupplyDict[BasinName]
-
-for reach in WaterSupply.keys():
+    # Set the bounds for the piecewise linear fit to be the 5th smallest and 5th largest water supply values
+    bounds = [
+        [0, WaterSupply.nsmallest(5).iloc[4], -np.inf],
+        [0.002, WaterSupply.nlargest(5).iloc[4], np.inf],
+    ]
 
-    for flow in WaterSupply[reach]['Inflow']:
-        df = pd.read_html(f"https://www.usbr.gov/pn-bin/daily.pl?station={flow}&format=html&year=1980&month=1&day=1&year=2018&month=12&day=31&pcode=qu", 
-                                        index_col=0, parse_dates=True)[0]
-        df *= 1.9835
-        df.loc[(df.index.dayofyear < StartDay[BasinName]) | (df.index.dayofyear > 273)] = 0
-        SWSITotal[reach] += df.values.flatten()
 
-    for reservoir in WaterSupply[reach]['Reservoirs']:
-        df = pd.read_html(f"https://www.usbr.gov/pn-bin/daily.pl?station={reservoir}&format=html&year=1980&month=1&day=1&year=2018&month=12&day=31&pcode=af", 
-                                        index_col=0, parse_dates=True)[0]
-        df.loc[df.index.dayofyear!=StartDay[BasinName]] = 0
-        SWSITotal[reach] += df.values.flatten()
+    # Fit the piecewise linear function
+    p, e = curve_fit(
+        piecewise_linear,
+        WaterSupply.values,
+        Flow.values,
+        p0=[0.001, WaterSupply.mean(), 0],
+        bounds=bounds,
+    )
+
+    m = p[0]
+    b = p[1]
+    y2 = p[2]
+
+    # Save the slope, breakpoint, and y2 value
+    Outputs.loc[reach, "Slope"] = m
+    Outputs.loc[reach, "Break"] = b
+    Outputs.loc[reach, "y2"] = y2
+
+    # Plot the flow vs the WaterSupply
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.scatter(WaterSupply, Flow, label="Historical Diversions")
+
+    # add labels for each year
+    for i, txt in enumerate(Flow.index.year):
+        ax.annotate(
+            txt,
+            (WaterSupply.values[i], Flow.values[i]),
+            xytext=(5, 5),
+            textcoords="offset points",
+        )
 
-SWSITotal = SWSITotal.resample("1Y").sum()
 
-HistoricalDiversions = pd.read_csv(f"../Outputs/{BasinName}/ObservedDiversions.csv",
-                                    index_col=0, parse_dates=True).dropna()
-ModeledDiversions = pd.read_csv(f"../Outputs/{BasinName}/ReachDiversions.csv", 
-                                index_col=0, parse_dates=True).dropna()
+    # Plot the piecewise linear fit
+    xHat = np.linspace(WaterSupply.min(), WaterSupply.max(), 100)
+    yHat = piecewise_linear(xHat, m, b, y2)
+    ax.plot(xHat, yHat, label="Piecewise Linear Fit")
 
-# Only use reaches the end with BasinName
-ReachWaterSupply = pd.read_csv("../Data/ReachSWSI.csv", index_col=0)
-ReachWaterSupply = ReachWaterSupply[ReachWaterSupply.index.str.contains(f"_{BasinName}")]
+    # Calculate the R2 value
+    r2 = r2_score(Flow, piecewise_linear(WaterSupply.values, m, b, y2))
 
+    Outputs.loc[reach, "R2"] = r2
 
-Outputs = pd.DataFrame(index=ReachWaterSupply.index, columns=["Slope", "y2", "Break", "R2"])
+    # Add the legend and title
+    params = f"m={m:.2e}\n b={b:.2e}\n y2={y2:.2f}\n R2={r2:.2f}"
+    plt.plot([], [], " ", label=params)
 
-for reach in HistoricalDiversions.columns:
-    print(reach)
+    plt.legend()
+    plt.title(f"{reach}")
+    plt.xlabel(f"{WaterSupplyName} (AF)")
+    plt.ylabel("Total Diversion (CFS)")
 
 
-    def fit_water_supply(Flow, reach, OutputFolder, UpdateOutputs=True):
-        # Get the avaiable water supply for the reach
-        WaterSupplyName = ReachWaterSupply.loc[reach, "Water Supply"]
-        WaterSupply = SWSITotal[WaterSupplyName]
-        WaterSupply = WaterSupply.reindex(Flow.index)
+    # If the folder doesn't exist, create it
+    if not os.path.exists(f"{Paths.Outputs}/{BasinName}/Figures/{OutputFolder}"):
+        os.makedirs(f"{Paths.Outputs}/{BasinName}/Figures/{OutputFolder}")
 
-        # Set the bounds for the piecewise linear fit to be the 5th smallest and 5th largest water supply values
-        bounds = [
-            [0, WaterSupply.nsmallest(5).iloc[4], -np.inf],
-            [0.002, WaterSupply.nlargest(5).iloc[4], np.inf],
-        ]
+    # Save the figure
+    fig.savefig(f"{Paths.Outputs}/{BasinName}/Figures/{OutputFolder}/{reach}.png", dpi=300)
+    plt.close()
 
 
-        # Fit the piecewise linear function
-        p, e = curve_fit(
-            piecewise_linear,
-            WaterSupply.values,
-            Flow.values,
-            p0=[0.001, WaterSupply.mean(), 0],
-            bounds=bounds,
-        )
-
-        m = p[0]
-        b = p[1]
-        y2 = p[2]
-
-        # Save the slope, breakpoint, and y2 value
-        Outputs.loc[reach, "Slope"] = m
-        Outputs.loc[reach, "Break"] = b
-        Outputs.loc[reach, "y2"] = y2
+# We need to create a key for sorting that extracts the numeric part of the column header and converts it to int
+def sorting_key(column_name):
+    match = re.search(r"\d+", column_name)
+    if match:
+        return int(match.group())
+    else:
+        return 0
 
-        # Plot the flow vs the WaterSupply
-        fig, ax = plt.subplots(figsize=(10, 5))
-        ax.scatter(WaterSupply, Flow, label="Historical Diversions")
 
-        # add labels for each year
-        for i, txt in enumerate(Flow.index.year):
-            ax.annotate(
-                txt,
-                (WaterSupply.values[i], Flow.values[i]),
-                xytext=(5, 5),
-                textcoords="offset points",
-            )
+def reach_gap(HistoricalDiversions, ModeledDiversions, StartDay):
+    """
+    Average daily shortage of each reach over its five largest shortage years
+    since 2000, smoothed over 30 days and normalised to a mean of 1.
+    """
+    ReachGap = pd.DataFrame(np.nan, index=range(366), columns=HistoricalDiversions.columns)
 
+    for reach in HistoricalDiversions.columns:
+        gap = (
+            ModeledDiversions.reindex(HistoricalDiversions.index) - HistoricalDiversions
+        ).loc[
+            HistoricalDiversions.index.year > 2000,
+            reach,
+        ]
 
-        # Plot the piecewise linear fit
-        xHat = np.linspace(WaterSupply.min(), WaterSupply.max(), 100)
-        yHat = piecewise_linear(xHat, m, b, y2)
-        ax.plot(xHat, yHat, label="Piecewise Linear Fit")
+        # Get index of 5 largest years
+        smallest = gap.groupby(gap.index.year).sum().nlargest(5).index
 
-        # Calculate the R2 value
-        r2 = r2_score(Flow, piecewise_linear(WaterSupply.values, m, b, y2))
+        gap = gap.loc[gap.index.year.isin(smallest)]
 
-        Outputs.loc[reach, "R2"] = r2
+        gap = gap.groupby(gap.index.dayofyear).mean()
+        gap.loc[gap.index < StartDay] = 0
 
-        # Add the legend and title
-        params = f"m={m:.2e}\n b={b:.2e}\n y2={y2:.2f}\n R2={r2:.2f}"
-        plt.plot([], [], " ", label=params)
+        gap = gap.rolling(30).mean().fillna(0)
 
-        plt.legend()
-        plt.title(f"{reach}")
-        plt.xlabel(f"{WaterSupplyName} (AF)")
-        plt.ylabel("Total Diversion (CFS)")
+        ReachGap[reach] = gap
 
 
-        # If the folder doesn't exist, create it
-        if not os.path.exists(f"../Outputs/{BasinName}/Figures/{OutputFolder}"):
-            os.makedirs(f"../Outputs/{BasinName}/Figures/{OutputFolder}")
+    ReachGap.fillna(0, inplace=True)
 
-        # Save the figure
-        fig.savefig(f"../Outputs/{BasinName}/Figures/{OutputFolder}/{reach}.png", dpi=300)
-        plt.close()
+    ReachGap /= ReachGap.mean()
 
+    ReachGap = ReachGap.reindex(sorted(ReachGap.columns, key=sorting_key), axis=1)
 
-    # Get the gap between the historical diversions and the previously calculated full water supply diversions
-    Flow = (HistoricalDiversions - ModeledDiversions.reindex(HistoricalDiversions.index))[reach]
-    Flow = Flow.loc[(Flow.index.dayofyear >= StartDay[BasinName]) & (Flow.index.dayofyear <= 273)]
+    return ReachGap
 
-    Flow = Flow.resample("1Y").mean().fillna(0)
-    Flow = Flow.loc[Flow.index.year >= 2000]
 
-    # Fit the piecewise linear function
-    fit_water_supply(Flow, reach, "WaterSupplyFull")
-    
-    # # Get the gap between the historical diversions and the previously calculated full water supply diversions
-    Flow = (HistoricalDiversions - ModeledDiversions.reindex(HistoricalDiversions.index))[reach]
-    Flow = Flow.loc[(Flow.index.dayofyear >= StartDay[BasinName]) & (Flow.index.dayofyear <= 273)]
+def waterSupplyAdjustment(BasinName, WaterSupply, StartDay, url=HydrometURL, AsOfDay=None):
+    """
+    Fit the piecewise linear water supply adjustment for every reach in
+    BasinName and write the RiverWare water supply and reach gap tables.
 
-    # # Calculate the cumulative sum of the gap for July and August
-    Flow = Flow.loc[(Flow.index.month >= 7) & (Flow.index.month <= 9)].resample("1Y").mean().fillna(0)
-    Flow = Flow.loc[Flow.index.year >= 2000]
+    WaterSupply is the dictionary of inflow and reservoir sources for each
+    water supply component, the group of each reach in ReachSWSI.csv is its
+    components joined by '+' (see WaterSupply.py). StartDay is the first day
+    of the irrigation season.
+    url is where the Hydromet data is read from (see read_hydromet).
 
-    # # Fit the piecewise linear function
-    fit_water_supply(Flow, reach, "WaterSupplyJulyAugust", UpdateOutputs=False)
+    AsOfDay (a day of year in the season) fits the adjustments for an
+    in-season update: the water supply is the storage on AsOfDay plus the
+    inflow to date and still to come (see water_supply_cube) and the gap is
+    the mean over the rest of the season. The default fits from StartDay.
+    """
+    HistoricalDiversions = read_daily(f"{Paths.Outputs}/{BasinName}/ObservedDiversions.csv").dropna()
+    ModeledDiversions = read_daily(f"{Paths.Outputs}/{BasinName}/ReachDiversions.csv").dropna()
 
+    # Only use reaches the end with BasinName
+    ReachWaterSupply = pd.read_csv(f"{Paths.Data}/ReachSWSI.csv", index_col=0)
+    ReachWaterSupply = ReachWaterSupply[ReachWaterSupply.index.str.contains(f"_{BasinName}")]
 
+    with section("Download"):
+        if AsOfDay is None:
+            SWSITotal = water_supply_total(WaterSupply, StartDay, url, Groups=ReachWaterSupply["Water Supply"])
+        else:
+            Cube = water_supply_cube(WaterSupply, StartDay, url, Groups=ReachWaterSupply["Water Supply"])
+            SWSITotal = water_supply_as_of(Cube, AsOfDay)
 
+    # First day of the season the adjustments are fitted over
+    FitDay = StartDay if AsOfDay is None else AsOfDay
 
 
-WaterSupplyRiverWare = pd.DataFrame(
-    index=ReachWaterSupply.index, columns=["HEII", "HEN", "AMF", "RIR"]
-).fillna(0)
-# Format ReachSWSI for RiverWare
-for reach in ReachWaterSupply.index:
-    if "HEII" in ReachWaterSupply.loc[reach, "Water Supply"]:
-        WaterSupplyRiverWare.loc[reach, "HEII"] = 1
-    if "HEN" in ReachWaterSupply.loc[reach, "Water Supply"]:
-        WaterSupplyRiverWare.loc[reach, "HEN"] = 1
-    if "AMF" in ReachWaterSupply.loc[reach, "Water Supply"]:
-        WaterSupplyRiverWare.loc[reach, "AMF"] = 1
-    if "RIR" in ReachWaterSupply.loc[reach, "Water Supply"]:
-        WaterSupplyRiverWare.loc[reach, "RIR"] = 1
+    Outputs = pd.DataFrame(np.nan, index=ReachWaterSupply.index, columns=["Slope", "y2", "Break", "R2"])
 
-WaterSupplyRiverWare.to_csv(f"../Outputs/{BasinName}/RiverWareInputs/WaterSupply.csv")
+    for reach in HistoricalDiversions.columns:
+        print(reach)
 
-Outputs.to_csv(f"../Outputs/{BasinName}/SlopeThreshold.csv")
+        with section("Curve fit", Reach=reach):
+            # Get the gap between the historical diversions and the previously calculated full water supply diversions
+            Flow = (HistoricalDiversions - ModeledDiversions.reindex(HistoricalDiversions.index))[reach]
+            Flow = Flow.loc[(Flow.index.dayofyear >= FitDay) & (Flow.index.dayofyear <= 273)]
 
-ReachGap = pd.DataFrame(index=range(366), columns=HistoricalDiversions.columns)
+            Flow = Flow.resample("1Y").mean().fillna(0)
+            Flow = Flow.loc[Flow.index.year >= 2000]
 
-for reach in HistoricalDiversions.columns:
-    gap = (
-        ModeledDiversions.reindex(HistoricalDiversions.index) - HistoricalDiversions
-    ).loc[
-        HistoricalDiversions.index.year > 2000,
-        reach,
-    ]
+            # Fit the piecewise linear function
+            WaterSupplyName = ReachWaterSupply.loc[reach, "Water Supply"]
+            fit_water_supply(Flow, SWSITotal[WaterSupplyName], WaterSupplyName, reach, Outputs, BasinName, "WaterSupplyFull")
+    
+            # # Get the gap between the historical diversions and the previously calculated full water supply diversions
+            Flow = (HistoricalDiversions - ModeledDiversions.reindex(HistoricalDiversions.index))[reach]
+            Flow = Flow.loc[(Flow.index.dayofyear >= FitDay) & (Flow.index.dayofyear <= 273)]
 
-    # Get index of 5 largest years
-    smallest = gap.groupby(gap.index.year).sum().nlargest(5).index
+            # # Calculate the cumulative sum of the gap for July and August
+            Flow = Flow.loc[(Flow.index.month >= 7) & (Flow.index.month <= 9)].resample("1Y").mean().fillna(0)
+            Flow = Flow.loc[Flow.index.year >= 2000]
 
-    gap = gap.loc[gap.index.year.isin(smallest)]
+            # # Fit the piecewise linear function
+            fit_water_supply(Flow, SWSITotal[WaterSupplyName], WaterSupplyName, reach, Outputs, BasinName, "WaterSupplyJulyAugust", UpdateOutputs=False)
 
-    gap = gap.groupby(gap.index.dayofyear).mean()
-    gap.loc[gap.index < StartDay[BasinName]] = 0
 
-    gap = gap.rolling(30).mean().fillna(0)
+    # Format ReachSWSI for RiverWare, 1 for each water supply component of the reach's group
+    WaterSupplyRiverWare = reach_membership(ReachWaterSupply, WaterSupply)
 
-    ReachGap[reach] = gap
+    with section("Write files"):
+        WaterSupplyRiverWare.to_csv(f"{Paths.Outputs}/{BasinName}/RiverWareInputs/WaterSupply.csv")
 
+        Outputs.to_csv(f"{Paths.Outputs}/{BasinName}/SlopeThreshold.csv")
 
-# We need to create a key for sorting that extracts the numeric part of the column header and converts it to int
-def sorting_key(column_name):
-    match = re.search(r"\d+", column_name)
-    if match:
-        return int(match.group())
-    else:
-        return 0
+    with section("Reach gap"):
+        ReachGap = reach_gap(HistoricalDiversions, ModeledDiversions, StartDay)
 
+    with section("Write files"):
+        ReachGap.to_csv(f"{Paths.Outputs}/{BasinName}/RiverWareInputs/ReachGap.csv")
 
-ReachGap.fillna(0, inplace=True)
 
-ReachGap /= ReachGap.mean()
+if __name__ == "__main__":
+    from BasinConfig import WaterSupplyDict, StartDay
 
-ReachGap = ReachGap.reindex(sorted(ReachGap.columns, key=sorting_key), axis=1)
+    # Update this to the name of the basin
+    BasinName = "BOI"
 
-ReachGap.to_csv(f"../Outputs/{BasinName}/RiverWareInputs/ReachGap.csv")
\ No newline at end of file
+    waterSupplyAdjustment(BasinName, WaterSupplyDict[BasinName], StartDay[BasinName])
@@ -0,0 +1,72 @@
+import os
+
+import pandas as pd
+
+import Paths
+import Pipeline
+from BasinConfig import Basins
+
+
+def basin_tree(root):
+    """Data and Outputs folders with a single PAY reach."""
+    os.makedirs(os.path.join(root, "Data"))
+    os.makedirs(os.path.join(root, "Outputs", "PAY"))
+    pd.DataFrame({"RiverWare Reach": ["Reach1Diversions_PAY"], "IDWR Site Code": ["13000000"],
+                  "Diversion name": ["Canal"]}).to_csv(os.path.join(root, "Data", "RiverWareReaches.csv"), index=False)
+    Paths.configure(os.path.join(root, "Data"), os.path.join(root, "Outputs"))
+
+
+def fake_stages(monkeypatch):
+    """Replace run_stage with one that writes the stage's outputs, returns the stages run."""
+    Ran = []
+
+    def run_stage(Stage, Config, download=True):
+        Ran.append(Stage)
+        Graph = {Node["Name"]: Node for Node in Pipeline.stage_graph(Config, download)}
+        for path in Graph[Stage]["Outputs"]:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(Stage)
+
+    monkeypatch.setattr(Pipeline, "run_stage", run_stage)
+    return Ran
+
+
+def test_second_run_downloads_again(tmp_path, monkeypatch):
+    basin_tree(str(tmp_path))
+    Ran = fake_stages(monkeypatch)
+    Config = Pipeline.basin_configs(["PAY"])["PAY"]
+    Stages = ["DiversionsDownload", "ClimateClean"]
+
+    Pipeline.run_basin(Config, stages=Stages, report=False)
+    Pipeline.run_basin(Config, stages=Stages, report=False)
+
+    assert Ran == Stages + Stages
+
+
+def test_no_download_uses_cache(tmp_path, monkeypatch):
+    basin_tree(str(tmp_path))
+    Ran = fake_stages(monkeypatch)
+    Config = Pipeline.basin_configs(["PAY"])["PAY"]
+
+    Pipeline.run_basin(Config, stages=["ClimateClean"], report=False)
+    Pipeline.run_basin(Config, download=False, stages=["ClimateClean"], report=False)
+
+    assert Ran == ["ClimateClean"]
+
+
+def test_missing_reach_locations(tmp_path, monkeypatch):
+    basin_tree(str(tmp_path))
+    Ran = fake_stages(monkeypatch)
+    Config = Pipeline.basin_configs(["PAY"], spatial_climate=True)["PAY"]
+
+    # Without Data/ReachLocations.csv the stage runs once and is then cached
+    Pipeline.run_basin(Config, download=False, stages=["ClimateDemand"], report=False)
+    Pipeline.run_basin(Config, download=False, stages=["ClimateDemand"], report=False)
+    assert Ran == ["ClimateDemand"]
+
+    # Providing it makes the stage stale
+    with open(os.path.join(str(tmp_path), "Data", "ReachLocations.csv"), "w") as f:
+        f.write("RiverWare Reach,Latitude,Longitude\nReach1Diversions_PAY,44,-116\n")
+    Pipeline.run_basin(Config, download=False, stages=["ClimateDemand"], report=False)
+    assert Ran == ["ClimateDemand", "ClimateDemand"]
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from WaterSupply import water_supply_as_of, water_supply_cube, water_supply_total
+
+
+WaterSupply = {"A": {"Inflow": ["IN"], "Reservoirs": ["RES"]}}
+
+
+@pytest.fixture
+def hydromet(tmp_path):
+    """Local Hydromet copies for 2001: 10 cfs of inflow (20 on day 100) and storage falling 250 AF a day."""
+    dates = pd.date_range("2001-01-01", "2001-12-31", name="Date")
+    doy = dates.dayofyear
+
+    pd.DataFrame({"IN": np.where(doy == 100, 20.0, 10.0)}, index=dates).to_csv(tmp_path / "IN_qu.csv")
+    pd.DataFrame({"RES": 1000.0 - 250 * (doy - 100)}, index=dates).to_csv(tmp_path / "RES_af.csv")
+
+    return str(tmp_path / "{station}_{pcode}.csv")
+
+
+def test_as_of_supply(hydromet):
+    Cube = water_supply_cube(WaterSupply, 100, hydromet, start="2001-01-01", end="2001-12-31")
+    AsOf = water_supply_as_of(Cube, 102)
+
+    # Storage on day 102, inflow on days 100 and 101, inflow on days 102 to 273
+    Storage = 1000 - 250 * 2
+    ToDate = (20 + 10) * 1.9835
+    Remaining = (273 - 102 + 1) * 10 * 1.9835
+
+    assert AsOf.loc["2001-12-31", "A"] == pytest.approx(Storage + ToDate + Remaining)
+    assert water_supply_as_of(Cube, 102, "InflowToDate").loc["2001-12-31", "A"] == pytest.approx(ToDate)
+
+
+def test_start_day_is_seasonal_total(hydromet):
+    Cube = water_supply_cube(WaterSupply, 100, hydromet, start="2001-01-01", end="2001-12-31")
+    Total = water_supply_total(WaterSupply, 100, hydromet, start="2001-01-01", end="2001-12-31")
+
+    assert water_supply_as_of(Cube, 100).loc["2001-12-31", "A"] == pytest.approx(Total.loc["2001-12-31", "A"])